@@ -0,0 +1,1251 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+import os
+import random
+import sys
+import time
+from optparse import OptionParser
+
+
+def _best_of(repeat, function, *args):
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+# _best_of() of the baseline and the current function, one run of each in
+# turn. The later runs of a process run slower, the baseline must not get
+# all the early ones.
+def _best_of_turns(repeat, baseline, current):
+    best = [None, None]
+
+    for _ in range(repeat):
+        for index, function in enumerate((baseline, current)):
+            elapsed = _best_of(1, function)
+
+            if best[index] is None or elapsed < best[index]:
+                best[index] = elapsed
+
+    return best
+
+
+def _report(name, baseline, current):
+    print("{0:<24} {1:>10.4f}s {2:>10.4f}s {3:>7.2f}x".format(
+        name, baseline, current, baseline / current))
+
+
+def bench_xxtea(options):
+    from xxteafile.xxteafile import xxteaFile
+
+    engine = xxteaFile()
+    key = "ljd-benchmark"
+    rng = random.Random(0)
+
+    # Files of 512 bytes to 8 KiB, the size of most compiled scripts, that
+    # add up to four times --size
+    encrypted = []
+    total = 0
+    while total < options.size * 4 * 1024:
+        data = rng.randbytes(rng.randrange(512, 8 * 1024))
+        encrypted.append(engine.encrypt(data, key))
+        total += len(data)
+
+    def decrypt_each():
+        return [engine.decrypt(data, key) for data in encrypted]
+
+    if engine.decrypt_many(encrypted, key) != decrypt_each():
+        raise AssertionError("decrypt_many() differs from decrypt()")
+
+    baseline = _best_of(options.repeat, decrypt_each)
+    current = _best_of(options.repeat, engine.decrypt_many, encrypted, key)
+
+    _report("xxtea ({0} files)".format(len(encrypted)), baseline, current)
+
+
+def _dump_files(options):
+    files = []
+
+    for path, _, filenames in os.walk(options.input):
+        for name in sorted(filenames):
+            if name.find(".lua") != -1:
+                files.append(os.path.join(path, name))
+
+    return sorted(files)
+
+
+def bench_parse(options):
+    import io
+    import ljd.rawdump.parser
+    import ljd.util.binstream
+
+    class FileBinStream(ljd.util.binstream.BinStream):
+        # The read(1)-per-byte stream BinStream used to be
+
+        def open(self, filename):
+            self.name = filename
+            self.fd = io.open(filename, 'rb')
+            self.size = os.stat(filename).st_size
+
+        def close(self):
+            self.fd.close()
+            self.size = 0
+            self.pos = 0
+
+        def read_bytes(self, size=1):
+            if not self.check_data_available(size):
+                raise IOError("Unexpected EOF")
+
+            self.pos += size
+            return self.fd.read(size)
+
+        def read_byte(self):
+            return int.from_bytes(self.read_bytes(1), byteorder=sys.byteorder)
+
+        def read_zstring(self):
+            string = b''
+
+            while not self.eof():
+                byte = self.read_bytes(1)
+
+                if byte == b'\x00':
+                    return string
+
+                string += byte
+
+            return string
+
+        def read_uleb128(self):
+            value = self.read_byte()
+
+            if value >= 0x80:
+                bitshift = 0
+                value &= 0x7f
+
+                while True:
+                    byte = self.read_byte()
+
+                    bitshift += 7
+                    value |= (byte & 0x7f) << bitshift
+
+                    if byte < 0x80:
+                        break
+
+            return value
+
+        def read_uint(self, size=4):
+            return int.from_bytes(self.read_bytes(size),
+                                  byteorder=self.data_byteorder)
+
+        def read_uints(self, count, size=4):
+            return tuple(self.read_uint(size) for _ in range(count))
+
+    files = _dump_files(options)
+
+    def parse_all():
+        for filename in files:
+            ljd.rawdump.parser.parse(filename)
+
+    original = ljd.util.binstream.BinStream
+
+    try:
+        ljd.util.binstream.BinStream = FileBinStream
+        baseline = _best_of(options.repeat, parse_all)
+    finally:
+        ljd.util.binstream.BinStream = original
+
+    current = _best_of(options.repeat, parse_all)
+
+    _report("parse ({0} files)".format(len(files)), baseline, current)
+
+
+def bench_decode(options):
+    import ljd.bytecode.instructions as instructions
+    import ljd.rawdump.code
+    import ljd.rawdump.parser
+    import ljd.rawdump.prototype
+
+    def process_operand(parser, operand_type, operand):
+        if operand_type in (instructions.T_STR, instructions.T_TAB,
+                            instructions.T_FUN, instructions.T_CDT):
+            return parser.complex_constants_count - operand - 1
+        elif operand_type == instructions.T_JMP:
+            return operand - 0x8000
+        else:
+            return operand
+
+    def read_instruction(parser):
+        # One read_uint and one operand pass per instruction, as before
+        codeword = parser.stream.read_uint(4)
+        opcode = codeword & 0xFF
+        instruction_class = parser.decoders[opcode][0]
+        instruction = instruction_class()
+
+        if instruction.args_count == 3:
+            A = (codeword >> 8) & 0xFF
+            CD = (codeword >> 16) & 0xFF
+            B = (codeword >> 24) & 0xFF
+        else:
+            A = (codeword >> 8) & 0xFF
+            CD = (codeword >> 16) & 0xFFFF
+
+        if instruction.A_type is not None:
+            instruction.A = process_operand(parser, instruction.A_type, A)
+
+        if instruction.B_type is not None:
+            instruction.B = process_operand(parser, instruction.B_type, B)
+
+        if instruction.CD_type is not None:
+            instruction.CD = process_operand(parser, instruction.CD_type, CD)
+
+        return instruction
+
+    def read_all(parser, count):
+        return [read_instruction(parser) for _ in range(count)]
+
+    files = _dump_files(options)
+
+    def parse_all():
+        for filename in files:
+            ljd.rawdump.parser.parse(filename)
+
+    original = ljd.rawdump.code.read_all
+
+    try:
+        ljd.rawdump.code.read_all = read_all
+        baseline = _best_of(options.repeat, parse_all)
+    finally:
+        ljd.rawdump.code.read_all = original
+
+    current = _best_of(options.repeat, parse_all)
+
+    _report("decode ({0} files)".format(len(files)), baseline, current)
+
+
+def bench_instructions(options):
+    import tracemalloc
+    import ljd.bytecode.instructions as instructions
+
+    class DictInstruction:
+        # Instructions used to copy their whole definition per instance
+
+        def __init__(self, definition):
+            for key, value in definition.__dict__.items():
+                setattr(self, key, value)
+
+            if self.A_type is not None:
+                self.A = 0
+
+            if self.B_type is not None:
+                self.B = 0
+
+            if self.CD_type is not None:
+                self.CD = 0
+
+    definitions = [definition for definition in vars(instructions).values()
+                   if isinstance(definition, instructions._IDef)]
+    count = options.size * 1024
+
+    def build_dict():
+        return [DictInstruction(definitions[i % len(definitions)])
+                for i in range(count)]
+
+    def build_slots():
+        return [definitions[i % len(definitions)]() for i in range(count)]
+
+    def peak_memory(function):
+        tracemalloc.start()
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+        return peak
+
+    baseline = _best_of(options.repeat, build_dict)
+    current = _best_of(options.repeat, build_slots)
+
+    _report("create {0} instructions".format(count), baseline, current)
+
+    baseline = peak_memory(build_dict)
+    current = peak_memory(build_slots)
+
+    print("{0:<24} {1:>10.1f}M {2:>10.1f}M {3:>7.2f}x".format(
+        "instructions memory", baseline / 2 ** 20, current / 2 ** 20,
+        baseline / current))
+
+
+def bench_locals(options):
+    from ljd.bytecode.debuginfo import DebugInformation, VariableInfo
+
+    rng = random.Random(0)
+    debuginfo = DebugInformation()
+    addr_count = options.size * 4
+
+    # Nested scopes, every variable lives until the end of its block
+    for start in sorted(rng.randrange(addr_count) for _ in range(addr_count // 8)):
+        info = VariableInfo()
+        info.start_addr = start
+        info.end_addr = min(addr_count, start + rng.randrange(1, 64))
+        info.name = "var" + str(start)
+        debuginfo.variable_info.append(info)
+
+    lookups = [(rng.randrange(addr_count), rng.randrange(8))
+               for _ in range(addr_count * 4)]
+
+    def scan_all():
+        for addr, slot in lookups:
+            debuginfo._scan_local_name(addr, slot)
+
+    def lookup_all():
+        debuginfo.reset_local_names()
+
+        for addr, slot in lookups:
+            debuginfo.lookup_local_name(addr, slot)
+
+    baseline = _best_of(options.repeat, scan_all)
+    current = _best_of(options.repeat, lookup_all)
+
+    _report("{0} local lookups".format(len(lookups)), baseline, current)
+
+
+def bench_edits(options):
+    import ljd.ast.builder as builder
+    import ljd.bytecode.instructions as instructions
+    from ljd.bytecode.debuginfo import DebugInformation, VariableInfo
+    from ljd.bytecode.helpers import get_jump_destination
+
+    def remove_instruction(state, code, index):
+        # One pop and one relocation pass per removal, as before
+        code.pop(index)
+        state.debuginfo.addr_to_line_map.pop(index)
+
+        for current_index, moved_instruction in enumerate(code):
+            if moved_instruction.opcode not in builder._WARP_INSTRUCTIONS:
+                continue
+
+            if current_index < index and moved_instruction.CD >= 0:
+                destination = get_jump_destination(
+                    current_index, moved_instruction)
+                if destination > index:
+                    moved_instruction.CD -= 1
+
+            elif current_index >= index and moved_instruction.CD < 0:
+                destination = current_index + moved_instruction.CD + 2
+                if destination < index:
+                    moved_instruction.CD += 1
+
+        for info in state.debuginfo.variable_info:
+            if info.end_addr > index:
+                info.end_addr -= 1
+
+            if info.start_addr > index:
+                info.start_addr -= 1
+
+    count = options.size * 16
+    rng = random.Random(0)
+
+    def make_state():
+        state = builder._State()
+        state.debuginfo = DebugInformation()
+        code = []
+
+        for addr in range(count):
+            if addr % 7 == 3:
+                instruction = instructions.JMP()
+                instruction.CD = rng.randrange(-min(addr, 40), 40)
+            else:
+                instruction = instructions.MOV()
+
+            code.append(instruction)
+            state.debuginfo.addr_to_line_map.append(addr)
+
+        for addr in range(0, count, 16):
+            info = VariableInfo()
+            info.start_addr = addr
+            info.end_addr = min(count, addr + 32)
+            state.debuginfo.variable_info.append(info)
+
+        return state, code
+
+    removals = sorted(rng.sample(range(1, count - 1, 3), count // 64),
+                      reverse=True)
+
+    def snapshot(state, code):
+        return ([(i.opcode, i.CD) for i in code],
+                [(i.start_addr, i.end_addr)
+                 for i in state.debuginfo.variable_info])
+
+    def remove_sequential():
+        state, code = make_state()
+
+        for addr in removals:
+            remove_instruction(state, code, addr)
+
+        return snapshot(state, code)
+
+    def remove_batched():
+        state, code = make_state()
+        edits = builder._InstructionEdits(code)
+
+        for addr in removals:
+            edits.remove(addr)
+
+        edits.apply(state)
+
+        return snapshot(state, code)
+
+    baseline = _best_of(options.repeat, remove_sequential)
+    current = _best_of(options.repeat, remove_batched)
+
+    _report("remove {0} of {1}".format(len(removals), count),
+            baseline, current)
+
+
+def _reference_visit(visitor, node):
+    # The recursive walk traverse.Visitor._visit used to be, one Python
+    # frame per level and every handler called through the hooks
+
+    assert node is not None
+
+    if not visitor._enter(node):
+        return
+
+    node_class = node.__class__
+    admit = getattr(node_class, "_admit", None)
+
+    if node_class._handlers is not None \
+            and (admit is None or admit(node, visitor)):
+        visit_name, leave_name = node_class._handlers
+        lists = getattr(node_class, "_child_lists", ())
+
+        ordered = visitor._visit_node(getattr(visitor, visit_name), node)
+
+        if ordered is not None:
+            for child in ordered:
+                visitor._visit(child)
+
+        for name in getattr(node_class, "_children", ()):
+            if name in lists:
+                for child in getattr(node, name):
+                    visitor._visit(child)
+            else:
+                visitor._visit(getattr(node, name))
+
+        visitor._leave_node(getattr(visitor, leave_name), node)
+
+    visitor._exit(node)
+
+
+def bench_traverse(options):
+    import ljd.ast.builder
+    import ljd.ast.locals
+    import ljd.ast.mutator
+    import ljd.ast.slotworks
+    import ljd.ast.traverse
+    import ljd.ast.unwarper
+    import ljd.ast.validator
+    import ljd.lua.writer
+    import ljd.rawdump.parser
+
+    asts = []
+
+    for filename in _dump_files(options):
+        _, prototype = ljd.rawdump.parser.parse(filename)
+
+        if not prototype:
+            continue
+
+        try:
+            ast = ljd.ast.builder.build(prototype)
+
+            ljd.ast.mutator.pre_pass(ast)
+            ljd.ast.locals.mark_locals(ast)
+            ljd.ast.slotworks.eliminate_temporary(ast, upvalues=True)
+            ljd.ast.unwarper.unwarp(ast)
+            ljd.ast.locals.mark_local_definitions(ast)
+            ljd.ast.mutator.primary_pass(ast)
+        except Exception:
+            continue
+
+        asts.append(ast)
+
+    def walk(ast):
+        ljd.ast.validator.validate(ast, warped=False)
+
+        visitor = ljd.lua.writer.Visitor()
+        ljd.ast.traverse.traverse(visitor, ast.statements)
+        return visitor.print_queue
+
+    def walk_all():
+        return [walk(ast) for ast in asts]
+
+    # The writer drops trailing empty returns on its first pass
+    walk_all()
+
+    original = ljd.ast.traverse.Visitor._visit
+
+    # Trees too deep for the recursive walk are left out of both timings
+    ljd.ast.traverse.Visitor._visit = _reference_visit
+    walked = []
+
+    try:
+        for ast in asts:
+            try:
+                walk(ast)
+            except RecursionError:
+                continue
+
+            walked.append(ast)
+    finally:
+        ljd.ast.traverse.Visitor._visit = original
+
+    skipped = len(asts) - len(walked)
+    asts = walked
+
+    try:
+        ljd.ast.traverse.Visitor._visit = _reference_visit
+        baseline = _best_of(options.repeat, walk_all)
+    finally:
+        ljd.ast.traverse.Visitor._visit = original
+
+    current = _best_of(options.repeat, walk_all)
+
+    _report("validate+write ({0} files)".format(len(asts)),
+            baseline, current)
+
+    if skipped:
+        print("  {0} files too deep for the recursive walk".format(skipped))
+
+
+def _reference_unwarp(ast):
+    import ljd.ast.unwarper as unwarper
+    import ljd.context
+
+    ctx = ljd.context.DecompileContext()
+
+    # Every step gathers the statements lists for itself
+    unwarper._run_step(unwarper._unwarp_loops, ast, repeat_until=False)
+    unwarper._run_step(unwarper._unwarp_loops, ast, repeat_until=True)
+    unwarper._run_step(unwarper._unwarp_expressions, ast, ctx=ctx)
+    unwarper._run_step(unwarper._unwarp_ifs, ast, ctx=ctx)
+    unwarper._glue_flows(ast)
+
+
+def _parse_prototypes(options):
+    import ljd.rawdump.parser
+
+    prototypes = []
+
+    for filename in _dump_files(options):
+        _, prototype = ljd.rawdump.parser.parse(filename)
+
+        if prototype:
+            prototypes.append(prototype)
+
+    return prototypes
+
+
+# The prototype and all the ones nested in it
+def _nested_prototypes(prototype):
+    import ljd.bytecode.prototype
+
+    prototypes = [prototype]
+
+    for constant in prototype.constants.complex_constants:
+        if isinstance(constant, ljd.bytecode.prototype.Prototype):
+            prototypes += _nested_prototypes(constant)
+
+    return prototypes
+
+
+# The lua source run() gives for each prototype, None where it fails
+def _decompile_all(prototypes, run):
+    import io
+
+    import ljd.lua.writer
+
+    outputs = []
+
+    for prototype in prototypes:
+        try:
+            ast = run(prototype)
+        except Exception:
+            outputs.append(None)
+            continue
+
+        out = io.StringIO()
+        ljd.lua.writer.write(out, ast)
+        outputs.append(out.getvalue())
+
+    return outputs
+
+
+# The best seconds of decompiling the corpus with baseline_run and with
+# current_run, one run of each in turn, and the outputs of the last runs.
+# Building a tree changes the prototype, so every run parses the files
+# afresh and only the decompilation is timed.
+def _compare_decompile(options, baseline_run, current_run):
+    best = [None, None]
+    outputs = [None, None]
+
+    for _ in range(options.repeat):
+        for index, run in enumerate((baseline_run, current_run)):
+            prototypes = _parse_prototypes(options)
+
+            start = time.perf_counter()
+            outputs[index] = _decompile_all(prototypes, run)
+            elapsed = time.perf_counter() - start
+
+            if best[index] is None or elapsed < best[index]:
+                best[index] = elapsed
+
+    return best, outputs
+
+
+def _report_outputs(outputs):
+    baseline, current = outputs
+
+    changed = sum(old != new for old, new in zip(baseline, current))
+
+    print("  {0} of {1} outputs changed, {2} files failed, {3} before".format(
+        changed, len(current), current.count(None), baseline.count(None)))
+
+
+def bench_passes(options):
+    import ljd.ast.builder
+    import ljd.ast.locals
+    import ljd.ast.mutator
+    import ljd.ast.pipeline
+    import ljd.ast.slotworks
+    import ljd.ast.validator
+
+    def run_separately(prototype):
+        ast = ljd.ast.builder.build(prototype)
+
+        ljd.ast.validator.validate(ast, warped=True)
+        ljd.ast.mutator.pre_pass(ast)
+        ljd.ast.locals.mark_locals(ast)
+        ljd.ast.slotworks.eliminate_temporary(ast, upvalues=True)
+        _reference_unwarp(ast)
+        ljd.ast.locals.mark_local_definitions(ast)
+        ljd.ast.mutator.primary_pass(ast)
+        ljd.ast.validator.validate(ast, warped=False)
+
+        return ast
+
+    manager = ljd.ast.pipeline.PassManager()
+
+    def run_managed(prototype):
+        ast = ljd.ast.builder.build(prototype)
+        manager.run(ast)
+
+        return ast
+
+    (baseline, current), outputs = _compare_decompile(
+        options, run_separately, run_managed)
+
+    _report("passes ({0} files)".format(len(outputs[1])), baseline, current)
+    _report_outputs(outputs)
+
+
+def bench_validate(options):
+    import ljd.ast.builder
+    import ljd.ast.pipeline
+    import ljd.context
+
+    manager = ljd.ast.pipeline.PassManager()
+
+    def run_validated(prototype):
+        ast = ljd.ast.builder.build(prototype)
+        manager.run(ast)
+
+        return ast
+
+    def run_unvalidated(prototype):
+        ast = ljd.ast.builder.build(prototype)
+        manager.run(ast, ljd.context.DecompileContext(checks=False))
+
+        return ast
+
+    (baseline, current), outputs = _compare_decompile(
+        options, run_validated, run_unvalidated)
+
+    _report("never validate ({0} files)".format(len(outputs[1])),
+            baseline, current)
+    _report_outputs(outputs)
+
+
+# The lua writer as it was, every command queued before printing
+def _reference_write(fd, ast):
+    import ljd.ast.traverse as traverse
+    import ljd.lua.writer as writer
+
+    visitor = writer.Visitor()
+    traverse.traverse(visitor, ast.statements)
+
+    queue = visitor.print_queue
+
+    def wrapped_write(text):
+        enc = sys.stdout.encoding
+        if enc == 'UTF-8':
+            fd.write(text)
+        else:
+            fd.write(str(text).encode(
+                enc, errors='backslashreplace').decode(enc))
+
+    def get_next_significant(i):
+        i += 1
+
+        while i < len(queue):
+            if queue[i][0] not in (writer.CMD_END_LINE, writer.CMD_WRITE):
+                break
+
+            i += 1
+
+        if i < len(queue):
+            return queue[i]
+        else:
+            return writer.CMD_END_BLOCK,
+
+    indent = 0
+    line_broken = True
+
+    for i, cmd in enumerate(queue):
+        if cmd[0] == writer.CMD_END_STATEMENT:
+            wrapped_write("\n")
+            line_broken = True
+
+            next_cmd = get_next_significant(i)
+
+            if next_cmd[0] not in (writer.CMD_END_BLOCK,
+                                   writer.CMD_START_BLOCK):
+                if next_cmd[1] != cmd[1] \
+                        or cmd[1] >= writer.STATEMENT_IF \
+                        or next_cmd[1] >= writer.STATEMENT_IF:
+                    wrapped_write("\n")
+        elif cmd[0] == writer.CMD_END_LINE:
+            wrapped_write("\n")
+            line_broken = True
+        elif cmd[0] == writer.CMD_START_BLOCK:
+            indent += 1
+        elif cmd[0] == writer.CMD_END_BLOCK:
+            indent -= 1
+        elif cmd[0] == writer.CMD_WRITE:
+            if line_broken:
+                wrapped_write(indent * '\t')
+                line_broken = False
+
+            _id, fmt, args, kargs = cmd
+
+            if len(args) + len(kargs) > 0:
+                text = fmt.format(*args, **kargs)
+            elif isinstance(fmt, str):
+                text = fmt
+            else:
+                text = str(fmt)
+
+            wrapped_write(text)
+
+
+# A config module returning a table of rows small tables
+def _make_config_ast(rows):
+    import ljd.ast.nodes as nodes
+
+    def constant(value):
+        node = nodes.Constant()
+
+        if isinstance(value, str):
+            node.type = nodes.Constant.T_STRING
+        else:
+            node.type = nodes.Constant.T_INTEGER
+
+        node.value = value
+
+        return node
+
+    def record(key, value):
+        node = nodes.TableRecord()
+        node.key = constant(key)
+        node.value = value
+
+        return node
+
+    table = nodes.TableConstructor()
+
+    for i in range(rows):
+        row = nodes.TableConstructor()
+
+        row.records.contents = [
+            record("id", constant(i)),
+            record("name", constant("item_{0}".format(i))),
+            record("price", constant(i * 7 % 1000))
+        ]
+
+        for value in range(4):
+            array_record = nodes.ArrayRecord()
+            array_record.value = constant(i + value)
+            row.array.contents.append(array_record)
+
+        table.records.contents.append(record(i + 1, row))
+
+    statement = nodes.Return()
+    statement.returns.contents.append(table)
+
+    ast = nodes.FunctionDefinition()
+    ast.statements.contents.append(statement)
+
+    return ast
+
+
+def bench_writer(options):
+    import io
+    import tracemalloc
+
+    import ljd.lua.writer
+
+    ast = _make_config_ast(options.size * 64)
+
+    def write(function):
+        out = io.StringIO()
+        function(out, ast)
+
+        return out.getvalue()
+
+    def peak_memory(function):
+        tracemalloc.start()
+
+        try:
+            write(function)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    baseline = _best_of(options.repeat, write, _reference_write)
+    current = _best_of(options.repeat, write, ljd.lua.writer.write)
+
+    size = len(write(ljd.lua.writer.write))
+    name = "write {0:.1f} MiB".format(size / 1024 / 1024)
+
+    _report(name, baseline, current)
+
+    baseline = peak_memory(_reference_write) / 1024 / 1024
+    current = peak_memory(ljd.lua.writer.write) / 1024 / 1024
+
+    print("{0:<24} {1:>9.1f}M {2:>9.1f}M {3:>7.2f}x".format(
+        "  peak memory", baseline, current, baseline / current))
+
+
+# Template tables turned into nodes right away, as the builder used to
+def _reference_table_copy(state, slot):
+    import ljd.ast.nodes as nodes
+
+    node = nodes.ConstantTable(state.constants.complex_constants[slot])
+    node.expand()
+
+    return node
+
+
+def bench_tables(options):
+    import ljd.ast.builder
+    import ljd.ast.pipeline
+
+    manager = ljd.ast.pipeline.PassManager()
+
+    def run(prototype):
+        ast = ljd.ast.builder.build(prototype)
+        manager.run(ast)
+
+        return ast
+
+    def run_expanded(prototype):
+        original = ljd.ast.builder._build_table_copy
+
+        try:
+            ljd.ast.builder._build_table_copy = _reference_table_copy
+            return run(prototype)
+        finally:
+            ljd.ast.builder._build_table_copy = original
+
+    (baseline, current), outputs = _compare_decompile(
+        options, run_expanded, run)
+
+    _report("templates ({0} files)".format(len(outputs[1])),
+            baseline, current)
+    _report_outputs(outputs)
+
+
+def _make_reference_slots_collector():
+    import ljd.ast.slotworks as slotworks
+
+    # Every reference with a list copy of the path, as before
+    class _ReferenceSlotsCollector(slotworks._SlotsCollector):
+        def __init__(self):
+            super().__init__()
+            self._path = []
+
+        def _register_slot_reference(self, slot, node):
+            info = None
+            if node.type == slotworks.nodes.Identifier.T_UPVALUE:
+                up_len = len(self._states) - 1
+                while up_len > 0:
+                    up_len = up_len - 1
+                    info = self._states[up_len].known_slots.get(slot)
+                    if info:
+                        break
+            else:
+                info = self._state().known_slots.get(slot)
+
+            if info is None:
+                return
+            reference = slotworks._SlotReference()
+            reference.identifier = node
+            reference.path = self._path[:]
+
+            info.references.append(reference)
+
+        def _enter(self, node):
+            if self._skip == node:
+                return False
+
+            self._path.append(node)
+
+            return True
+
+        def _exit(self, node):
+            self._path.pop()
+
+    return _ReferenceSlotsCollector
+
+
+def bench_slots(options):
+    import tracemalloc
+
+    import ljd.ast.builder
+    import ljd.ast.pipeline
+    import ljd.ast.slotworks as slotworks
+    import ljd.ast.traverse as traverse
+
+    # The trees as eliminate_temporary() gets them, the first walk takes
+    # the MULTRES values out
+    before = ljd.ast.pipeline.PassManager(
+        [step for step in ljd.ast.pipeline.PASSES
+         if step.name in ("pre_pass", "mark_locals")])
+
+    asts = []
+
+    for prototype in _parse_prototypes(options):
+        ast = ljd.ast.builder.build(prototype)
+
+        try:
+            before.run(ast)
+            traverse.traverse(slotworks._SlotsCollector(upvalues=True), ast)
+        except Exception:
+            continue
+
+        asts.append(ast)
+
+    reference = _make_reference_slots_collector()
+
+    def collect_all(collector_class):
+        counts = []
+
+        for ast in asts:
+            collector = collector_class()
+            traverse.traverse(collector, ast)
+
+            counts.append(sum(len(info.references)
+                              for info in collector.slots))
+
+        return counts
+
+    # The most memory collecting the slots of one tree takes
+    def peak_memory(collector_class):
+        peak = 0
+
+        for ast in asts:
+            tracemalloc.start()
+
+            try:
+                traverse.traverse(collector_class(), ast)
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+
+        return peak
+
+    baseline, current = _best_of_turns(
+        options.repeat, lambda: collect_all(reference),
+        lambda: collect_all(slotworks._SlotsCollector))
+
+    _report("collect slots ({0} files)".format(len(asts)), baseline, current)
+
+    baseline = peak_memory(reference) / 1024 / 1024
+    current = peak_memory(slotworks._SlotsCollector) / 1024 / 1024
+
+    print("{0:<24} {1:>9.1f}M {2:>9.1f}M {3:>7.2f}x".format(
+        "  peak memory", baseline, current, baseline / current))
+
+
+def bench_dataflow(options):
+    import ljd.ast.builder
+    import ljd.ast.pipeline
+    import ljd.ast.slotworks as slotworks
+
+    before = ljd.ast.pipeline.PassManager(
+        [step for step in ljd.ast.pipeline.PASSES
+         if step.name in ("pre_pass", "mark_locals")])
+
+    manager = ljd.ast.pipeline.PassManager()
+
+    # Building a tree changes the prototype, every run gets a parse of its
+    # own and only the slot elimination is timed
+    def eliminate_all():
+        asts = []
+
+        for prototype in _parse_prototypes(options):
+            ast = ljd.ast.builder.build(prototype)
+
+            try:
+                before.run(ast)
+            except Exception:
+                continue
+
+            asts.append(ast)
+
+        start = time.perf_counter()
+
+        for ast in asts:
+            try:
+                slotworks.eliminate_temporary(ast, upvalues=True)
+            except Exception:
+                pass
+
+        return time.perf_counter() - start
+
+    def run_managed(prototype):
+        ast = ljd.ast.builder.build(prototype)
+        manager.run(ast)
+
+        return ast
+
+    def decompile_all():
+        prototypes = _parse_prototypes(options)
+
+        start = time.perf_counter()
+        outputs = _decompile_all(prototypes, run_managed)
+
+        return time.perf_counter() - start, outputs
+
+    # The count of the slot's reads in the tree, as slotworks had before
+    # it asked the dataflow
+    def tree_single_use(info):
+        return len(info.references) == 2
+
+    original = slotworks._is_single_use
+
+    try:
+        slotworks._is_single_use = tree_single_use
+
+        baseline = min(eliminate_all() for _ in range(options.repeat))
+        baseline_runs = [decompile_all() for _ in range(options.repeat)]
+    finally:
+        slotworks._is_single_use = original
+
+    current = min(eliminate_all() for _ in range(options.repeat))
+    current_runs = [decompile_all() for _ in range(options.repeat)]
+
+    count = len(_parse_prototypes(options))
+
+    _report("eliminate ({0} files)".format(count), baseline, current)
+    _report("decompile ({0} files)".format(count),
+            min(seconds for seconds, _ in baseline_runs),
+            min(seconds for seconds, _ in current_runs))
+
+    changed = sum(old != new for old, new in zip(baseline_runs[0][1],
+                                                 current_runs[0][1]))
+
+    print("  {0} of {1} outputs changed".format(changed, count))
+
+
+class _ScanningBlockList(list):
+    # What the unwarper had before _BlockList, a scan for every lookup
+    pass
+
+
+# A function of 2000 ifs in a row, made with "luajit -b" from
+#   "if a > {i} then x = x + b * {i} end" for every i
+_LARGE_INPUT = os.path.join("test", "large")
+
+
+def bench_unwarp(options):
+    import copy
+    import ljd.ast.builder
+    import ljd.ast.pipeline
+    import ljd.ast.unwarper
+    import ljd.context
+
+    manager = ljd.ast.pipeline.PassManager()
+
+    # Building a tree changes the prototype, every run parses the files
+    # afresh. Counts the seconds in unwarp only.
+    def unwarp_all(options):
+        seconds = 0
+
+        for prototype in _parse_prototypes(options):
+            ctx = ljd.context.DecompileContext(catch_asserts=True)
+            ast = ljd.ast.builder.build(prototype)
+
+            try:
+                manager.run(ast, ctx)
+            except Exception:
+                pass
+
+            seconds += ctx.timings.get("unwarp", 0)
+
+        return seconds
+
+    # The runs take turns, the later ones of a row run slower
+    def compare(name, options):
+        original = ljd.ast.unwarper._BlockList
+        baseline = None
+        current = None
+
+        for _ in range(options.repeat):
+            try:
+                ljd.ast.unwarper._BlockList = _ScanningBlockList
+                seconds = unwarp_all(options)
+            finally:
+                ljd.ast.unwarper._BlockList = original
+
+            if baseline is None or seconds < baseline:
+                baseline = seconds
+
+            seconds = unwarp_all(options)
+
+            if current is None or seconds < current:
+                current = seconds
+
+        _report(name, baseline, current)
+
+    compare("unwarp ({0} files)".format(len(_dump_files(options))), options)
+
+    large = copy.copy(options)
+    large.input = _LARGE_INPUT
+
+    compare("unwarp (2000 ifs)", large)
+
+
+def bench_expressions(options):
+    import copy
+    import ljd.ast.builder
+    import ljd.ast.pipeline
+    import ljd.ast.unwarper
+    import ljd.context
+
+    manager = ljd.ast.pipeline.PassManager()
+    original = ljd.ast.unwarper._clone
+
+    # The seconds in unwarp and in the copies of expressions it makes,
+    # clone copies them
+    def unwarp_all(clone):
+        seconds = [0, 0]
+
+        def timed_clone(node):
+            start = time.perf_counter()
+            node = clone(node)
+            seconds[1] += time.perf_counter() - start
+
+            return node
+
+        ljd.ast.unwarper._clone = timed_clone
+
+        try:
+            for prototype in _parse_prototypes(options):
+                ctx = ljd.context.DecompileContext(catch_asserts=True)
+                ast = ljd.ast.builder.build(prototype)
+
+                try:
+                    manager.run(ast, ctx)
+                except Exception:
+                    pass
+
+                seconds[0] += ctx.timings.get("unwarp", 0)
+        finally:
+            ljd.ast.unwarper._clone = original
+
+        return seconds
+
+    baseline = [unwarp_all(copy.deepcopy) for _ in range(options.repeat)]
+    current = [unwarp_all(original) for _ in range(options.repeat)]
+
+    count = len(_parse_prototypes(options))
+
+    _report("unwarp ({0} files)".format(count),
+            min(seconds[0] for seconds in baseline),
+            min(seconds[0] for seconds in current))
+    _report("expression copies",
+            min(seconds[1] for seconds in baseline),
+            min(seconds[1] for seconds in current))
+
+
+_SUITES = {
+    "dataflow": bench_dataflow,
+    "decode": bench_decode,
+    "edits": bench_edits,
+    "expressions": bench_expressions,
+    "instructions": bench_instructions,
+    "locals": bench_locals,
+    "parse": bench_parse,
+    "passes": bench_passes,
+    "slots": bench_slots,
+    "tables": bench_tables,
+    "traverse": bench_traverse,
+    "unwarp": bench_unwarp,
+    "validate": bench_validate,
+    "writer": bench_writer,
+    "xxtea": bench_xxtea,
+}
+
+
+def main():
+    parser = OptionParser(usage="%prog [options] [suite ...]")
+
+    parser.add_option("-n", "--repeat",
+                      type="int", dest="repeat", default=3,
+                      help="best of N runs")
+
+    parser.add_option("-s", "--size",
+                      type="int", dest="size", default=256,
+                      help="synthetic input size in KiB")
+
+    parser.add_option("-i", "--input",
+                      type="string", dest="input", default="test/enc",
+                      help="directory with compiled lua files", metavar="FOLDER")
+
+    (options, args) = parser.parse_args()
+
+    suites = args or sorted(_SUITES)
+
+    for name in suites:
+        if name not in _SUITES:
+            parser.error("unknown suite: " + name)
+
+    print("{0:<24} {1:>11} {2:>11} {3:>8}".format(
+        "suite", "baseline", "current", "speedup"))
+
+    for name in suites:
+        _SUITES[name](options)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
 #
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
+
+from ljd.context import DecompileContext, DecompileError
+from ljd.decompiler import Result, decompile
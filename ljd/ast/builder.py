@@ -2,11 +2,13 @@
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
 
+import time
+
 import ljd.ast.nodes as nodes
+import ljd.bytecode.dataflow as dataflow
 import ljd.bytecode.instructions as ins
-import ljd.config.version_config
 from ljd.bytecode.constants import T_FALSE, T_NIL, T_TRUE
-from ljd.bytecode.helpers import get_jump_destination
+from ljd.bytecode.helpers import get_jump_destination, set_jump_destination
 
 
 class _State:
@@ -17,6 +19,7 @@ class _State:
         self.blocks = []
         self.block_starts = {}
         self.slot_index = 0
+        self.times = None
 
     def _warp_in_block(self, addr):
         block = self.block_starts[addr]
@@ -24,11 +27,30 @@ class _State:
         return block
 
 
-def build(prototype):
-    return _build_function_definition(prototype, 0)
+# With a times list, every prototype built adds (prototype, node, seconds)
+# to it in source order. The seconds leave out the nested prototypes.
+def build(prototype, times=None):
+    return _build_function_definition(prototype, 0, times)
+
+
+def _build_function_definition(prototype, slot_index, times=None):
+    if times is None:
+        return _build_function_node(prototype, slot_index, None)
+
+    mark = len(times)
+    start = time.perf_counter()
+
+    node = _build_function_node(prototype, slot_index, times)
+
+    seconds = time.perf_counter() - start
+    seconds -= sum(nested[2] for nested in times[mark:])
+
+    times.insert(mark, (prototype, node, seconds))
+
+    return node
 
 
-def _build_function_definition(prototype, slot_index):
+def _build_function_node(prototype, slot_index, times):
     node = nodes.FunctionDefinition()
 
     state = _State()
@@ -36,7 +58,9 @@ def _build_function_definition(prototype, slot_index):
     state.constants = prototype.constants
     state.debuginfo = prototype.debuginfo
     state.slot_index = slot_index
+    state.times = times
     node._upvalues = prototype.constants.upvalue_references
+    node._upvalue_locals = prototype.constants.upvalue_locals
     node._debuginfo = prototype.debuginfo
     node._instructions_count = len(prototype.instructions)
 
@@ -48,6 +72,15 @@ def _build_function_definition(prototype, slot_index):
     instructions = prototype.instructions
     node.statements.contents = _build_function_blocks(state, instructions)
 
+    # The blocks the builder added itself don't start at an address of
+    # their own. The instructions are as the statements' _addr know them,
+    # nothing changes them after the build.
+    block_starts = [block.first_address for block in state.blocks
+                    if state.block_starts.get(block.first_address) is block]
+
+    node._dataflow = dataflow.Dataflow(list(instructions), block_starts,
+                                       prototype.arguments_count)
+
     return node
 
 
@@ -440,8 +473,7 @@ def _build_statement(state, addr, instruction):
     # ASSIGNMENT starting from TGETV and ending at TGETR
 
     elif opcode >= ins.TSETV.opcode and (opcode <= ins.TSETB.opcode
-                                         or (ljd.config.version_config.use_version > 2.0
-                                             and opcode == ins.TSETR.opcode)):
+                                         or opcode == ins.TSETR.opcode):
         return _build_table_assignment(state, addr, instruction)
 
     elif opcode == ins.TSETM.opcode:
@@ -481,8 +513,8 @@ def _build_var_assignment(state, addr, instruction):
     if opcode == ins.MOV.opcode \
             or opcode == ins.NOT.opcode \
             or opcode == ins.UNM.opcode \
-            or (ljd.config.version_config.use_version > 2.0 and opcode == ins.ISTYPE.opcode) \
-            or (ljd.config.version_config.use_version > 2.0 and opcode == ins.ISNUM.opcode) \
+            or opcode == ins.ISTYPE.opcode \
+            or opcode == ins.ISNUM.opcode \
             or opcode == ins.LEN.opcode:
         expression = _build_unary_expression(state, addr, instruction)
 
@@ -521,12 +553,8 @@ def _build_var_assignment(state, addr, instruction):
         expression = _build_global_variable(state, addr, instruction.CD)
 
     else:
-        if ljd.config.version_config.use_version > 2.0:
-            assert opcode <= ins.TGETR.opcode
-            expression = _build_table_element(state, addr, instruction)
-        else:
-            assert opcode <= ins.TGETB.opcode
-            expression = _build_table_element(state, addr, instruction)
+        assert opcode <= ins.TGETR.opcode
+        expression = _build_table_element(state, addr, instruction)
 
     assignment.expressions.contents.append(expression)
 
@@ -791,59 +819,13 @@ def _build_table_element(state, addr, instruction):
 
 def _build_function(state, slot, slotindex):
     prototype = state.constants.complex_constants[slot]
-    return _build_function_definition(prototype, slotindex+1)
+    return _build_function_definition(prototype, slotindex+1, state.times)
 
 
 def _build_table_copy(state, slot):
-    node = nodes.TableConstructor()
-
     table = state.constants.complex_constants[slot]
 
-    i = 0
-
-    for value in table.array:
-        record = nodes.ArrayRecord()
-        record.value = _build_table_record_item(value)
-
-        node.array.contents.append(record)
-
-        i += 1
-
-    for key, value in table.dictionary:
-        record = nodes.TableRecord()
-        record.key = _build_table_record_item(key)
-        record.value = _build_table_record_item(value)
-
-        node.records.contents.append(record)
-
-    return node
-
-
-def _build_table_record_item(value):
-    item = None
-    if value is None:
-        item = nodes.Primitive()
-        item.type = nodes.Primitive.T_NIL
-    elif value is True:
-        item = nodes.Primitive()
-        item.type = nodes.Primitive.T_TRUE
-    elif value is False:
-        item = nodes.Primitive()
-        item.type = nodes.Primitive.T_FALSE
-    elif isinstance(value, int):
-        item = nodes.Constant()
-        item.value = value
-        item.type = nodes.Constant.T_INTEGER
-    elif isinstance(value, float):
-        item = nodes.Constant()
-        item.value = value
-        item.type = nodes.Constant.T_FLOAT
-    elif isinstance(value, str):
-        item = nodes.Constant()
-        item.value = value
-        item.type = nodes.Constant.T_STRING
-
-    return item
+    return nodes.ConstantTable(table)
 
 
 _COMPARISON_MAP = [None] * 255
@@ -910,9 +892,9 @@ def _build_unary_expression(state, addr, instruction):
         operator.type = nodes.UnaryOperator.T_NOT
     elif opcode == ins.UNM.opcode:
         operator.type = nodes.UnaryOperator.T_MINUS
-    elif ljd.config.version_config.use_version > 2.0 and opcode == ins.ISTYPE.opcode:
+    elif opcode == ins.ISTYPE.opcode:
         operator.type = nodes.UnaryOperator.T_TOSTRING
-    elif ljd.config.version_config.use_version > 2.0 and opcode == ins.ISNUM.opcode:
+    elif opcode == ins.ISNUM.opcode:
         operator.type = nodes.UnaryOperator.T_TONUMBER
     else:
         assert opcode == ins.LEN.opcode
@@ -943,6 +925,7 @@ def _build_identifier(state, addr, slot, want_type):
         node.type = want_type
         node.slot_index = -1
         node.slot = state.constants.upvalue_references[slot]
+        setattr(node, "_local", state.constants.upvalue_locals[slot])
     return node
 
 
@@ -1047,17 +1030,23 @@ def _fix_inverted_comparison_expressions(state, instructions):
 
 
 def _fix_broken_repeat_until_loops(state, instructions):
-    enumerated_instructions = enumerate(instructions)
-    for i, instruction in enumerated_instructions:
+    edits = _InstructionEdits(instructions)
+
+    for i, instruction in enumerate(instructions):
 
         if instruction.opcode == ins.LOOP.opcode:
 
             # Check for the conditional jump that restarts the loop
             loop_exit_addr = get_jump_destination(i, instruction)
+
+            # Already fixed for another loop with the same exit
+            if edits.has_inserts(loop_exit_addr):
+                continue
+
             loop_condition_addr = loop_exit_addr - 1
             loop_condition_instruction = instructions[loop_condition_addr]
             if not loop_condition_instruction.opcode == ins.JMP.opcode:
-                if get_jump_destination(loop_condition_addr, loop_condition_instruction) <= i:
+                if edits.destination(loop_condition_addr, loop_condition_instruction) <= (i, 0):
                     continue
 
                 # It's not there, so this is probably a repeat-until true loop.
@@ -1068,21 +1057,19 @@ def _fix_broken_repeat_until_loops(state, instructions):
 
                 # Resulting jump to the loop starting point
                 fixed_jump_instruction = ins.JMP()
-                fixed_jump_instruction.CD = i - loop_condition_addr - 1
 
                 # Add fake conditional instructions
                 insertion_index = loop_condition_addr + 1
-                _insert_instruction(state, instructions,
-                                    insertion_index, fixed_jump_instruction)
-                _insert_instruction(state, instructions,
-                                    insertion_index, fixed_cond_instruction)
-
-                shift = 2
+                edits.insert(insertion_index,
+                             [fixed_cond_instruction, fixed_jump_instruction])
+                edits.retarget(fixed_jump_instruction, instruction)
 
                 # Fix non-break destinations within the loop
                 # Breaks in the empty-condition loop point towards the same exit destination
                 # as non-breaks, so we'll have to search for a pattern of jumps.
 
+                loop_exit = edits.destination(i, instruction)
+
                 leading_jump = False
                 start_index = i + 1
                 for j in range(start_index, insertion_index):
@@ -1094,18 +1081,17 @@ def _fix_broken_repeat_until_loops(state, instructions):
                         # Leading jump indicates this is a break?
                         if not leading_jump:
                             checked_instruction_destination \
-                                = get_jump_destination(j, checked_instruction)
+                                = edits.destination(j, checked_instruction)
 
                             # If the destination would've been moved
-                            if checked_instruction.CD >= shift \
-                                    and checked_instruction_destination == insertion_index + shift:
+                            if checked_instruction_destination == loop_exit:
 
                                 # Check for an inverted jump pair
                                 next_index = j + 1
                                 following_instruction = instructions[next_index]
                                 if following_instruction.opcode == ins.JMP.opcode:
                                     following_destination \
-                                        = get_jump_destination(next_index, following_instruction)
+                                        = edits.destination(next_index, following_instruction)
 
                                     # e.g. goto 277 followed directly by goto 176
                                     if following_destination < checked_instruction_destination:
@@ -1128,11 +1114,10 @@ def _fix_broken_repeat_until_loops(state, instructions):
 
                                         else:
                                             following_destination \
-                                                = get_jump_destination(k, following_instruction)
+                                                = edits.destination(k, following_instruction)
 
                                             # Don't adjust the checked jump, it's probably a break
-                                            if following_instruction.CD >= shift \
-                                                    and following_destination \
+                                            if following_destination \
                                                     == checked_instruction_destination:
                                                 following_else_break_found = True
                                                 break
@@ -1142,118 +1127,243 @@ def _fix_broken_repeat_until_loops(state, instructions):
                                     else:
                                         if prev_jump:
                                             last_destination \
-                                                = get_jump_destination(k - 1, instructions[k - 1])
+                                                = edits.destination(k - 1, instructions[k - 1])
                                             # We can adjust, it's probably not a break
                                             if last_destination < checked_instruction_destination:
                                                 break
                                         prev_jump = False
 
                                 if not following_else_break_found:
-                                    checked_instruction.CD -= shift
+                                    edits.retarget(checked_instruction,
+                                                   fixed_cond_instruction)
                         leading_jump = True
 
                     else:
                         leading_jump = False
 
+    edits.apply(state)
+
 
 def _fix_broken_unary_expressions(state, instructions):
-    enumerated_instructions = enumerate(instructions)
-    for i, instruction in enumerated_instructions:
-        if i > 2 and instruction.opcode == ins.ISTC.opcode \
+    edits = _InstructionEdits(instructions)
+
+    # Addresses are the original ones, removed_count converts them to the
+    # addresses the instructions will have once the edits are applied
+    removed_count = 0
+    i = 0
+    while i < len(instructions):
+        instruction = instructions[i]
+        current_addr = i - removed_count
+
+        if current_addr > 2 and instruction.opcode == ins.ISTC.opcode \
                 and ins.ADDVN.opcode <= instructions[i - 1].opcode <= ins.CAT.opcode:
 
             # Search for a jump that precedes the ISTC op
             leading_jump_found = False
-            for j in range(1, i):
-                if instructions[i - j].opcode == ins.JMP.opcode:
+            leading_addr = i
+            for _ in range(1, current_addr):
+                leading_addr = edits.previous(leading_addr)
+                if instructions[leading_addr].opcode == ins.JMP.opcode:
                     leading_jump_found = True
                     break
-                elif instructions[i - j].opcode not in range(ins.ADDVN.opcode, ins.CAT.opcode):
+                elif instructions[leading_addr].opcode not in range(ins.ADDVN.opcode, ins.CAT.opcode):
                     break
 
+            broken = False
+
             # Make sure the preceding jump matches the destination of the ISTC op
-            instruction_destination = get_jump_destination(
-                i + 1, instructions[i + 1])
-            if instruction_destination == i + 2 and leading_jump_found:
+            instruction_destination = edits.destination(i + 1, instructions[i + 1])
+            if instruction_destination == (i + 2, 0) and leading_jump_found:
+                leading_destination = edits.destination(
+                    leading_addr, instructions[leading_addr])
+
                 # Additional jump edge case of an edge case when expression is in an else body
-                if not instruction_destination == get_jump_destination(i - j, instructions[i - j]):
+                if not instruction_destination == leading_destination:
 
                     if instructions[i + 2].opcode == ins.JMP.opcode:
-                        instruction_destination = get_jump_destination(
+                        instruction_destination = edits.destination(
                             i + 2, instructions[i + 2])
 
-                        if instruction_destination == get_jump_destination(i - j, instructions[i - j]):
-                            instructions[i - 1].A = instruction.A
-
-                            # Remove the broken condition
-                            _remove_instruction(state, instructions, i + 1)
-                            _remove_instruction(state, instructions, i)
+                        if instruction_destination == leading_destination:
+                            broken = True
 
                 else:
-                    instructions[i - 1].A = instruction.A
+                    broken = True
 
-                    # Remove the broken condition
-                    _remove_instruction(state, instructions, i + 1)
-                    _remove_instruction(state, instructions, i)
+            if broken:
+                instructions[i - 1].A = instruction.A
 
+                # Remove the broken condition
+                edits.remove(i)
+                edits.remove(i + 1)
+                removed_count += 2
 
-def _insert_instruction(state, instructions, index, new_instruction):
-    preceding_index = index - 1
-    line_mapping = state.debuginfo.addr_to_line_map[preceding_index]
+                # The instruction after the removed ones is skipped too
+                i += 3
+                continue
 
-    instructions.insert(index, new_instruction)
-    state.debuginfo.addr_to_line_map.insert(index, line_mapping)
+        i += 1
 
-    # Offset
-    shift = 1
+    edits.apply(state)
+
+
+# Instruction inserts and removals in the addresses from before any of them,
+# applied at once by apply(). Jumps are moved the way a list.insert or a
+# list.pop with relocation after every single edit would move them: forward
+# jumps skip inserted instructions and land after removed ones, backward
+# jumps land on inserted instructions and before removed ones.
+class _InstructionEdits:
+    def __init__(self, instructions):
+        self.instructions = instructions
+        self.inserts = {}
+        self.removed = set()
+        self.targets = {}
+        self._inserted_keys = {}
+        self._addresses = None
+
+    def has_inserts(self, addr):
+        return addr in self.inserts
+
+    # new_instructions go right before the instruction at addr
+    def insert(self, addr, new_instructions):
+        inserted = self.inserts.setdefault(addr, [])
+
+        for instruction in new_instructions:
+            self._inserted_keys[instruction] = (addr, -1, len(inserted))
+            inserted.append(instruction)
+
+    def remove(self, addr):
+        self.removed.add(addr)
+
+    # Points the jump at an original or inserted instruction
+    def retarget(self, jump, target):
+        key = self._inserted_keys.get(target)
+
+        if key is None:
+            if self._addresses is None:
+                self._addresses = {instruction: addr for addr, instruction
+                                   in enumerate(self.instructions)}
+
+            key = (self._addresses[target], 0)
+
+        self.targets[jump] = key
+
+    # Closest preceding address that isn't removed
+    def previous(self, addr):
+        addr -= 1
+
+        while addr in self.removed:
+            addr -= 1
+
+        return addr
+
+    # Sortable key of the instruction the jump at addr lands on: (addr, 0)
+    # for original instructions, (addr, -1, n) for the n-th one inserted
+    # before addr
+    def destination(self, addr, instruction):
+        key = self.targets.get(instruction)
+
+        if key is not None:
+            return key
+
+        destination = get_jump_destination(addr, instruction)
+
+        if instruction.CD >= 0:
+            while destination in self.removed:
+                destination += 1
+
+            return destination, 0
+
+        if destination in self.inserts:
+            return destination, -1, 0
+
+        while destination in self.removed:
+            inserted = self.inserts.get(destination)
+
+            if inserted:
+                return destination, -1, len(inserted) - 1
+
+            destination -= 1
+
+        return destination, 0
+
+    def apply(self, state):
+        if not self.inserts and not self.removed:
+            return
+
+        instructions = self.instructions
+        line_map = state.debuginfo.addr_to_line_map
+        count = len(instructions)
+
+        new_instructions = []
+        new_line_map = []
+
+        # New addresses of the first instruction inserted before every
+        # original address and of the original instruction itself (of the
+        # next one if it is removed)
+        insert_addrs = []
+        own_addrs = []
+
+        for addr in range(count + 1):
+            insert_addrs.append(len(new_instructions))
+
+            for instruction in self.inserts.get(addr, ()):
+                new_instructions.append(instruction)
 
-    # Update warp destinations with regards to the inserted instruction
-    _shift_warp_destinations(state, instructions, shift, index)
+                # Inserted instructions take the line of the preceding one
+                if line_map:
+                    new_line_map.append(new_line_map[-1] if new_line_map else 0)
 
-    # Update variable info ranges
-    _shift_debug_variable_info(state, shift, index)
+            own_addrs.append(len(new_instructions))
 
+            if addr < count and addr not in self.removed:
+                new_instructions.append(instructions[addr])
 
-def _remove_instruction(state, instructions, index):
-    removed_instruction = instructions.pop(index)
-    state.debuginfo.addr_to_line_map.pop(index)
+                if line_map:
+                    new_line_map.append(line_map[addr])
 
-    # Offset
-    shift = -1
+        def new_addr(key):
+            if len(key) == 3:
+                return insert_addrs[key[0]] + key[2]
+            elif key[0] > count:
+                return own_addrs[count] + key[0] - count
+            else:
+                return own_addrs[key[0]]
 
-    # Update warp destinations with regards to the removed instruction
-    _shift_warp_destinations(state, instructions, shift, index)
+        for addr, instruction in enumerate(instructions):
+            if addr in self.removed or instruction.opcode not in _WARP_INSTRUCTIONS:
+                continue
 
-    # Update variable info ranges
-    _shift_debug_variable_info(state, shift, index)
+            destination = new_addr(self.destination(addr, instruction))
+            set_jump_destination(own_addrs[addr], instruction, destination)
 
-    return removed_instruction
+        for jump, key in self.targets.items():
+            jump_key = self._inserted_keys.get(jump)
 
+            if jump_key is not None:
+                set_jump_destination(new_addr(jump_key), jump, new_addr(key))
 
-def _shift_warp_destinations(state, instructions, shift, modified_index):
-    for current_index, moved_instruction in enumerate(instructions):
-        opcode = moved_instruction.opcode
+        # A range that starts or ends on a removed instruction does so on
+        # the next one that stays, past the inserts before it
+        def kept_addr(addr):
+            while addr in self.removed:
+                addr += 1
 
-        if opcode in _WARP_INSTRUCTIONS:
-            if current_index < modified_index and moved_instruction.CD >= 0:
-                destination = get_jump_destination(
-                    current_index, moved_instruction)
-                if destination > modified_index or (destination == modified_index and shift > 0):
-                    moved_instruction.CD += shift
+            return new_addr((addr, 0))
 
-            elif current_index >= modified_index and moved_instruction.CD < 0:
-                destination = current_index + moved_instruction.CD - shift + 1
-                if destination < modified_index or (destination == modified_index and shift > 0):
-                    moved_instruction.CD -= shift
+        for variable_info in state.debuginfo.variable_info:
+            variable_info.start_addr = kept_addr(variable_info.start_addr)
+            variable_info.end_addr = kept_addr(variable_info.end_addr)
 
+        state.debuginfo.reset_local_names()
 
-def _shift_debug_variable_info(state, shift, modified_index):
-    for variable_info in state.debuginfo.variable_info:
+        instructions[:] = new_instructions
 
-        if variable_info.end_addr > modified_index \
-                or (shift > 0 and variable_info.end_addr == modified_index):
-            variable_info.end_addr += shift
+        if line_map:
+            line_map[:] = new_line_map
 
-        if variable_info.start_addr > modified_index \
-                or (shift > 0 and variable_info.start_addr == modified_index):
-            variable_info.start_addr += shift
+        self.inserts = {}
+        self.removed = set()
+        self.targets = {}
+        self._inserted_keys = {}
+        self._addresses = None
@@ -2,8 +2,9 @@ import ljd.ast.nodes as nodes
 import ljd.ast.traverse as traverse
 
 
+# Only integer keys change the array, a ConstantTable keeps its template
+# raw for the rest
 def insert_table_record(constructor, key, value):
-    array = constructor.array.contents
     records = constructor.records.contents
 
     if isinstance(key, nodes.MULTRES):
@@ -18,6 +19,11 @@ def insert_table_record(constructor, key, value):
             and key.value >= 0:
         index = key.value
 
+        if isinstance(constructor, nodes.ConstantTable):
+            constructor.expand()
+
+        array = constructor.array.contents
+
         if index == 1 and len(array) == 0:
             record = nodes.ArrayRecord()
             record.value = nodes.Primitive()
@@ -54,26 +60,22 @@ def insert_table_record(constructor, key, value):
         records.append(record)
 
 
-def has_same_table(node, table):
-    class Checker(traverse.Visitor):
-        def __init__(self, checker_table):
-            super().__init__()
-            self.found = False
-            self.table = checker_table
+class _TableChecker(traverse.Visitor):
+    def __init__(self, checker_table):
+        super().__init__()
+        self.found = False
+        self.table = checker_table
 
-        def visit_table_element(self, checked_node):
-            if is_equal(self.table, checked_node):
-                self.found = True
+    def visit_table_element(self, checked_node):
+        if is_equal(self.table, checked_node):
+            self.found = True
 
-        def _visit(self, checked_node):
-            if not self.found:
-                traverse.Visitor._visit(self, checked_node)
+    def _enter(self, checked_node):
+        return not self.found
 
-        def _visit_list(self, nodes_list):
-            if not self.found:
-                traverse.Visitor._visit_list(self, nodes_list)
 
-    checker = Checker(table)
+def has_same_table(node, table):
+    checker = _TableChecker(table)
     traverse.traverse(checker, node)
 
     return checker.found
@@ -9,14 +9,14 @@ import ljd.bytecode.debuginfo as debuginfo
 
 
 def mark_locals(ast):
-    traverse.traverse(_LocalsMarker(), ast)
+    traverse.traverse(LocalsMarker(), ast)
 
 
 def mark_local_definitions(ast):
-    traverse.traverse(_LocalDefinitionsMarker(), ast)
+    traverse.traverse(LocalDefinitionsMarker(), ast)
 
 
-class _LocalsMarker(traverse.Visitor):
+class LocalsMarker(traverse.Visitor):
     class _State:
         def __init__(self):
             self.pending_slots = {}
@@ -30,7 +30,7 @@ class _LocalsMarker(traverse.Visitor):
     # ##
 
     def _push_state(self):
-        self._states.append(_LocalsMarker._State())
+        self._states.append(LocalsMarker._State())
 
     def _pop_state(self):
         self._states.pop()
@@ -128,7 +128,7 @@ class _LocalsMarker(traverse.Visitor):
         traverse.Visitor._visit_node(self, handler, node)
 
 
-class _LocalDefinitionsMarker(traverse.Visitor):
+class LocalDefinitionsMarker(traverse.Visitor):
     class _State:
         def __init__(self):
             self.known_locals = [None] * 255
@@ -139,7 +139,7 @@ class _LocalDefinitionsMarker(traverse.Visitor):
         self._states = []
 
     def _push_state(self):
-        self._states.append(_LocalDefinitionsMarker._State())
+        self._states.append(LocalDefinitionsMarker._State())
 
     def _pop_state(self):
         self._states.pop()
@@ -222,10 +222,10 @@ class _LocalDefinitionsMarker(traverse.Visitor):
         if not known_slot:
             node.type = nodes.Assignment.T_LOCAL_DEFINITION
 
-    def _visit(self, node):
+    def _enter(self, node):
         node_addr = getattr(node, "_addr", -1)
 
         if node_addr >= 0:
             self._state().addr = node_addr
 
-        traverse.Visitor._visit(self, node)
+        return True
@@ -4,82 +4,107 @@
 
 
 # We should visit stuff in it's execution order. That's important
+#
+# ljd.ast.traverse walks the _children of a node in the listed order,
+# the names in _child_lists hold plain lists of nodes. A node with an
+# _admit method is skipped whenever it returns False
 
 
 class FunctionDefinition:
+    _handlers = ("visit_function_definition", "leave_function_definition")
+    _children = ("arguments", "statements")
+
     def __init__(self):
         self.arguments = IdentifiersList()
         self.statements = StatementsList()
 
         self._upvalues = None
+        self._upvalue_locals = None
         self._debuginfo = None
         self._instructions_count = 0
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_function_definition, self)
-
-        visitor._visit(self.arguments)
-        visitor._visit(self.statements)
-
-        visitor._leave_node(visitor.leave_function_definition, self)
+        # ljd.bytecode.dataflow.Dataflow of the prototype
+        self._dataflow = None
 
 
 class TableConstructor:
-    anti_loop = set()
-    cur_visitor = None
+    _handlers = ("visit_table_constructor", "leave_table_constructor")
+    _children = ("array", "records")
 
     def __init__(self):
         self.array = RecordsList()
         self.records = RecordsList()
 
-    def _accept(self, visitor):
-        if TableConstructor.cur_visitor is not None:
-            if TableConstructor.cur_visitor != visitor:
-                TableConstructor.cur_visitor = visitor
-                TableConstructor.anti_loop.clear()
-        else:
-            TableConstructor.cur_visitor = visitor
+    # A walk goes into every table once, records inserted into it may
+    # have made the tree cyclic
+    def _admit(self, visitor):
+        if self in visitor._admitted:
+            return False
 
-        if self in TableConstructor.anti_loop:
-            return
+        visitor._admitted.add(self)
 
-        TableConstructor.anti_loop.add(self)
+        return True
 
-        visitor._visit_node(visitor.visit_table_constructor, self)
 
-        visitor._visit(self.array)
-        visitor._visit(self.records)
+class ArrayRecord:
+    _handlers = ("visit_array_record", "leave_array_record")
+    _children = ("value",)
+
+    def __init__(self):
+        self.value = None
 
-        visitor._leave_node(visitor.leave_table_constructor, self)
 
+class TableRecord:
+    _handlers = ("visit_table_record", "leave_table_record")
+    _children = ("key", "value")
 
-class ArrayRecord:
     def __init__(self):
+        self.key = None
         self.value = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_array_record, self)
 
-        visitor._visit(self.value)
+# A table built from a TDUP template. The template constants stay raw in
+# template, an ljd.bytecode.constants.Table, records only holds what was
+# added after them and array nothing. Code that changes the array of the
+# table calls expand() first, which puts the template in array and in
+# front of records as nodes and sets template to None.
+class ConstantTable(TableConstructor):
+    def __init__(self, template):
+        super().__init__()
+        self.template = template
 
-        visitor._leave_node(visitor.leave_array_record, self)
+    def expand(self):
+        if self.template is None:
+            return
 
+        array = self.array.contents
 
-class TableRecord:
-    def __init__(self):
-        self.key = None
-        self.value = None
+        assert len(array) == 0
+
+        for value in self.template.array:
+            record = ArrayRecord()
+            record.value = _make_template_item(value)
+
+            array.append(record)
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_table_record, self)
+        records = []
 
-        visitor._visit(self.key)
-        visitor._visit(self.value)
+        for key, value in self.template.dictionary:
+            record = TableRecord()
+            record.key = _make_template_item(key)
+            record.value = _make_template_item(value)
 
-        visitor._leave_node(visitor.leave_table_record, self)
+            records.append(record)
+
+        # Whoever holds the records list already keeps seeing all of them
+        self.records.contents[:0] = records
+        self.template = None
 
 
 class Assignment:
+    _handlers = ("visit_assignment", "leave_assignment")
+    _children = ("expressions", "destinations")
+
     T_LOCAL_DEFINITION = 0
     T_NORMAL = 1
 
@@ -88,14 +113,6 @@ class Assignment:
         self.destinations = VariablesList()
         self.type = -1
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_assignment, self)
-
-        visitor._visit(self.expressions)
-        visitor._visit(self.destinations)
-
-        visitor._leave_node(visitor.leave_assignment, self)
-
     def __str__(self):
         return "{ Assignment: { destinations: " + str(self.destinations) + ", expressions: " + \
                str(self.expressions) + ", type: " + \
@@ -106,6 +123,9 @@ class Assignment:
 
 
 class BinaryOperator:
+    _handlers = ("visit_binary_operator", "leave_binary_operator")
+    _children = ("left", "right")
+
     T_LOGICAL_OR = 0  # left or right
     T_LOGICAL_AND = 10  # left and right
 
@@ -133,100 +153,72 @@ class BinaryOperator:
         self.left = None
         self.right = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_binary_operator, self)
-
-        visitor._visit(self.left)
-        visitor._visit(self.right)
-
-        visitor._leave_node(visitor.leave_binary_operator, self)
-
 
 class UnaryOperator:
-    import ljd.config.version_config
+    _handlers = ("visit_unary_operator", "leave_unary_operator")
+    _children = ("operand",)
 
     T_NOT = 60  # not operand
     T_LENGTH_OPERATOR = 61  # #operand
     T_MINUS = 62  # -operand
 
-    if ljd.config.version_config.use_version > 2.0:
-        T_TOSTRING = 63  # tostring()
-        T_TONUMBER = 64  # tonumber()
+    T_TOSTRING = 63  # tostring()
+    T_TONUMBER = 64  # tonumber()
 
     def __init__(self):
         self.type = -1
         self.operand = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_unary_operator, self)
-
-        visitor._visit(self.operand)
-
-        visitor._leave_node(visitor.leave_unary_operator, self)
-
 
 class StatementsList:
+    _handlers = ("visit_statements_list", "leave_statements_list")
+    _children = ("contents",)
+    _child_lists = ("contents",)
+
     def __init__(self):
         self.contents = []
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_statements_list, self)
-
-        visitor._visit_list(self.contents)
-
-        visitor._leave_node(visitor.leave_statements_list, self)
-
 
 class IdentifiersList:
+    _handlers = ("visit_identifiers_list", "leave_identifiers_list")
+    _children = ("contents",)
+    _child_lists = ("contents",)
+
     def __init__(self):
         self.contents = []
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_identifiers_list, self)
-
-        visitor._visit_list(self.contents)
-
-        visitor._leave_node(visitor.leave_identifiers_list, self)
-
 
 class RecordsList:
+    _handlers = ("visit_records_list", "leave_records_list")
+    _children = ("contents",)
+    _child_lists = ("contents",)
+
     def __init__(self):
         self.contents = []
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_records_list, self)
-
-        visitor._visit_list(self.contents)
-
-        visitor._leave_node(visitor.leave_records_list, self)
-
 
 class VariablesList:
+    _handlers = ("visit_variables_list", "leave_variables_list")
+    _children = ("contents",)
+    _child_lists = ("contents",)
+
     def __init__(self):
         self.contents = []
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_variables_list, self)
-
-        visitor._visit_list(self.contents)
-
-        visitor._leave_node(visitor.leave_variables_list, self)
-
 
 class ExpressionsList:
+    _handlers = ("visit_expressions_list", "leave_expressions_list")
+    _children = ("contents",)
+    _child_lists = ("contents",)
+
     def __init__(self):
         self.contents = []
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_expressions_list, self)
-
-        visitor._visit_list(self.contents)
-
-        visitor._leave_node(visitor.leave_expressions_list, self)
-
 
 # Called Name in the Lua 5.1 reference
 class Identifier:
+    _handlers = ("visit_identifier", "leave_identifier")
+
     T_SLOT = 0
     T_LOCAL = 1
     T_UPVALUE = 2
@@ -239,10 +231,6 @@ class Identifier:
         self.slot_index = 0
         self._varinfo = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_identifier, self)
-        visitor._leave_node(visitor.leave_identifier, self)
-
     def __str__(self):
         return "{ Identifier: {name: " + str(self.name) + ", type: " + ["T_SLOT", "T_LOCAL", "T_UPVALUE", "T_BUILTIN"][
             self.type] + \
@@ -252,24 +240,17 @@ class Identifier:
 # helper vararg/varreturn
 
 class MULTRES:
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_multres, self)
-        visitor._leave_node(visitor.leave_multres, self)
+    _handlers = ("visit_multres", "leave_multres")
 
 
 class TableElement:
+    _handlers = ("visit_table_element", "leave_table_element")
+    _children = ("key", "table")
+
     def __init__(self):
         self.table = None
         self.key = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_table_element, self)
-
-        visitor._visit(self.key)
-        visitor._visit(self.table)
-
-        visitor._leave_node(visitor.leave_table_element, self)
-
     def __str__(self):
         return str(self.table) + "[" + str(self.key) + "]"
 
@@ -278,66 +259,50 @@ class TableElement:
 
 
 class Vararg:
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_vararg, self)
-        visitor._leave_node(visitor.leave_vararg, self)
+    _handlers = ("visit_vararg", "leave_vararg")
 
 
 class FunctionCall:
+    _handlers = ("visit_function_call", "leave_function_call")
+    _children = ("arguments", "function")
+
     def __init__(self):
         self.function = None
         self.arguments = ExpressionsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_function_call, self)
-
-        visitor._visit(self.arguments)
-        visitor._visit(self.function)
-
-        visitor._leave_node(visitor.leave_function_call, self)
-
     def __str__(self):
         return "{FunctionCall: { function: " + str(self.function) + ", arguments: " + str(self.arguments) + "} }"
 
 
 class If:
+    _handlers = ("visit_if", "leave_if")
+    _children = ("expression", "then_block", "elseifs", "else_block")
+    _child_lists = ("elseifs",)
+
     def __init__(self):
         self.expression = None
         self.then_block = StatementsList()
         self.elseifs = []
         self.else_block = StatementsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_if, self)
-
-        visitor._visit(self.expression)
-        visitor._visit(self.then_block)
-
-        visitor._visit_list(self.elseifs)
-
-        visitor._visit(self.else_block)
-
-        visitor._leave_node(visitor.leave_if, self)
-
 
 class ElseIf:
+    _handlers = ("visit_elseif", "leave_elseif")
+    _children = ("expression", "then_block")
+
     def __init__(self):
         self.expression = None
         self.then_block = StatementsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_elseif, self)
-
-        visitor._visit(self.expression)
-        visitor._visit(self.then_block)
-
-        visitor._leave_node(visitor.leave_elseif, self)
-
 
 # ##
 
 
 class Block:
+    _handlers = ("visit_block", "leave_block")
+    _children = ("contents", "warp")
+    _child_lists = ("contents",)
+
     def __init__(self):
         self.index = -1
         self.warp = None
@@ -346,14 +311,6 @@ class Block:
         self.last_address = 0
         self.warpins_count = 0
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_block, self)
-
-        visitor._visit_list(self.contents)
-        visitor._visit(self.warp)
-
-        visitor._leave_node(visitor.leave_block, self)
-
     def __str__(self):
         return "{Block: {index: " + str(self.index) + ", warp: " + str(self.warp) + ", contents: " + \
                str(self.contents) + \
@@ -362,6 +319,9 @@ class Block:
 
 
 class UnconditionalWarp:
+    _handlers = ("visit_unconditional_warp", "leave_unconditional_warp")
+    # DO NOT VISIT self.target - warps are not part of the tree
+
     T_JUMP = 0
     T_FLOW = 1
 
@@ -370,13 +330,6 @@ class UnconditionalWarp:
         self.target = None
         self.is_uclo = False
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_unconditional_warp, self)
-
-        # DO NOT VISIT self.target - warps are not part of the tree
-
-        visitor._leave_node(visitor.leave_unconditional_warp, self)
-
     def __str__(self):
         return "{UnconditionalWarp: {type: " + ["T_JUMP", "T_FLOW"][self.type] + ", target: " + str(
             self.target) + ", is_uclo: " + \
@@ -384,65 +337,49 @@ class UnconditionalWarp:
 
 
 class ConditionalWarp:
+    _handlers = ("visit_conditional_warp", "leave_conditional_warp")
+    _children = ("condition",)
+    # DO NOT VISIT self.true_target - warps are not part of the tree
+    # DO NOT VISIT self.false_target - warps are not part of the tree
+
     def __init__(self):
         self.condition = None
         self.true_target = None
         self.false_target = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_conditional_warp, self)
-
-        visitor._visit(self.condition)
-        # DO NOT VISIT self.true_target - warps are not part of the tree
-        # DO NOT VISIT self.false_target - warps are not part of the tree
-
-        visitor._leave_node(visitor.leave_conditional_warp, self)
-
     def __str__(self):
         return "{ConditionalWarp: { condition: " + str(self.condition) + ", true_target: " + str(self.true_target) + \
                ", false_target: " + str(self.false_target) + "} }"
 
 
 class IteratorWarp:
+    _handlers = ("visit_iterator_warp", "leave_iterator_warp")
+    _children = ("variables", "controls")
+    # DO NOT VISIT self.body - warps are not part of the tree
+    # DO NOT VISIT self.way_out - warps are not part of the tree
+
     def __init__(self):
         self.variables = VariablesList()
         self.controls = ExpressionsList()
         self.body = None
         self.way_out = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_iterator_warp, self)
-
-        visitor._visit(self.variables)
-        visitor._visit(self.controls)
-        # DO NOT VISIT self.body - warps are not part of the tree
-        # DO NOT VISIT self.way_out - warps are not part of the tree
-
-        visitor._leave_node(visitor.leave_iterator_warp, self)
-
 
 class NumericLoopWarp:
+    _handlers = ("visit_numeric_loop_warp", "leave_numeric_loop_warp")
+    _children = ("index", "controls")
+    # DO NOT VISIT self.body - warps are not part of the tree
+    # DO NOT VISIT self.way_out - warps are not part of the tree
+
     def __init__(self):
         self.index = Identifier()
         self.controls = ExpressionsList()
         self.body = None
         self.way_out = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_numeric_loop_warp, self)
-
-        visitor._visit(self.index)
-        visitor._visit(self.controls)
-        # DO NOT VISIT self.body - warps are not part of the tree
-        # DO NOT VISIT self.way_out - warps are not part of the tree
-
-        visitor._leave_node(visitor.leave_numeric_loop_warp, self)
-
 
 class EndWarp:
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_end_warp, self)
-        visitor._leave_node(visitor.leave_end_warp, self)
+    _handlers = ("visit_end_warp", "leave_end_warp")
 
     def __str__(self):
         return "EndWarp"
@@ -452,84 +389,58 @@ class EndWarp:
 
 
 class Return:
+    _handlers = ("visit_return", "leave_return")
+    _children = ("returns",)
+
     def __init__(self):
         self.returns = ExpressionsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_return, self)
-
-        visitor._visit(self.returns)
-
-        visitor._leave_node(visitor.leave_return, self)
-
 
 class Break:
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_break, self)
-        visitor._leave_node(visitor.leave_break, self)
+    _handlers = ("visit_break", "leave_break")
 
 
 class While:
+    _handlers = ("visit_while", "leave_while")
+    _children = ("expression", "statements")
+
     def __init__(self):
         self.expression = None
         self.statements = StatementsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_while, self)
-
-        visitor._visit(self.expression)
-        visitor._visit(self.statements)
-
-        visitor._leave_node(visitor.leave_while, self)
-
 
 class RepeatUntil:
+    _handlers = ("visit_repeat_until", "leave_repeat_until")
+    _children = ("statements", "expression")
+
     def __init__(self):
         self.expression = None
         self.statements = StatementsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_repeat_until, self)
-
-        visitor._visit(self.statements)
-        visitor._visit(self.expression)
-
-        visitor._leave_node(visitor.leave_repeat_until, self)
-
 
 class NumericFor:
+    _handlers = ("visit_numeric_for", "leave_numeric_for")
+    _children = ("variable", "expressions", "statements")
+
     def __init__(self):
         self.variable = None
         self.expressions = ExpressionsList()
         self.statements = StatementsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_numeric_for, self)
-
-        visitor._visit(self.variable)
-        visitor._visit(self.expressions)
-        visitor._visit(self.statements)
-
-        visitor._leave_node(visitor.leave_numeric_for, self)
-
 
 class IteratorFor:
+    _handlers = ("visit_iterator_for", "leave_iterator_for")
+    _children = ("expressions", "identifiers", "statements")
+
     def __init__(self):
         self.expressions = ExpressionsList()
         self.identifiers = VariablesList()
         self.statements = StatementsList()
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_iterator_for, self)
-
-        visitor._visit(self.expressions)
-        visitor._visit(self.identifiers)
-        visitor._visit(self.statements)
-
-        visitor._leave_node(visitor.leave_iterator_for, self)
-
 
 class Constant:
+    _handlers = ("visit_constant", "leave_constant")
+
     T_INTEGER = 0
     T_FLOAT = 1
     T_STRING = 2
@@ -539,15 +450,13 @@ class Constant:
         self.type = -1
         self.value = None
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_constant, self)
-        visitor._leave_node(visitor.leave_constant, self)
-
     def __str__(self):
         return str(self.value)
 
 
 class Primitive:
+    _handlers = ("visit_primitive", "leave_primitive")
+
     T_NIL = 0
     T_TRUE = 1
     T_FALSE = 2
@@ -555,17 +464,38 @@ class Primitive:
     def __init__(self):
         self.type = -1
 
-    def _accept(self, visitor):
-        visitor._visit_node(visitor.visit_primitive, self)
-        visitor._leave_node(visitor.leave_primitive, self)
-
     def __str__(self):
         return ["nil", "True", "False"][self.type]
 
 
 class NoOp:
+    # Neither handlers nor the _visit_node/_leave_node hooks see it
+    _handlers = None
+
     def __init__(self):
         pass
 
-    def _accept(self, visitor):
-        pass
+
+def _make_template_item(value):
+    if value is None:
+        item = Primitive()
+        item.type = Primitive.T_NIL
+    elif value is True:
+        item = Primitive()
+        item.type = Primitive.T_TRUE
+    elif value is False:
+        item = Primitive()
+        item.type = Primitive.T_FALSE
+    else:
+        item = Constant()
+        item.value = value
+
+        if isinstance(value, int):
+            item.type = Constant.T_INTEGER
+        elif isinstance(value, float):
+            item.type = Constant.T_FLOAT
+        else:
+            assert isinstance(value, str)
+            item.type = Constant.T_STRING
+
+    return item
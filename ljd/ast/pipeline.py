@@ -0,0 +1,216 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import functools
+import time
+
+import ljd.ast.locals as locals_
+import ljd.ast.mutator as mutator
+import ljd.ast.slotworks as slotworks
+import ljd.ast.traverse as traverse
+import ljd.ast.unwarper as unwarper
+import ljd.ast.validator as validator
+import ljd.context
+
+
+# A step of the decompilation of a built tree: either a function run over
+# the whole tree with the ljd.context.DecompileContext of the run or a walk
+# with a fresh visitor from the visitor factory.
+#
+# needs - the states of the tree the pass expects: "warped" holds until
+#   unwarp turns blocks and warps into statements, "unwarped" after it,
+#   "locals" once slots got their names from the debug info
+# provides, removes - the states it brings in and ends
+# reads, writes - the parts of the tree a visitor pass looks at and
+#   changes: "blocks", "warps", "statements", "expressions", "identifiers"
+# pre_order - a visitor pass is done with a node once the node's visit
+#   handler returns and never touches anything above the node
+# catch - with ctx.catch_asserts, a failure of the pass goes to ctx.errors
+#   as a failure of this and decompilation goes on
+# check - the pass only checks the tree and may be left out
+#
+# A visitor pass joins the walk of the visitor passes before it when they
+# are all pre_order and it writes nothing they read, every node then looks
+# to each of them the way it would in a walk of its own.
+class Pass:
+    def __init__(self, name, run=None, visitor=None,
+                 needs=(), provides=(), removes=(),
+                 reads=(), writes=(), pre_order=False, catch=None,
+                 check=False):
+        assert (run is None) != (visitor is None)
+
+        self.name = name
+        self.visitor = visitor
+        self.needs = frozenset(needs)
+        self.provides = frozenset(provides)
+        self.removes = frozenset(removes)
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self.pre_order = pre_order
+        self.catch = catch
+        self.check = check
+
+        if run is not None:
+            self.run = run
+
+    def run(self, ast, ctx):
+        traverse.traverse(self.visitor(), ast)
+
+
+# The slot walk binds the upvalues on its way, so a failure caught here may
+# leave some of them unbound. They get a walk of their own then, outside
+# the catch: binding the upvalues fails decompilation even with
+# ctx.catch_asserts, as when it was a pass of its own.
+def _eliminate_temporary(ast, ctx):
+    try:
+        slotworks.eliminate_temporary(ast, ctx, upvalues=True)
+        return
+    except Exception:
+        if not ctx.catch_asserts:
+            raise
+
+        ctx.add_error("-- Decompilation Error: "
+                      "self.ljd.ast.slotworks.eliminate_temporary(self.ast)\n")
+
+    slotworks.bind_upvalues(ast)
+
+
+_ALL = ("blocks", "warps", "statements", "expressions", "identifiers")
+
+PASSES = (
+    Pass("validate_warped",
+         visitor=functools.partial(validator.Visitor, warped=True),
+         needs=("warped",),
+         reads=_ALL,
+         pre_order=True,
+         check=True),
+
+    Pass("pre_pass",
+         visitor=mutator.SimpleLoopWarpSwapper,
+         needs=("warped",),
+         reads=("blocks", "warps"),
+         writes=("blocks", "warps"),
+         pre_order=True),
+
+    Pass("mark_locals",
+         visitor=locals_.LocalsMarker,
+         needs=("warped",),
+         provides=("locals",),
+         reads=("statements", "identifiers"),
+         writes=("identifiers",)),
+
+    Pass("eliminate_temporary",
+         run=_eliminate_temporary,
+         needs=("warped", "locals")),
+
+    Pass("unwarp",
+         run=unwarper.unwarp,
+         needs=("warped",),
+         provides=("unwarped",),
+         removes=("warped",)),
+
+    Pass("mark_local_definitions",
+         visitor=locals_.LocalDefinitionsMarker,
+         needs=("unwarped", "locals"),
+         reads=("statements", "identifiers"),
+         writes=("statements",),
+         pre_order=True),
+
+    Pass("primary_pass",
+         visitor=mutator.MutatorVisitor,
+         needs=("unwarped",),
+         reads=_ALL,
+         writes=("statements", "expressions")),
+
+    Pass("validate",
+         visitor=functools.partial(validator.Visitor, warped=False),
+         needs=("unwarped",),
+         reads=_ALL,
+         pre_order=True,
+         catch="self.ljd.ast.validator.validate(self.ast, warped=False)",
+         check=True),
+)
+
+
+# Runs the passes over built trees, fusing what can share a walk. Keeps
+# nothing of a run, so one manager may serve several at once.
+# run() adds the seconds spent in each pass to ctx.timings as it goes, so a
+# failed run still shows where it stopped, and so does ctx.stage. Fused
+# passes are timed together under their names joined with "+". Without
+# ctx.checks the check passes are left out.
+class PassManager:
+    def __init__(self, passes=PASSES, initial=("warped",)):
+        self.groups = []
+
+        state = set(initial)
+
+        for step in passes:
+            assert step.needs <= state, \
+                "{0} needs {1}".format(step.name, step.needs - state)
+
+            state -= step.removes
+            state |= step.provides
+
+            if self.groups and _can_join(self.groups[-1], step):
+                self.groups[-1].append(step)
+            else:
+                self.groups.append([step])
+
+        self.names = ["+".join(step.name for step in group)
+                      for group in self.groups]
+
+    def run(self, ast, ctx=None):
+        if ctx is None:
+            ctx = ljd.context.DecompileContext()
+
+        timings = ctx.timings
+
+        for name, group in zip(self.names, self.groups):
+            if not ctx.checks:
+                group = [step for step in group if not step.check]
+
+                if not group:
+                    continue
+
+            ctx.stage = name
+            start = time.perf_counter()
+
+            try:
+                if len(group) == 1:
+                    self._run_pass(group[0], ast, ctx)
+                else:
+                    visitors = [step.visitor() for step in group]
+                    traverse.traverse(traverse.FusedVisitor(visitors), ast)
+            finally:
+                timings[name] = time.perf_counter() - start
+
+        return timings
+
+    def _run_pass(self, step, ast, ctx):
+        if step.catch is None:
+            step.run(ast, ctx)
+            return
+
+        try:
+            step.run(ast, ctx)
+        except:
+            if ctx.catch_asserts:
+                ctx.add_error(
+                    "-- Decompilation Error: {0}\n".format(step.catch))
+            else:
+                raise
+
+
+def _can_join(group, step):
+    if step.visitor is None or step.catch is not None:
+        return False
+
+    for previous in group:
+        if previous.visitor is None or previous.catch is not None:
+            return False
+
+        if not previous.pre_order or previous.reads & step.writes:
+            return False
+
+    return True
@@ -4,25 +4,33 @@
 
 import ljd.ast.nodes as nodes
 import ljd.ast.traverse as traverse
+import ljd.context
 from ljd.ast.helpers import insert_table_record
 
-catch_asserts = False
 
+# With upvalues the walk that collects the slots also gives every upvalue
+# the slot_index of what it refers to, a run over a whole tree wants that
+def eliminate_temporary(ast, ctx=None, upvalues=False):
+    if ctx is None:
+        ctx = ljd.context.DecompileContext()
 
-def eliminate_temporary(ast):
-    _eliminate_multres(ast)
+    collector = _SlotsCollector(upvalues)
+    traverse.traverse(collector, ast)
+
+    # The statements the walk left out go before anything may fail
+    if collector.skipped:
+        _cleanup_invalid_nodes(collector.blocks)
 
-    slots, unused = _collect_slots(ast)
-    _eliminate_temporary(slots)
+    _eliminate_temporary(collector.slots, ctx)
 
     _recovery_invalid_nodes(ast)
 
-    _cleanup_invalid_nodes(ast)
+    _cleanup_invalid_nodes(collector.blocks)
 
     return ast
 
 
-def _eliminate_temporary(slots):
+def _eliminate_temporary(slots, ctx):
     simple = []
     massive = []
     tables = []
@@ -31,6 +39,11 @@ def _eliminate_temporary(slots):
     for info in slots:
         assignment = info.assignment
 
+        # A closure reads the variable, not the value it has here
+        if any(ref.identifier.type == nodes.Identifier.T_UPVALUE
+               for ref in info.references[1:]):
+            continue
+
         if not isinstance(assignment, nodes.Assignment):
             assert isinstance(assignment, (nodes.IteratorWarp,
                                            nodes.NumericLoopWarp,
@@ -50,9 +63,9 @@ def _eliminate_temporary(slots):
             _fill_simple_refs(info, simple, tables)
 
     _eliminate_simple_cases(simple)
-    _eliminate_into_table_constructors(tables)
+    _eliminate_into_table_constructors(slots, tables)
     _eliminate_mass_assignments(massive)
-    _eliminate_iterators(iterators)
+    _eliminate_iterators(iterators, ctx)
 
 
 def _fill_massive_refs(info, simple, massive, iterators):
@@ -92,7 +105,12 @@ def _fill_massive_refs(info, simple, massive, iterators):
 def _fill_simple_refs(info, simple, tables):
     src = info.assignment.expressions.contents[0]
 
-    if isinstance(src, nodes.FunctionCall) and len(info.references) > 3:
+    if isinstance(src, nodes.FunctionCall) and len(info.references) > 2 \
+            and not _is_method_object(info):
+        return
+
+    # The tree misses the reads in the other blocks
+    if _count_reads(info) > len(info.references) - 1:
         return
 
     src_is_table = isinstance(src, nodes.TableConstructor)
@@ -121,6 +139,28 @@ def _fill_simple_refs(info, simple, tables):
             simple.append((info, ref, None))
 
 
+# A call may be read twice as the object of a method call only: once by
+# the copy for the first argument and once by the lookup of the method
+def _is_method_object(info):
+    if len(info.references) != 3:
+        return False
+
+    copies = 0
+    lookups = 0
+
+    for ref in info.references[1:]:
+        holder = ref.path[-2]
+
+        if isinstance(holder, nodes.ExpressionsList):
+            copies += 1
+        elif isinstance(holder, nodes.TableElement) \
+                and holder.table is ref.identifier \
+                and not isinstance(ref.path[-3], nodes.VariablesList):
+            lookups += 1
+
+    return copies == 1 and lookups == 1
+
+
 LIST_TYPES = (nodes.VariablesList,
               nodes.IdentifiersList,
               nodes.ExpressionsList,
@@ -150,18 +190,78 @@ def _eliminate_simple_cases(simple):
 
                 if not (isinstance(holder, nodes.VariablesList) and isinstance(src, nodes.BinaryOperator)):
                     if isinstance(src, nodes.FunctionDefinition):
-                        if len(info.references) > 2:
+                        if not _is_single_use(info):
                             _unmark_invalidated(info.assignment)
                             continue
                     _replace_node_in_list(conts, dst, src)
+            elif isinstance(src, nodes.FunctionDefinition) \
+                    and not _is_single_use(info):
+                _unmark_invalidated(info.assignment)
             else:
                 _replace_node(holder, dst, src)
 
         # assert found
 
 
-def _eliminate_into_table_constructors(tables):
-    for info, ref in tables:
+# The tree only has the reads in the block of the assignment and those of
+# the closures, the dataflow of the function the reads of the bytecode in
+# every block. A value is used once when both have a single read.
+def _is_single_use(info):
+    return len(info.references) == 2 and _count_reads(info) <= 1
+
+
+# The reads the dataflow has of the value, 0 if there is none to ask. The
+# unwarper's runs over merged blocks know no function, they get what the
+# run over the whole tree found.
+def _count_reads(info):
+    reads = getattr(info.assignment, "_reads", None)
+
+    if reads is not None:
+        return reads
+
+    addr = getattr(info.assignment, "_addr", None)
+
+    if addr is None or info.function is None:
+        return 0
+
+    flow = info.function._dataflow
+
+    if flow is None:
+        return 0
+
+    reads = flow.reads(addr, info.slot)
+    setattr(info.assignment, "_reads", reads)
+
+    return reads
+
+
+def _eliminate_into_table_constructors(slots, tables):
+    records = _TableRecords(slots)
+
+    # The records of a table built for a value go in before the value
+    pending = tables
+
+    while pending:
+        left = [entry for entry in pending if not records.insert(*entry)]
+
+        if len(left) == len(pending):
+            break
+
+        pending = left
+
+
+# A record goes into the constructor only if everything between them is
+# gone already, the value may read a slot assigned in between otherwise.
+# A table built in between for the value alone goes in with it, the inner
+# table of {{a}} is built after the outer one.
+class _TableRecords:
+    def __init__(self, slots):
+        self._infos = {id(info.assignment): info for info in slots}
+        self._positions = {}
+        self._last_records = {}
+        self._counts = {}
+
+    def insert(self, info, ref):
         constructor = info.assignment.expressions.contents[0]
         table_element = ref.path[-2]
         assignment = ref.path[-4]
@@ -170,12 +270,79 @@ def _eliminate_into_table_constructors(tables):
 
         assert len(assignment.expressions.contents) == 1
 
-        _mark_invalidated(assignment)
+        statements = ref.path[-5].contents
+        indices = self._indices(statements)
+
+        start = self._last_records.get(id(info))
+
+        if start is None:
+            start = indices.get(id(info.assignment))
+
+        if start is None:
+            return False
+
+        end = indices[id(assignment)]
+
+        between = [node for node in statements[start + 1:end]
+                   if not _is_invalidated(node)]
 
-        key = table_element.key
         value = assignment.expressions.contents[0]
 
-        insert_table_record(constructor, key, value)
+        if between:
+            inner = self._inner_table(value, between)
+
+            if inner is None:
+                return False
+
+            _mark_invalidated(inner.assignment)
+
+            value = inner.assignment.expressions.contents[0]
+
+        self._last_records[id(info)] = end
+        self._counts[id(info)] = self._counts.get(id(info), 0) + 1
+
+        _mark_invalidated(assignment)
+
+        insert_table_record(constructor, table_element.key, value)
+
+        return True
+
+    def _indices(self, statements):
+        indices = self._positions.get(id(statements))
+
+        if indices is None:
+            indices = {id(node): i for i, node in enumerate(statements)}
+            self._positions[id(statements)] = indices
+
+        return indices
+
+    # The info of the table the value is, if the value is its only read
+    # besides the records it got already
+    def _inner_table(self, value, between):
+        if len(between) != 1 or not isinstance(value, nodes.Identifier):
+            return None
+
+        info = self._infos.get(id(between[0]))
+
+        if info is None or value.type != nodes.Identifier.T_SLOT \
+                or info.slot != value.slot:
+            return None
+
+        assignment = info.assignment
+
+        if len(assignment.destinations.contents) != 1 \
+                or not isinstance(assignment.expressions.contents[0],
+                                  nodes.TableConstructor):
+            return None
+
+        # The definition, the records and the value
+        if len(info.references) != self._counts.get(id(info), 0) + 2:
+            return None
+
+        if not any(ref.identifier is value for ref in info.references):
+            return None
+
+        return info
 
 
 def _eliminate_mass_assignments(massive):
@@ -207,7 +374,7 @@ def _replace_node_in_list(node_list, original, replacement):
     return True
 
 
-def _eliminate_iterators(iterators):
+def _eliminate_iterators(iterators, ctx):
     processed_warps = set()
 
     for assignment, src, warp in iterators:
@@ -219,10 +386,9 @@ def _eliminate_iterators(iterators):
                 try:
                     assert warp.controls.contents[i].slot == slot.slot
                 except (AttributeError, AssertionError):
-                    if catch_asserts:
+                    if ctx.catch_asserts:
                         setattr(assignment, "_decompilation_error_here", True)
-                        print("-- WARNING: Error occurred during decompilation.")
-                        print("--   Code may be incomplete or incorrect.")
+                        ctx.add_error(ljd.context.WARNING_COMMENT)
                     else:
                         raise
 
@@ -244,69 +410,6 @@ def _is_invalidated(node):
     return getattr(node, "_invalidated", False)
 
 
-def _collect_slots(ast):
-    collector = _SlotsCollector()
-    traverse.traverse(collector, ast)
-
-    return collector.slots, collector.unused
-
-
-def _eliminate_multres(ast):
-    traverse.traverse(_MultresEliminator(), ast)
-    _cleanup_invalid_nodes(ast)
-
-
-class _MultresEliminator(traverse.Visitor):
-    def __init__(self):
-        super().__init__()
-        self._last_multres_value = None
-
-    def leave_assignment(self, node):
-        src = node.expressions.contents[0]
-        dst = node.destinations.contents[0]
-
-        if isinstance(dst, nodes.MULTRES):
-            assert len(node.destinations.contents) == 1
-            assert len(node.expressions.contents) == 1
-
-            assert isinstance(src, (nodes.FunctionCall, nodes.Vararg))
-
-            assert self._last_multres_value is None
-
-            self._last_multres_value = src
-
-            _mark_invalidated(node)
-        else:
-            for i, src in enumerate(node.expressions.contents):
-                if isinstance(src, nodes.MULTRES):
-                    break
-            else:
-                return
-
-            assert self._last_multres_value is not None
-
-            node.expressions.contents[i] = self._last_multres_value
-            self._last_multres_value = None
-
-    def _process_multres_in_list(self, nodes_list):
-        for i, node in enumerate(nodes_list):
-            if isinstance(node, nodes.MULTRES):
-                break
-        else:
-            return
-
-        assert self._last_multres_value is not None
-
-        nodes_list[i] = self._last_multres_value
-        self._last_multres_value = None
-
-    def visit_function_call(self, node):
-        self._process_multres_in_list(node.arguments.contents)
-
-    def visit_return(self, node):
-        self._process_multres_in_list(node.returns.contents)
-
-
 class _SlotReference:
     def __init__(self):
         self.path = []
@@ -324,12 +427,19 @@ class _SlotInfo:
         self.function = None
 
 
-class _SlotsCollector(traverse.Visitor):
+# The walk the slot passes share. It keeps the slots assigned so far in
+# the current block of every function down to the current one and the
+# path to the current node, and visits the expressions of an assignment
+# before its destinations are registered.
+class _SlotsVisitor(traverse.Visitor):
     class _State:
         def __init__(self):
             self.known_slots = {}
             self.function = None
 
+            # slot -> the identifier assigned to it last, for the upvalues
+            self.identifiers = {}
+
     # ##
 
     def __init__(self):
@@ -338,9 +448,6 @@ class _SlotsCollector(traverse.Visitor):
         self._path = []
         self._skip = None
 
-        self.slots = []
-        self.unused = []
-
         self._push_state()
 
     # ##
@@ -349,81 +456,90 @@ class _SlotsCollector(traverse.Visitor):
         return self._states[-1]
 
     def _push_state(self):
-        self._states.append(_SlotsCollector._State())
+        self._states.append(_SlotsVisitor._State())
 
     def _pop_state(self):
         self._states.pop()
 
-    def _commit_info(self, info):
-        assert len(info.references) > 0
+    def _register_slot(self, slot, node):
+        info = _SlotInfo()
+        info.slot = slot
+        info.assignment = node
+        info.function = self._state().function
 
-        if len(info.references) == 1:
-            self.unused.append(info)
-        else:
-            self.slots.append(info)
+        self._state().known_slots[slot] = info
 
-    def _commit_slot(self, slot, node):
-        info = self._state().known_slots.get(slot)
+    # The info of the slot an identifier refers to, upvalues are looked up
+    # in the function that holds them
+    def _find_slot(self, slot, node):
+        if node.type != nodes.Identifier.T_UPVALUE:
+            return self._state().known_slots.get(slot)
 
-        if info is None:
+        state, slot = self._upvalue_slot(slot, node)
+
+        if state is None:
+            return None
+
+        return state.known_slots.get(slot)
+
+    # Gives an upvalue the slot_index of the identifier or argument it
+    # refers to. The writer names it by slot + slot_index, and the slot of
+    # an upvalue of the enclosing function is its index there.
+    def _bind_upvalue(self, slot, node):
+        state, slot = self._upvalue_slot(slot, node)
+
+        if state is None:
             return
 
-        info.termination = node
+        offset = slot - node.slot
 
-        del self._state().known_slots[slot]
+        identifier = state.identifiers.get(slot)
 
-        self._commit_info(info)
+        if identifier is not None:
+            node.slot_index = identifier.slot_index + offset
+            return
 
-    def _register_slot(self, slot, node):
-        self._commit_slot(slot, node)
+        if state.function:
+            for arg in state.function.arguments.contents:
+                if isinstance(arg, nodes.Identifier) and arg.slot == slot:
+                    node.slot_index = arg.slot_index + offset
+                    return
 
-        info = _SlotInfo()
-        info.slot = slot
-        info.assignment = node
-        info.function = self._state().function
+    # The state of the function an upvalue is a slot of and the slot there.
+    # An upvalue that is an upvalue of the enclosing function too is
+    # followed up, the same number in a function further out is another
+    # slot.
+    def _upvalue_slot(self, slot, node):
+        is_local = getattr(node, "_local", True)
+        level = len(self._states) - 2
 
-        self._state().known_slots[slot] = info
+        while level >= 0:
+            state = self._states[level]
 
-    def _register_all_slots(self, node, slots):
-        for slot in slots:
-            if not isinstance(slot, nodes.Identifier):
-                continue
-            if slot.type == nodes.Identifier.T_UPVALUE:
-                self._register_slot_reference(slot.slot, slot)
-                continue
-            elif slot.type != nodes.Identifier.T_SLOT:
-                continue
+            if is_local:
+                return state, slot
 
-            self._register_slot(slot.slot, node)
+            function = state.function
 
-    def _commit_all_slots(self, slots, node):
-        for slot in slots:
-            if not isinstance(slot, nodes.Identifier):
-                continue
+            if function is None:
+                break
 
-            self._commit_slot(slot.slot, node)
+            is_local = function._upvalue_locals[slot]
+            slot = function._upvalues[slot]
 
-    def _register_slot_reference(self, slot, node):
-        info = None
-        if node.type == nodes.Identifier.T_UPVALUE:
-            up_len = len(self._states)-1
-            while up_len > 0:
-                up_len = up_len-1
-                info = self._states[up_len].known_slots.get(slot)
-                if info:
-                    break
-        else:
-            info = self._state().known_slots.get(slot)
+            level -= 1
 
-        if info is None:
-            return
+        return None, slot
+
+    def _make_reference(self, node):
         reference = _SlotReference()
         reference.identifier = node
 
-        # Copy the list, but not contents
-        reference.path = self._path[:]
+        # Copy the path, but not the nodes. A tuple is a single allocation
+        # and smaller than a list copy
+        reference.path = tuple(self._path)
 
-        info.references.append(reference)
+        return reference
 
     # ##
 
@@ -436,10 +552,6 @@ class _SlotsCollector(traverse.Visitor):
     def leave_assignment(self, node):
         self._skip = None
 
-    def visit_identifier(self, node):
-        if node.type == nodes.Identifier.T_SLOT or node.type == nodes.Identifier.T_UPVALUE:
-            self._register_slot_reference(node.slot, node)
-
     # ##
 
     def visit_function_definition(self, node):
@@ -450,289 +562,272 @@ class _SlotsCollector(traverse.Visitor):
         self._pop_state()
 
     def leave_block(self, node):
-        for info in self._state().known_slots.values():
-            self._commit_info(info)
-
         self._state().known_slots = {}
-
-    def visit_iterator_warp(self, node):
-        self._commit_all_slots(node.variables.contents, node)
-
-    def visit_numeric_loop_warp(self, node):
-        self._commit_slot(node.index.slot, node)
+        self._state().identifiers = {}
 
     # ##
 
-    def _visit_node(self, handler, node):
+    def _enter(self, node):
+        if self._skip == node:
+            return False
+
         self._path.append(node)
 
-        traverse.Visitor._visit_node(self, handler, node)
+        return True
 
-    def _leave_node(self, handler, node):
+    def _exit(self, node):
         self._path.pop()
 
-        traverse.Visitor._leave_node(self, handler, node)
 
-    def _visit(self, node):
-        if self._skip == node:
+# Collects the slots eliminate_temporary() may get rid of in a single walk.
+# On the way it puts the values of MULTRES back where they are used,
+# invalidating the assignments that held them, keeps the blocks for the
+# cleanup and, with upvalues, gives every upvalue the slot_index of the
+# identifier or argument it refers to.
+class _SlotsCollector(_SlotsVisitor):
+    def __init__(self, upvalues=False):
+        super().__init__()
+        self._upvalues = upvalues
+        self._last_multres_value = None
+
+        self.slots = []
+        self.unused = []
+        self.blocks = []
+        self.skipped = False
+
+    # ##
+
+    def _commit_info(self, info):
+        assert len(info.references) > 0
+
+        if len(info.references) == 1:
+            self.unused.append(info)
+        else:
+            self.slots.append(info)
+
+    def _commit_slot(self, slot, node):
+        info = self._state().known_slots.get(slot)
+
+        if info is None:
             return
 
-        traverse.Visitor._visit(self, node)
+        info.termination = node
 
+        del self._state().known_slots[slot]
 
-def _cleanup_invalid_nodes(ast):
-    traverse.traverse(_TreeCleanup(), ast)
+        self._commit_info(info)
 
+    def _register_slot(self, slot, node):
+        self._commit_slot(slot, node)
 
-class _TreeCleanup(traverse.Visitor):
-    def visit_block(self, node):
-        patched = []
+        super()._register_slot(slot, node)
 
-        for subnode in node.contents:
-            if not _is_invalidated(subnode):
-                patched.append(subnode)
+    def _register_all_slots(self, node, slots):
+        for slot in slots:
+            if not isinstance(slot, nodes.Identifier):
+                continue
+            if slot.type == nodes.Identifier.T_UPVALUE:
+                self._register_slot_reference(slot.slot, slot)
+                continue
+            elif slot.type == nodes.Identifier.T_LOCAL:
+                # The reads of the local, the closures' too, are not the
+                # temporary's that had the slot before
+                self._commit_slot(slot.slot, node)
+                continue
+            elif slot.type != nodes.Identifier.T_SLOT:
+                continue
 
-        node.contents = patched
+            self._register_slot(slot.slot, node)
+            self._state().identifiers[slot.slot] = slot
 
+    def _commit_all_slots(self, slots, node):
+        for slot in slots:
+            if not isinstance(slot, nodes.Identifier):
+                continue
 
-def _recovery_invalid_nodes(ast):
-    traverse.traverse(_TreeRecovery(), ast)
+            self._commit_slot(slot.slot, node)
 
+    def _register_slot_reference(self, slot, node):
+        if self._upvalues and node.type == nodes.Identifier.T_UPVALUE:
+            self._bind_upvalue(slot, node)
 
-class _TreeRecovery(traverse.Visitor):
-    def __init__(self):
-        super().__init__()
-        self._states = []
-        self._path = []
-        self._skip = None
+        info = self._find_slot(slot, node)
 
-        self.slots = []
-        self.unused = []
+        if info is None:
+            return
 
-        self._push_state()
+        info.references.append(self._make_reference(node))
 
     # ##
 
-    def _state(self):
-        return self._states[-1]
+    # True for an assignment the walk leaves out: one that holds a MULTRES
+    # value, or one an earlier run invalidated
+    def _eliminate_multres(self, node):
+        if _is_invalidated(node):
+            return True
 
-    def _push_state(self):
-        self._states.append(_SlotsCollector._State())
+        dst = node.destinations.contents[0]
 
-    def _pop_state(self):
-        self._states.pop()
+        if isinstance(dst, nodes.MULTRES):
+            assert len(node.destinations.contents) == 1
+            assert len(node.expressions.contents) == 1
 
-    def _register_slot(self, slot, node):
+            src = node.expressions.contents[0]
 
-        info = _SlotInfo()
-        info.slot = slot
-        info.assignment = node
-        info.function = self._state().function
+            assert isinstance(src, (nodes.FunctionCall, nodes.Vararg))
 
-        self._state().known_slots[slot] = info
+            # The value is visited where it ends up, so take any MULTRES
+            # of its own arguments now
+            if isinstance(src, nodes.FunctionCall):
+                self._process_multres_in_list(src.arguments.contents)
 
-    def _register_all_slots(self, node, slots):
-        for slot in slots:
-            if not isinstance(slot, nodes.Identifier):
-                continue
+            assert self._last_multres_value is None
 
-            if slot.type != nodes.Identifier.T_SLOT:
-                continue
+            self._last_multres_value = src
 
-            self._register_slot(slot.slot, node)
+            _mark_invalidated(node)
 
-    def _register_slot_reference(self, slot, node):
-        info = None
-        if node.type == nodes.Identifier.T_UPVALUE:
-            up_len = len(self._states)-1
-            while up_len > 0:
-                up_len = up_len-1
-                info = self._states[up_len].known_slots.get(slot)
-                if info:
-                    break
-        else:
-            info = self._state().known_slots.get(slot)
+            return True
 
-        if info is None:
+        self._process_multres_in_list(node.expressions.contents)
+
+        return False
+
+    def _process_multres_in_list(self, nodes_list):
+        for i, node in enumerate(nodes_list):
+            if isinstance(node, nodes.MULTRES):
+                break
+        else:
             return
-        if _is_invalidated(info.assignment):
-            _unmark_invalidated(info.assignment)
-            self._visit(info.assignment.expressions)
-        reference = _SlotReference()
-        reference.identifier = node
 
-        # Copy the list, but not contents
-        reference.path = self._path[:]
+        assert self._last_multres_value is not None
 
-        info.references.append(reference)
+        nodes_list[i] = self._last_multres_value
+        self._last_multres_value = None
 
     # ##
 
     def visit_assignment(self, node):
-        self._visit(node.expressions)
-        self._skip = node.expressions
-
-        self._register_all_slots(node, node.destinations.contents)
+        if self._eliminate_multres(node):
+            self._skip = node.expressions
+            self.skipped = True
+            return
 
-    def leave_assignment(self, node):
-        self._skip = None
+        super().visit_assignment(node)
 
     def visit_identifier(self, node):
         if node.type == nodes.Identifier.T_SLOT or node.type == nodes.Identifier.T_UPVALUE:
-            if not isinstance(self._path[-2], nodes.VariablesList):
-                uplen = len(self._path)-2
-                while uplen > 0:
-                    if isinstance(self._path[uplen], nodes.Assignment):
-                        if _is_invalidated(self._path[uplen]):
-                            return
-                    uplen = uplen-1
-                self._register_slot_reference(node.slot, node)
-
-    # ##
+            self._register_slot_reference(node.slot, node)
 
-    def visit_function_definition(self, node):
-        self._push_state()
-        self._state().function = node
+    def visit_function_call(self, node):
+        self._process_multres_in_list(node.arguments.contents)
 
-    def leave_function_definition(self, node):
-        self._pop_state()
+    def visit_return(self, node):
+        self._process_multres_in_list(node.returns.contents)
 
-    def leave_block(self, node):
-        self._state().known_slots = {}
     # ##
 
-    def _visit_node(self, handler, node):
-        self._path.append(node)
-
-        traverse.Visitor._visit_node(self, handler, node)
+    def visit_block(self, node):
+        self.blocks.append(node)
 
-    def _leave_node(self, handler, node):
-        self._path.pop()
-        traverse.Visitor._leave_node(self, handler, node)
+    def leave_block(self, node):
+        for info in self._state().known_slots.values():
+            self._commit_info(info)
 
-    def _visit(self, node):
-        if self._skip == node or isinstance(node, nodes.FunctionCall) or isinstance(node, nodes.BinaryOperator):
-            return
-        traverse.Visitor._visit(self, node)
+        super().leave_block(node)
 
+    def visit_iterator_warp(self, node):
+        self._commit_all_slots(node.variables.contents, node)
 
-def eliminate_upvalue(ast):
-    traverse.traverse(_TreeUpvalue(), ast)
+    def visit_numeric_loop_warp(self, node):
+        self._commit_slot(node.index.slot, node)
 
 
-class _TreeUpvalue(traverse.Visitor):
-    # ##
+# Binds the upvalues only, as the walk of eliminate_temporary() does with
+# upvalues
+def bind_upvalues(ast):
+    traverse.traverse(_UpvalueBinder(), ast)
 
-    def __init__(self):
-        super().__init__()
-        self._states = []
-        self._path = []
-        self._skip = None
-        self._push_state()
 
-    # ##
+class _UpvalueBinder(_SlotsVisitor):
+    def _register_all_slots(self, node, slots):
+        for slot in slots:
+            if isinstance(slot, nodes.Identifier) \
+                    and slot.type == nodes.Identifier.T_SLOT:
+                self._state().identifiers[slot.slot] = slot
 
-    def _state(self):
-        return self._states[-1]
+    def visit_identifier(self, node):
+        if node.type == nodes.Identifier.T_UPVALUE:
+            self._bind_upvalue(node.slot, node)
 
-    def _push_state(self):
-        self._states.append(_SlotsCollector._State())
 
-    def _pop_state(self):
-        self._states.pop()
+# Drops the invalidated statements of the blocks
+def _cleanup_invalid_nodes(blocks):
+    for block in blocks:
+        block.contents = [subnode for subnode in block.contents
+                          if not _is_invalidated(subnode)]
 
-    def _register_slot(self, slot, node):
 
-        info = _SlotInfo()
-        info.slot = slot
-        info.assignment = node
-        info.function = self._state().function
+def _recovery_invalid_nodes(ast):
+    traverse.traverse(_TreeRecovery(), ast)
 
-        self._state().known_slots[slot] = info
 
+# Brings back the invalidated assignments of slots that are still read
+# after the elimination
+class _TreeRecovery(_SlotsVisitor):
     def _register_all_slots(self, node, slots):
         for slot in slots:
             if not isinstance(slot, nodes.Identifier):
                 continue
-            if slot.type == nodes.Identifier.T_UPVALUE:
-                self._register_slot_reference(slot.slot, slot)
+
+            if slot.type == nodes.Identifier.T_LOCAL:
+                self._state().known_slots.pop(slot.slot, None)
                 continue
-            elif slot.type != nodes.Identifier.T_SLOT:
+
+            if slot.type != nodes.Identifier.T_SLOT:
                 continue
 
-            self._register_slot(slot.slot, slot)
+            self._register_slot(slot.slot, node)
 
     def _register_slot_reference(self, slot, node):
-        info = None
-
-        if node.type == nodes.Identifier.T_UPVALUE:
-            up_len = len(self._states)-1
-            while up_len > 0:
-                up_len = up_len-1
-                info = self._states[up_len].known_slots.get(slot)
-                if info is None:
-                    if self._states[up_len].function:
-                        for arg in self._states[up_len].function.arguments.contents:
-                            if isinstance(arg, nodes.Identifier) and arg.slot == slot:
-                                node.slot_index = arg.slot_index
-                                return
-                if info:
-                    node.slot_index = info.assignment.slot_index
-                    break
-        else:
-            info = self._state().known_slots.get(slot)
+        info = self._find_slot(slot, node)
 
         if info is None:
             return
-        reference = _SlotReference()
-        reference.identifier = node
-
-        # Copy the list, but not contents
-        reference.path = self._path[:]
-
-        info.references.append(reference)
+        if _is_invalidated(info.assignment):
+            _unmark_invalidated(info.assignment)
+            self._visit(info.assignment.expressions)
 
     # ##
 
+    # The expressions of an invalidated assignment are walked once a
+    # reference brings it back. Walking them here too doubles the walk with
+    # every function nested in such an assignment
     def visit_assignment(self, node):
-        self._visit(node.expressions)
+        if not _is_invalidated(node):
+            self._visit(node.expressions)
+
         self._skip = node.expressions
 
         self._register_all_slots(node, node.destinations.contents)
 
-    def leave_assignment(self, node):
-        self._skip = None
-
     def visit_identifier(self, node):
         if node.type == nodes.Identifier.T_SLOT or node.type == nodes.Identifier.T_UPVALUE:
-            self._register_slot_reference(node.slot, node)
+            if not isinstance(self._path[-2], nodes.VariablesList):
+                uplen = len(self._path)-2
+                while uplen > 0:
+                    if isinstance(self._path[uplen], nodes.Assignment):
+                        if _is_invalidated(self._path[uplen]):
+                            return
+                    uplen = uplen-1
+                self._register_slot_reference(node.slot, node)
 
     # ##
 
-    def visit_function_definition(self, node):
-        self._push_state()
-        self._state().function = node
-
-    def leave_function_definition(self, node):
-        self._pop_state()
-
-    def leave_block(self, node):
-        self._state().known_slots = {}
-
-    # ##
+    def _enter(self, node):
+        if self._skip == node or isinstance(node, (nodes.FunctionCall, nodes.BinaryOperator)):
+            return False
 
-    def _visit_node(self, handler, node):
         self._path.append(node)
 
-        traverse.Visitor._visit_node(self, handler, node)
-
-    def _leave_node(self, handler, node):
-        self._path.pop()
-
-        traverse.Visitor._leave_node(self, handler, node)
-
-    def _visit(self, node):
-        if self._skip == node:
-            return
-
-        traverse.Visitor._visit(self, node)
+        return True
@@ -1,6 +1,32 @@
+import functools
+import itertools
+
+# Trees are walked with an explicit stack, so deep nesting does not eat
+# into the recursion limit, and handlers a visitor leaves as no-ops are
+# never called. A visitor may override _enter() - return False to skip the
+# node's subtree - and _exit() to wrap every node it visits, _visit_node()
+# and _leave_node() still see each handler call as well. A visit handler
+# that is a generator gets the nodes it yields visited right away, before
+# the node's children, without recursing into _visit().
+
+# A broken unwarp can leave a cycle in the tree, fail on it the way the
+# recursive walk used to instead of growing the stack forever
+_MAX_DEPTH = 10000
+
+# Visitor class -> _Plans, see below
+_PLANS = {}
+
+# How the children of a node are laid out
+_ONE_LIST = 0
+_ONE_NODE = 1
+_NODES = 2
+_FIELDS = 3
+
+
 class Visitor:
     def __init__(self):
-        pass
+        # Nodes the _admit of their class let in, see ljd.ast.nodes
+        self._admitted = set()
 
     # ##
 
@@ -225,17 +251,116 @@ class Visitor:
     # ##
 
     def _visit_node(self, handler, node):
-        handler(node)
+        return handler(node)
 
     def _leave_node(self, handler, node):
         handler(node)
 
+    def _enter(self, node):
+        return True
+
+    def _exit(self, node):
+        pass
+
     # ##
 
     def _visit(self, node):
         assert node is not None
 
-        node._accept(self)
+        plans = _PLANS.get(self.__class__)
+
+        if plans is None:
+            plans = _get_plans(self.__class__)
+
+        enter_hook = self._enter if plans.has_enter else None
+        exit_hook = self._exit if plans.has_exit else None
+        visit_hook = plans.visit_hook
+        leave_hook = plans.leave_hook
+
+        # (node, leave handler, iterator over the node's children), the
+        # bottom one only holds the node we were called with
+        stack = [(None, None, iter((node,)))]
+
+        while True:
+            parent, parent_leave, children = stack[-1]
+
+            for node in children:
+                assert node is not None
+
+                if enter_hook is not None and not enter_hook(node):
+                    continue
+
+                visit, leave, kind, names, fields, admit = \
+                    plans[node.__class__]
+
+                if admit is not None and not admit(node, self):
+                    if exit_hook is not None:
+                        exit_hook(node)
+
+                    continue
+
+                if visit is None:
+                    ordered = None
+                elif visit_hook is None:
+                    ordered = visit(self, node)
+                else:
+                    ordered = visit_hook(self, visit.__get__(self), node)
+
+                if kind is None and ordered is None:
+                    if leave is not None:
+                        if leave_hook is None:
+                            leave(self, node)
+                        else:
+                            leave_hook(self, leave.__get__(self), node)
+
+                    if exit_hook is not None:
+                        exit_hook(node)
+
+                    continue
+
+                if len(stack) > _MAX_DEPTH:
+                    raise RecursionError("maximum tree depth exceeded")
+
+                if ordered is not None:
+                    # A generator handler yields the nodes it wants visited
+                    # at that point, the usual children follow them
+                    stack.append((node, leave, _lazy_children(node, fields)))
+                    stack.append((None, None, ordered))
+
+                    break
+
+                if kind == _ONE_LIST:
+                    children = getattr(node, names)
+                    assert isinstance(children, list)
+                    children = iter(children)
+                elif kind == _ONE_NODE:
+                    children = iter((getattr(node, names),))
+                elif kind == _NODES:
+                    children = map(getattr, itertools.repeat(node), names)
+                else:
+                    children = _lazy_children(node, fields)
+
+                stack.append((node, leave, children))
+
+                break
+            else:
+                stack.pop()
+
+                if not stack:
+                    return
+
+                # Done with a generator handler, its node is below
+                if parent is None:
+                    continue
+
+                if parent_leave is not None:
+                    if leave_hook is None:
+                        parent_leave(self, parent)
+                    else:
+                        leave_hook(self, parent_leave.__get__(self), parent)
+
+                if exit_hook is not None:
+                    exit_hook(parent)
 
     def _visit_list(self, nodes_list):
         assert isinstance(nodes_list, list)
@@ -244,6 +369,170 @@ class Visitor:
             self._visit(node)
 
 
+# Runs several visitors in a single walk. Every node gets the visit
+# handlers of all of them, in order, before its children and their leave
+# handlers, in reverse order, after. None of the visitors may skip a
+# subtree or have generator handlers.
+class FusedVisitor(Visitor):
+    def __init__(self, visitors):
+        super().__init__()
+
+        self.visitors = visitors
+
+        # handler name -> the visitors' calls for it
+        self._calls = {}
+
+    def _get_calls(self, name):
+        calls = self._calls.get(name)
+
+        if calls is not None:
+            return calls
+
+        is_leave = name.startswith("leave_")
+        hook_name = "_leave_node" if is_leave else "_visit_node"
+
+        calls = []
+
+        for visitor in self.visitors:
+            plans = _get_plans(visitor.__class__)
+            hook = plans._get_hook(hook_name)
+            handler = plans._get_handler(hook, name)
+
+            if handler is None:
+                continue
+
+            handler = handler.__get__(visitor)
+
+            if hook is None:
+                calls.append(handler)
+            else:
+                calls.append(functools.partial(hook, visitor, handler))
+
+        if is_leave:
+            calls.reverse()
+
+        self._calls[name] = calls
+
+        return calls
+
+    def _visit_node(self, handler, node):
+        for call in self._get_calls(handler.__name__):
+            ordered = call(node)
+            assert ordered is None
+
+    def _leave_node(self, handler, node):
+        for call in self._get_calls(handler.__name__):
+            call(node)
+
+    def _enter(self, node):
+        for visitor in self.visitors:
+            skip = not visitor._enter(node)
+            assert not skip
+
+        return True
+
+    def _exit(self, node):
+        for visitor in reversed(self.visitors):
+            visitor._exit(node)
+
+
+# Per visitor class: node class ->
+#   (visit, leave, kind, the child name(s), all fields, admit)
+class _Plans(dict):
+    def __init__(self, visitor_class):
+        super().__init__()
+
+        self.visitor_class = visitor_class
+
+        self.has_enter = visitor_class._enter is not Visitor._enter
+        self.has_exit = visitor_class._exit is not Visitor._exit
+
+        self.visit_hook = self._get_hook("_visit_node")
+        self.leave_hook = self._get_hook("_leave_node")
+
+    def __missing__(self, node_class):
+        if node_class._handlers is None:
+            visit = None
+            leave = None
+        else:
+            visit_name, leave_name = node_class._handlers
+
+            visit = self._get_handler(self.visit_hook, visit_name)
+            leave = self._get_handler(self.leave_hook, leave_name)
+
+        lists = getattr(node_class, "_child_lists", ())
+
+        fields = tuple((name, name in lists)
+                       for name in getattr(node_class, "_children", ()))
+
+        names = None
+
+        if not fields:
+            kind = None
+        elif len(fields) == 1:
+            names, is_list = fields[0]
+            kind = _ONE_LIST if is_list else _ONE_NODE
+        elif not lists:
+            names = tuple(name for name, _ in fields)
+            kind = _NODES
+        else:
+            kind = _FIELDS
+
+        admit = getattr(node_class, "_admit", None)
+
+        plan = (visit, leave, kind, names, fields, admit)
+
+        self[node_class] = plan
+
+        return plan
+
+    def _get_hook(self, hook_name):
+        hook = getattr(self.visitor_class, hook_name)
+
+        if hook is getattr(Visitor, hook_name):
+            return None
+
+        return hook
+
+    # Handlers the visitor didn't override are skipped, unless a hook
+    # wants to see them
+    def _get_handler(self, hook, name):
+        handler = getattr(self.visitor_class, name)
+
+        if hook is None and handler is getattr(Visitor, name):
+            return None
+
+        return handler
+
+
+def _get_children(node, field):
+    name, is_list = field
+    value = getattr(node, name)
+
+    if is_list:
+        assert isinstance(value, list)
+        return value
+
+    return value,
+
+
+# Attributes are read only once the previous child is done with, it may
+# have replaced them. Lists are iterated live, like _visit_list does
+def _lazy_children(node, fields):
+    return itertools.chain.from_iterable(
+        map(_get_children, itertools.repeat(node), fields))
+
+
+def _get_plans(visitor_class):
+    plans = _PLANS.get(visitor_class)
+
+    if plans is None:
+        plans = _Plans(visitor_class)
+        _PLANS[visitor_class] = plans
+
+    return plans
+
+
 def traverse(visitor, node):
     if isinstance(node, list):
         visitor._visit_list(node)
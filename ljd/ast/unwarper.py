@@ -1,14 +1,12 @@
 import copy
-import sys
 
 import ljd.ast.nodes as nodes
 import ljd.ast.slotworks as slotworks
 import ljd.ast.traverse as traverse
+import ljd.context
 
 binop = nodes.BinaryOperator
 
-catch_asserts = False
-
 
 # ##
 # ## REMEMBER
@@ -30,65 +28,208 @@ class _StatementsCollector(traverse.Visitor):
             self.result.append(node)
 
 
-def unwarp(node):
+# Shorter lists of blocks stay plain lists, a scan in list.index() costs
+# less than the bookkeeping
+_INDEXED_BLOCKS = 64
+
+
+# A list of blocks that finds a block without a scan. Block positions
+# stay known for the part of the list in front of every change made since
+# they were taken, a lookup past it numbers the blocks from there on up to
+# the one asked for. Slices and sums are plain lists.
+class _BlockList(list):
+    def __init__(self, blocks=()):
+        super().__init__(blocks)
+
+        self._positions = {}
+
+        # The positions of self[:_known] are right
+        self._known = 0
+
+    def index(self, block, *args):
+        if args:
+            return super().index(block, *args)
+
+        position = self._positions.get(block)
+
+        # Blocks that went out leave their old positions behind
+        if position is not None and position < self._known \
+                and self[position] is block:
+            return position
+
+        positions = self._positions
+
+        for position in range(self._known, len(self)):
+            current = self[position]
+            known = positions.get(current)
+
+            # Only the first of the blocks that are there twice counts
+            if known is None or known >= position \
+                    or self[known] is not current:
+                positions[current] = position
+
+            if current is block:
+                self._known = position + 1
+                return position
+
+        self._known = len(self)
+
+        raise ValueError("{0!r} is not in list".format(block))
+
+    def _changed(self, position):
+        if position < 0:
+            position = max(position + len(self), 0)
+
+        if position < self._known:
+            self._known = position
+
+    def _changed_slice(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            self._changed(min(start, stop) if step < 0 else start)
+        else:
+            self._changed(key)
+
+    def __setitem__(self, key, value):
+        self._changed_slice(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._changed_slice(key)
+        super().__delitem__(key)
+
+    def insert(self, position, block):
+        self._changed(min(position, len(self)))
+        super().insert(position, block)
+
+    def pop(self, position=-1):
+        self._changed(position)
+        return super().pop(position)
+
+    def remove(self, block):
+        del self[self.index(block)]
+
+    def clear(self):
+        self._known = 0
+        super().clear()
+
+    def reverse(self):
+        self._known = 0
+        super().reverse()
+
+    def sort(self, *args, **kargs):
+        self._known = 0
+        super().sort(*args, **kargs)
+
+    def __imul__(self, count):
+        self._known = 0
+        return super().__imul__(count)
+
+
+def _block_list(blocks):
+    if isinstance(blocks, _BlockList) or len(blocks) < _INDEXED_BLOCKS:
+        return blocks
+
+    return _BlockList(blocks)
+
+
+def _copy_block_list(blocks):
+    if len(blocks) < _INDEXED_BLOCKS:
+        return list(blocks)
+
+    return _BlockList(blocks)
+
+
+def unwarp(node, ctx=None):
+    if ctx is None:
+        ctx = ljd.context.DecompileContext()
+
+    # Every step hands the statements lists it left behind to the next one,
+    # None after a failure makes the next step gather them again
+    statements_lists = None
+
     # There could be many negative jumps within while conditions, so
     # filter them first
     try:
-        _run_step(_unwarp_loops, node, repeat_until=False)
+        statements_lists = _run_step(_unwarp_loops, node, statements_lists,
+                                     repeat_until=False)
     except:
-        if catch_asserts:
-            print(
-                "-- Decompilation Error: _run_step(_unwarp_loops, node, repeat_until=False)\n", file=sys.stdout)
+        statements_lists = None
+
+        if ctx.catch_asserts:
+            ctx.add_error(
+                "-- Decompilation Error: _run_step(_unwarp_loops, node, repeat_until=False)\n")
         else:
             raise
 
     try:
-        _run_step(_unwarp_loops, node, repeat_until=True)
+        statements_lists = _run_step(_unwarp_loops, node, statements_lists,
+                                     repeat_until=True)
     except:
-        if catch_asserts:
-            print(
-                "-- Decompilation Error: _run_step(_unwarp_loops, node, repeat_until=True)\n", file=sys.stdout)
+        statements_lists = None
+
+        if ctx.catch_asserts:
+            ctx.add_error(
+                "-- Decompilation Error: _run_step(_unwarp_loops, node, repeat_until=True)\n")
         else:
             raise
 
     try:
-        _run_step(_unwarp_expressions, node)
+        statements_lists = _run_step(_unwarp_expressions, node, statements_lists,
+                                     ctx=ctx)
     except:
-        if catch_asserts:
-            print(
-                "-- Decompilation Error: _run_step(_unwarp_expressions, node)\n", file=sys.stdout)
+        statements_lists = None
+
+        if ctx.catch_asserts:
+            ctx.add_error(
+                "-- Decompilation Error: _run_step(_unwarp_expressions, node)\n")
         else:
             raise
 
     try:
-        _run_step(_unwarp_ifs, node)
+        statements_lists = _run_step(_unwarp_ifs, node, statements_lists,
+                                     ctx=ctx)
     except:
-        if catch_asserts:
-            print("-- Decompilation Error: _run_step(_unwarp_ifs, node)\n",
-                  file=sys.stdout)
+        statements_lists = None
+
+        if ctx.catch_asserts:
+            ctx.add_error(
+                "-- Decompilation Error: _run_step(_unwarp_ifs, node)\n")
         else:
             raise
 
     try:
-        _glue_flows(node)
+        _glue_flows(node, statements_lists)
     except:
-        if catch_asserts:
-            print("-- Decompilation Error: _glue_flows(node)\n", file=sys.stdout)
+        if ctx.catch_asserts:
+            ctx.add_error(
+                "-- Decompilation Error: _glue_flows(node)\n")
         else:
             raise
 
 
-def _run_step(step, node, **kargs):
-    for statements in _gather_statements_lists(node):
-        statements.contents = step(statements.contents, **kargs)
+# Returns the statements lists the step left behind
+def _run_step(step, node, statements_lists=None, **kargs):
+    if statements_lists is None:
+        statements_lists = _gather_statements_lists(node)
+
+    for statements in statements_lists:
+        # The tree keeps what a failed step left in place, as before
+        blocks = _block_list(statements.contents)
+        statements.contents = blocks
+        statements.contents = step(blocks, **kargs)
+
+    statements_lists = _gather_statements_lists(node)
 
     # Fix block indices in case anything was moved
-    for statements in _gather_statements_lists(node):
+    for statements in statements_lists:
         for i, block in enumerate(statements.contents):
             if block.index != i:
                 block.former_index = block.index
                 block.index = i
 
+    return statements_lists
+
 
 def _gather_statements_lists(node):
     collector = _StatementsCollector()
@@ -96,10 +237,13 @@ def _gather_statements_lists(node):
     return collector.result
 
 
-def _glue_flows(node):
+def _glue_flows(node, statements_lists=None):
+    if statements_lists is None:
+        statements_lists = _gather_statements_lists(node)
+
     error_pending = False
 
-    for statements in _gather_statements_lists(node):
+    for statements in statements_lists:
         blocks = statements.contents
         for i, block in enumerate(blocks[:-1]):
             if hasattr(block, "_decompilation_error_here"):
@@ -132,10 +276,13 @@ def _glue_flows(node):
 # ## IFs AND EXPRESSIONs PROCESSING
 # ##
 
-def _unwarp_expressions(blocks):
+def _unwarp_expressions(blocks, ctx):
     pack = []
     pack_set = set()
 
+    # The subexpressions found so far, see _find_subexpressions()
+    found = {}
+
     start_index = 0
     end_index = 0
     while start_index < len(blocks) - 1:
@@ -159,19 +306,18 @@ def _unwarp_expressions(blocks):
                     continue
 
         body, end, end_index = _extract_if_body(start_index,
-                                                blocks, None)
+                                                blocks, None, ctx)
 
         if body is None:
             raise NotImplementedError("GOTO statements are not"
                                       " supported")
 
         try:
-            expressions = _find_expressions(start, body, end)
+            expressions = _find_expressions(start, body, end, ctx, found)
         except AttributeError:
-            if catch_asserts:
+            if ctx.catch_asserts:
                 setattr(start, "_decompilation_error_here", True)
-                print("-- WARNING: Error occurred during decompilation.")
-                print("--   Code may be incomplete or incorrect.")
+                ctx.add_error(ljd.context.WARNING_COMMENT)
                 expressions = []
             else:
                 raise
@@ -196,7 +342,7 @@ def _unwarp_expressions(blocks):
 
         start_index = end_index
 
-    return _unwarp_expressions_pack(blocks, pack)
+    return _unwarp_expressions_pack(blocks, pack, ctx)
 
 
 def _find_endest_end(expressions):
@@ -209,7 +355,8 @@ def _find_endest_end(expressions):
     return endest_end
 
 
-def _unwarp_ifs(blocks, top_end=None, topmost_end=None):
+def _unwarp_ifs(blocks, ctx, top_end=None, topmost_end=None):
+    blocks = _block_list(blocks)
     boundaries = []
 
     start_index = 0
@@ -224,14 +371,13 @@ def _unwarp_ifs(blocks, top_end=None, topmost_end=None):
                 continue
 
         body, end, end_index = _extract_if_body(start_index,
-                                                blocks, topmost_end)
+                                                blocks, topmost_end, ctx)
 
         if body is None:
-            if catch_asserts:
+            if ctx.catch_asserts:
                 setattr(start, "_decompilation_error_here", True)
-                print("-- WARNING: Error occurred during decompilation.")
-                # print("--   GOTO statements are not supported")
-                print("--   Code may be incomplete or incorrect.")
+                ctx.add_error(ljd.context.WARNING_COMMENT,
+                              "GOTO statements are not supported")
                 _set_flow_to(start, blocks[start_index + 1])
                 start_index += 1
                 continue
@@ -242,12 +388,11 @@ def _unwarp_ifs(blocks, top_end=None, topmost_end=None):
         is_end = isinstance(body[-1].warp, nodes.EndWarp)
 
         try:
-            _unwarp_if_statement(start, body, end, end)
+            _unwarp_if_statement(start, body, end, end, ctx)
         except (AssertionError, IndexError):
-            if catch_asserts:
+            if ctx.catch_asserts:
                 setattr(start, "_decompilation_error_here", True)
-                print("-- WARNING: Error occurred during decompilation.")
-                print("--   Code may be incomplete or incorrect.")
+                ctx.add_error(ljd.context.WARNING_COMMENT)
             else:
                 raise
 
@@ -263,8 +408,8 @@ def _unwarp_ifs(blocks, top_end=None, topmost_end=None):
     return _remove_processed_blocks(blocks, boundaries)
 
 
-def _extract_if_body(start_index, blocks, topmost_end):
-    end = _find_branching_end(blocks[start_index:], topmost_end)
+def _extract_if_body(start_index, blocks, topmost_end, ctx):
+    end = _find_branching_end(blocks, start_index, topmost_end, ctx)
 
     try:
         end_index = blocks.index(end)
@@ -279,7 +424,10 @@ def _extract_if_body(start_index, blocks, topmost_end):
     return body, end, end_index
 
 
-def _unwarp_expressions_pack(blocks, pack):
+def _unwarp_expressions_pack(blocks, pack, ctx):
+    # Blocks go out in place, from the back mostly, so the ones in front
+    # are found as fast as ever
+    blocks = _copy_block_list(blocks)
     replacements = {}
 
     for start, end, slot, slot_type in reversed(pack):
@@ -293,10 +441,9 @@ def _unwarp_expressions_pack(blocks, pack):
         try:
             _unwarp_logical_expression(start, end, body)
         except (AssertionError, IndexError):
-            if catch_asserts:
+            if ctx.catch_asserts:
                 setattr(start, "_decompilation_error_here", True)
-                print("-- WARNING: Error occurred during decompilation.")
-                print("--   Code may be incomplete or incorrect.")
+                ctx.add_error(ljd.context.WARNING_COMMENT)
             else:
                 raise
 
@@ -315,13 +462,13 @@ def _unwarp_expressions_pack(blocks, pack):
             end.contents = start.contents + end.contents
             start.contents = []
 
-            blocks = blocks[:start_index] + blocks[end_index:]
+            del blocks[start_index:end_index]
 
             _replace_targets(blocks, start, end)
 
             replacements[start] = end
 
-            slotworks.eliminate_temporary(end)
+            slotworks.eliminate_temporary(end, ctx)
 
             _set_flow_to(start, end)
         else:
@@ -334,7 +481,7 @@ def _unwarp_expressions_pack(blocks, pack):
                     if target_index in range(start_index + 1, end_index - 1):
                         continue
 
-            blocks = blocks[:start_index + 1] + blocks[end_index:]
+            del blocks[start_index + 1:end_index]
 
             start.contents = statements[:split_i]
             end.contents = statements[split_i:]
@@ -343,7 +490,7 @@ def _unwarp_expressions_pack(blocks, pack):
             # elimination or it could result in a cycled AST.
             _set_flow_to(start, end)
 
-            slotworks.eliminate_temporary(start)
+            slotworks.eliminate_temporary(start, ctx)
 
     return blocks
 
@@ -392,24 +539,25 @@ def _extract_destination_slots(statement):
     return sets
 
 
-def _gather_slots(node):
-    class Collector(traverse.Visitor):
-        def __init__(self):
-            super().__init__()
-            self.slots = set()
+class _SlotsCollector(traverse.Visitor):
+    def __init__(self):
+        super().__init__()
+        self.slots = set()
 
-        def visit_identifier(self, visited_node):
-            if visited_node.type == nodes.Identifier.T_SLOT:
-                self.slots.add(visited_node.slot)
+    def visit_identifier(self, visited_node):
+        if visited_node.type == nodes.Identifier.T_SLOT:
+            self.slots.add(visited_node.slot)
 
-    collector = Collector()
+
+def _gather_slots(node):
+    collector = _SlotsCollector()
 
     traverse.traverse(collector, node)
 
     return collector.slots
 
 
-def _find_expressions(start, body, end):
+def _find_expressions(start, body, end, ctx, found):
     # Explicitly allow the local a = x ~= "b" case
     slot, slot_type = _get_simple_local_assignment_slot(start, body, end)
 
@@ -429,7 +577,7 @@ def _find_expressions(start, body, end):
     while i < len(extbody):
         block = extbody[i]
 
-        subs = _find_subexpressions(block, body[i:])
+        subs = _find_subexpressions(block, body, i, ctx, found)
 
         if len(subs) != 0:
             endest_end = _find_endest_end(subs)
@@ -552,9 +700,29 @@ def _find_expressions(start, body, end):
     return expressions + [(start, end, slot, slot_type)]
 
 
-def _find_subexpressions(start, body):
+# The subexpressions of start and body[first:], which follow it. Every
+# start block is tried with the tail of each body it is in, and the blocks
+# of the step stay as they are while the expressions are looked for. So
+# start and the last block tell the tails apart, and found keeps what was
+# found for each. That keeps a long chain of conditions from costing a
+# walk over the tail for every start before it.
+def _find_subexpressions(start, body, first, ctx, found):
+    key = (start, body[-1] if first < len(body) else None)
+
+    subexpressions = found.get(key)
+
+    if subexpressions is None:
+        subexpressions = _search_subexpressions(start, body[first:], ctx,
+                                                found)
+        found[key] = subexpressions
+
+    return subexpressions
+
+
+def _search_subexpressions(start, body, ctx, found):
     try:
-        body, end, _end_index = _extract_if_body(0, [start] + body, None)
+        body, end, _end_index = _extract_if_body(0, [start] + body, None,
+                                                 ctx)
     except ValueError:
         # a warp target is not in a list
         return []
@@ -562,7 +730,7 @@ def _find_subexpressions(start, body):
     if body is None:
         return []
 
-    return _find_expressions(start, body, end)
+    return _find_expressions(start, body, end, ctx, found)
 
 
 def _get_simple_local_assignment_slot(start, body, end):
@@ -603,7 +771,7 @@ def _unwarp_logical_expression(start, end, body):
 
     expression = _compile_expression([start] + body, end, true, false)
 
-    dst = copy.deepcopy(slot)
+    dst = _clone(slot)
 
     assignment = nodes.Assignment()
     assignment.destinations.contents.append(dst)
@@ -678,7 +846,31 @@ def _compile_expression(body, end, true, false):
 # Now we have a subexpression and both TRUE and FALSE terminators for it.
 # Recurse and repeat.
 #
+# A chain of n "and"s or "or"s nests n subexpressions, so the recursion
+# runs on a stack of its own: _unwarp_expression_parts() yields the
+# arguments of the subexpression it needs and gets its parts back.
+#
 def _unwarp_expression(body, end, true, false):
+    stack = [_unwarp_expression_parts(body, end, true, false)]
+    parts = None
+
+    while True:
+        try:
+            request = stack[-1].send(parts)
+        except StopIteration as stop:
+            stack.pop()
+            parts = stop.value
+
+            if not stack:
+                return parts
+
+            continue
+
+        stack.append(_unwarp_expression_parts(*request))
+        parts = None
+
+
+def _unwarp_expression_parts(body, end, true, false):
     parts = []
 
     if true is not None:
@@ -760,9 +952,11 @@ def _unwarp_expression(body, end, true, false):
 
         operator = _get_operator(last_block, true, end)
 
-        subexpression = _compile_subexpression(subexpression, operator,
-                                               last_block, next_block,
-                                               true, end)
+        subexpression = yield from _compile_subexpression(subexpression,
+                                                          operator,
+                                                          last_block,
+                                                          next_block,
+                                                          true, end)
 
         parts.append(subexpression)
         parts.append(operator)
@@ -881,6 +1075,8 @@ def _get_and_remove_last_assignment_source(block):
             return assignment
 
 
+# A generator, the parts of a longer subexpression come from the stack of
+# _unwarp_expression()
 def _compile_subexpression(subexpression, operator,
                            block, next_block, true, end):
     warp = block.warp
@@ -908,7 +1104,7 @@ def _compile_subexpression(subexpression, operator,
                 subtrue = warp.true_target
                 subfalse = warp.false_target
 
-        return _unwarp_expression(subexpression, None, subtrue, subfalse)
+        return (yield subexpression, None, subtrue, subfalse)
 
 
 def _is_inverted(warp, true, end):
@@ -950,8 +1146,7 @@ def _invert(expression):
 
         return node
 
-    # Just in case
-    expression = copy.deepcopy(expression)
+    expression = _clone(expression)
 
     new_type = _NEGATION_MAP[expression.type]
 
@@ -962,6 +1157,13 @@ def _invert(expression):
     return expression
 
 
+# A new node with the fields of node, its children are shared. Nothing here
+# changes more than the fields of the node itself, and the warps and blocks
+# the originals come from are thrown away, so a deep copy only costs time
+def _clone(node):
+    return copy.copy(node)
+
+
 def _get_terminators(body):
     if len(body) < 2:
         return None, None, body
@@ -998,20 +1200,48 @@ def _get_terminators(body):
     return last, prev, body[:-2]
 
 
+# The nested lists of parts are assembled before the lists holding them,
+# without recursion, a long chain nests as deep as it is long
 def _assemble_expression(parts):
     if not isinstance(parts, list):
         return parts
 
+    lists = []
+    pending = [parts]
+
+    while pending:
+        current = pending.pop()
+        lists.append(current)
+
+        if len(current) > 1:
+            pending += [component for component in current[::2]
+                        if isinstance(component, list)]
+
+    assembled = {}
+
+    for current in reversed(lists):
+        assembled[id(current)] = _assemble_parts(current, assembled)
+
+    return assembled[id(parts)]
+
+
+def _assemble_parts(parts, assembled):
     if len(parts) == 1:
         return parts[0]
 
+    def get(component):
+        if isinstance(component, list):
+            return assembled[id(component)]
+
+        return component
+
     node = nodes.BinaryOperator()
-    node.left = _assemble_expression(parts[-3])
+    node.left = get(parts[-3])
 
     node.type = parts[-2]
     assert isinstance(node.type, int)
 
-    node.right = _assemble_expression(parts[-1])
+    node.right = get(parts[-1])
 
     i = len(parts) - 4
 
@@ -1021,7 +1251,7 @@ def _assemble_expression(parts):
 
         upper_node = nodes.BinaryOperator()
         upper_node.right = node
-        upper_node.left = _assemble_expression(component)
+        upper_node.left = get(component)
 
         upper_node.type = operator
 
@@ -1069,7 +1299,7 @@ def _make_explicit_subexpressions(parts):
     return patched
 
 
-def _unwarp_if_statement(start, body, end, topmost_end):
+def _unwarp_if_statement(start, body, end, topmost_end, ctx):
     expression, body, false = _extract_if_expression(start, body, end,
                                                      topmost_end)
 
@@ -1102,11 +1332,13 @@ def _unwarp_if_statement(start, body, end, topmost_end):
             assert isinstance(else_warp_out, nodes.EndWarp)
 
         _set_end(then_body[-1])
-        then_blocks = _unwarp_ifs(then_body, then_body[-1], topmost_end)
+        then_blocks = _unwarp_ifs(then_body, ctx, then_body[-1],
+                                  topmost_end)
         node.then_block.contents = then_blocks
 
         _set_end(else_body[-1])
-        else_blocks = _unwarp_ifs(else_body, else_body[-1], topmost_end)
+        else_blocks = _unwarp_ifs(else_body, ctx, else_body[-1],
+                                  topmost_end)
         node.else_block.contents = else_blocks
     else:
         warp_out = body[-1].warp
@@ -1117,7 +1349,7 @@ def _unwarp_if_statement(start, body, end, topmost_end):
             pass
 
         _set_end(body[-1])
-        then_blocks = _unwarp_ifs(body, body[-1], topmost_end)
+        then_blocks = _unwarp_ifs(body, ctx, body[-1], topmost_end)
         node.then_block.contents = then_blocks
 
     start.contents.append(node)
@@ -1195,10 +1427,11 @@ def _search_expression_end(expression, falses):
     return false, expression_end
 
 
-def _find_branching_end(blocks, topmost_end):
-    end = blocks[0]
+def _find_branching_end(blocks, start_index, topmost_end, ctx):
+    end = blocks[start_index]
 
-    for block in blocks:
+    for i in range(start_index, len(blocks)):
+        block = blocks[i]
         warp = block.warp
 
         target = _get_target(warp, allow_end=True)
@@ -1207,10 +1440,9 @@ def _find_branching_end(blocks, topmost_end):
             try:
                 assert block == end
             except AssertionError:
-                if catch_asserts:
+                if ctx.catch_asserts:
                     setattr(block, "_decompilation_error_here", True)
-                    print("-- WARNING: Error occurred during decompilation.")
-                    print("--   Code may be incomplete or incorrect.")
+                    ctx.add_error(ljd.context.WARNING_COMMENT)
                     if hasattr(end, "warp") and _get_target(end.warp) == block:
                         return end
                 else:
@@ -1257,6 +1489,8 @@ def _unwarp_loops(blocks, repeat_until):
 
     fixed = _cleanup_breaks_and_if_ends(loops, blocks)
 
+    blocks = _copy_block_list(blocks)
+
     for start, end in fixed:
         start_index = blocks.index(start)
         end_index = blocks.index(end)
@@ -1284,7 +1518,7 @@ def _unwarp_loops(blocks, repeat_until):
         _set_end(body[-1])
         _unwarp_breaks(start, body, end)
 
-        blocks = blocks[:start_index + 1] + [block] + blocks[end_index:]
+        blocks[start_index + 1:end_index] = [block]
 
     return blocks
 
@@ -1775,8 +2009,7 @@ def _find_all_loops(blocks, repeat_until):
             i = last_i
 
             # There always should be at least one return block
-            end_index = blocks.index(end)
-            end = blocks[end_index + 1]
+            end = blocks[last_i + 1]
 
             loops.append((start, end))
 
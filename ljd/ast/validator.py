@@ -5,8 +5,6 @@
 import ljd.ast.nodes as nodes
 import ljd.ast.traverse as traverse
 
-catch_asserts = False
-
 
 class TypeRestriction:
     def __init__(self, default, specific):
@@ -72,6 +70,15 @@ VARIABLE_TYPES = (
     nodes.MULTRES  # It's not valid here, but it is a hack anyway...
 )
 
+# The raw values a ConstantTable template may hold
+TEMPLATE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str
+)
+
 WARP_TYPES = (
     nodes.UnconditionalWarp,
     nodes.ConditionalWarp,
@@ -83,6 +90,8 @@ WARP_TYPES = (
 
 class Visitor(traverse.Visitor):
     def __init__(self, warped=True):
+        super().__init__()
+
         # Restrictions for the upmost level
         self.restrictions = [None]
         self.warped = warped
@@ -105,6 +114,17 @@ class Visitor(traverse.Visitor):
     def visit_table_constructor(self, node):
         self._set_restrictions(nodes.RecordsList)
 
+        if isinstance(node, nodes.ConstantTable) and node.template is not None:
+            self._check_template(node.template)
+
+    def _check_template(self, template):
+        for value in template.array:
+            assert isinstance(value, TEMPLATE_TYPES)
+
+        for key, value in template.dictionary:
+            assert key is not None and isinstance(key, TEMPLATE_TYPES)
+            assert isinstance(value, TEMPLATE_TYPES)
+
     def visit_array_record(self, node):
         self._set_restrictions(EXPRESSION_TYPES)
 
@@ -154,16 +174,13 @@ class Visitor(traverse.Visitor):
             or node.type == nodes.BinaryOperator.T_POW
 
     def visit_unary_operator(self, node):
-        import ljd.config.version_config
-
         self._set_restrictions(EXPRESSION_TYPES)
 
         assert node.type == nodes.UnaryOperator.T_NOT \
             or node.type == nodes.UnaryOperator.T_LENGTH_OPERATOR \
             or node.type == nodes.UnaryOperator.T_MINUS \
-            or (ljd.config.version_config.use_version > 2.0
-                and (node.type == nodes.UnaryOperator.T_TOSTRING
-                     or node.type == nodes.UnaryOperator.T_TONUMBER))
+            or node.type == nodes.UnaryOperator.T_TOSTRING \
+            or node.type == nodes.UnaryOperator.T_TONUMBER
 
     # ##
 
@@ -338,7 +355,7 @@ class Visitor(traverse.Visitor):
 
     # ##
 
-    def _visit(self, node):
+    def _enter(self, node):
         restrictions = self.restrictions[-1]
 
         if restrictions is not None:
@@ -347,8 +364,9 @@ class Visitor(traverse.Visitor):
         # Add layer for the child node
         self.restrictions.append(None)
 
-        traverse.Visitor._visit(self, node)
+        return True
 
+    def _exit(self, node):
         # And pop it back
         self.restrictions.pop()
 
@@ -19,5 +19,9 @@ class Table:
 class Constants:
     def __init__(self):
         self.upvalue_references = []
+
+        # True for an upvalue that is a slot of the enclosing function,
+        # False for one that is an upvalue of it
+        self.upvalue_locals = []
         self.numeric_constants = []
         self.complex_constants = []
@@ -0,0 +1,525 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import bisect
+
+import ljd.bytecode.instructions as ins
+from ljd.bytecode.helpers import get_jump_destination
+
+# Slot sets are ints with a bit per slot, definition sets ints with a bit
+# per definition. The slots an instruction reads and writes follow the
+# way ljd.ast.builder builds its statement. MULTRES values are left out,
+# they are no slots.
+
+_CONDITIONS = range(ins.ISLT.opcode, ins.ISF.opcode + 1)
+
+# Loops may jump or go on, a JMP only after a condition
+_LOOPS = {ins.FORI.opcode, ins.JFORI.opcode, ins.FORL.opcode,
+          ins.IFORL.opcode, ins.JFORL.opcode, ins.ITERL.opcode,
+          ins.IITERL.opcode, ins.JITERL.opcode}
+
+_JUMPS = {ins.JMP.opcode, ins.UCLO.opcode, ins.ISNEXT.opcode} | _LOOPS
+
+# The copy of ISTC and ISFC only happens when they jump, the old value
+# of the slot may live on
+_COPIES = {ins.ISTC.opcode, ins.ISFC.opcode}
+
+# The loop instructions that read again what FORI, ISNEXT or ITERC read
+# first, the tree has one read for both
+_REREADS = {ins.FORL.opcode, ins.IFORL.opcode, ins.JFORL.opcode,
+            ins.ITERN.opcode, ins.ITERL.opcode, ins.IITERL.opcode,
+            ins.JITERL.opcode}
+
+_RETURNS = {ins.RETM.opcode, ins.RET.opcode, ins.RET0.opcode,
+            ins.RET1.opcode, ins.CALLMT.opcode, ins.CALLT.opcode}
+
+
+# Liveness and reaching definitions of the slots of a prototype, over
+# the basic blocks of its instructions.
+#
+# block_starts - the first address of every block, the first block
+#   starts at 1, after the function header. These are the blocks of
+#   ljd.ast.builder, which leaves the dead code after a return in the
+#   block of the return, so the blocks split after every return as well.
+# arguments_count - the slots the header defines
+#
+# Nothing is worked out until the first question. Every definition is
+# named by its address and slot, 0 is the address of the arguments.
+class Dataflow:
+    def __init__(self, instructions, block_starts, arguments_count):
+        self.instructions = instructions
+        self.block_starts = sorted(_split_after_returns(instructions,
+                                                        block_starts))
+        self.arguments_count = arguments_count
+
+        # Per block: the successors and the slots live at its entry
+        # and exit
+        self.successors = None
+        self.live_in = None
+        self.live_out = None
+
+        # (address, slot) of a definition -> the addresses that read it
+        self._uses = None
+
+        # (address, slot) of a read -> the addresses of the definitions
+        # it may see
+        self._definitions = None
+
+        # Per instruction: the slots it reads, the slots it writes and
+        # the slots whose old value is gone after it
+        self._effects = None
+
+    # The facts of the bytecode, copies of a tree share them
+    def __deepcopy__(self, memo):
+        return self
+
+    # The addresses that may read the value slot gets at addr
+    def uses(self, addr, slot):
+        if self._uses is None:
+            self._solve()
+
+        return self._uses.get((addr, slot), ())
+
+    # How many times the value is read, as the tree reads it. A loop
+    # instruction reads again what FORI, ISNEXT or ITERC read, and where
+    # the values of several definitions meet the read is that of a
+    # conditional expression, whose parts the tree reads on their own.
+    def reads(self, addr, slot):
+        count = 0
+
+        for use in self.uses(addr, slot):
+            if self.instructions[use].opcode in _REREADS:
+                continue
+
+            if len(self.definitions(use, slot)) > 1:
+                continue
+
+            count += 1
+
+        return count
+
+    # The addresses of the definitions a read of slot at addr may see
+    def definitions(self, addr, slot):
+        if self._definitions is None:
+            self._solve()
+
+        return self._definitions.get((addr, slot), ())
+
+    # The index of the block addr is in
+    def block_of(self, addr):
+        return bisect.bisect_right(self.block_starts, addr) - 1
+
+    # ##
+
+    def _last_address(self, index):
+        if index + 1 < len(self.block_starts):
+            return self.block_starts[index + 1] - 1
+
+        return len(self.instructions) - 1
+
+    def _solve(self):
+        self._effects = [_get_effects(instruction)
+                         for instruction in self.instructions]
+
+        self.successors = [self._get_successors(index)
+                           for index in range(len(self.block_starts))]
+
+        self._solve_liveness()
+        self._solve_definitions()
+
+    def _get_successors(self, index):
+        last = self._last_address(index)
+        instruction = self.instructions[last]
+        opcode = instruction.opcode
+
+        addresses = []
+
+        if opcode in _JUMPS:
+            destination = get_jump_destination(last, instruction)
+            addresses.append(destination)
+
+            previous = self.instructions[last - 1].opcode
+
+            if opcode in _LOOPS or (opcode == ins.JMP.opcode
+                                    and previous in _CONDITIONS):
+                addresses.append(last + 1)
+        elif opcode not in _RETURNS:
+            addresses.append(last + 1)
+
+        successors = []
+
+        for addr in addresses:
+            if 0 < addr < len(self.instructions):
+                successor = self.block_of(addr)
+
+                if successor not in successors:
+                    successors.append(successor)
+
+        return successors
+
+    # Upward exposed reads and writes of every block, then the live sets
+    # till nothing changes
+    def _solve_liveness(self):
+        count = len(self.block_starts)
+
+        exposed = [0] * count
+        killed = [0] * count
+
+        for index in range(count):
+            block_uses = 0
+            block_defs = 0
+
+            for addr in range(self.block_starts[index],
+                              self._last_address(index) + 1):
+                uses, defs, kills = self._effects[addr]
+                block_uses |= uses & ~block_defs
+                block_defs |= kills
+
+            exposed[index] = block_uses
+            killed[index] = block_defs
+
+        predecessors = _get_predecessors(self.successors)
+
+        live_in = [0] * count
+        live_out = [0] * count
+
+        worklist = list(range(count))
+        pending = set(worklist)
+
+        while worklist:
+            index = worklist.pop()
+            pending.discard(index)
+
+            out = 0
+            for successor in self.successors[index]:
+                out |= live_in[successor]
+
+            live_out[index] = out
+            new_in = exposed[index] | (out & ~killed[index])
+
+            if new_in == live_in[index]:
+                continue
+
+            live_in[index] = new_in
+
+            for predecessor in predecessors[index]:
+                if predecessor not in pending:
+                    pending.add(predecessor)
+                    worklist.append(predecessor)
+
+        self.live_in = live_in
+        self.live_out = live_out
+
+    # Only the definitions that may be read in another block take part in
+    # the iteration: the last ones of a block, of the slots live at its
+    # exit. The reads of the rest are linked in the final scan.
+    def _solve_definitions(self):
+        count = len(self.block_starts)
+
+        # Definition number -> (address, slot)
+        definitions = []
+
+        # Slot -> the bits of its definitions
+        by_slot = {}
+
+        generated = [0] * count
+        killed = [0] * count
+
+        entry = 0
+        for slot in range(self.arguments_count):
+            entry |= _add_definition(definitions, by_slot, 0, slot)
+
+        for index in range(count):
+            exposed = {}
+            killed_slots = 0
+
+            for addr in range(self.block_starts[index],
+                              self._last_address(index) + 1):
+                uses, defs, kills = self._effects[addr]
+
+                for slot in _iterate_bits(kills):
+                    exposed[slot] = []
+
+                for slot in _iterate_bits(defs):
+                    exposed.setdefault(slot, []).append(addr)
+
+                killed_slots |= kills
+
+            live = self.live_out[index]
+            block_generated = 0
+
+            for slot, addresses in exposed.items():
+                if not live >> slot & 1:
+                    continue
+
+                for addr in addresses:
+                    block_generated |= _add_definition(definitions, by_slot,
+                                                       addr, slot)
+
+            generated[index] = block_generated
+            killed[index] = killed_slots
+
+        # Every definition has its bit only now
+        for index in range(count):
+            mask = 0
+
+            for slot in _iterate_bits(killed[index]):
+                mask |= by_slot.get(slot, 0)
+
+            killed[index] = mask & ~generated[index]
+
+        reaching_in = [0] * count
+        reaching_out = [0] * count
+
+        predecessors = _get_predecessors(self.successors)
+
+        worklist = list(reversed(range(count)))
+        pending = set(worklist)
+
+        while worklist:
+            index = worklist.pop()
+            pending.discard(index)
+
+            new_in = entry if index == 0 else 0
+            for predecessor in predecessors[index]:
+                new_in |= reaching_out[predecessor]
+
+            reaching_in[index] = new_in
+            new_out = generated[index] | (new_in & ~killed[index])
+
+            if new_out == reaching_out[index]:
+                continue
+
+            reaching_out[index] = new_out
+
+            for successor in self.successors[index]:
+                if successor not in pending:
+                    pending.add(successor)
+                    worklist.append(successor)
+
+        uses = {}
+        seen = {}
+
+        for index in range(count):
+            reaching = reaching_in[index]
+
+            # Slot -> the definitions in the block a read sees so far,
+            # overwritten has the slots those from before are gone for
+            local = {}
+            overwritten = 0
+
+            for addr in range(self.block_starts[index],
+                              self._last_address(index) + 1):
+                read, written, gone = self._effects[addr]
+
+                for slot in _iterate_bits(read):
+                    found = local.get(slot, [])
+
+                    if not overwritten >> slot & 1:
+                        mask = reaching & by_slot.get(slot, 0)
+                        found = [definitions[number][0]
+                                 for number in _iterate_bits(mask)] + found
+
+                    seen[(addr, slot)] = tuple(found)
+
+                    for definition in found:
+                        uses.setdefault((definition, slot), []).append(addr)
+
+                for slot in _iterate_bits(gone):
+                    local[slot] = []
+
+                for slot in _iterate_bits(written):
+                    local.setdefault(slot, []).append(addr)
+
+                overwritten |= gone
+
+        self._uses = uses
+        self._definitions = seen
+
+
+def _split_after_returns(instructions, block_starts):
+    starts = set(block_starts)
+
+    for addr in range(1, len(instructions) - 1):
+        if instructions[addr].opcode in _RETURNS:
+            starts.add(addr + 1)
+
+    return starts
+
+
+# Numbers a definition, returns its bit
+def _add_definition(definitions, by_slot, addr, slot):
+    bit = 1 << len(definitions)
+
+    definitions.append((addr, slot))
+    by_slot[slot] = by_slot.get(slot, 0) | bit
+
+    return bit
+
+
+def _get_predecessors(successors):
+    predecessors = [[] for _ in successors]
+
+    for index, targets in enumerate(successors):
+        for successor in targets:
+            predecessors[successor].append(index)
+
+    return predecessors
+
+
+def _iterate_bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _slots(first, last):
+    if last < first:
+        return 0
+
+    return ((1 << (last - first + 1)) - 1) << first
+
+
+# (read slots, written slots, slots whose old value is gone after it) of
+# an instruction
+def _get_effects(instruction):
+    opcode = instruction.opcode
+
+    handler = _SPECIAL.get(opcode)
+
+    if handler is not None:
+        uses, defs = handler(instruction)
+        return uses, defs, defs
+
+    uses = 0
+    defs = 0
+
+    for name in ("A", "B", "CD"):
+        kind = getattr(instruction, name + "_type")
+
+        if kind != ins.T_VAR and kind != ins.T_DST:
+            continue
+
+        slot = getattr(instruction, name)
+
+        # The builder's placeholders for the constant conditions
+        if slot >= ins.SLOT_FALSE:
+            continue
+
+        if kind == ins.T_VAR:
+            uses |= 1 << slot
+        else:
+            defs |= 1 << slot
+
+    if opcode in _COPIES:
+        return uses, defs, 0
+
+    return uses, defs, defs
+
+
+def _get_concat_effects(instruction):
+    return (_slots(instruction.B, instruction.CD),
+            1 << instruction.A)
+
+
+def _get_knil_effects(instruction):
+    return 0, _slots(instruction.A, instruction.CD)
+
+
+def _get_table_mass_effects(instruction):
+    return 1 << (instruction.A - 1), 0
+
+
+def _get_call_effects(instruction):
+    base = instruction.A
+    last = base + instruction.CD
+
+    if instruction.opcode in (ins.CALL.opcode, ins.CALLT.opcode):
+        last -= 1
+
+    defs = 0
+
+    if instruction.opcode in (ins.CALLM.opcode, ins.CALL.opcode):
+        defs = _slots(base, base + instruction.B - 2)
+
+    return _slots(base, last), defs
+
+
+def _get_iterator_effects(instruction):
+    base = instruction.A
+
+    return (_slots(base - 3, base - 1),
+            _slots(base, base + instruction.B - 2))
+
+
+def _get_isnext_effects(instruction):
+    return _slots(instruction.A - 3, instruction.A - 1), 0
+
+
+def _get_vararg_effects(instruction):
+    return 0, _slots(instruction.A, instruction.A + instruction.B - 2)
+
+
+def _get_return_effects(instruction):
+    base = instruction.A
+    last = base + instruction.CD - 1
+
+    if instruction.opcode != ins.RETM.opcode:
+        last -= 1
+
+    return _slots(base, last), 0
+
+
+def _get_for_init_effects(instruction):
+    base = instruction.A
+
+    return _slots(base, base + 2), 1 << (base + 3)
+
+
+def _get_for_loop_effects(instruction):
+    base = instruction.A
+
+    return _slots(base, base + 2), 1 << base | 1 << (base + 3)
+
+
+def _get_iterator_loop_effects(instruction):
+    return 1 << instruction.A, 1 << (instruction.A - 1)
+
+
+def _get_no_effects(instruction):
+    return 0, 0
+
+
+_SPECIAL = {
+    ins.CAT.opcode: _get_concat_effects,
+    ins.KNIL.opcode: _get_knil_effects,
+    ins.TSETM.opcode: _get_table_mass_effects,
+    ins.CALLM.opcode: _get_call_effects,
+    ins.CALL.opcode: _get_call_effects,
+    ins.CALLMT.opcode: _get_call_effects,
+    ins.CALLT.opcode: _get_call_effects,
+    ins.ITERC.opcode: _get_iterator_effects,
+    ins.ITERN.opcode: _get_iterator_effects,
+    ins.ISNEXT.opcode: _get_isnext_effects,
+    ins.VARG.opcode: _get_vararg_effects,
+    ins.RETM.opcode: _get_return_effects,
+    ins.RET.opcode: _get_return_effects,
+    ins.RET0.opcode: _get_return_effects,
+    ins.RET1.opcode: _get_return_effects,
+    ins.FORI.opcode: _get_for_init_effects,
+    ins.JFORI.opcode: _get_for_init_effects,
+    ins.FORL.opcode: _get_for_loop_effects,
+    ins.IFORL.opcode: _get_for_loop_effects,
+    ins.JFORL.opcode: _get_for_loop_effects,
+    ins.ITERL.opcode: _get_iterator_loop_effects,
+    ins.IITERL.opcode: _get_iterator_loop_effects,
+    ins.JITERL.opcode: _get_iterator_loop_effects,
+}
+
+for _definition in (ins.UCLO, ins.LOOP, ins.ILOOP, ins.JLOOP, ins.JMP,
+                    ins.FUNCF, ins.IFUNCF, ins.JFUNCF, ins.FUNCV,
+                    ins.IFUNCV, ins.JFUNCV, ins.FUNCC, ins.FUNCCW,
+                    ins.UNKNW):
+    _SPECIAL[_definition.opcode] = _get_no_effects
@@ -2,6 +2,7 @@
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
 
+import bisect
 
 class VariableInfo:
     T_VISIBLE = 0
@@ -20,6 +21,9 @@ class DebugInformation:
         self.upvalue_variable_names = []
         self.variable_info = []
 
+        # Variables alive at every address, see _build_live_variables
+        self._live_variables = None
+
     def lookup_line_number(self, addr):
         try:
             return self.addr_to_line_map[addr]
@@ -27,6 +31,27 @@ class DebugInformation:
             return 0
 
     def lookup_local_name(self, addr, slot):
+        if self._live_variables is None:
+            self._live_variables = self._build_live_variables()
+
+        if addr < 0:
+            return self._scan_local_name(addr, slot)
+
+        try:
+            live = self._live_variables[addr]
+        except IndexError:
+            return None
+
+        if slot < len(live):
+            return live[slot]
+
+        return None
+
+    # Must be called after variable_info ranges are changed
+    def reset_local_names(self):
+        self._live_variables = None
+
+    def _scan_local_name(self, addr, slot):
         for info in self.variable_info:
             if info.start_addr > addr:
                 break
@@ -39,6 +64,42 @@ class DebugInformation:
 
         return None
 
+    # For every address the tuple of variables _scan_local_name walks
+    # through, in slot order. The tuples only change at range bounds, so
+    # addresses in between share them.
+    def _build_live_variables(self):
+        infos = self.variable_info
+
+        # The scan stops at the first variable starting past addr
+        starts = []
+        last_start = None
+
+        for info in infos:
+            if last_start is None or info.start_addr > last_start:
+                last_start = info.start_addr
+
+            starts.append(last_start)
+
+        bounds = set()
+
+        for info in infos:
+            bounds.add(info.start_addr)
+            bounds.add(info.end_addr)
+
+        live_variables = []
+        live = ()
+
+        for addr in range(max(bounds, default=0)):
+            if addr in bounds:
+                count = bisect.bisect_right(starts, addr)
+
+                live = tuple(info for info in infos[:count]
+                             if info.end_addr > addr)
+
+            live_variables.append(live)
+
+        return live_variables
+
     def lookup_upvalue_name(self, slot):
         try:
             return self.upvalue_variable_names[slot]
@@ -20,8 +20,6 @@
 # 	bar(...)
 #
 
-import ljd.config.version_config
-
 # Argument types
 
 T_VAR = 0  # variable slot number
@@ -48,10 +46,14 @@ SLOT_FALSE = 30000  # placeholder slot value for logical false
 SLOT_TRUE = 30001  # placeholder slot value for logical true
 
 
+# Instances only carry the operands; name, types, description and the
+# other static metadata are class attributes of the per-opcode subclass
+# _IDef creates. Operands the opcode doesn't have are left unset.
 class _Instruction:
-    def __init__(self, definition):
-        for key, value in definition.__dict__.items():
-            setattr(self, key, value)
+    __slots__ = ("opcode", "A", "B", "CD")
+
+    def __init__(self):
+        self.opcode = self.definition.opcode
 
         if self.A_type is not None:
             self.A = 0
@@ -80,11 +82,24 @@ class _IDef:
 
         _IDef._LAST_OPCODE += 1
 
+        self.instruction_class = type(name, (_Instruction,), {
+            "__slots__": (),
+            "definition": self,
+            "name": self.name,
+            "A_type": self.A_type,
+            "B_type": self.B_type,
+            "CD_type": self.CD_type,
+            "description": self.description,
+            "args_count": self.args_count
+        })
+
     def __call__(self):
-        return _Instruction(self)
+        return self.instruction_class()
 
 
-# Names and order are in sync with luaJIT bytecode for ease of changing
+# Names and order are in sync with luaJIT bytecode for ease of changing.
+# The numbering is the LuaJIT 2.1 one, 2.0 dumps are mapped onto it by
+# ljd/rawdump/luajit/2.0/luajit_opcode.py
 
 # class = name			A	B	C	description
 # Comparison ops
@@ -114,9 +129,10 @@ ISFC = _IDef("ISFC", T_DST, None, T_VAR, "{A} = {D}; if not {D}")
 IST = _IDef("IST", None, None, T_VAR, "if {D}")
 ISF = _IDef("ISF", None, None, T_VAR, "if not {D}")
 
-if ljd.config.version_config.use_version > 2.0:
-    ISTYPE = _IDef("ISTYPE", T_VAR, None, T_LIT, "see lj vm source")
-    ISNUM = _IDef("ISNUM", T_VAR, None, T_LIT, "see lj vm source")
+# LuaJIT 2.1 only
+
+ISTYPE = _IDef("ISTYPE", T_VAR, None, T_LIT, "see lj vm source")
+ISNUM = _IDef("ISNUM", T_VAR, None, T_LIT, "see lj vm source")
 
 # Unary ops
 
@@ -188,8 +204,8 @@ TGETV = _IDef("TGETV", T_DST, T_VAR, T_VAR, "{A} = {B}[{C}]")
 TGETS = _IDef("TGETS", T_DST, T_VAR, T_STR, "{A} = {B}.{C}")
 TGETB = _IDef("TGETB", T_DST, T_VAR, T_LIT, "{A} = {B}[{C}]")
 
-if ljd.config.version_config.use_version > 2.0:
-    TGETR = _IDef("TGETR", T_DST, T_VAR, T_VAR, "{A} = {B}[{C}]")
+# LuaJIT 2.1 only
+TGETR = _IDef("TGETR", T_DST, T_VAR, T_VAR, "{A} = {B}[{C}]")
 
 TSETV = _IDef("TSETV", T_VAR, T_VAR, T_VAR, "{B}[{C}] = {A}")
 TSETS = _IDef("TSETS", T_VAR, T_VAR, T_STR, "{B}.{C} = {A}")
@@ -199,8 +215,8 @@ TSETM = _IDef("TSETM", T_BS, None, T_NUM,
               "for i = 0, MULTRES, 1 do"
               " {A_minus_one}[{D_low} + i] = slot({A} + i)")
 
-if ljd.config.version_config.use_version > 2.0:
-    TSETR = _IDef("TSETR", T_VAR, T_VAR, T_VAR, "{B}[{C}] = {A}")
+# LuaJIT 2.1 only
+TSETR = _IDef("TSETR", T_VAR, T_VAR, T_VAR, "{B}[{C}] = {A}")
 
 # Calls and vararg handling. T = tail call.
 
@@ -1,4 +1,5 @@
-# Will automatically be changed if file is listed below
+# Version of the dumps whose header names none we know, see
+# ljd.context.DecompileContext
 use_version = 2.1
 
 # Add fully-qualified names and versions of lua files to relevant lists below.
@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import sys
+import traceback
+
+import ljd.config.version_config
+
+# The comment of a failure at a node that decompilation went on after
+WARNING_COMMENT = "-- WARNING: Error occurred during decompilation.\n" \
+                  "--   Code may be incomplete or incorrect."
+
+
+# Options and state of a single decompilation run, handed down the
+# pipeline. ljd keeps nothing between runs elsewhere, so runs with their
+# own contexts may go on side by side, in threads too.
+#
+# catch_asserts - failures of unwarp and of the temporary slots
+#   elimination are reported inline and decompilation goes on with the
+#   code as it is
+# version - LuaJIT version to decode the dump with, None picks it from the
+#   dump header
+# default_version - the version of dumps whose header names none we know
+# checks - run the passes that only check the tree
+#
+# timings gets the seconds spent in each stage of the run, by stage name,
+# stage is the one the run is in and errors the DecompileError of the
+# failures it went on after
+class DecompileContext:
+    def __init__(self, catch_asserts=False, version=None,
+                 default_version=ljd.config.version_config.use_version,
+                 checks=True):
+        self.catch_asserts = catch_asserts
+        self.version = version
+        self.default_version = default_version
+        self.checks = checks
+
+        self.timings = {}
+        self.stage = None
+        self.errors = []
+
+    # message defaults to the exception being handled
+    def add_error(self, comment=None, message=None):
+        if message is None:
+            message = _describe_exception()
+
+        error = DecompileError(self.stage, message, comment)
+        self.errors.append(error)
+
+        return error
+
+
+# stage - the stage of the run it happened in
+# message - what went wrong
+# comment - the lua comment that tells about it in place of the code that
+#   failed, None if there is none
+class DecompileError:
+    def __init__(self, stage, message, comment=None):
+        self.stage = stage
+        self.message = message
+        self.comment = comment
+
+    def __repr__(self):
+        return "DecompileError({0!r}, {1!r})".format(self.stage, self.message)
+
+
+def _describe_exception():
+    error_type, error, _ = sys.exc_info()
+
+    if error_type is None:
+        return "unknown error"
+
+    return traceback.format_exception_only(error_type, error)[-1].strip()
@@ -0,0 +1,97 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import io
+import os
+import time
+
+import ljd.ast.builder
+import ljd.ast.pipeline
+import ljd.context
+import ljd.lua.writer
+import ljd.rawdump.parser
+import ljd.util.log
+
+# Keeps nothing of a run, so all of them share it
+_PASSES = ljd.ast.pipeline.PassManager()
+
+
+# What decompile() made of a dump. lua is the decompiled text, None if
+# decompilation failed. errors has the ljd.context.DecompileError of every
+# failure, the one that stopped decompilation last, and timings the
+# seconds spent in each stage.
+class Result:
+    def __init__(self, lua, errors, timings):
+        self.lua = lua
+        self.errors = errors
+        self.timings = timings
+
+
+# source is a file name, as a str or path-like, a binary file object or
+# the dump itself as bytes or any other buffer, name labels the latter two
+# in messages. The options are those of ljd.context.DecompileContext.
+# A dump that fails to decompile shows in the result, nothing is raised
+# or printed.
+def decompile(source, name="", catch_asserts=False, version=None,
+              checks=True):
+    ctx = ljd.context.DecompileContext(catch_asserts=catch_asserts,
+                                       version=version, checks=checks)
+
+    messages = []
+    lua = None
+
+    with ljd.util.log.collect(messages):
+        try:
+            ast = build(source, name, ctx)
+
+            if ast is not None:
+                _PASSES.run(ast, ctx)
+
+                ctx.stage = "write"
+                start = time.perf_counter()
+
+                out = io.StringIO()
+                ljd.lua.writer.write(out, ast, "UTF-8")
+                lua = out.getvalue()
+
+                ctx.timings["write"] = time.perf_counter() - start
+        except Exception:
+            ctx.add_error()
+
+    # Only the dump parser prints messages
+    errors = [ljd.context.DecompileError("parse", message)
+              for message in messages]
+
+    return Result(lua, errors + ctx.errors, ctx.timings)
+
+
+# Reads source and builds the tree of it, None if the dump can't be read.
+# The seconds spent go to ctx.timings, the times of the prototypes to
+# times, see ljd.ast.builder.build().
+def build(source, name, ctx, times=None):
+    if isinstance(source, os.PathLike):
+        source = os.fspath(source)
+    elif hasattr(source, "read"):
+        source = source.read()
+
+    ctx.stage = "parse"
+    start = time.perf_counter()
+
+    header, prototype = ljd.rawdump.parser.parse(source, name, ctx)
+
+    ctx.timings["parse"] = time.perf_counter() - start
+
+    if not prototype:
+        return None
+
+    ctx.stage = "build"
+    start = time.perf_counter()
+
+    ast = ljd.ast.builder.build(prototype, times)
+
+    ctx.timings["build"] = time.perf_counter() - start
+
+    assert ast is not None
+
+    return ast
@@ -36,6 +36,9 @@ STATEMENT_FUNCTION = 9
 
 VALID_IDENTIFIER = re.compile(r'^\w[\w\d]*$')
 
+# Printed text is joined into a chunk every this many fragments
+_CHUNK_FRAGMENTS = 4096
+
 
 class _State:
     def __init__(self):
@@ -44,11 +47,19 @@ class _State:
         self.function_local = False
 
 
+# Handlers yield the nodes to print at that point, see ljd.ast.traverse.
+# The commands go to printer.feed() as they come, or to print_queue when
+# there is no printer.
 class Visitor(traverse.Visitor):
-    def __init__(self):
+    def __init__(self, printer=None):
         traverse.Visitor.__init__(self)
 
-        self.print_queue = []
+        if printer is None:
+            self.print_queue = []
+            self._emit = self.print_queue.append
+        else:
+            self.print_queue = None
+            self._emit = printer.feed
 
         self._visited_nodes = [set()]
         self._states = [_State()]
@@ -58,24 +69,24 @@ class Visitor(traverse.Visitor):
     def _start_statement(self, statement):
         assert self._state().current_statement == STATEMENT_NONE
         self._state().current_statement = statement
-        self.print_queue.append((CMD_START_STATEMENT, statement))
+        self._emit((CMD_START_STATEMENT, statement))
 
     def _end_statement(self, statement):
         assert statement == self._state().current_statement
         self._state().current_statement = STATEMENT_NONE
-        self.print_queue.append((CMD_END_STATEMENT, statement))
+        self._emit((CMD_END_STATEMENT, statement))
 
     def _end_line(self):
-        self.print_queue.append((CMD_END_LINE,))
+        self._emit((CMD_END_LINE,))
 
     def _start_block(self):
-        self.print_queue.append((CMD_START_BLOCK,))
+        self._emit((CMD_START_BLOCK,))
 
     def _end_block(self):
-        self.print_queue.append((CMD_END_BLOCK,))
+        self._emit((CMD_END_BLOCK,))
 
     def _write(self, fmt, *args, **kargs):
-        self.print_queue.append((CMD_WRITE, fmt, args, kargs))
+        self._emit((CMD_WRITE, fmt, args, kargs))
 
     def _state(self):
         return self._states[-1]
@@ -99,7 +110,7 @@ class Visitor(traverse.Visitor):
 
             self._write("function ")
 
-            self._visit(self._state().function_name)
+            yield self._state().function_name
 
             self._write("(")
 
@@ -107,7 +118,7 @@ class Visitor(traverse.Visitor):
         else:
             self._write("function (")
 
-        self._visit(node.arguments)
+        yield node.arguments
 
         self._write(")")
 
@@ -119,7 +130,7 @@ class Visitor(traverse.Visitor):
             if isinstance(end_node, nodes.Return) and len(end_node.returns.contents) == 0:
                 node.statements.contents.pop(-1)
 
-        self._visit(node.statements)
+        yield node.statements
 
         self._write("end")
 
@@ -129,6 +140,11 @@ class Visitor(traverse.Visitor):
     # ##
 
     def visit_table_constructor(self, node):
+        if isinstance(node, nodes.ConstantTable) \
+                and node.template is not None:
+            yield from self._write_constant_table(node)
+            return
+
         self._write("{")
 
         if len(node.records.contents) + len(node.array.contents) > 0:
@@ -157,7 +173,7 @@ class Visitor(traverse.Visitor):
 
                     all_records.contents.insert(0, record)
 
-            self._visit(all_records)
+            yield all_records
 
             self._skip(node.array)
             self._skip(node.records)
@@ -169,6 +185,90 @@ class Visitor(traverse.Visitor):
 
         self._write("}")
 
+    # Prints the template the way visit_table_constructor would print its
+    # nodes, without making them
+    def _write_constant_table(self, node):
+        array = node.template.array
+        dictionary = node.template.dictionary
+        records = node.records.contents
+
+        self._skip(node.array)
+        self._skip(node.records)
+
+        self._write("{")
+
+        if len(array) + len(dictionary) + len(records) == 0:
+            self._write("}")
+            return
+
+        self._end_line()
+
+        self._start_block()
+
+        first = True
+
+        if len(array) > 0 and array[0] is not None:
+            self._write("[")
+            self._write_template_item(0)
+            self._write("] = ")
+            self._write_template_item(array[0])
+
+            first = False
+
+        for value in array[1:]:
+            if not first:
+                self._write(",")
+                self._end_line()
+
+            self._write_template_item(value)
+
+            first = False
+
+        for key, value in dictionary:
+            if not first:
+                self._write(",")
+                self._end_line()
+
+            if isinstance(key, str) and VALID_IDENTIFIER.match(key):
+                self._write(key)
+                self._write(" = ")
+            else:
+                self._write("[")
+                self._write_template_item(key)
+                self._write("] = ")
+
+            self._write_template_item(value)
+
+            first = False
+
+        for record in records:
+            if not first:
+                self._write(",")
+                self._end_line()
+
+            yield record
+
+            first = False
+
+        if not first:
+            self._end_line()
+
+        self._end_block()
+
+        self._write("}")
+
+    def _write_template_item(self, value):
+        if value is None:
+            self._write("nil")
+        elif value is True:
+            self._write("true")
+        elif value is False:
+            self._write("false")
+        elif isinstance(value, str):
+            self._write_string(value)
+        else:
+            self._write(value)
+
     def visit_table_record(self, node):
         if self._is_valid_name(node.key):
             self._write(node.key.value)
@@ -179,11 +279,11 @@ class Visitor(traverse.Visitor):
         else:
             self._write("[")
 
-            self._visit(node.key)
+            yield node.key
 
             self._write("] = ")
 
-        self._visit(node.value)
+        yield node.value
 
     # visit_array_record is a passthough
 
@@ -211,7 +311,7 @@ class Visitor(traverse.Visitor):
                     self._state().function_name = dst
                     self._state().function_local = is_local
 
-                    self._visit(src)
+                    yield src
 
                     self._skip(node.destinations)
                     self._skip(node.expressions)
@@ -226,11 +326,11 @@ class Visitor(traverse.Visitor):
         else:
             self._start_statement(STATEMENT_ASSIGNMENT)
 
-        self._visit(node.destinations)
+        yield node.destinations
 
         self._write(" = ")
 
-        self._visit(node.expressions)
+        yield node.expressions
 
         if src_is_function:
             self._end_statement(STATEMENT_FUNCTION)
@@ -307,7 +407,7 @@ class Visitor(traverse.Visitor):
         if left_parentheses:
             self._write("(")
 
-        self._visit(node.left)
+        yield node.left
 
         if left_parentheses:
             self._write(")")
@@ -353,14 +453,12 @@ class Visitor(traverse.Visitor):
         if right_parentheses:
             self._write("(")
 
-        self._visit(node.right)
+        yield node.right
 
         if right_parentheses:
             self._write(")")
 
     def visit_unary_operator(self, node):
-        import ljd.config.version_config
-
         if node.type == nodes.UnaryOperator.T_LENGTH_OPERATOR:
             self._write("#")
         elif node.type == nodes.UnaryOperator.T_MINUS:
@@ -373,12 +471,11 @@ class Visitor(traverse.Visitor):
                     node.operand.slot = SLOT_TRUE
             else:
                 self._write("not ")
-        elif ljd.config.version_config.use_version > 2.0:
-            # TODO
-            if node.type == nodes.UnaryOperator.T_TOSTRING:
-                self._write("tostring")
-            elif node.type == nodes.UnaryOperator.T_TONUMBER:
-                self._write("tonumber")
+        # TODO
+        elif node.type == nodes.UnaryOperator.T_TOSTRING:
+            self._write("tostring")
+        elif node.type == nodes.UnaryOperator.T_TONUMBER:
+            self._write("tonumber")
 
         has_subexp = isinstance(node.operand, OPERATOR_TYPES)
         need_parentheses = has_subexp and node.operand.type < node.type
@@ -386,7 +483,7 @@ class Visitor(traverse.Visitor):
         if need_parentheses:
             self._write("(")
 
-        self._visit(node.operand)
+        yield node.operand
 
         if need_parentheses:
             self._write(")")
@@ -410,10 +507,10 @@ class Visitor(traverse.Visitor):
             return
 
         for subnode in node.contents[:-1]:
-            self._visit(subnode)
+            yield subnode
             self._write(", ")
 
-        self._visit(node.contents[-1])
+        yield node.contents[-1]
 
     visit_identifiers_list = _visit_comma_separated_list
 
@@ -422,12 +519,12 @@ class Visitor(traverse.Visitor):
             return
 
         for subnode in node.contents[:-1]:
-            self._visit(subnode)
+            yield subnode
 
             self._write(",")
             self._end_line()
 
-        self._visit(node.contents[-1])
+        yield node.contents[-1]
         self._end_line()
 
     visit_variables_list = _visit_comma_separated_list
@@ -473,7 +570,7 @@ class Visitor(traverse.Visitor):
         base_is_constructor = isinstance(base, nodes.TableConstructor)
 
         if not base_is_constructor and is_valid_name:
-            self._visit(base)
+            yield base
             self._write(".")
 
             self._write(key.value)
@@ -482,14 +579,14 @@ class Visitor(traverse.Visitor):
             if base_is_constructor:
                 self._write("(")
 
-            self._visit(base)
+            yield base
 
             if base_is_constructor:
                 self._write(")")
 
             self._write("[")
 
-            self._visit(key)
+            yield key
 
             self._write("]")
 
@@ -522,7 +619,7 @@ class Visitor(traverse.Visitor):
                     is_method = table == first_arg
 
         if is_method:
-            self._visit(node.function.table)
+            yield node.function.table
             self._write(":")
             self._write(node.function.key.value)
 
@@ -531,15 +628,15 @@ class Visitor(traverse.Visitor):
             args.pop(0)
 
             self._write("(")
-            self._visit(node.arguments)
+            yield node.arguments
             self._write(")")
 
             self._skip(node.arguments)
         else:
-            self._visit(node.function)
+            yield node.function
 
             self._write("(")
-            self._visit(node.arguments)
+            yield node.arguments
             self._write(")")
 
         if is_statement:
@@ -552,22 +649,22 @@ class Visitor(traverse.Visitor):
 
         self._write("if ")
 
-        self._visit(node.expression)
+        yield node.expression
 
         self._write(" then")
 
         self._end_line()
 
-        self._visit(node.then_block)
+        yield node.then_block
 
-        self._visit_list(node.elseifs)
+        yield from node.elseifs
 
         if len(node.else_block.contents) > 0:
             self._write("else")
 
             self._end_line()
 
-            self._visit(node.else_block)
+            yield node.else_block
         else:
             self._skip(node.else_block)
 
@@ -578,13 +675,13 @@ class Visitor(traverse.Visitor):
     def visit_elseif(self, node):
         self._write("elseif ")
 
-        self._visit(node.expression)
+        yield node.expression
 
         self._write(" then")
 
         self._end_line()
 
-        self._visit(node.then_block)
+        yield node.then_block
 
     # ##
 
@@ -596,14 +693,14 @@ class Visitor(traverse.Visitor):
 
         self._end_line()
 
-        self._visit_list(node.contents)
+        yield from node.contents
 
         self._write("--- END OF BLOCK #{0} ---", node.index)
 
         self._end_line()
 
         self._end_line()
-        self._visit(node.warp)
+        yield node.warp
         self._end_line()
 
         self._end_line()
@@ -625,7 +722,7 @@ class Visitor(traverse.Visitor):
 
         self._write("if ")
 
-        self._visit(node.condition)
+        yield node.condition
 
         self._write(" then")
         self._end_line()
@@ -646,11 +743,11 @@ class Visitor(traverse.Visitor):
     def visit_iterator_warp(self, node):
         self._write("for ")
 
-        self._visit(node.variables)
+        yield node.variables
 
         self._write(" in ")
 
-        self._visit(node.controls)
+        yield node.controls
 
         self._end_line()
         self._write("LOOP BLOCK #{0}", node.body.index)
@@ -663,11 +760,11 @@ class Visitor(traverse.Visitor):
     def visit_numeric_loop_warp(self, node):
         self._write("for ")
 
-        self._visit(node.index)
+        yield node.index
 
         self._write("=")
 
-        self._visit(node.controls)
+        yield node.controls
 
         self._end_line()
         self._write("LOOP BLOCK #{0}", node.body.index)
@@ -685,7 +782,7 @@ class Visitor(traverse.Visitor):
         else:
             self._write("return")
 
-        self._visit(node.returns)
+        yield node.returns
 
         self._end_statement(STATEMENT_RETURN)
 
@@ -702,12 +799,12 @@ class Visitor(traverse.Visitor):
         self._start_statement(STATEMENT_WHILE)
 
         self._write("while ")
-        self._visit(node.expression)
+        yield node.expression
         self._write(" do")
 
         self._end_line()
 
-        self._visit(node.statements)
+        yield node.statements
 
         self._write("end")
         self._end_statement(STATEMENT_WHILE)
@@ -718,10 +815,10 @@ class Visitor(traverse.Visitor):
         self._write("repeat")
         self._end_line()
 
-        self._visit(node.statements)
+        yield node.statements
 
         self._write("until ")
-        self._visit(node.expression)
+        yield node.expression
 
         self._end_statement(STATEMENT_REPEAT_UNTIL)
 
@@ -729,16 +826,16 @@ class Visitor(traverse.Visitor):
         self._start_statement(STATEMENT_NUMERIC_FOR)
 
         self._write("for ")
-        self._visit(node.variable)
+        yield node.variable
         self._write(" = ")
 
-        self._visit(node.expressions)
+        yield node.expressions
 
         self._write(" do")
 
         self._end_line()
 
-        self._visit(node.statements)
+        yield node.statements
 
         self._write("end")
         self._end_statement(STATEMENT_NUMERIC_FOR)
@@ -747,14 +844,14 @@ class Visitor(traverse.Visitor):
         self._start_statement(STATEMENT_ITERATOR_FOR)
 
         self._write("for ")
-        self._visit(node.identifiers)
+        yield node.identifiers
         self._write(" in ")
-        self._visit(node.expressions)
+        yield node.expressions
         self._write(" do")
 
         self._end_line()
 
-        self._visit(node.statements)
+        yield node.statements
 
         self._write("end")
         self._end_statement(STATEMENT_ITERATOR_FOR)
@@ -766,18 +863,21 @@ class Visitor(traverse.Visitor):
             self._write(node.value)
             return
 
-        lines = node.value.count("\n")
+        self._write_string(node.value)
+
+    def _write_string(self, value):
+        lines = value.count("\n")
 
         if lines > 2:
             self._write("[[")
 
             self._write("\n")
 
-            self._write(node.value)
+            self._write(value)
 
             self._write("]]")
         else:
-            text = node.value
+            text = value
 
             text = text.replace("\\", "\\\\")
             text = text.replace("\t", "\\t")
@@ -798,11 +898,9 @@ class Visitor(traverse.Visitor):
     def _skip(self, node):
         self._visited_nodes[-1].add(node)
 
-    def _visit(self, node):
-        assert node is not None
-
+    def _enter(self, node):
         if node in self._visited_nodes[-1]:
-            return
+            return False
 
         self._visited_nodes[-1].add(node)
 
@@ -816,95 +914,132 @@ class Visitor(traverse.Visitor):
             self._write("-- Decompilation error in this vicinity:")
             self._end_line()
 
-        traverse.Visitor._visit(self, node)
+        return True
 
+    def _exit(self, node):
         self._visited_nodes.pop()
 
 
-def write(fd, ast):
+def write(fd, ast, encoding=None):
     assert isinstance(ast, nodes.FunctionDefinition)
 
-    visitor = Visitor()
+    printer = Printer(fd, encoding)
+    visitor = Visitor(printer)
 
     traverse.traverse(visitor, ast.statements)
 
-    _process_queue(fd, visitor.print_queue)
+    printer.close()
 
 
-def wrapped_write(fd, *objects, sep=' ', end='\n', file=sys.stdout):
-    enc = file.encoding
-    if enc == 'UTF-8':
-        fd.write(*objects)
-    else:
-        def f(obj): return str(obj).encode(
-            enc, errors='backslashreplace').decode(enc)
-        fd.write(*map(f, objects))
+# Formats the visitor's commands as they come. Whether a statement is
+# followed by a blank line depends on the next statement or block start or
+# end, so a slot for it is left open until one of those shows up.
+# Nothing reaches fd before close(), a failed write leaves it untouched.
+# Characters the encoding lacks are escaped, it defaults to the one of
+# stdout everything used to be written in.
+class Printer:
+    def __init__(self, fd, encoding=None):
+        self.fd = fd
 
+        if encoding is None:
+            encoding = sys.stdout.encoding
 
-def _get_next_significant(queue, i):
-    i += 1
+        self._encoding = encoding
 
-    while i < len(queue):
-        cmd = queue[i]
+        self._indent = 0
+        self._line_broken = True
 
-        if cmd[0] not in (CMD_END_LINE, CMD_WRITE):
-            break
+        self._fragments = []
+        self._chunks = []
 
-        i += 1
+        # (statement, its blank line slot in _fragments) or None
+        self._pending = None
 
-    if i < len(queue):
-        return queue[i]
-    else:
-        return CMD_END_BLOCK,
+    def feed(self, cmd):
+        kind = cmd[0]
 
+        if kind == CMD_WRITE:
+            self._write(cmd)
+            return
 
-def _process_queue(fd, queue):
-    indent = 0
+        if kind == CMD_END_LINE:
+            self._fragments.append("\n")
+            self._line_broken = True
+            return
+
+        if self._pending is not None:
+            self._settle(cmd)
+
+        if kind == CMD_END_STATEMENT:
+            self._fragments.append("\n")
+            self._line_broken = True
+
+            self._pending = (cmd[1], len(self._fragments))
+            self._fragments.append("")
+        elif kind == CMD_START_BLOCK:
+            self._indent += 1
+        elif kind == CMD_END_BLOCK:
+            self._indent -= 1
+
+            assert self._indent >= 0
+        else:
+            assert kind == CMD_START_STATEMENT
+
+        if len(self._fragments) >= _CHUNK_FRAGMENTS:
+            self._join()
+
+    def close(self):
+        if self._pending is not None:
+            self._settle((CMD_END_BLOCK,))
 
-    line_broken = True
+        self._join()
 
-    for i, cmd in enumerate(queue):
-        assert isinstance(cmd, tuple)
+        text = "".join(self._chunks)
+        self._chunks = []
 
-        if cmd[0] == CMD_START_STATEMENT:
-            # assert line_broken
-            pass
-        elif cmd[0] == CMD_END_STATEMENT:
-            wrapped_write(fd, "\n")
-            line_broken = True
+        if self._encoding != 'UTF-8':
+            text = text.encode(self._encoding, errors='backslashreplace') \
+                .decode(self._encoding)
 
-            next_cmd = _get_next_significant(queue, i)
+        self.fd.write(text)
 
-            if next_cmd[0] not in (CMD_END_BLOCK, CMD_START_BLOCK):
-                assert next_cmd[0] == CMD_START_STATEMENT
+    def _write(self, cmd):
+        if self._line_broken:
+            self._fragments.append(self._indent * '\t')
+            self._line_broken = False
 
-                if next_cmd[1] != cmd[1] \
-                        or cmd[1] >= STATEMENT_IF \
-                        or next_cmd[1] >= STATEMENT_IF:
-                    wrapped_write(fd, "\n")
-        elif cmd[0] == CMD_END_LINE:
-            wrapped_write(fd, "\n")
-            line_broken = True
-        elif cmd[0] == CMD_START_BLOCK:
-            indent += 1
-        elif cmd[0] == CMD_END_BLOCK:
-            indent -= 1
+        _id, fmt, args, kargs = cmd
 
-            assert indent >= 0
+        if len(args) + len(kargs) > 0:
+            text = fmt.format(*args, **kargs)
+        elif isinstance(fmt, str):
+            text = fmt
         else:
-            assert cmd[0] == CMD_WRITE
+            text = str(fmt)
 
-            if line_broken:
-                wrapped_write(fd, indent * '\t')
-                line_broken = False
+        self._fragments.append(text)
 
-            _id, fmt, args, kargs = cmd
+        if len(self._fragments) >= _CHUNK_FRAGMENTS \
+                and self._pending is None:
+            self._join()
 
-            if len(args) + len(kargs) > 0:
-                text = fmt.format(*args, **kargs)
-            elif isinstance(fmt, str):
-                text = fmt
-            else:
-                text = str(fmt)
+    def _settle(self, next_cmd):
+        statement, slot = self._pending
+        self._pending = None
+
+        if next_cmd[0] in (CMD_END_BLOCK, CMD_START_BLOCK):
+            return
+
+        assert next_cmd[0] == CMD_START_STATEMENT
+
+        if next_cmd[1] != statement \
+                or statement >= STATEMENT_IF \
+                or next_cmd[1] >= STATEMENT_IF:
+            self._fragments[slot] = "\n"
+
+    def _join(self):
+        if self._pending is not None:
+            return
 
-            wrapped_write(fd, text)
+        self._chunks.append("".join(self._fragments))
+        self._fragments = []
@@ -2,10 +2,7 @@
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
 
-import bisect
-
 import ljd.bytecode.instructions as ins
-import ljd.config.version_config
 import ljd.pseudoasm.prototype
 from ljd.bytecode.constants import T_NIL, T_FALSE, T_TRUE
 
@@ -556,6 +553,9 @@ _HANDLERS_MAP = [
     (ins.IST.opcode, _translate_normal),
     (ins.ISF.opcode, _translate_normal),
 
+    (ins.ISTYPE.opcode, _translate_normal),
+    (ins.ISNUM.opcode, _translate_normal),
+
     # Unary ops
 
     (ins.MOV.opcode, _translate_normal),
@@ -621,12 +621,14 @@ _HANDLERS_MAP = [
     (ins.TGETV.opcode, _translate_normal),
     (ins.TGETS.opcode, _translate_table_str_op),
     (ins.TGETB.opcode, _translate_normal),
+    (ins.TGETR.opcode, _translate_normal),
 
     (ins.TSETV.opcode, _translate_normal),
     (ins.TSETS.opcode, _translate_table_str_op),
     (ins.TSETB.opcode, _translate_normal),
 
     (ins.TSETM.opcode, _translate_mass_set),
+    (ins.TSETR.opcode, _translate_normal),
 
     # Calls and vararg handling
 
@@ -682,12 +684,6 @@ _HANDLERS_MAP = [
     (ins.FUNCCW.opcode, _translate_normal)
 ]
 
-if ljd.config.version_config.use_version > 2.0:
-    bisect.insort(_HANDLERS_MAP, (ins.ISTYPE.opcode, _translate_normal))
-    bisect.insort(_HANDLERS_MAP, (ins.ISNUM.opcode, _translate_normal))
-    bisect.insort(_HANDLERS_MAP, (ins.TGETR.opcode, _translate_normal))
-    bisect.insort(_HANDLERS_MAP, (ins.TSETR.opcode, _translate_normal))
-
 
 def _init():
     global _HANDLERS_MAP, _DESCRIPTION_HANDLERS
@@ -2,77 +2,136 @@
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
 
+import importlib.util
+import os
+
 import ljd.bytecode.instructions as instructions
 from ljd.util.log import errprint
 
-_MAP = [None] * 256
+# Every supported LuaJIT version keeps its opcode numbering in
+# luajit/<version>/luajit_opcode.py
+_OPCODES_DIR = os.path.join(os.path.dirname(__file__), "luajit")
+
+# Per-opcode decoding recipes (see _make_decoder) by LuaJIT version,
+# loaded on first use
+_DECODERS = {}
+
+_OPERAND_PLAIN = 0
+_OPERAND_CONSTANT = 1
+_OPERAND_JUMP = 2
 
 
 def read(parser):
-    global _MAP
+    return read_all(parser, 1)[0]
 
-    codeword = parser.stream.read_uint(4)
 
-    opcode = codeword & 0xFF
+def read_all(parser, count):
+    codewords = parser.stream.read_uints(count, 4)
 
-    instruction_class = _MAP[opcode]
+    return decode(parser, codewords)
 
-    if instruction_class is None:
-        errprint("Warning: unknown opcode {0:08x}", opcode)
-        instruction_class = instructions.UNKNW  # @UndefinedVariable
 
-    instruction = instruction_class()
+def decode(parser, codewords):
+    decoders = parser.decoders
+    constants_count = parser.complex_constants_count
 
-    if instruction_class.opcode != opcode:
-        instruction.opcode = opcode
+    decoded = []
 
-    _set_instruction_operands(parser, codeword, instruction)
+    for codeword in codewords:
+        opcode = codeword & 0xFF
 
-    return instruction
+        decoder = decoders[opcode]
 
+        if decoder is None:
+            errprint("Warning: unknown opcode {0:08x}", opcode)
+            decoder = _make_decoder(
+                opcode, instructions.UNKNW)  # @UndefinedVariable
 
-def _set_instruction_operands(parser, codeword, instruction):
-    if instruction.args_count == 3:
-        A = (codeword >> 8) & 0xFF
-        CD = (codeword >> 16) & 0xFF
-        B = (codeword >> 24) & 0xFF
-    else:
-        A = (codeword >> 8) & 0xFF
-        CD = (codeword >> 16) & 0xFFFF
+        instruction_class, override, has_A, has_B, CD_mask, CD_kind = decoder
+
+        instruction = instruction_class()
+
+        if override:
+            instruction.opcode = opcode
+
+        if has_A:
+            instruction.A = (codeword >> 8) & 0xFF
+
+        if has_B:
+            instruction.B = (codeword >> 24) & 0xFF
+
+        if CD_kind is not None:
+            CD = (codeword >> 16) & CD_mask
 
-    if instruction.A_type is not None:
-        instruction.A = _process_operand(parser, instruction.A_type, A)
+            if CD_kind == _OPERAND_CONSTANT:
+                CD = constants_count - CD - 1
+            elif CD_kind == _OPERAND_JUMP:
+                CD -= 0x8000
 
-    if instruction.B_type is not None:
-        instruction.B = _process_operand(parser, instruction.B_type, B)
+            instruction.CD = CD
 
-    if instruction.CD_type is not None:
-        instruction.CD = _process_operand(parser, instruction.CD_type, CD)
+        decoded.append(instruction)
 
+    return decoded
 
-def _process_operand(parser, operand_type, operand):
-    if operand_type == instructions.T_STR \
+
+# Only the CD operand ever refers to constants or jump targets, so A and B
+# are plain bytes for every instruction
+def _make_decoder(opcode, instruction_class):
+    assert _operand_kind(instruction_class.A_type) in (None, _OPERAND_PLAIN)
+    assert _operand_kind(instruction_class.B_type) in (None, _OPERAND_PLAIN)
+
+    if instruction_class.args_count == 3:
+        CD_mask = 0xFF
+    else:
+        CD_mask = 0xFFFF
+
+    return (instruction_class.instruction_class,
+            instruction_class is instructions.UNKNW,  # @UndefinedVariable
+            instruction_class.A_type is not None,
+            instruction_class.B_type is not None,
+            CD_mask,
+            _operand_kind(instruction_class.CD_type))
+
+
+def _operand_kind(operand_type):
+    if operand_type is None:
+        return None
+    elif operand_type == instructions.T_STR \
             or operand_type == instructions.T_TAB \
             or operand_type == instructions.T_FUN \
             or operand_type == instructions.T_CDT:
-        return parser.complex_constants_count - operand - 1
+        return _OPERAND_CONSTANT
     elif operand_type == instructions.T_JMP:
-        return operand - 0x8000
+        return _OPERAND_JUMP
     else:
-        return operand
+        return _OPERAND_PLAIN
+
+
+# Returns None if there is no opcode table for the version
+def get_decoders(version):
+    version = str(version)
+
+    try:
+        return _DECODERS[version]
+    except KeyError:
+        pass
 
+    path = os.path.join(_OPCODES_DIR, version, "luajit_opcode.py")
 
-def _init():
-    global _MAP
+    if not os.path.isfile(path):
+        return None
 
-    # from opcode import _OPCODES
-    from luajit_opcode import _OPCODES
+    spec = importlib.util.spec_from_file_location(
+        "ljd.rawdump.luajit_opcode_" + version.replace(".", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
 
-    for opcode, instruction in sorted(_OPCODES, key=lambda x: x[0]):
-        _MAP[opcode] = instruction
+    decoders = [None] * 256
 
-    del globals()["_init"]
-    del _OPCODES
+    for opcode, instruction in module._OPCODES:
+        decoders[opcode] = _make_decoder(opcode, instruction)
 
+    _DECODERS[version] = decoders
 
-_init()
+    return decoders
@@ -28,24 +28,25 @@ PROTO_UV_IMMUTABLE = 0x4000
 def read(parser, constants):
     r = True
 
-    r = r and _read_upvalue_references(parser, constants.upvalue_references)
+    r = r and _read_upvalue_references(parser, constants)
     r = r and _read_complex_constants(parser, constants.complex_constants)
     r = r and _read_numeric_constants(parser, constants.numeric_constants)
 
     return r
 
 
-def _read_upvalue_references(parser, references):
+def _read_upvalue_references(parser, constants):
     i = 0
 
     while i < parser.upvalues_count:
         i += 1
         upvalue = parser.stream.read_uint(2)
+        constants.upvalue_locals.append(bool(upvalue & PROTO_UV_LOCAL))
         if upvalue & PROTO_UV_LOCAL:
             upvalue = upvalue ^ PROTO_UV_LOCAL
         if upvalue & PROTO_UV_IMMUTABLE:
             upvalue = upvalue ^ PROTO_UV_IMMUTABLE
-        references.append(upvalue)
+        constants.upvalue_references.append(upvalue)
 
     return True
 
@@ -46,8 +46,9 @@ def _read_lineinfo(parser, line_offset, lineinfo):
 
     lineinfo.append(0)
 
-    while len(lineinfo) < parser.instructions_count + 1:
-        line_number = parser.stream.read_uint(lineinfo_size)
+    count = parser.instructions_count + 1 - len(lineinfo)
+
+    for line_number in parser.stream.read_uints(count, lineinfo_size):
         lineinfo.append(line_offset + line_number)
 
     return True
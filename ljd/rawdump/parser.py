@@ -5,23 +5,44 @@
 # !/usr/bin/python3
 
 import ljd.bytecode.prototype
+import ljd.context
+import ljd.rawdump.code
 import ljd.rawdump.header
 import ljd.rawdump.prototype
 import ljd.util.binstream
 from ljd.util.log import errprint
 
+# Dump format version byte to the LuaJIT version writing it
+_DUMP_VERSIONS = {
+    1: 2.0,
+    2: 2.1
+}
+
 
 class _State:
     def __init__(self):
         self.stream = ljd.util.binstream.BinStream()
         self.flags = ljd.rawdump.header.Flags()
         self.prototypes = []
+        self.version = None
+        self.default_version = None
+        self.decoders = None
+
 
+# source is either a file name or the dump itself as a bytes-like object.
+# Unless ctx forces a version the opcode set is picked from the dump header.
+def parse(source, name="", ctx=None):
+    if ctx is None:
+        ctx = ljd.context.DecompileContext()
 
-def parse(filename):
     parser = _State()
+    parser.version = ctx.version
+    parser.default_version = ctx.default_version
 
-    parser.stream.open(filename)
+    if isinstance(source, str):
+        parser.stream.open(source)
+    else:
+        parser.stream.open_buffer(source, name)
 
     header = ljd.rawdump.header.Header()
 
@@ -60,6 +81,16 @@ def _read_header(parser, header):
     else:
         parser.stream.data_byteorder = 'little'
 
+    if parser.version is None:
+        parser.version = _DUMP_VERSIONS.get(
+            header.version, parser.default_version)
+
+    parser.decoders = ljd.rawdump.code.get_decoders(parser.version)
+
+    if parser.decoders is None:
+        errprint("Unsupported LuaJIT version: {0}", parser.version)
+        return False
+
     parser.header = header  # TODO yzg
     return True
 
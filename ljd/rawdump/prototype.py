@@ -110,8 +110,6 @@ def _read_counts_and_sizes(parser, prototype):
 
 
 def _read_instructions(parser, prototype):
-    i = 0
-
     if prototype.flags.is_variadic:
         header = ins.FUNCV()
     else:
@@ -120,15 +118,8 @@ def _read_instructions(parser, prototype):
     header.A = prototype.framesize
     prototype.instructions.append(header)
 
-    while i < parser.instructions_count:
-        instruction = ljd.rawdump.code.read(parser)
-
-        if not instruction:
-            return False
-
-        prototype.instructions.append(instruction)
-
-        i += 1
+    prototype.instructions += ljd.rawdump.code.read_all(
+        parser, parser.instructions_count)
 
     return True
 
@@ -2,14 +2,42 @@
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
 
-import io
-import os
+import struct
 import sys
 
 
+_UINT_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+_BYTEORDER_PREFIXES = {"little": "<", "big": ">"}
+
+
+# Returns the value and the offset right after it
+def read_uleb128_at(data, pos):
+    value = data[pos]
+    pos += 1
+
+    if value >= 0x80:
+        bitshift = 0
+        value &= 0x7f
+
+        while True:
+            byte = data[pos]
+            pos += 1
+
+            bitshift += 7
+            value |= (byte & 0x7f) << bitshift
+
+            if byte < 0x80:
+                break
+
+    return value, pos
+
+
+# The whole dump is loaded at once and decoded by offset, so every read is
+# a slice or a struct.unpack_from instead of a file read
 class BinStream:
     def __init__(self):
-        self.fd = None
+        self.data = b""
 
         self.size = 0
         self.pos = 0
@@ -18,12 +46,20 @@ class BinStream:
         self.data_byteorder = sys.byteorder
 
     def open(self, filename):
-        self.name = filename
-        self.fd = io.open(filename, 'rb')
-        self.size = os.stat(filename).st_size
+        with open(filename, "rb") as fd:
+            self.open_buffer(fd.read(), filename)
+
+    def open_buffer(self, data, name=""):
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+
+        self.name = name
+        self.data = data
+        self.size = len(data)
+        self.pos = 0
 
     def close(self):
-        self.fd.close()
+        self.data = b""
         self.size = 0
         self.pos = 0
 
@@ -38,7 +74,7 @@ class BinStream:
             raise IOError("Unexpected EOF while trying to read {0} bytes"
                           .format(size))
 
-        data = self.fd.read(size)
+        data = bytes(self.data[self.pos:self.pos + size])
         self.pos += size
 
         return data
@@ -47,41 +83,29 @@ class BinStream:
         if not self.check_data_available(1):
             raise IOError("Unexpected EOF while trying to read 1 byte")
 
-        data = self.fd.read(1)
+        value = self.data[self.pos]
         self.pos += 1
 
-        return int.from_bytes(data,
-                              byteorder=sys.byteorder,
-                              signed=False)
+        return value
 
     def read_zstring(self):
-        string = b''
+        end = self.data.find(b"\x00", self.pos)
 
-        while not self.eof():
-            byte = self.read_bytes(1)
-
-            if byte == b'\x00':
-                return string
-            else:
-                string += byte
+        if end < 0:
+            string = bytes(self.data[self.pos:])
+            self.pos = self.size
+        else:
+            string = bytes(self.data[self.pos:end])
+            self.pos = end + 1
 
         return string
 
     def read_uleb128(self):
-        value = self.read_byte()
-
-        if value >= 0x80:
-            bitshift = 0
-            value &= 0x7f
-
-            while True:
-                byte = self.read_byte()
-
-                bitshift += 7
-                value |= (byte & 0x7f) << bitshift
-
-                if byte < 0x80:
-                    break
+        try:
+            value, self.pos = read_uleb128_at(self.data, self.pos)
+        except IndexError:
+            self.pos = self.size
+            raise IOError("Unexpected EOF while trying to read 1 byte")
 
         return value
 
@@ -157,7 +181,34 @@ class BinStream:
         return is_number_bit, value
 
     def read_uint(self, size=4):
-        value = self.read_bytes(size)
+        if not self.check_data_available(size):
+            raise IOError("Unexpected EOF while trying to read {0} bytes"
+                          .format(size))
+
+        value = int.from_bytes(self.data[self.pos:self.pos + size],
+                               byteorder=self.data_byteorder, signed=False)
+        self.pos += size
+
+        return value
+
+    # Reads count unsigned integers of size bytes each in one go
+    def read_uints(self, count, size=4):
+        total = count * size
+
+        if not self.check_data_available(total):
+            raise IOError("Unexpected EOF while trying to read {0} bytes"
+                          .format(total))
+
+        code = _UINT_CODES.get(size)
+
+        if code is None:
+            return tuple(self.read_uint(size) for _ in range(count))
+
+        values = struct.unpack_from(
+            "{0}{1}{2}".format(_BYTEORDER_PREFIXES[self.data_byteorder],
+                               count, code),
+            self.data, self.pos)
+
+        self.pos += total
 
-        return int.from_bytes(value, byteorder=self.data_byteorder,
-                              signed=False)
+        return values
@@ -0,0 +1,117 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+_ENTRY_SUFFIX = ".lua"
+
+
+# Digest of the decompiler sources, any change to them invalidates
+# everything cached so far
+def decompiler_stamp():
+    digest = hashlib.sha1()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    for path, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+
+        for name in sorted(filenames):
+            if not name.endswith(".py"):
+                continue
+
+            full_path = os.path.join(path, name)
+            relative_path = os.path.relpath(full_path, root)
+
+            digest.update(relative_path.encode("utf-8"))
+
+            with open(full_path, "rb") as source:
+                digest.update(source.read())
+
+    return digest.hexdigest()
+
+
+# Decompiled files stored by the hash of the bytecode they came from.
+# Entries are replaced atomically, so several processes may share a cache;
+# evict() drops the least recently used ones beyond max_size bytes.
+class Cache:
+    def __init__(self, path, stamp, max_size):
+        self.path = path
+        self.stamp = stamp.encode("utf-8")
+        self.max_size = max_size
+
+    def key(self, data):
+        digest = hashlib.sha1(self.stamp)
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key[:2], key + _ENTRY_SUFFIX)
+
+    # Copies the cached file to file_out, False if there is none
+    def fetch(self, key, file_out):
+        entry_path = self._entry_path(key)
+
+        try:
+            shutil.copyfile(entry_path, file_out)
+        except FileNotFoundError:
+            return False
+
+        # Hits keep the entry young for evict()
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return True
+
+    def store(self, key, file_in):
+        entry_path = self._entry_path(key)
+        entry_dir = os.path.dirname(entry_path)
+
+        os.makedirs(entry_dir, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            shutil.copyfile(file_in, temp_path)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def evict(self):
+        entries = []
+        total_size = 0
+
+        for path, _, filenames in os.walk(self.path):
+            for name in filenames:
+                if not name.endswith(_ENTRY_SUFFIX):
+                    continue
+
+                full_path = os.path.join(path, name)
+
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, full_path))
+                total_size += stat.st_size
+
+        entries.sort()
+
+        for _, size, full_path in entries:
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.remove(full_path)
+            except OSError:
+                pass
+
+            total_size -= size
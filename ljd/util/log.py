@@ -2,8 +2,13 @@
 # Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
 #
 
+import contextlib
+import contextvars
 import sys
 
+# The list collect() gathers the messages of the current thread in
+_collected = contextvars.ContextVar("ljd.util.log.collected", default=None)
+
 
 def errprint(*args):
     fmt = None
@@ -14,7 +19,25 @@ def errprint(*args):
         fmt = args.pop(0)
 
     if fmt:
-        print(fmt.format(*args), file=sys.stderr)
+        message = fmt.format(*args)
     else:
         strs = [repr(x) for x in args]
-        print(" ".join(strs), file=sys.stderr)
+        message = " ".join(strs)
+
+    messages = _collected.get()
+
+    if messages is None:
+        print(message, file=sys.stderr)
+    else:
+        messages.append(message)
+
+
+# errprint() adds to messages instead of printing inside the with block
+@contextlib.contextmanager
+def collect(messages):
+    token = _collected.set(messages)
+
+    try:
+        yield messages
+    finally:
+        _collected.reset(token)
@@ -0,0 +1,191 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import csv
+import json
+import math
+
+import ljd.ast.nodes as nodes
+import ljd.ast.traverse as traverse
+
+_PERCENTILES = (50, 90, 99)
+
+_COUNTS = ("prototypes", "instructions", "blocks", "nodes")
+
+
+# Counts of a freshly built tree per prototype, from the times list
+# ljd.ast.builder.build() filled. A function counts its own blocks and
+# nodes only, those of the functions nested in it go to them.
+def describe_prototypes(times):
+    prototypes = []
+
+    for prototype, node, seconds in times:
+        counter = _NodesCounter(node)
+        traverse.traverse(counter, node)
+
+        prototypes.append({
+            "line": prototype.first_line_number,
+            "instructions": node._instructions_count,
+            "blocks": counter.blocks,
+            "nodes": counter.nodes,
+            "build": seconds
+        })
+
+    result = {"prototypes": len(prototypes)}
+
+    for name in _COUNTS[1:]:
+        result[name] = sum(entry[name] for entry in prototypes)
+
+    result["by_prototype"] = prototypes
+
+    return result
+
+
+class _NodesCounter(traverse.Visitor):
+    def __init__(self, function):
+        super().__init__()
+
+        self.function = function
+        self.blocks = 0
+        self.nodes = 0
+
+    def _enter(self, node):
+        if isinstance(node, nodes.FunctionDefinition) \
+                and node is not self.function:
+            return False
+
+        self.nodes += 1
+
+        if isinstance(node, nodes.Block):
+            self.blocks += 1
+
+        return True
+
+
+# Per file records of a --profile run and the report made of them
+class Report:
+    def __init__(self):
+        self.files = []
+
+    # record is the one Main.decompile_job() returned
+    def add(self, file_in, seconds, error, record):
+        entry = {
+            "file": file_in,
+            "seconds": seconds,
+            "failed": error is not None
+        }
+
+        entry.update(record)
+
+        self.files.append(entry)
+
+    def stages(self):
+        names = {}
+
+        for entry in self.files:
+            for name in entry["stages"]:
+                names[name] = True
+
+        return list(names)
+
+    def summary(self, top):
+        summary = {
+            "files": len(self.files),
+            "failed": sum(1 for entry in self.files if entry["failed"]),
+            "cached": sum(1 for entry in self.files if entry["cached"]),
+            "validated": sum(1 for entry in self.files
+                             if entry.get("validated")),
+            "seconds": _distribution(
+                [entry["seconds"] for entry in self.files]),
+            "stages": {}
+        }
+
+        for name in self.stages():
+            summary["stages"][name] = _distribution(
+                [entry["stages"][name] for entry in self.files
+                 if name in entry["stages"]])
+
+        for name in _COUNTS:
+            summary[name] = _distribution(
+                [entry[name] for entry in self.files if name in entry])
+
+        slowest = sorted(self.files, key=_get_seconds, reverse=True)
+        summary["slowest"] = slowest[:top]
+
+        return summary
+
+    # JSON has the summary and every file, CSV a row per file, slowest
+    # first, followed by the total, mean and percentile rows
+    def write(self, path, top):
+        if path.lower().endswith(".csv"):
+            self._write_csv(path)
+            return
+
+        report = self.summary(top)
+        report["records"] = self.files
+
+        with open(path, "w", encoding="utf8") as out_file:
+            json.dump(report, out_file, indent=1)
+
+    def _write_csv(self, path):
+        stages = self.stages()
+        header = ["file", "seconds", "failed", "cached", "validated"] \
+            + list(_COUNTS) + stages
+
+        rows = []
+
+        for entry in sorted(self.files, key=_get_seconds, reverse=True):
+            row = [entry["file"], entry["seconds"],
+                   int(entry["failed"]), int(entry["cached"]),
+                   int(entry.get("validated", False))]
+
+            row += [entry.get(name, "") for name in _COUNTS]
+            row += [entry["stages"].get(name, "") for name in stages]
+
+            rows.append(row)
+
+        columns = [[row[i] for row in rows if row[i] != ""]
+                   for i in range(1, len(header))]
+
+        distributions = [_distribution(values) for values in columns]
+
+        with open(path, "w", encoding="utf8", newline="") as out_file:
+            writer = csv.writer(out_file)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+            for key in distributions[0]:
+                writer.writerow([key] + [distribution[key]
+                                         for distribution in distributions])
+
+
+def _get_seconds(entry):
+    return entry["seconds"]
+
+
+def _distribution(values):
+    values = sorted(values)
+
+    distribution = {"total": sum(values)}
+
+    if not values:
+        distribution["mean"] = 0
+
+        for percentile in _PERCENTILES:
+            distribution["p{0}".format(percentile)] = 0
+
+        distribution["max"] = 0
+
+        return distribution
+
+    distribution["mean"] = distribution["total"] / len(values)
+
+    # Nearest rank
+    for percentile in _PERCENTILES:
+        rank = math.ceil(percentile / 100 * len(values))
+        distribution["p{0}".format(percentile)] = values[max(rank, 1) - 1]
+
+    distribution["max"] = values[-1]
+
+    return distribution
@@ -28,12 +28,17 @@ import logging
 import os
 import sys
 import hashlib
+import json
 import operator
 import platform
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from shutil import copyfile
 from datetime import datetime
 from optparse import OptionParser
+import subprocess
+import tempfile
 import progressbar
 from xxteafile import xxteaFile
 
@@ -79,6 +84,32 @@ class MakeFileHandler(logging.FileHandler):
         logging.FileHandler.__init__(self, filename, *args, **kwargs)
 
 
+_MANIFEST_VERSION = 1
+
+_LUAJIT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "luajit")
+
+# The error of a file whose dump has no prototype, the parser printed why
+_PARSE_ERROR = "bytecode can't be parsed"
+
+# Date mode reads and decrypts about this many bytes of files at a time
+_DECRYPT_CHUNK = 32 << 20
+
+# Per-process decompiler used by the --jobs worker pool
+_worker = None
+
+
+def _init_worker(options):
+    global _worker
+
+    _worker = Main()
+    _worker.options = options
+    _worker.load_modules()
+
+
+def _run_job(file_in, file_out, decrypt_out, source=None):
+    return _worker.decompile_job(file_in, file_out, decrypt_out, source)
+
+
 class Main:
     def main(self):
         # Parser arguments
@@ -117,7 +148,7 @@ class Main:
         # Global override of LuaJIT version, ignores -j
         parser.add_option("-j", "--jit_version",
                           type="string", dest="luajit_version", default="",
-                          help="override LuaJIT version, default 2.1, now supports 2.0, 2.1")
+                          help="override LuaJIT version, detected per file by default, now supports 2.0, 2.1")
 
         # 'Profiles' that hardcode LuaJIT versions per file
         parser.add_option("-v", "--version_config_list",
@@ -134,40 +165,72 @@ class Main:
                           action="store_true", dest="enable_logging", default=False,
                           help="log info and exceptions to external file while decompiling")
 
+        # Number of worker processes used with -r and -C
+        parser.add_option("--jobs",
+                          type="int", dest="jobs", default=1,
+                          help="decompile files in N parallel processes", metavar="N")
+
+        # Write decrypted bytecode to ../files/<date>/decrypt in date mode
+        parser.add_option("--keep-decrypted",
+                          action="store_true", dest="keep_decrypted", default=False,
+                          help="keep the decrypted lua files on disk in date mode")
+
+        # Seconds a single luajit fallback may run in -C mode
+        parser.add_option("--luajit-timeout",
+                          type="float", dest="luajit_timeout", default=30,
+                          help="give up on the luajit fallback after N seconds",
+                          metavar="N")
+
+        # Reuse decompiled files by bytecode hash with -r and -C
+        parser.add_option("--cache-dir",
+                          type="string", dest="cache_dir", default="",
+                          help="cache decompiled files in FOLDER", metavar="FOLDER")
+
+        parser.add_option("--cache-size",
+                          type="int", dest="cache_size", default=1024,
+                          help="evict least recently used cache entries beyond N MiB",
+                          metavar="N")
+
+        # Seconds spent in every decompiler pass, summed over all files
+        parser.add_option("--pass-times",
+                          action="store_true", dest="pass_times", default=False,
+                          help="print the time spent in each pass to stderr")
+
+        # Per file and per prototype timings and sizes, see ljd.util.profile
+        parser.add_option("--profile",
+                          type="string", dest="profile", default="",
+                          help="write a JSON or, for a .csv name, CSV profile to FILE",
+                          metavar="FILE")
+
+        parser.add_option("--profile-top",
+                          type="int", dest="profile_top", default=10,
+                          help="list the N slowest files in the JSON profile",
+                          metavar="N")
+
+        # Validation costs a full walk of the tree before and after unwarp
+        parser.add_option("--validate",
+                          type="choice", dest="validate", default="always",
+                          choices=["always", "sample", "never"],
+                          help="validate the tree of always, a sample of or never any file")
+
+        parser.add_option("--validate-rate",
+                          type="float", dest="validate_rate", default=0.1,
+                          help="share of files validated with --validate=sample",
+                          metavar="RATE")
+
         (self.options, args) = parser.parse_args()
 
-        # Initialize opcode set for required LuaJIT version
-        basepath = os.path.dirname(sys.argv[0])
-        if basepath == "":
-            basepath = "."
-        if self.options.luajit_version == "":
-            version_required = self.check_for_version_config(
-                self.options.file_name)
-            sys.path.append(basepath + "/ljd/rawdump/luajit/" +
-                            str(version_required) + "/")
-        else:
-            self.set_version_config(float(self.options.luajit_version))
-            sys.path.append(basepath + "/ljd/rawdump/luajit/" +
-                            self.options.luajit_version + "/")
+        if not 0 <= self.options.validate_rate <= 1:
+            parser.error("--validate-rate must be between 0 and 1.")
 
-        # LuaJIT version is known after the argument is parsed, so delay module import.
-        import ljd.rawdump.parser
-        import ljd.pseudoasm.writer
-        import ljd.ast.builder
-        import ljd.ast.validator
-        import ljd.ast.locals
-        import ljd.ast.slotworks
-        import ljd.ast.unwarper
-        import ljd.ast.mutator
-        import ljd.lua.writer
+        self.load_modules()
 
-        # Send assert catch argument to modules
-        if self.options.catch_asserts:
-            ljd.ast.unwarper.catch_asserts = True
-            ljd.ast.slotworks.catch_asserts = True
-            ljd.ast.validator.catch_asserts = True
+        self.pass_times = {}
 
-        self.ljd = ljd
+        if self.options.profile:
+            self.report = self.ljd.util.profile.Report()
+        else:
+            self.report = None
 
         # Start logging if required
         if self.options.enable_logging:
@@ -206,104 +269,117 @@ class Main:
                 '../files/' + self.options.current_date + '/decrypt')
             curr_date_folder_name_decompile = os.path.abspath(
                 '../files/' + self.options.current_date + '/decompile')
-            if not os.path.exists(curr_date_folder_name_decrypt):
+            if self.options.keep_decrypted and not os.path.exists(curr_date_folder_name_decrypt):
                 os.makedirs(curr_date_folder_name_decrypt)
             if not os.path.exists(curr_date_folder_name_decompile):
                 os.makedirs(curr_date_folder_name_decompile)
 
-            for path, _, filenames in os.walk(last_date_folder_name_decompile):
-                for file in filenames:
-                    if file.endswith('.lua'):
-                        full_path = os.path.join(path, file)
-                        new_path = full_path.replace(
-                            last_date_folder_name_decompile, curr_date_folder_name_decompile)
-                        parent_path = os.path.dirname(new_path)
-                        if not os.path.exists(parent_path):
-                            os.makedirs(parent_path)
-                        copyfile(full_path, new_path)
-
-            total_file_num = 0
-            for path, _, filenames in os.walk(curr_date_folder_name):
-                for file in filenames:
-                    if file.endswith('.lua'):
-                        total_file_num = total_file_num + 1
+            print("Comparing...")
+            last_manifest_name = os.path.abspath(
+                '../files/' + self.options.last_date + '/manifest.json')
+            curr_manifest_name = os.path.abspath(
+                '../files/' + self.options.current_date + '/manifest.json')
+            last_manifest = self.read_manifest(last_manifest_name)
+            if last_manifest is None:
+                last_manifest = self.update_manifest(last_date_folder_name, {})
+                if os.path.isdir(last_date_folder_name):
+                    self.write_manifest(last_manifest_name, last_manifest)
+            curr_manifest = self.update_manifest(
+                curr_date_folder_name, self.read_manifest(curr_manifest_name) or {})
+            self.write_manifest(curr_manifest_name, curr_manifest)
+
+            carry_over = last_date_folder_name_decompile != curr_date_folder_name_decompile
+
+            total_file_num = len(curr_manifest)
             bar = progressbar.ProgressBar(0, total_file_num)
             file_count = 0
             # generate file list
             file_list = []
-            print("Decrypting...")
-            for path, _, filenames in os.walk(curr_date_folder_name):
-                for file in filenames:
-                    if file.endswith('.lua'):
-                        full_path = os.path.join(path, file)
-                        releate_path = path.replace(curr_date_folder_name, "")
-                        last_path = path.replace(
-                            curr_date_folder_name, last_date_folder_name)
-                        last_full_path = os.path.join(last_path, file)
-                        last_decompile_file_path = os.path.join(
-                            last_date_folder_name_decompile + releate_path, file)
-                        curr_decompile_file_path = os.path.join(
-                            curr_date_folder_name_decompile + releate_path, file)
-                        if self.file_compare(full_path, last_full_path) and os.path.isfile(last_decompile_file_path):
-                            parent_path = os.path.dirname(
-                                curr_decompile_file_path)
-                            if not os.path.exists(parent_path):
-                                os.makedirs(parent_path)
-                            copyfile(last_decompile_file_path,
-                                     curr_decompile_file_path)
-                        else:
-                            decrypt_file_path = os.path.join(
-                                curr_date_folder_name_decrypt + releate_path, file)
-                            decrypt = xxteaFile(full_path, decrypt_file_path)
-                            file_list.append(decrypt_file_path)
-                        file_count = file_count + 1
-                        bar.update(file_count)
+            for releate_path, (_, _, md5) in curr_manifest.items():
+                releate_parts = releate_path.split('/')
+                last_entry = last_manifest.get(releate_path)
+                last_decompile_file_path = os.path.join(
+                    last_date_folder_name_decompile, *releate_parts)
+                curr_decompile_file_path = os.path.join(
+                    curr_date_folder_name_decompile, *releate_parts)
+                if last_entry and last_entry[2] == md5 and os.path.isfile(last_decompile_file_path):
+                    # Carry the previous output over, hard linked where possible
+                    if carry_over:
+                        parent_path = os.path.dirname(curr_decompile_file_path)
+                        if not os.path.exists(parent_path):
+                            os.makedirs(parent_path)
+                        self.link_file(last_decompile_file_path,
+                                       curr_decompile_file_path)
+                else:
+                    # Never write through a link to the previous output
+                    self.unlink_shared_file(curr_decompile_file_path)
+                    if self.options.keep_decrypted:
+                        decrypt_file_path = os.path.join(
+                            curr_date_folder_name_decrypt, *releate_parts)
+                    else:
+                        decrypt_file_path = None
+                    file_list.append((os.path.join(curr_date_folder_name, *releate_parts),
+                                      curr_decompile_file_path, decrypt_file_path))
+                file_count = file_count + 1
+                bar.update(file_count)
             bar.finish()
             print("Decompling...")
             total_file_num = len(file_list)
             bar = progressbar.ProgressBar(0, total_file_num)
             fail_count = 0
             file_count = 0
-            for file in file_list:
-                if file.endswith('.lua'):
-                    full_path = file
+            # Failed files go through luajit in the background
+            fallback = ThreadPoolExecutor(max_workers=max(1, self.options.jobs))
+            fallback_jobs = []
+            try:
+                for full_path, new_path, error, seconds, record in self.decompile_files(self.decrypt_jobs(file_list), logger):
                     file_count = file_count + 1
-                    if self.options.enable_logging:
-                        logger.info(full_path)
-                    try:
-                        self.decompile(full_path)
-                        new_path = full_path.replace(
-                            curr_date_folder_name_decrypt, curr_date_folder_name_decompile)
-                        parent_path = os.path.dirname(new_path)
-                        if not os.path.exists(parent_path):
-                            os.makedirs(parent_path)
-                        self.write_file(new_path)
+                    self.add_record(full_path, seconds, error, record)
+                    if error is None:
                         if self.options.enable_logging:
                             logger.info("Success")
                         else:
                             bar.update(file_count)
-                    except KeyboardInterrupt:
-                        if self.options.enable_logging:
-                            logger.info("Exit")
-                        else:
-                            bar.update(file_count)
-                        return 0
-                    except:
-                        fail_count = fail_count + 1
-                        new_path = full_path.replace(
-                            curr_date_folder_name_decrypt, curr_date_folder_name_decompile)
-                        parent_path = os.path.dirname(new_path)
-                        if not os.path.exists(parent_path):
-                            os.makedirs(parent_path)
-                        self.decompile_luajit(full_path, new_path)
-                        if self.options.enable_logging:
-                            logger.info("Exception")
-                            logger.debug('', exc_info=True)
-                        else:
-                            bar.update(file_count)
+                        continue
+
+                    fail_count = fail_count + 1
+                    parent_path = os.path.dirname(new_path)
+                    if not os.path.exists(parent_path):
+                        os.makedirs(parent_path)
+                    fallback_jobs.append((full_path, fallback.submit(
+                        self.decompile_luajit_file, full_path, new_path)))
+                    if self.options.enable_logging:
+                        logger.info("Exception")
+                        logger.debug(error)
+                    else:
+                        bar.update(file_count)
+
+                luajit_fail_count = 0
+                for full_path, future in fallback_jobs:
+                    error = future.result()
+                    if error is None:
+                        continue
+                    luajit_fail_count = luajit_fail_count + 1
+                    if self.options.enable_logging:
+                        logger.info(full_path)
+                        logger.info("Luajit exception")
+                        logger.debug(error)
+            except KeyboardInterrupt:
+                if self.options.enable_logging:
+                    logger.info("Exit")
+                else:
+                    bar.update(file_count)
+                return 0
+            finally:
+                fallback.shutdown(wait=True, cancel_futures=True)
             bar.finish()
+            if self.cache:
+                self.cache.evict()
+            self.write_stats()
             print("New file(s): " + str(total_file_num) + ". Including " +
-                  str(fail_count) + " file(s) decompiled by luajit")
+                  str(fail_count - luajit_fail_count) + " file(s) decompiled by luajit")
+            if luajit_fail_count:
+                print(str(luajit_fail_count) + " file(s) failed in luajit too")
             return 0
 
         # Recursive batch processing
@@ -325,39 +401,40 @@ class Main:
             bar.start()
             file_count = 0
 
+            jobs = []
             for path, _, filenames in os.walk(self.options.folder_name):
                 for file in filenames:
                     if file.find('.lua') != -1:
                         full_path = os.path.join(path, file)
                         out_path = os.path.join(
                             path, file.replace(".luac", ".lua"))
-                        file_count = file_count + 1
-                        if self.options.enable_logging:
-                            logger.info(full_path)
-                        try:
-                            self.decompile(full_path)
-
-                            new_path = os.path.join(self.options.folder_output,
-                                                    os.path.relpath(out_path, self.options.folder_name))
-                            os.makedirs(os.path.dirname(
-                                new_path), exist_ok=True)
-                            self.write_file(new_path)
-                            if self.options.enable_logging:
-                                logger.info("Success")
-                            else:
-                                bar.update(file_count)
-                        except KeyboardInterrupt:
-                            if self.options.enable_logging:
-                                logger.info("Exit")
-                            else:
-                                bar.update(file_count)
-                            return 0
-                        except:
-                            if self.options.enable_logging:
-                                logger.info("Exception")
-                                logger.debug('', exc_info=True)
-                            else:
-                                bar.update(file_count)
+                        new_path = os.path.join(self.options.folder_output,
+                                                os.path.relpath(out_path, self.options.folder_name))
+                        jobs.append((full_path, new_path, None))
+
+            try:
+                for full_path, _, error, seconds, record in self.decompile_files(jobs, logger):
+                    file_count = file_count + 1
+                    self.add_record(full_path, seconds, error, record)
+                    if self.options.enable_logging:
+                        if error is None:
+                            logger.info("Success")
+                        else:
+                            logger.info("Exception")
+                            logger.debug(error)
+                    else:
+                        bar.update(file_count)
+            except KeyboardInterrupt:
+                if self.options.enable_logging:
+                    logger.info("Exit")
+                else:
+                    bar.update(file_count)
+                return 0
+
+            if self.cache:
+                self.cache.evict()
+
+            self.write_stats()
 
             return 0
 
@@ -367,46 +444,218 @@ class Main:
             parser.error("Options -f or -r are required.")
             return 0
 
+        start = time.time()
+
         self.decompile(self.options.file_name)
 
-        if self.options.output_file:
-            self.write_file(self.options.output_file)
+        if self.ast is None:
+            error = _PARSE_ERROR
         else:
-            self.ljd.lua.writer.write(sys.stdout, self.ast)
+            error = None
+
+            if self.options.output_file:
+                self.write_file(self.options.output_file)
+            else:
+                self.write_file(None)
+
+        self.add_record(self.options.file_name, time.time() - start, error,
+                        self.record)
+        self.write_stats()
+
+        return 0 if error is None else 1
+
+    def load_modules(self):
+        # Forced LuaJIT version, otherwise every file is decoded with the
+        # opcode set its dump header asks for
+        if self.options.luajit_version == "":
+            self.luajit_version = self.check_for_version_config(
+                self.options.file_name)
+        else:
+            self.luajit_version = float(self.options.luajit_version)
+
+        # Delay module import until the options are parsed
+        import ljd.rawdump.parser
+        import ljd.pseudoasm.writer
+        import ljd.ast.builder
+        import ljd.ast.validator
+        import ljd.ast.locals
+        import ljd.ast.slotworks
+        import ljd.ast.unwarper
+        import ljd.ast.mutator
+        import ljd.ast.pipeline
+        import ljd.lua.writer
+        import ljd.config.version_config
+        import ljd.context
+        import ljd.decompiler
+        import ljd.util.cache
+        import ljd.util.profile
+
+        self.ljd = ljd
+
+        self.passes = ljd.ast.pipeline.PassManager()
+
+        if self.options.cache_dir:
+            # Everything that changes the output for the same bytecode
+            stamp = "{0}:{1}:{2}:{3}:{4}:{5}".format(
+                ljd.util.cache.decompiler_stamp(),
+                self.options.catch_asserts,
+                self.luajit_version,
+                ljd.config.version_config.use_version,
+                self.options.validate,
+                self.options.validate_rate)
+
+            self.cache = ljd.util.cache.Cache(
+                self.options.cache_dir, stamp,
+                self.options.cache_size * 1024 * 1024)
+        else:
+            self.cache = None
+
+    # Date mode inputs are encrypted, everything else is raw bytecode
+    def read_source(self, file_in, decrypt_out=None):
+        if not self.options.current_date:
+            with open(file_in, "rb") as source_file:
+                return source_file.read()
+
+        return xxteaFile(file_in, decrypt_out).data
+
+    # The date mode jobs with the source of every file appended. The files
+    # of a chunk are decrypted together, see xxteaFile.decrypt_many(); the
+    # files of a chunk that can't be read are left to read_source().
+    def decrypt_jobs(self, jobs):
+        chunk = []
+        size = 0
+
+        for job in jobs:
+            chunk.append(job)
+            size += os.path.getsize(job[0])
+
+            if size >= _DECRYPT_CHUNK:
+                yield from self.decrypt_chunk(chunk)
+                chunk = []
+                size = 0
+
+        yield from self.decrypt_chunk(chunk)
+
+    def decrypt_chunk(self, jobs):
+        try:
+            sources = xxteaFile().read_files([job[0] for job in jobs])
+        except (OSError, ValueError):
+            sources = [None] * len(jobs)
+
+        for job, source in zip(jobs, sources):
+            yield job + (source,)
+
+    def decompile_job(self, file_in, file_out, decrypt_out=None, source=None):
+        start = time.time()
+        self.record = {"stages": {}, "cached": False}
+
+        error = None
+
+        try:
+            if source is None:
+                source = self.read_source(file_in, decrypt_out)
+            elif decrypt_out is not None:
+                xxteaFile().write_file(decrypt_out, source)
+            os.makedirs(os.path.dirname(file_out), exist_ok=True)
+
+            if self.cache is None:
+                key = None
+            else:
+                key = self.cache.key(source)
+
+            if key is None or not self.cache.fetch(key, file_out):
+                self.decompile(source, file_in)
+
+                # Nothing is written for a dump that can't be parsed
+                if self.ast is None:
+                    error = _PARSE_ERROR
+                else:
+                    self.write_file(file_out)
+
+                    if key is not None:
+                        self.cache.store(key, file_out)
+            else:
+                self.record["cached"] = True
+        except Exception:
+            error = traceback.format_exc()
+
+        return file_in, file_out, error, time.time() - start, self.record
+
+    # Yields (file_in, file_out, error, seconds, record) for every job, see
+    # decompile() for the record. With --jobs
+    # the results arrive in completion order, not in the order of jobs.
+    def decompile_files(self, jobs, logger):
+        if self.options.jobs <= 1:
+            for job in jobs:
+                if logger:
+                    logger.info(job[0])
+
+                yield self.decompile_job(*job)
+
+            return
+
+        executor = ProcessPoolExecutor(max_workers=self.options.jobs,
+                                       initializer=_init_worker,
+                                       initargs=(self.options,))
+
+        try:
+            futures = [executor.submit(_run_job, *job) for job in jobs]
+
+            for future in as_completed(futures):
+                result = future.result()
+
+                if logger:
+                    logger.info(result[0])
 
-        return 0
-
-    def decompile_luajit(self, file_in, file_out):
-        file1_dec_name = os.path.abspath('./luajit/test.lua')
-        file1_temp_name = os.path.abspath('./luajit/test.asm')
-        file2_dec_name = os.path.abspath('./luajit/out.lua')
-        file2_com_name = os.path.abspath('./luajit/out2.lua')
-        if os.path.exists(file1_dec_name):
-            os.remove(file1_dec_name)
-        if os.path.exists(file1_temp_name):
-            os.remove(file1_temp_name)
-        if os.path.exists(file2_dec_name):
-            os.remove(file2_dec_name)
-        if os.path.exists(file2_com_name):
-            os.remove(file2_com_name)
-        copyfile(file_in, os.path.abspath("./luajit/test.lua"))
-        sys_platform = platform.system()
-        time.sleep(0.01)
-        retval = os.getcwd()
-        os.chdir(os.path.abspath('./luajit'))
-        if sys_platform == "Windows":
-            os.system(os.path.abspath('./decoder_new.exe'))
-        elif sys_platform == "Linux":
-            os.system(os.path.abspath('./luajit -blg test.lua out2.lua'))
-        try_time = 0
-        os.chdir(retval)
-        while not os.path.exists(file2_com_name):
-            try_time = try_time + 1
-            if try_time > 2000:
-                break
-            time.sleep(0.001)
-        if os.path.exists(file2_com_name):
-            copyfile(file2_dec_name, file_out)
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # Fallback to the luajit bytecode listing (decoder_new.exe turns it into
+    # lua on Windows). Every call works in its own temporary directory, so it
+    # is safe to run from several threads. Returns None or an error message.
+    def decompile_luajit(self, data, file_out):
+        with tempfile.TemporaryDirectory() as work_dir:
+            with open(os.path.join(work_dir, "test.lua"), "wb") as test_file:
+                test_file.write(data)
+
+            if platform.system() == "Windows":
+                command = [os.path.join(_LUAJIT_DIR, "decoder_new.exe")]
+            else:
+                command = [os.path.join(_LUAJIT_DIR, "luajit"),
+                           "-blg", "test.lua", "out2.lua"]
+
+            # -bl loads jit/bc.lua, which is found relative to the cwd
+            env = dict(os.environ)
+            env["LUA_PATH"] = os.path.join(_LUAJIT_DIR, "?.lua") + ";;"
+
+            try:
+                subprocess.run(command, cwd=work_dir, env=env,
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL,
+                               timeout=self.options.luajit_timeout,
+                               check=True)
+            except (OSError, subprocess.SubprocessError) as e:
+                return str(e)
+
+            for name in ("out.lua", "out2.lua"):
+                out_name = os.path.join(work_dir, name)
+
+                if os.path.exists(out_name):
+                    copyfile(out_name, file_out)
+                    return None
+
+            return "luajit produced no output"
+
+    # The luajit fallback of a date mode file, reads it in the calling
+    # thread. Returns None or an error message, like decompile_luajit().
+    def decompile_luajit_file(self, file_in, file_out):
+        try:
+            data = self.read_source(file_in)
+        except (OSError, ValueError) as e:
+            return str(e)
+
+        return self.decompile_luajit(data, file_out)
 
     def get_file_md5(self, file_path):
         if not os.path.isfile(file_path):
@@ -421,71 +670,165 @@ class Main:
                 md5_obj.update(data)
         return str(md5_obj.hexdigest()).lower()
 
-    def file_compare(self, file1, file2):
-        file1_md5 = self.get_file_md5(file1)
-        file2_md5 = self.get_file_md5(file2)
-        if operator.eq(file1_md5, file2_md5):
-            return True
-        else:
-            return False
+    # The manifest of a date folder maps every relative .lua path to its
+    # [size, mtime_ns, md5], so unchanged files are never hashed twice
+    @staticmethod
+    def read_manifest(manifest_name):
+        try:
+            with open(manifest_name, "r", encoding="utf8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return None
+
+        return manifest["files"]
+
+    @staticmethod
+    def write_manifest(manifest_name, files):
+        temp_name = manifest_name + ".tmp"
+
+        with open(temp_name, "w", encoding="utf8") as manifest_file:
+            json.dump({"version": _MANIFEST_VERSION, "files": files},
+                      manifest_file)
+
+        os.replace(temp_name, manifest_name)
+
+    # Hashes only the files whose size or mtime differ from old_files
+    def update_manifest(self, folder_name, old_files):
+        files = {}
+
+        for path, _, filenames in os.walk(folder_name):
+            for file in filenames:
+                if not file.endswith('.lua'):
+                    continue
+
+                full_path = os.path.join(path, file)
+                releate_path = os.path.relpath(
+                    full_path, folder_name).replace(os.sep, '/')
+                stat = os.stat(full_path)
+                entry = old_files.get(releate_path)
+
+                if entry is None or entry[0] != stat.st_size \
+                        or entry[1] != stat.st_mtime_ns:
+                    entry = [stat.st_size, stat.st_mtime_ns,
+                             self.get_file_md5(full_path)]
+
+                files[releate_path] = entry
+
+        return files
+
+    # Hard links share unchanged outputs between dates, files that get
+    # rewritten must be unlinked first instead of truncated
+    @staticmethod
+    def link_file(file_in, file_out):
+        if os.path.lexists(file_out):
+            if os.path.samefile(file_in, file_out):
+                return
 
+            os.remove(file_out)
+
+        try:
+            os.link(file_in, file_out)
+        except OSError:
+            copyfile(file_in, file_out)
+
+    @staticmethod
+    def unlink_shared_file(file_name):
+        try:
+            if os.stat(file_name).st_nlink > 1:
+                os.remove(file_name)
+        except FileNotFoundError:
+            pass
+
+    # None writes to stdout
     def write_file(self, file_name):
-        with open(file_name, "w", encoding="utf8") as out_file:
-            self.ljd.lua.writer.write(out_file, self.ast)
+        start = time.perf_counter()
 
-    def decompile(self, file_in):
-        header, prototype = self.ljd.rawdump.parser.parse(file_in)
+        if file_name is None:
+            self.ljd.lua.writer.write(sys.stdout, self.ast)
+        else:
+            with open(file_name, "w", encoding="utf8") as out_file:
+                self.ljd.lua.writer.write(out_file, self.ast)
 
-        if not prototype:
-            return 1
+        self.timings["write"] = time.perf_counter() - start
 
-        # self.ljd.pseudoasm.writer.write(sys.stdout, header, prototype)
+    # source is a file name or the bytecode itself, name labels the latter.
+    # Leaves the seconds spent in each pass in self.timings, which
+    # self.record holds as "stages" along with the ljd.util.profile counts
+    # of the file under --profile
+    def decompile(self, source, name=""):
+        checks = self.should_validate(source)
 
-        self.ast = self.ljd.ast.builder.build(prototype)
+        ctx = self.ljd.context.DecompileContext(
+            catch_asserts=self.options.catch_asserts,
+            version=self.luajit_version,
+            checks=checks)
 
-        assert self.ast is not None
+        self.timings = ctx.timings
+        self.record = {"stages": self.timings, "cached": False}
 
-        self.ljd.ast.validator.validate(self.ast, warped=True)
+        if self.options.profile:
+            times = []
+        else:
+            times = None
 
-        self.ljd.ast.mutator.pre_pass(self.ast)
+        self.ast = self.ljd.decompiler.build(source, name, ctx, times)
 
-        # self.ljd.ast.validator.validate(self.ast, warped=True)
+        if self.ast is None:
+            return 1
 
-        self.ljd.ast.locals.mark_locals(self.ast)
+        if times is not None:
+            self.record.update(
+                self.ljd.util.profile.describe_prototypes(times))
+
+        self.record["validated"] = checks
 
-        # self.ljd.ast.validator.validate(self.ast, warped=True)
-        self.ljd.ast.slotworks.eliminate_upvalue(self.ast)
         try:
-            self.ljd.ast.slotworks.eliminate_temporary(self.ast)
-        except:
-            if self.options.catch_asserts:
-                print(
-                    "-- Decompilation Error: self.ljd.ast.slotworks.eliminate_temporary(self.ast)\n", file=sys.stdout)
-            else:
-                raise
+            self.passes.run(self.ast, ctx)
+        finally:
+            # The comments of what --catch_asserts let through
+            for error in ctx.errors:
+                if error.comment is not None:
+                    print(error.comment)
 
-        # self.ljd.ast.validator.validate(self.ast, warped=True)
+    # --validate=sample picks the same files on every run, by a hash of
+    # their bytecode
+    def should_validate(self, source):
+        if self.options.validate != "sample":
+            return self.options.validate == "always"
 
-        if True:
-            self.ljd.ast.unwarper.unwarp(self.ast)
+        if isinstance(source, str):
+            with open(source, "rb") as source_file:
+                source = source_file.read()
 
-            # self.ljd.ast.validator.validate(self.ast, warped=False)
+        digest = hashlib.sha1(source).digest()
+        share = int.from_bytes(digest[:4], "big") / 2 ** 32
 
-            if True:
-                self.ljd.ast.locals.mark_local_definitions(self.ast)
+        return share < self.options.validate_rate
 
-                # self.ljd.ast.validator.validate(self.ast, warped=False)
+    def add_record(self, file_in, seconds, error, record):
+        for name, stage_seconds in record["stages"].items():
+            self.pass_times[name] = \
+                self.pass_times.get(name, 0) + stage_seconds
 
-                self.ljd.ast.mutator.primary_pass(self.ast)
+        if self.report is not None:
+            self.report.add(file_in, seconds, error, record)
 
-                try:
-                    self.ljd.ast.validator.validate(self.ast, warped=False)
-                except:
-                    if self.options.catch_asserts:
-                        print("-- Decompilation Error: self.ljd.ast.validator.validate(self.ast, warped=False)\n",
-                              file=sys.stdout)
-                    else:
-                        raise
+    def write_stats(self):
+        if self.report is not None:
+            self.report.write(self.options.profile, self.options.profile_top)
+
+        if not self.options.pass_times:
+            return
+
+        total = sum(self.pass_times.values()) or 1
+
+        for name, seconds in sorted(self.pass_times.items(),
+                                    key=operator.itemgetter(1), reverse=True):
+            print("{0:<40} {1:10.3f}s {2:6.1%}".format(
+                name, seconds, seconds / total), file=sys.stderr)
 
     def check_for_version_config(self, file_name):
         import ljd.config.version_config as version_config_file
@@ -506,15 +849,9 @@ class Main:
         # Search for a matching entry
         for config_entry_name in version_list:
             if config_entry_name in file_name:
-                self.set_version_config(version_list[config_entry_name])
-                break
-
-        return version_config_file.use_version
+                return version_list[config_entry_name]
 
-    @staticmethod
-    def set_version_config(version_number):
-        import ljd.config.version_config
-        ljd.config.version_config.use_version = version_number
+        return None
 
 
 if __name__ == "__main__":
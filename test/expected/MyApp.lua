@@ -0,0 +1,13 @@
+local slot0 = class("MyApp", cc.load("mvc").AppBase)
+
+slot0.onCreate = function (slot2)
+	math.randomseed(os.time())
+
+	local slot4 = {
+		device.writablePath .. "src/app/p/"
+	}
+
+	pb.Reset(slot4)
+end
+
+return slot0
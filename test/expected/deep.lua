@@ -0,0 +1,825 @@
+local f = ...
+
+function ifs(a)
+	if a > 0 and a > 1 and a > 2 and a > 3 and a > 4 and a > 5 and a > 6 and a > 7 and a > 8 and a > 9 and a > 10 and a > 11 and a > 12 and a > 13 and a > 14 and a > 15 and a > 16 and a > 17 and a > 18 and a > 19 and a > 20 and a > 21 and a > 22 and a > 23 and a > 24 and a > 25 and a > 26 and a > 27 and a > 28 and a > 29 and a > 30 and a > 31 and a > 32 and a > 33 and a > 34 and a > 35 and a > 36 and a > 37 and a > 38 and a > 39 and a > 40 and a > 41 and a > 42 and a > 43 and a > 44 and a > 45 and a > 46 and a > 47 and a > 48 and a > 49 and a > 50 and a > 51 and a > 52 and a > 53 and a > 54 and a > 55 and a > 56 and a > 57 and a > 58 and a > 59 and a > 60 and a > 61 and a > 62 and a > 63 and a > 64 and a > 65 and a > 66 and a > 67 and a > 68 and a > 69 and a > 70 and a > 71 and a > 72 and a > 73 and a > 74 and a > 75 and a > 76 and a > 77 and a > 78 and a > 79 and a > 80 and a > 81 and a > 82 and a > 83 and a > 84 and a > 85 and a > 86 and a > 87 and a > 88 and a > 89 and a > 90 and a > 91 and a > 92 and a > 93 and a > 94 and a > 95 and a > 96 and a > 97 and a > 98 and a > 99 and a > 100 and a > 101 and a > 102 and a > 103 and a > 104 and a > 105 and a > 106 and a > 107 and a > 108 and a > 109 and a > 110 and a > 111 and a > 112 and a > 113 and a > 114 and a > 115 and a > 116 and a > 117 and a > 118 and a > 119 and a > 120 and a > 121 and a > 122 and a > 123 and a > 124 and a > 125 and a > 126 and a > 127 and a > 128 and a > 129 and a > 130 and a > 131 and a > 132 and a > 133 and a > 134 and a > 135 and a > 136 and a > 137 and a > 138 and a > 139 and a > 140 and a > 141 and a > 142 and a > 143 and a > 144 and a > 145 and a > 146 and a > 147 and a > 148 and a > 149 then
+		return 0
+	end
+
+	return a
+end
+
+function loops(a)
+	while a > 0 do
+		while a > 1 do
+			while a > 2 do
+				while a > 3 do
+					while a > 4 do
+						while a > 5 do
+							while a > 6 do
+								while a > 7 do
+									while a > 8 do
+										while a > 9 do
+											while a > 10 do
+												while a > 11 do
+													while a > 12 do
+														while a > 13 do
+															while a > 14 do
+																while a > 15 do
+																	while a > 16 do
+																		while a > 17 do
+																			while a > 18 do
+																				while a > 19 do
+																					while a > 20 do
+																						while a > 21 do
+																							while a > 22 do
+																								while a > 23 do
+																									while a > 24 do
+																										while a > 25 do
+																											while a > 26 do
+																												while a > 27 do
+																													while a > 28 do
+																														while a > 29 do
+																															while a > 30 do
+																																while a > 31 do
+																																	while a > 32 do
+																																		while a > 33 do
+																																			while a > 34 do
+																																				while a > 35 do
+																																					while a > 36 do
+																																						while a > 37 do
+																																							while a > 38 do
+																																								while a > 39 do
+																																									while a > 40 do
+																																										while a > 41 do
+																																											while a > 42 do
+																																												while a > 43 do
+																																													while a > 44 do
+																																														while a > 45 do
+																																															while a > 46 do
+																																																while a > 47 do
+																																																	while a > 48 do
+																																																		while a > 49 do
+																																																			while a > 50 do
+																																																				while a > 51 do
+																																																					while a > 52 do
+																																																						while a > 53 do
+																																																							while a > 54 do
+																																																								while a > 55 do
+																																																									while a > 56 do
+																																																										while a > 57 do
+																																																											while a > 58 do
+																																																												while a > 59 do
+																																																													while a > 60 do
+																																																														while a > 61 do
+																																																															while a > 62 do
+																																																																while a > 63 do
+																																																																	while a > 64 do
+																																																																		while a > 65 do
+																																																																			while a > 66 do
+																																																																				while a > 67 do
+																																																																					while a > 68 do
+																																																																						while a > 69 do
+																																																																							while a > 70 do
+																																																																								while a > 71 do
+																																																																									while a > 72 do
+																																																																										while a > 73 do
+																																																																											while a > 74 do
+																																																																												while a > 75 do
+																																																																													while a > 76 do
+																																																																														while a > 77 do
+																																																																															while a > 78 do
+																																																																																while a > 79 do
+																																																																																	while a > 80 do
+																																																																																		while a > 81 do
+																																																																																			while a > 82 do
+																																																																																				while a > 83 do
+																																																																																					while a > 84 do
+																																																																																						while a > 85 do
+																																																																																							while a > 86 do
+																																																																																								while a > 87 do
+																																																																																									while a > 88 do
+																																																																																										while a > 89 do
+																																																																																											while a > 90 do
+																																																																																												while a > 91 do
+																																																																																													while a > 92 do
+																																																																																														while a > 93 do
+																																																																																															while a > 94 do
+																																																																																																while a > 95 do
+																																																																																																	while a > 96 do
+																																																																																																		while a > 97 do
+																																																																																																			while a > 98 do
+																																																																																																				while a > 99 do
+																																																																																																					while a > 100 do
+																																																																																																						while a > 101 do
+																																																																																																							while a > 102 do
+																																																																																																								while a > 103 do
+																																																																																																									while a > 104 do
+																																																																																																										while a > 105 do
+																																																																																																											while a > 106 do
+																																																																																																												while a > 107 do
+																																																																																																													while a > 108 do
+																																																																																																														while a > 109 do
+																																																																																																															while a > 110 do
+																																																																																																																while a > 111 do
+																																																																																																																	while a > 112 do
+																																																																																																																		while a > 113 do
+																																																																																																																			while a > 114 do
+																																																																																																																				while a > 115 do
+																																																																																																																					while a > 116 do
+																																																																																																																						while a > 117 do
+																																																																																																																							while a > 118 do
+																																																																																																																								while a > 119 do
+																																																																																																																									while a > 120 do
+																																																																																																																										while a > 121 do
+																																																																																																																											while a > 122 do
+																																																																																																																												while a > 123 do
+																																																																																																																													while a > 124 do
+																																																																																																																														while a > 125 do
+																																																																																																																															while a > 126 do
+																																																																																																																																while a > 127 do
+																																																																																																																																	while a > 128 do
+																																																																																																																																		while a > 129 do
+																																																																																																																																			while a > 130 do
+																																																																																																																																				while a > 131 do
+																																																																																																																																					while a > 132 do
+																																																																																																																																						while a > 133 do
+																																																																																																																																							while a > 134 do
+																																																																																																																																								while a > 135 do
+																																																																																																																																									while a > 136 do
+																																																																																																																																										while a > 137 do
+																																																																																																																																											while a > 138 do
+																																																																																																																																												while a > 139 do
+																																																																																																																																													while a > 140 do
+																																																																																																																																														while a > 141 do
+																																																																																																																																															while a > 142 do
+																																																																																																																																																while a > 143 do
+																																																																																																																																																	while a > 144 do
+																																																																																																																																																		while a > 145 do
+																																																																																																																																																			while a > 146 do
+																																																																																																																																																				while a > 147 do
+																																																																																																																																																					while a > 148 do
+																																																																																																																																																						while a > 149 do
+																																																																																																																																																							a = f(a)
+																																																																																																																																																						end
+																																																																																																																																																					end
+																																																																																																																																																				end
+																																																																																																																																																			end
+																																																																																																																																																		end
+																																																																																																																																																	end
+																																																																																																																																																end
+																																																																																																																																															end
+																																																																																																																																														end
+																																																																																																																																													end
+																																																																																																																																												end
+																																																																																																																																											end
+																																																																																																																																										end
+																																																																																																																																									end
+																																																																																																																																								end
+																																																																																																																																							end
+																																																																																																																																						end
+																																																																																																																																					end
+																																																																																																																																				end
+																																																																																																																																			end
+																																																																																																																																		end
+																																																																																																																																	end
+																																																																																																																																end
+																																																																																																																															end
+																																																																																																																														end
+																																																																																																																													end
+																																																																																																																												end
+																																																																																																																											end
+																																																																																																																										end
+																																																																																																																									end
+																																																																																																																								end
+																																																																																																																							end
+																																																																																																																						end
+																																																																																																																					end
+																																																																																																																				end
+																																																																																																																			end
+																																																																																																																		end
+																																																																																																																	end
+																																																																																																																end
+																																																																																																															end
+																																																																																																														end
+																																																																																																													end
+																																																																																																												end
+																																																																																																											end
+																																																																																																										end
+																																																																																																									end
+																																																																																																								end
+																																																																																																							end
+																																																																																																						end
+																																																																																																					end
+																																																																																																				end
+																																																																																																			end
+																																																																																																		end
+																																																																																																	end
+																																																																																																end
+																																																																																															end
+																																																																																														end
+																																																																																													end
+																																																																																												end
+																																																																																											end
+																																																																																										end
+																																																																																									end
+																																																																																								end
+																																																																																							end
+																																																																																						end
+																																																																																					end
+																																																																																				end
+																																																																																			end
+																																																																																		end
+																																																																																	end
+																																																																																end
+																																																																															end
+																																																																														end
+																																																																													end
+																																																																												end
+																																																																											end
+																																																																										end
+																																																																									end
+																																																																								end
+																																																																							end
+																																																																						end
+																																																																					end
+																																																																				end
+																																																																			end
+																																																																		end
+																																																																	end
+																																																																end
+																																																															end
+																																																														end
+																																																													end
+																																																												end
+																																																											end
+																																																										end
+																																																									end
+																																																								end
+																																																							end
+																																																						end
+																																																					end
+																																																				end
+																																																			end
+																																																		end
+																																																	end
+																																																end
+																																															end
+																																														end
+																																													end
+																																												end
+																																											end
+																																										end
+																																									end
+																																								end
+																																							end
+																																						end
+																																					end
+																																				end
+																																			end
+																																		end
+																																	end
+																																end
+																															end
+																														end
+																													end
+																												end
+																											end
+																										end
+																									end
+																								end
+																							end
+																						end
+																					end
+																				end
+																			end
+																		end
+																	end
+																end
+															end
+														end
+													end
+												end
+											end
+										end
+									end
+								end
+							end
+						end
+					end
+				end
+			end
+		end
+	end
+
+	return a
+end
+
+function calls(a)
+	return f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(f(a))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))
+end
+
+function tables(a)
+	local slot3 = {
+		{
+			{
+				{
+					{
+						{
+							{
+								{
+									{
+										{
+											{
+												{
+													{
+														{
+															{
+																{
+																	{
+																		{
+																			{
+																				{
+																					{
+																						{
+																							{
+																								{
+																									{
+																										{
+																											{
+																												{
+																													{
+																														{
+																															{
+																																{
+																																	{
+																																		{
+																																			{
+																																				{
+																																					{
+																																						{
+																																							{
+																																								{
+																																									{
+																																										{
+																																											{
+																																												{
+																																													{
+																																														{
+																																															{
+																																																{
+																																																	{
+																																																		{
+																																																			{
+																																																				{
+																																																					{
+																																																						{
+																																																							{
+																																																								{
+																																																									{
+																																																										{
+																																																											{
+																																																												{
+																																																													{
+																																																														{
+																																																															{
+																																																																{
+																																																																	{
+																																																																		{
+																																																																			{
+																																																																				{
+																																																																					{
+																																																																						{
+																																																																							{
+																																																																								{
+																																																																									{
+																																																																										{
+																																																																											{
+																																																																												{
+																																																																													{
+																																																																														{
+																																																																															{
+																																																																																{
+																																																																																	{
+																																																																																		{
+																																																																																			{
+																																																																																				{
+																																																																																					{
+																																																																																						{
+																																																																																							{
+																																																																																								{
+																																																																																									{
+																																																																																										{
+																																																																																											{
+																																																																																												{
+																																																																																													{
+																																																																																														{
+																																																																																															{
+																																																																																																{
+																																																																																																	{
+																																																																																																		{
+																																																																																																			{
+																																																																																																				{
+																																																																																																					{
+																																																																																																						{
+																																																																																																							{
+																																																																																																								{
+																																																																																																									{
+																																																																																																										{
+																																																																																																											{
+																																																																																																												{
+																																																																																																													{
+																																																																																																														{
+																																																																																																															{
+																																																																																																																{
+																																																																																																																	{
+																																																																																																																		{
+																																																																																																																			{
+																																																																																																																				{
+																																																																																																																					{
+																																																																																																																						{
+																																																																																																																							{
+																																																																																																																								{
+																																																																																																																									{
+																																																																																																																										{
+																																																																																																																											{
+																																																																																																																												{
+																																																																																																																													{
+																																																																																																																														{
+																																																																																																																															{
+																																																																																																																																{
+																																																																																																																																	{
+																																																																																																																																		{
+																																																																																																																																			{
+																																																																																																																																				{
+																																																																																																																																					{
+																																																																																																																																						{
+																																																																																																																																							{
+																																																																																																																																								{
+																																																																																																																																									{
+																																																																																																																																										{
+																																																																																																																																											{
+																																																																																																																																												{
+																																																																																																																																													{
+																																																																																																																																														{
+																																																																																																																																															{
+																																																																																																																																																{
+																																																																																																																																																	{
+																																																																																																																																																		{
+																																																																																																																																																			{
+																																																																																																																																																				{
+																																																																																																																																																					{
+																																																																																																																																																						{
+																																																																																																																																																							a
+																																																																																																																																																						}
+																																																																																																																																																					}
+																																																																																																																																																				}
+																																																																																																																																																			}
+																																																																																																																																																		}
+																																																																																																																																																	}
+																																																																																																																																																}
+																																																																																																																																															}
+																																																																																																																																														}
+																																																																																																																																													}
+																																																																																																																																												}
+																																																																																																																																											}
+																																																																																																																																										}
+																																																																																																																																									}
+																																																																																																																																								}
+																																																																																																																																							}
+																																																																																																																																						}
+																																																																																																																																					}
+																																																																																																																																				}
+																																																																																																																																			}
+																																																																																																																																		}
+																																																																																																																																	}
+																																																																																																																																}
+																																																																																																																															}
+																																																																																																																														}
+																																																																																																																													}
+																																																																																																																												}
+																																																																																																																											}
+																																																																																																																										}
+																																																																																																																									}
+																																																																																																																								}
+																																																																																																																							}
+																																																																																																																						}
+																																																																																																																					}
+																																																																																																																				}
+																																																																																																																			}
+																																																																																																																		}
+																																																																																																																	}
+																																																																																																																}
+																																																																																																															}
+																																																																																																														}
+																																																																																																													}
+																																																																																																												}
+																																																																																																											}
+																																																																																																										}
+																																																																																																									}
+																																																																																																								}
+																																																																																																							}
+																																																																																																						}
+																																																																																																					}
+																																																																																																				}
+																																																																																																			}
+																																																																																																		}
+																																																																																																	}
+																																																																																																}
+																																																																																															}
+																																																																																														}
+																																																																																													}
+																																																																																												}
+																																																																																											}
+																																																																																										}
+																																																																																									}
+																																																																																								}
+																																																																																							}
+																																																																																						}
+																																																																																					}
+																																																																																				}
+																																																																																			}
+																																																																																		}
+																																																																																	}
+																																																																																}
+																																																																															}
+																																																																														}
+																																																																													}
+																																																																												}
+																																																																											}
+																																																																										}
+																																																																									}
+																																																																								}
+																																																																							}
+																																																																						}
+																																																																					}
+																																																																				}
+																																																																			}
+																																																																		}
+																																																																	}
+																																																																}
+																																																															}
+																																																														}
+																																																													}
+																																																												}
+																																																											}
+																																																										}
+																																																									}
+																																																								}
+																																																							}
+																																																						}
+																																																					}
+																																																				}
+																																																			}
+																																																		}
+																																																	}
+																																																}
+																																															}
+																																														}
+																																													}
+																																												}
+																																											}
+																																										}
+																																									}
+																																								}
+																																							}
+																																						}
+																																					}
+																																				}
+																																			}
+																																		}
+																																	}
+																																}
+																															}
+																														}
+																													}
+																												}
+																											}
+																										}
+																									}
+																								}
+																							}
+																						}
+																					}
+																				}
+																			}
+																		}
+																	}
+																}
+															}
+														}
+													}
+												}
+											}
+										}
+									}
+								}
+							}
+						}
+					}
+				}
+			}
+		}
+	}
+
+	return slot3
+end
+
+function closures()
+	return function (a0)
+		return function (a1)
+			return function (a2)
+				return function (a3)
+					return function (a4)
+						return function (a5)
+							return function (a6)
+								return function (a7)
+									return function (a8)
+										return function (a9)
+											return function (a10)
+												return function (a11)
+													return function (a12)
+														return function (a13)
+															return function (a14)
+																return function (a15)
+																	return function (a16)
+																		return function (a17)
+																			return function (a18)
+																				return function (a19)
+																					return function (a20)
+																						return function (a21)
+																							return function (a22)
+																								return function (a23)
+																									return function (a24)
+																										return function (a25)
+																											return function (a26)
+																												return function (a27)
+																													return function (a28)
+																														return function (a29)
+																															return function (a30)
+																																return function (a31)
+																																	return function (a32)
+																																		return function (a33)
+																																			return function (a34)
+																																				return function (a35)
+																																					return function (a36)
+																																						return function (a37)
+																																							return function (a38)
+																																								return function (a39)
+																																									return function (a40)
+																																										return function (a41)
+																																											return function (a42)
+																																												return function (a43)
+																																													return function (a44)
+																																														return function (a45)
+																																															return function (a46)
+																																																return function (a47)
+																																																	return function (a48)
+																																																		return function (a49)
+																																																			return function (a50)
+																																																				return function (a51)
+																																																					return function (a52)
+																																																						return function (a53)
+																																																							return function (a54)
+																																																								return function (a55)
+																																																									return function (a56)
+																																																										return function (a57)
+																																																											return function (a58)
+																																																												return function (a59)
+																																																													return function (a60)
+																																																														return function (a61)
+																																																															return function (a62)
+																																																																return function (a63)
+																																																																	return function (a64)
+																																																																		return function (a65)
+																																																																			return function (a66)
+																																																																				return function (a67)
+																																																																					return function (a68)
+																																																																						return function (a69)
+																																																																							return function (a70)
+																																																																								return function (a71)
+																																																																									return function (a72)
+																																																																										return function (a73)
+																																																																											return function (a74)
+																																																																												return function (a75)
+																																																																													return function (a76)
+																																																																														return function (a77)
+																																																																															return function (a78)
+																																																																																return function (a79)
+																																																																																	return function (a80)
+																																																																																		return function (a81)
+																																																																																			return function (a82)
+																																																																																				return function (a83)
+																																																																																					return function (a84)
+																																																																																						return function (a85)
+																																																																																							return function (a86)
+																																																																																								return function (a87)
+																																																																																									return function (a88)
+																																																																																										return function (a89)
+																																																																																											return function (a90)
+																																																																																												return function (a91)
+																																																																																													return function (a92)
+																																																																																														return function (a93)
+																																																																																															return function (a94)
+																																																																																																return a0 + a94
+																																																																																															end
+																																																																																														end
+																																																																																													end
+																																																																																												end
+																																																																																											end
+																																																																																										end
+																																																																																									end
+																																																																																								end
+																																																																																							end
+																																																																																						end
+																																																																																					end
+																																																																																				end
+																																																																																			end
+																																																																																		end
+																																																																																	end
+																																																																																end
+																																																																															end
+																																																																														end
+																																																																													end
+																																																																												end
+																																																																											end
+																																																																										end
+																																																																									end
+																																																																								end
+																																																																							end
+																																																																						end
+																																																																					end
+																																																																				end
+																																																																			end
+																																																																		end
+																																																																	end
+																																																																end
+																																																															end
+																																																														end
+																																																													end
+																																																												end
+																																																											end
+																																																										end
+																																																									end
+																																																								end
+																																																							end
+																																																						end
+																																																					end
+																																																				end
+																																																			end
+																																																		end
+																																																	end
+																																																end
+																																															end
+																																														end
+																																													end
+																																												end
+																																											end
+																																										end
+																																									end
+																																								end
+																																							end
+																																						end
+																																					end
+																																				end
+																																			end
+																																		end
+																																	end
+																																end
+																															end
+																														end
+																													end
+																												end
+																											end
+																										end
+																									end
+																								end
+																							end
+																						end
+																					end
+																				end
+																			end
+																		end
+																	end
+																end
+															end
+														end
+													end
+												end
+											end
+										end
+									end
+								end
+							end
+						end
+					end
+				end
+			end
+		end
+	end
+end
+
+function sum(a)
+	return a + 1 + 2 + 3 + 4 + 5 + 6 + 7 + 8 + 9 + 10 + 11 + 12 + 13 + 14 + 15 + 16 + 17 + 18 + 19 + 20 + 21 + 22 + 23 + 24 + 25 + 26 + 27 + 28 + 29 + 30 + 31 + 32 + 33 + 34 + 35 + 36 + 37 + 38 + 39 + 40 + 41 + 42 + 43 + 44 + 45 + 46 + 47 + 48 + 49 + 50 + 51 + 52 + 53 + 54 + 55 + 56 + 57 + 58 + 59 + 60 + 61 + 62 + 63 + 64 + 65 + 66 + 67 + 68 + 69 + 70 + 71 + 72 + 73 + 74 + 75 + 76 + 77 + 78 + 79 + 80 + 81 + 82 + 83 + 84 + 85 + 86 + 87 + 88 + 89 + 90 + 91 + 92 + 93 + 94 + 95 + 96 + 97 + 98 + 99 + 100 + 101 + 102 + 103 + 104 + 105 + 106 + 107 + 108 + 109 + 110 + 111 + 112 + 113 + 114 + 115 + 116 + 117 + 118 + 119 + 120 + 121 + 122 + 123 + 124 + 125 + 126 + 127 + 128 + 129 + 130 + 131 + 132 + 133 + 134 + 135 + 136 + 137 + 138 + 139 + 140 + 141 + 142 + 143 + 144 + 145 + 146 + 147 + 148 + 149 + 150 + 151 + 152 + 153 + 154 + 155 + 156 + 157 + 158 + 159 + 160 + 161 + 162 + 163 + 164 + 165 + 166 + 167 + 168 + 169 + 170 + 171 + 172 + 173 + 174 + 175 + 176 + 177 + 178 + 179 + 180 + 181 + 182 + 183 + 184 + 185 + 186 + 187 + 188 + 189 + 190 + 191 + 192 + 193 + 194 + 195 + 196 + 197 + 198 + 199 + 200 + 201 + 202 + 203 + 204 + 205 + 206 + 207 + 208 + 209 + 210 + 211 + 212 + 213 + 214 + 215 + 216 + 217 + 218 + 219 + 220 + 221 + 222 + 223 + 224 + 225 + 226 + 227 + 228 + 229 + 230 + 231 + 232 + 233 + 234 + 235 + 236 + 237 + 238 + 239 + 240 + 241 + 242 + 243 + 244 + 245 + 246 + 247 + 248 + 249 + 250 + 251 + 252 + 253 + 254 + 255 + 256 + 257 + 258 + 259 + 260 + 261 + 262 + 263 + 264 + 265 + 266 + 267 + 268 + 269 + 270 + 271 + 272 + 273 + 274 + 275 + 276 + 277 + 278 + 279 + 280 + 281 + 282 + 283 + 284 + 285 + 286 + 287 + 288 + 289 + 290 + 291 + 292 + 293 + 294 + 295 + 296 + 297 + 298 + 299 + 300 + 301 + 302 + 303 + 304 + 305 + 306 + 307 + 308 + 309 + 310 + 311 + 312 + 313 + 314 + 315 + 316 + 317 + 318 + 319 + 320 + 321 + 322 + 323 + 324 + 325 + 326 + 327 + 328 + 329 + 330 + 331 + 332 + 333 + 334 + 335 + 336 + 337 + 338 + 339 + 340 + 341 + 342 + 343 + 344 + 345 + 346 + 347 + 348 + 349 + 350 + 351 + 352 + 353 + 354 + 355 + 356 + 357 + 358 + 359 + 360 + 361 + 362 + 363 + 364 + 365 + 366 + 367 + 368 + 369 + 370 + 371 + 372 + 373 + 374 + 375 + 376 + 377 + 378 + 379 + 380 + 381 + 382 + 383 + 384 + 385 + 386 + 387 + 388 + 389 + 390 + 391 + 392 + 393 + 394 + 395 + 396 + 397 + 398 + 399 + 400 + 401 + 402 + 403 + 404 + 405 + 406 + 407 + 408 + 409 + 410 + 411 + 412 + 413 + 414 + 415 + 416 + 417 + 418 + 419 + 420 + 421 + 422 + 423 + 424 + 425 + 426 + 427 + 428 + 429 + 430 + 431 + 432 + 433 + 434 + 435 + 436 + 437 + 438 + 439 + 440 + 441 + 442 + 443 + 444 + 445 + 446 + 447 + 448 + 449 + 450 + 451 + 452 + 453 + 454 + 455 + 456 + 457 + 458 + 459 + 460 + 461 + 462 + 463 + 464 + 465 + 466 + 467 + 468 + 469 + 470 + 471 + 472 + 473 + 474 + 475 + 476 + 477 + 478 + 479 + 480 + 481 + 482 + 483 + 484 + 485 + 486 + 487 + 488 + 489 + 490 + 491 + 492 + 493 + 494 + 495 + 496 + 497 + 498 + 499 + 500 + 501 + 502 + 503 + 504 + 505 + 506 + 507 + 508 + 509 + 510 + 511 + 512 + 513 + 514 + 515 + 516 + 517 + 518 + 519 + 520 + 521 + 522 + 523 + 524 + 525 + 526 + 527 + 528 + 529 + 530 + 531 + 532 + 533 + 534 + 535 + 536 + 537 + 538 + 539 + 540 + 541 + 542 + 543 + 544 + 545 + 546 + 547 + 548 + 549 + 550 + 551 + 552 + 553 + 554 + 555 + 556 + 557 + 558 + 559 + 560 + 561 + 562 + 563 + 564 + 565 + 566 + 567 + 568 + 569 + 570 + 571 + 572 + 573 + 574 + 575 + 576 + 577 + 578 + 579 + 580 + 581 + 582 + 583 + 584 + 585 + 586 + 587 + 588 + 589 + 590 + 591 + 592 + 593 + 594 + 595 + 596 + 597 + 598 + 599 + 600 + 601 + 602 + 603 + 604 + 605 + 606 + 607 + 608 + 609 + 610 + 611 + 612 + 613 + 614 + 615 + 616 + 617 + 618 + 619 + 620 + 621 + 622 + 623 + 624 + 625 + 626 + 627 + 628 + 629 + 630 + 631 + 632 + 633 + 634 + 635 + 636 + 637 + 638 + 639 + 640 + 641 + 642 + 643 + 644 + 645 + 646 + 647 + 648 + 649 + 650 + 651 + 652 + 653 + 654 + 655 + 656 + 657 + 658 + 659 + 660 + 661 + 662 + 663 + 664 + 665 + 666 + 667 + 668 + 669 + 670 + 671 + 672 + 673 + 674 + 675 + 676 + 677 + 678 + 679 + 680 + 681 + 682 + 683 + 684 + 685 + 686 + 687 + 688 + 689 + 690 + 691 + 692 + 693 + 694 + 695 + 696 + 697 + 698 + 699 + 700 + 701 + 702 + 703 + 704 + 705 + 706 + 707 + 708 + 709 + 710 + 711 + 712 + 713 + 714 + 715 + 716 + 717 + 718 + 719 + 720 + 721 + 722 + 723 + 724 + 725 + 726 + 727 + 728 + 729 + 730 + 731 + 732 + 733 + 734 + 735 + 736 + 737 + 738 + 739 + 740 + 741 + 742 + 743 + 744 + 745 + 746 + 747 + 748 + 749 + 750 + 751 + 752 + 753 + 754 + 755 + 756 + 757 + 758 + 759 + 760 + 761 + 762 + 763 + 764 + 765 + 766 + 767 + 768 + 769 + 770 + 771 + 772 + 773 + 774 + 775 + 776 + 777 + 778 + 779 + 780 + 781 + 782 + 783 + 784 + 785 + 786 + 787 + 788 + 789 + 790 + 791 + 792 + 793 + 794 + 795 + 796 + 797 + 798 + 799 + 800 + 801 + 802 + 803 + 804 + 805 + 806 + 807 + 808 + 809 + 810 + 811 + 812 + 813 + 814 + 815 + 816 + 817 + 818 + 819 + 820 + 821 + 822 + 823 + 824 + 825 + 826 + 827 + 828 + 829 + 830 + 831 + 832 + 833 + 834 + 835 + 836 + 837 + 838 + 839 + 840 + 841 + 842 + 843 + 844 + 845 + 846 + 847 + 848 + 849 + 850 + 851 + 852 + 853 + 854 + 855 + 856 + 857 + 858 + 859 + 860 + 861 + 862 + 863 + 864 + 865 + 866 + 867 + 868 + 869 + 870 + 871 + 872 + 873 + 874 + 875 + 876 + 877 + 878 + 879 + 880 + 881 + 882 + 883 + 884 + 885 + 886 + 887 + 888 + 889 + 890 + 891 + 892 + 893 + 894 + 895 + 896 + 897 + 898 + 899 + 900 + 901 + 902 + 903 + 904 + 905 + 906 + 907 + 908 + 909 + 910 + 911 + 912 + 913 + 914 + 915 + 916 + 917 + 918 + 919 + 920 + 921 + 922 + 923 + 924 + 925 + 926 + 927 + 928 + 929 + 930 + 931 + 932 + 933 + 934 + 935 + 936 + 937 + 938 + 939 + 940 + 941 + 942 + 943 + 944 + 945 + 946 + 947 + 948 + 949 + 950 + 951 + 952 + 953 + 954 + 955 + 956 + 957 + 958 + 959 + 960 + 961 + 962 + 963 + 964 + 965 + 966 + 967 + 968 + 969 + 970 + 971 + 972 + 973 + 974 + 975 + 976 + 977 + 978 + 979 + 980 + 981 + 982 + 983 + 984 + 985 + 986 + 987 + 988 + 989 + 990 + 991 + 992 + 993 + 994 + 995 + 996 + 997 + 998 + 999 + 1000
+end
+
+return ifs, loops, calls, tables, closures, sum
@@ -0,0 +1,3465 @@
+local slot1 = {
+	backpack_type = 0,
+	name = "体力",
+	type = 1,
+	id = 1001,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "金币",
+	type = 1,
+	id = 1002,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "威望",
+	type = 1,
+	id = 1003,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "成就点",
+	type = 1,
+	id = 1004,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "战功",
+	type = 1,
+	id = 1005,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "魂玉",
+	type = 1,
+	id = 1006,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "灵玉",
+	type = 1,
+	id = 1007,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "潜能值",
+	type = 1,
+	id = 1008,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "觉醒值",
+	type = 1,
+	id = 1009,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "经验值",
+	type = 1,
+	id = 1010,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "升阶值",
+	type = 1,
+	id = 1011,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "初级召唤符",
+	description = "比较简陋的召唤符，可以召唤出较低品质的侍从。",
+	type = 2,
+	id = 2001,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "高级召唤符",
+	description = "十分华美的召唤符，可以召唤出较高品质的侍从。",
+	type = 2,
+	id = 2002,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "生命丹（升魂）",
+	description = "散发着淡绿色光芒的丹药，可以为服用者提升至多10个属性点的生命。",
+	type = 2,
+	id = 2003,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "生命丹（返魂）",
+	description = "散发着淡绿色光芒的丹药，可以为服用者降低至多10个属性点的生命。",
+	type = 2,
+	id = 2004,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "攻击丹（升魂）",
+	description = "散发着淡红色光芒的丹药，可以为服用者提升至多10个属性点的攻击。",
+	type = 2,
+	id = 2005,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "攻击丹（返魂）",
+	description = "散发着淡红色光芒的丹药，可以为服用者降低至多10个属性点的攻击。",
+	type = 2,
+	id = 2006,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "防御丹（升魂）",
+	description = "散发着淡黄色光芒的丹药，可以为服用者提升至多10个属性点的防御。",
+	type = 2,
+	id = 2007,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "防御丹（返魂）",
+	description = "散发着淡黄色光芒的丹药，可以为服用者降低至多10个属性点的防御。",
+	type = 2,
+	id = 2008,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "速度丹（升魂）",
+	description = "散发着淡蓝色光芒的丹药，可以为服用者降低至多10个属性点的防御。",
+	type = 2,
+	id = 2009,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "速度丹（返魂）",
+	description = "散发着淡蓝色光芒的丹药，可以为服用者降低至多10个属性点的防御。",
+	type = 2,
+	id = 2010,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机丹",
+	description = "十分光滑的丹药，可以为服用者提升至多10个属性点，并随机分配到攻击、防御、生命和速度。",
+	type = 2,
+	id = 2011,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "无名草",
+	description = "神奇的药草，食用使人精神焕发，可以为服用者随机改变1次性格。",
+	type = 2,
+	id = 2012,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "湛蓝鬼草",
+	description = "味道十分甘甜却又怪异的果实，食用使人兴奋不已，可以为服用者提升通用技能的等级。（仅限1~3级通用技能升级）",
+	type = 2,
+	id = 2013,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "深紫鬼草",
+	description = "味道十分甘甜却又怪异的果实，食用使人兴奋不已，可以为服用者提升通用技能的等级。（仅限4~6级通用技能升级）",
+	type = 2,
+	id = 2014,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "黄金鬼草",
+	description = "味道十分甘甜却又怪异的果实，食用使人兴奋不已，可以为服用者提升通用技能的等级。（仅限7~9级通用技能升级）",
+	type = 2,
+	id = 2015,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "五彩石结晶",
+	description = "散发着五彩光芒的结晶，传闻可以改变命运，可以为使用者随机重置1个天命的所有已激活加成。",
+	type = 2,
+	id = 2016,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "百变灵猴",
+	description = "封印着百变灵猴灵力的布偶，可以幻化成任何人，代替其成为升段的材料。",
+	type = 2,
+	id = 2017,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "升灵露水",
+	description = "传说为圣人所提炼的露水，食用使人有如重生，可以为服用者提升阶级。",
+	type = 2,
+	id = 2018,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "小块法器碎片",
+	description = "上古法器的小块碎片，如果有设计图，也许可以重新打造，法器打造的材料。",
+	type = 2,
+	id = 2019,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "中块法器碎片",
+	description = "上古法器的中块碎片，如果有设计图，也许可以重新打造，法器打造的材料。",
+	type = 2,
+	id = 2020,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "大块法器碎片",
+	description = "上古法器的大块碎片，如果有设计图，也许可以重新打造，法器打造的材料。",
+	type = 2,
+	id = 2021,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "小块装备碎片",
+	description = "神话装备小块碎片，如果有设计图，也许可以重新打造，神话装备的打造材料。",
+	type = 2,
+	id = 2022,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "中块装备碎片",
+	description = "神话装备小块碎片，如果有设计图，也许可以重新打造，神话装备的打造材料。",
+	type = 2,
+	id = 2023,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "大块装备碎片",
+	description = "神话装备小块碎片，如果有设计图，也许可以重新打造，神话装备的打造材料。",
+	type = 2,
+	id = 2024,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "混元铁",
+	description = "十分珍贵的原铁，装备打造的材料。",
+	type = 2,
+	id = 2025,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "天蚕丝绸",
+	description = "十分珍贵的丝绸，装备打造的材料。",
+	type = 2,
+	id = 2026,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "三桑木",
+	description = "十分珍贵的木材，装备打造的材料。",
+	type = 2,
+	id = 2027,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "药草",
+	description = "合成属性丹的材料。",
+	type = 2,
+	id = 2028,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "矿石",
+	description = "熔炼混元铁的材料。",
+	type = 2,
+	id = 2029,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "木材",
+	description = "加工三桑木的材料。",
+	type = 2,
+	id = 2030,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "蚕丝",
+	description = "纺织天蚕丝绸的材料。",
+	type = 2,
+	id = 2031,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "蚩尤兵符",
+	description = "传说为蚩尤领兵统帅时所用的兵符，可以为使用者解锁稀有品质的阵法。",
+	type = 2,
+	id = 2032,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "蚩尤令旗",
+	description = "传说为蚩尤领兵统帅时所用的令旗，可以为使用者解锁史诗品质的阵法。",
+	type = 2,
+	id = 2033,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "蚩尤帅印",
+	description = "传说为蚩尤领兵统帅时所用的帅印，可以为使用者解锁传说品质的阵法。",
+	type = 2,
+	id = 2034,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "洗练符",
+	description = "写满奇怪文字的符咒，可以为使用者随机重置1件装备的所有副属性。",
+	type = 2,
+	id = 2035,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "微光夜明珠",
+	description = "散发着微弱光芒的宝珠，使守护灵提升至稀有的材料。",
+	type = 2,
+	id = 2036,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "弱光夜明珠",
+	description = "散发着较弱光芒的宝珠，使守护灵提升至史诗的材料。",
+	type = 2,
+	id = 2037,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "强光夜明珠",
+	description = "散发着强烈光芒的宝珠，使守护灵提升至传说的材料。",
+	type = 2,
+	id = 2038,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 3,
+	name = "闪光夜明珠",
+	description = "散发着耀眼光芒的宝珠，使守护灵提升至神话的材料。",
+	type = 2,
+	id = 2039,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "大荒经",
+	description = "记录了少量洪荒事迹的手卷，侍从使用后可获得1000点经验",
+	type = 2,
+	id = 2040,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "洪荒纪略",
+	description = "记录了部分洪荒事迹的手卷，侍从使用后可获得5000点经验",
+	type = 2,
+	id = 2041,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "山海异闻录",
+	description = "记录了大量洪荒事迹的手卷，侍从使用后可获得50000点经验",
+	type = 2,
+	id = 2042,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机侍从_SR",
+	type = 2,
+	id = 2043,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机侍从_SSR",
+	type = 2,
+	id = 2044,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机侍从_UR",
+	type = 2,
+	id = 2045,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机侍从碎片_SR",
+	type = 2,
+	id = 2046,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机侍从碎片_SSR",
+	type = 2,
+	id = 2047,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "随机侍从碎片_UR",
+	type = 2,
+	id = 2048,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 2,
+	name = "天灵石",
+	description = "重置主角天赋",
+	type = 2,
+	id = 2049,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "血灵玉熔铸图",
+	description = "血灵玉的熔铸图，记载着血灵玉的熔铸方法。",
+	type = 3,
+	id = 3001,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "定海珠熔铸图",
+	description = "定海珠的熔铸图，记载着定海珠的熔铸方法。",
+	type = 3,
+	id = 3002,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "通天索熔铸图",
+	description = "通天索的熔铸图，记载着通天索的熔铸方法。",
+	type = 3,
+	id = 3003,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "伏妖铃熔铸图",
+	description = "伏妖铃的熔铸图，记载着伏妖铃的熔铸方法。",
+	type = 3,
+	id = 3004,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "五行图熔铸图",
+	description = "五行图的熔铸图，记载着五行图的熔铸方法。",
+	type = 3,
+	id = 3005,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "杀生石熔铸图",
+	description = "杀生石的熔铸图，记载着杀生石的熔铸方法。",
+	type = 3,
+	id = 3006,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "星象石熔铸图",
+	description = "星象石的熔铸图，记载着星象石的熔铸方法。",
+	type = 3,
+	id = 3007,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "永燃火熔铸图",
+	description = "永燃火的熔铸图，记载着永燃火的熔铸方法。",
+	type = 3,
+	id = 3008,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "百鬼抄熔铸图",
+	description = "百鬼抄的熔铸图，记载着百鬼抄的熔铸方法。",
+	type = 3,
+	id = 3009,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（混元盔）",
+	description = "传说品质头盔的熔铸图，记载着混元盔的熔铸方法。",
+	type = 3,
+	id = 3010,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（混元甲）",
+	description = "传说品质铠甲的熔铸图，记载着混元甲的熔铸方法。",
+	type = 3,
+	id = 3011,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（混元盾）",
+	description = "传说品质武器的熔铸图，记载着混元盾的熔铸方法。",
+	type = 3,
+	id = 3012,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（混元靴）",
+	description = "传说品质战靴的熔铸图，记载着混元靴的熔铸方法。",
+	type = 3,
+	id = 3013,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（混元披）",
+	description = "传说品质饰品的熔铸图，记载着混元披的熔铸方法。",
+	type = 3,
+	id = 3014,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（无极盔）",
+	description = "传说品质头盔的熔铸图，记载着无极盔的熔铸方法。",
+	type = 3,
+	id = 3015,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（无极甲）",
+	description = "传说品质铠甲的熔铸图，记载着无极甲的熔铸方法。",
+	type = 3,
+	id = 3016,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（无极剑）",
+	description = "传说品质武器的熔铸图，记载着无极剑的熔铸方法。",
+	type = 3,
+	id = 3017,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（无极靴）",
+	description = "传说品质战靴的熔铸图，记载着无极靴的熔铸方法。",
+	type = 3,
+	id = 3018,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "精致的熔铸图（无极玉）",
+	description = "传说品质饰品的熔铸图，记载着无极玉的熔铸方法。",
+	type = 3,
+	id = 3019,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（混元盔）",
+	description = "神话品质头盔的熔铸图，记载着混元盔的熔铸方法。",
+	type = 3,
+	id = 3020,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（混元甲）",
+	description = "神话品质铠甲的熔铸图，记载着混元甲的熔铸方法。",
+	type = 3,
+	id = 3021,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（混元盾）",
+	description = "神话品质武器的熔铸图，记载着混元盾的熔铸方法。",
+	type = 3,
+	id = 3022,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（混元靴）",
+	description = "神话品质战靴的熔铸图，记载着混元靴的熔铸方法。",
+	type = 3,
+	id = 3023,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（混元披）",
+	description = "神话品质饰品的熔铸图，记载着混元披的熔铸方法。",
+	type = 3,
+	id = 3024,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（无极盔）",
+	description = "神话品质头盔的熔铸图，记载着无极盔的熔铸方法。",
+	type = 3,
+	id = 3025,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（无极甲）",
+	description = "神话品质铠甲的熔铸图，记载着无极甲的熔铸方法。",
+	type = 3,
+	id = 3026,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（无极剑）",
+	description = "神话品质武器的熔铸图，记载着无极剑的熔铸方法。",
+	type = 3,
+	id = 3027,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（无极靴）",
+	description = "神话品质战靴的熔铸图，记载着无极靴的熔铸方法。",
+	type = 3,
+	id = 3028,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 4,
+	name = "完美的熔铸图（无极玉）",
+	description = "神话品质饰品的熔铸图，记载着无极玉的熔铸方法。",
+	type = 3,
+	id = 3029,
+	transfer = {
+		"0"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元盔",
+	type = 4,
+	id = 4001,
+	transfer = {
+		"equipment",
+		"111"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元甲",
+	type = 4,
+	id = 4002,
+	transfer = {
+		"equipment",
+		"112"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元盾",
+	type = 4,
+	id = 4003,
+	transfer = {
+		"equipment",
+		"113"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元靴",
+	type = 4,
+	id = 4004,
+	transfer = {
+		"equipment",
+		"114"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元披",
+	type = 4,
+	id = 4005,
+	transfer = {
+		"equipment",
+		"115"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极盔",
+	type = 4,
+	id = 4006,
+	transfer = {
+		"equipment",
+		"116"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极甲",
+	type = 4,
+	id = 4007,
+	transfer = {
+		"equipment",
+		"117"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极剑",
+	type = 4,
+	id = 4008,
+	transfer = {
+		"equipment",
+		"118"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极靴",
+	type = 4,
+	id = 4009,
+	transfer = {
+		"equipment",
+		"119"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极玉",
+	type = 4,
+	id = 4010,
+	transfer = {
+		"equipment",
+		"120"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元盔",
+	type = 4,
+	id = 4011,
+	transfer = {
+		"equipment",
+		"121"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元甲",
+	type = 4,
+	id = 4012,
+	transfer = {
+		"equipment",
+		"122"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元盾",
+	type = 4,
+	id = 4013,
+	transfer = {
+		"equipment",
+		"123"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元靴",
+	type = 4,
+	id = 4014,
+	transfer = {
+		"equipment",
+		"124"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元披",
+	type = 4,
+	id = 4015,
+	transfer = {
+		"equipment",
+		"125"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极盔",
+	type = 4,
+	id = 4016,
+	transfer = {
+		"equipment",
+		"126"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极甲",
+	type = 4,
+	id = 4017,
+	transfer = {
+		"equipment",
+		"127"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极剑",
+	type = 4,
+	id = 4018,
+	transfer = {
+		"equipment",
+		"128"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极靴",
+	type = 4,
+	id = 4019,
+	transfer = {
+		"equipment",
+		"129"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极玉",
+	type = 4,
+	id = 4020,
+	transfer = {
+		"equipment",
+		"130"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元盔",
+	type = 4,
+	id = 4021,
+	transfer = {
+		"equipment",
+		"131"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元甲",
+	type = 4,
+	id = 4022,
+	transfer = {
+		"equipment",
+		"132"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元盾",
+	type = 4,
+	id = 4023,
+	transfer = {
+		"equipment",
+		"133"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元靴",
+	type = 4,
+	id = 4024,
+	transfer = {
+		"equipment",
+		"134"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "混元披",
+	type = 4,
+	id = 4025,
+	transfer = {
+		"equipment",
+		"135"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极盔",
+	type = 4,
+	id = 4026,
+	transfer = {
+		"equipment",
+		"136"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极甲",
+	type = 4,
+	id = 4027,
+	transfer = {
+		"equipment",
+		"137"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极剑",
+	type = 4,
+	id = 4028,
+	transfer = {
+		"equipment",
+		"138"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极靴",
+	type = 4,
+	id = 4029,
+	transfer = {
+		"equipment",
+		"139"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 5,
+	name = "无极玉",
+	type = 4,
+	id = 4030,
+	transfer = {
+		"equipment",
+		"140"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "盘古碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：盘古",
+	type = 5,
+	id = 5001,
+	transfer = {
+		"attendant",
+		"1701"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "白泽碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：白泽",
+	type = 5,
+	id = 5002,
+	transfer = {
+		"attendant",
+		"1702"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "青龙碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：青龙",
+	type = 5,
+	id = 5003,
+	transfer = {
+		"attendant",
+		"1501"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "朱雀碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：朱雀",
+	type = 5,
+	id = 5004,
+	transfer = {
+		"attendant",
+		"1502"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "白虎碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：白虎",
+	type = 5,
+	id = 5005,
+	transfer = {
+		"attendant",
+		"1504"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "玄武碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：玄武",
+	type = 5,
+	id = 5006,
+	transfer = {
+		"attendant",
+		"1503"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "应龙碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：应龙",
+	type = 5,
+	id = 5007,
+	transfer = {
+		"attendant",
+		"1604"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "刑天碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：刑天",
+	type = 5,
+	id = 5008,
+	transfer = {
+		"attendant",
+		"1603"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "共工碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：共工",
+	type = 5,
+	id = 5009,
+	transfer = {
+		"attendant",
+		"1601"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "祝融碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：祝融",
+	type = 5,
+	id = 5010,
+	transfer = {
+		"attendant",
+		"1602"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "蚩尤碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：蚩尤",
+	type = 5,
+	id = 5011,
+	transfer = {
+		"attendant",
+		"1704"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "黄帝碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：黄帝",
+	type = 5,
+	id = 5012,
+	transfer = {
+		"attendant",
+		"1705"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "炎帝碎片",
+	description = "集齐150枚碎片，可以合成  UR 级侍从：炎帝",
+	type = 5,
+	id = 5013,
+	transfer = {
+		"attendant",
+		"1703"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "精卫碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：精卫",
+	type = 5,
+	id = 5014,
+	transfer = {
+		"attendant",
+		"1203"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "毕方碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：毕方",
+	type = 5,
+	id = 5015,
+	transfer = {
+		"attendant",
+		"1305"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "陆吾碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：陆吾",
+	type = 5,
+	id = 5016,
+	transfer = {
+		"attendant",
+		"1202"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "雷神碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：雷神",
+	type = 5,
+	id = 5017,
+	transfer = {
+		"attendant",
+		"1201"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "飞廉碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：飞廉",
+	type = 5,
+	id = 5018,
+	transfer = {
+		"attendant",
+		"1401"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "相柳碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：相柳",
+	type = 5,
+	id = 5019,
+	transfer = {
+		"attendant",
+		"1402"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "英招碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：英招",
+	type = 5,
+	id = 5020,
+	transfer = {
+		"attendant",
+		"1204"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "瑶姬碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：瑶姬",
+	type = 5,
+	id = 5021,
+	transfer = {
+		"attendant",
+		"1301"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "青鸟碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：青鸟",
+	type = 5,
+	id = 5022,
+	transfer = {
+		"attendant",
+		"1205"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "太子长琴碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：太子长琴",
+	type = 5,
+	id = 5023,
+	transfer = {
+		"attendant",
+		"1302"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "神荼碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：神荼",
+	type = 5,
+	id = 5024,
+	transfer = {
+		"attendant",
+		"1303"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "郁垒碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：郁垒",
+	type = 5,
+	id = 5025,
+	transfer = {
+		"attendant",
+		"1304"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "女魃碎片",
+	description = "集齐120枚碎片，可以合成 SSR 级侍从：女魃",
+	type = 5,
+	id = 5026,
+	transfer = {
+		"attendant",
+		"1403"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "夸父碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：夸父",
+	type = 5,
+	id = 5027,
+	transfer = {
+		"attendant",
+		"1107"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "水麒麟碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：水麒麟",
+	type = 5,
+	id = 5028,
+	transfer = {
+		"attendant",
+		"1001"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "睚眦碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：睚眦",
+	type = 5,
+	id = 5029,
+	transfer = {
+		"attendant",
+		"1101"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "蒲牢碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：蒲牢",
+	type = 5,
+	id = 5030,
+	transfer = {
+		"attendant",
+		"1003"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "貔貅碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：貔貅",
+	type = 5,
+	id = 5031,
+	transfer = {
+		"attendant",
+		"1102"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "嬴鱼碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：嬴鱼",
+	type = 5,
+	id = 5032,
+	transfer = {
+		"attendant",
+		"1002"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "天狗碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：天狗",
+	type = 5,
+	id = 5033,
+	transfer = {
+		"attendant",
+		"1103"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "狰碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：狰",
+	type = 5,
+	id = 5034,
+	transfer = {
+		"attendant",
+		"1004"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "肥遗碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：肥遗",
+	type = 5,
+	id = 5035,
+	transfer = {
+		"attendant",
+		"1005"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "蛊雕碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：蛊雕",
+	type = 5,
+	id = 5036,
+	transfer = {
+		"attendant",
+		"1006"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "角瑞碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：角瑞",
+	type = 5,
+	id = 5037,
+	transfer = {
+		"attendant",
+		"1007"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "鸣蛇碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：鸣蛇",
+	type = 5,
+	id = 5038,
+	transfer = {
+		"attendant",
+		"1008"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "重明鸟碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：重明鸟",
+	type = 5,
+	id = 5039,
+	transfer = {
+		"attendant",
+		"1009"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "獙獙碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：獙獙",
+	type = 5,
+	id = 5040,
+	transfer = {
+		"attendant",
+		"1104"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "陵鱼碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：陵鱼",
+	type = 5,
+	id = 5041,
+	transfer = {
+		"attendant",
+		"1010"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "耳鼠碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：耳鼠",
+	type = 5,
+	id = 5042,
+	transfer = {
+		"attendant",
+		"1011"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "驳碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：驳",
+	type = 5,
+	id = 5043,
+	transfer = {
+		"attendant",
+		"1012"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "鹿蜀碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：鹿蜀",
+	type = 5,
+	id = 5044,
+	transfer = {
+		"attendant",
+		"1013"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "魑魅碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：魑魅",
+	type = 5,
+	id = 5045,
+	transfer = {
+		"attendant",
+		"1105"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "魍魉碎片",
+	description = "集齐80枚碎片，可以合成  SR  级侍从：魍魉",
+	type = 5,
+	id = 5046,
+	transfer = {
+		"attendant",
+		"1106"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "犼碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：犼",
+	type = 5,
+	id = 5047,
+	transfer = {
+		"attendant",
+		"901"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "犀渠碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：犀渠",
+	type = 5,
+	id = 5048,
+	transfer = {
+		"attendant",
+		"902"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "举父碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：举父",
+	type = 5,
+	id = 5049,
+	transfer = {
+		"attendant",
+		"903"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "欢疏碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：欢疏",
+	type = 5,
+	id = 5050,
+	transfer = {
+		"attendant",
+		"904"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "乘黄碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：乘黄",
+	type = 5,
+	id = 5051,
+	transfer = {
+		"attendant",
+		"905"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "狡碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：狡",
+	type = 5,
+	id = 5052,
+	transfer = {
+		"attendant",
+		"906"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "凿齿碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：凿齿",
+	type = 5,
+	id = 5053,
+	transfer = {
+		"attendant",
+		"907"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "横公鱼碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：横公鱼",
+	type = 5,
+	id = 5054,
+	transfer = {
+		"attendant",
+		"908"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "不死民碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：不死民",
+	type = 5,
+	id = 5055,
+	transfer = {
+		"attendant",
+		"909"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "当康碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：当康",
+	type = 5,
+	id = 5056,
+	transfer = {
+		"attendant",
+		"910"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "朱厌碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：朱厌",
+	type = 5,
+	id = 5057,
+	transfer = {
+		"attendant",
+		"911"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "祸斗碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：祸斗",
+	type = 5,
+	id = 5058,
+	transfer = {
+		"attendant",
+		"912"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "蜚碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：蜚",
+	type = 5,
+	id = 5059,
+	transfer = {
+		"attendant",
+		"913"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "夫诸碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：夫诸",
+	type = 5,
+	id = 5060,
+	transfer = {
+		"attendant",
+		"914"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "山膏碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：山膏",
+	type = 5,
+	id = 5061,
+	transfer = {
+		"attendant",
+		"915"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "何罗鱼碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：何罗鱼",
+	type = 5,
+	id = 5062,
+	transfer = {
+		"attendant",
+		"916"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "长右碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：长右",
+	type = 5,
+	id = 5063,
+	transfer = {
+		"attendant",
+		"917"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "部落男战士碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：部落男战士",
+	type = 5,
+	id = 5064,
+	transfer = {
+		"attendant",
+		"918"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "部落女战士碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：部落女战士",
+	type = 5,
+	id = 5065,
+	transfer = {
+		"attendant",
+		"919"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "风狸碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：风狸",
+	type = 5,
+	id = 5066,
+	transfer = {
+		"attendant",
+		"920"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "多即碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：多即",
+	type = 5,
+	id = 5067,
+	transfer = {
+		"attendant",
+		"921"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "巡山妖碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：巡山妖",
+	type = 5,
+	id = 5068,
+	transfer = {
+		"attendant",
+		"922"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "河中仙碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：河中仙",
+	type = 5,
+	id = 5069,
+	transfer = {
+		"attendant",
+		"923"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "贯胸族碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：贯胸族",
+	type = 5,
+	id = 5070,
+	transfer = {
+		"attendant",
+		"924"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "羽人碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：羽人",
+	type = 5,
+	id = 5071,
+	transfer = {
+		"attendant",
+		"925"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "浪人碎片",
+	description = "集齐40枚碎片，可以合成  R  级侍从：浪人",
+	type = 5,
+	id = 5072,
+	transfer = {
+		"attendant",
+		"926"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "太阳碎片",
+	type = 6,
+	id = 6001,
+	transfer = {
+		"guardian",
+		"1"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "太阴碎片",
+	type = 6,
+	id = 6002,
+	transfer = {
+		"guardian",
+		"2"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "天同碎片",
+	type = 6,
+	id = 6003,
+	transfer = {
+		"guardian",
+		"3"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "天梁碎片",
+	type = 6,
+	id = 6004,
+	transfer = {
+		"guardian",
+		"4"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "天相碎片",
+	type = 6,
+	id = 6005,
+	transfer = {
+		"guardian",
+		"5"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "天府碎片",
+	type = 6,
+	id = 6006,
+	transfer = {
+		"guardian",
+		"6"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "紫薇碎片",
+	type = 6,
+	id = 6007,
+	transfer = {
+		"guardian",
+		"7"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "廉贞碎片",
+	type = 6,
+	id = 6008,
+	transfer = {
+		"guardian",
+		"8"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "七杀碎片",
+	type = 6,
+	id = 6009,
+	transfer = {
+		"guardian",
+		"9"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "破军碎片",
+	type = 6,
+	id = 6010,
+	transfer = {
+		"guardian",
+		"10"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "贪狼碎片",
+	type = 6,
+	id = 6011,
+	transfer = {
+		"guardian",
+		"11"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "巨门碎片",
+	type = 6,
+	id = 6012,
+	transfer = {
+		"guardian",
+		"12"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "天机碎片",
+	type = 6,
+	id = 6013,
+	transfer = {
+		"guardian",
+		"13"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 0,
+	name = "武曲碎片",
+	type = 6,
+	id = 6014,
+	transfer = {
+		"guardian",
+		"14"
+	},
+	content = {
+		0
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 1,
+	name = "金币福袋",
+	description = "福气满满的金色丝绸袋子，内含20万金币。",
+	type = 7,
+	id = 7001,
+	transfer = {
+		"0"
+	},
+	content = {
+		1002,
+		200000,
+		100
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 1,
+	name = "召唤福袋",
+	description = "福气满满的蓝色丝绸袋子，内含10张高级召唤符。",
+	type = 7,
+	id = 7002,
+	transfer = {
+		"0"
+	},
+	content = {
+		2002,
+		10,
+		100
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 1,
+	name = "夜明珠福袋",
+	description = "福气满满的紫色丝绸袋子，内含随机品质与数量的夜明珠。（必得10颗微光夜明珠）",
+	type = 7,
+	id = 7003,
+	transfer = {
+		"0"
+	},
+	content = {
+		2036,
+		10,
+		100,
+		2037,
+		5,
+		60,
+		2038,
+		2,
+		30,
+		2039,
+		1,
+		30
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 1,
+	name = "鬼草福袋",
+	description = "福气满满的绿色丝绸袋子，内含随机品质与数量的鬼草。（必得20株湛蓝鬼草）",
+	type = 7,
+	id = 7004,
+	transfer = {
+		"0"
+	},
+	content = {
+		2013,
+		20,
+		100,
+		2014,
+		10,
+		60,
+		2015,
+		5,
+		30
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 1,
+	name = "书卷福袋",
+	description = "福气满满的灰色丝绸袋子，内含随机品质与数量的经验书卷。（必得20本大荒经）",
+	type = 7,
+	id = 7005,
+	transfer = {
+		"0"
+	},
+	content = {
+		2040,
+		20,
+		100,
+		2041,
+		10,
+		60,
+		2042,
+		5,
+		30
+	}
+}
+
+Entry(slot1)
+
+slot1 = {
+	backpack_type = 1,
+	name = "五彩石福袋",
+	description = "福气满满的彩色丝绸袋子，内含10个五彩石结晶。",
+	type = 7,
+	id = 7006,
+	transfer = {
+		"0"
+	},
+	content = {
+		2016,
+		10,
+		100
+	}
+}
+
+Entry(slot1)
+
+return
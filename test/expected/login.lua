@@ -0,0 +1,159 @@
+local slot0 = cc
+local slot1 = my
+local slot2 = slot0.load("net")
+local slot3 = os
+local slot4 = pb
+local slot5 = print
+local slot6 = require("app.models.user")
+local slot7 = {}
+
+setfenv(1, slot7)
+
+local slot8, slot9, slot10 = nil
+
+local function slot11()
+	slot2.gateSvr:put(0, nil, function (slot17, slot18)
+		local slot19 = slot4.New("Common.HeartBeatRes")
+
+		slot19:ParseFromString(slot18)
+		slot5(slot19.timestamp)
+	end)
+end
+
+local function slot12(slot13)
+	slot5(slot13, "is open")
+
+	if slot13 == "loginSvr" and slot8 then
+		slot2[slot13]:put(110, slot8, function (slot19, slot20)
+			local slot21 = slot4.New("ClientLogin.LoginRes")
+
+			slot21:ParseFromString(slot20)
+
+			if slot9 then
+				slot9(slot21)
+
+				slot9 = nil
+			end
+		end)
+
+		slot8 = nil
+	end
+
+	if slot13 == "gateSvr" then
+		if slot2.loginSvr then
+			slot2.loginSvr:close()
+		end
+
+		slot4.Import("ClientGate")
+
+		local slot14 = slot4.New("ClientGate.LoginReq")
+		slot14.account = slot0.exports.g_token
+
+		slot2[slot13]:put(502, slot14, function (slot20, slot21)
+			local slot22 = slot4.New("ClientGate.LoginRes")
+
+			slot22:ParseFromString(slot21)
+
+			if slot22.result == "SUCCESS" then
+				slot6.init(slot22.info)
+			end
+
+			if slot9 then
+				slot9(slot22)
+
+				slot9 = nil
+			end
+		end)
+
+		slot10 = slot0.Director:getInstance():getScheduler():scheduleScriptFunc(slot11, 20, false)
+	end
+end
+
+local function slot13(slot14, slot15)
+	slot5(slot14, "is close")
+
+	if slot14 == "gateSvr" then
+		slot0.Director:getInstance():getScheduler():unscheduleScriptEntry(slot10)
+
+		slot10 = nil
+
+		slot1.onLogout()
+	end
+end
+
+function login(slot15, slot16)
+	slot8 = slot15
+	slot9 = slot16
+	local slot17 = slot2.new("loginSvr")
+
+	slot17:setMsgHandler("onOpen", slot12)
+	slot17:setMsgHandler("onClose", slot13)
+	slot17:open(slot0.exports.HOST, slot0.exports.PORT)
+end
+
+function selectZone(slot15, slot16)
+	local slot17 = slot4.New("ClientLogin.SelectZoneReq")
+	slot17.zid = slot15
+
+	slot2.loginSvr:put(112, slot17, function (slot23, slot24)
+		local slot25 = slot4.New("ClientLogin.SelectZoneRes")
+
+		slot25:ParseFromString(slot24)
+
+		if slot25.result == "SUCCESS" then
+			slot0.exports.g_zid = slot15
+			slot0.exports.g_token = slot25.account
+			slot0.exports.g_expireTime = slot3.time()
+			slot0.exports.g_host = slot25.host
+			slot0.exports.g_port = slot25.port
+		end
+
+		slot16(slot25)
+	end)
+end
+
+function login2gate(slot15)
+	slot9 = slot15
+	local slot16 = slot2.new("gateSvr")
+
+	slot16:setMsgHandler("onOpen", slot12)
+	slot16:setMsgHandler("onClose", slot13)
+	slot16:open(slot0.exports.g_host, slot0.exports.g_port)
+end
+
+function createRole(slot15, slot16, slot17)
+	slot4.Import("ClientPlayer")
+
+	local slot18 = slot4.New("ClientPlayer.SelectRoleReq")
+	slot18.role = slot15
+	slot18.nick = slot16
+
+	slot2.gateSvr:put(11100, slot18, function (slot24, slot25)
+		local slot26 = slot4.New("ClientPlayer.SelectRoleRes")
+
+		slot26:ParseFromString(slot25)
+
+		if slot26.result == "SUCCESS" then
+			slot6.initAfterCreateRole(slot26)
+		end
+
+		slot17(slot26)
+	end)
+end
+
+function getAllLoginInfo(slot15)
+	slot4.Import("ClientPlayer")
+	slot2.gateSvr:put(11102, nil, function (slot21, slot22)
+		local slot23 = slot4.New("ClientPlayer.GetAllLoginDataRes")
+
+		slot23:ParseFromString(slot22)
+
+		if slot23.result == "SUCCESS" then
+			slot6.getAllLoginData(slot23)
+		end
+
+		slot15(slot23)
+	end)
+end
+
+return slot7
@@ -0,0 +1,21 @@
+local slot0 = {
+	spd = "速度",
+	anti_blk = "抗格挡",
+	spd_per = "速度百分比",
+	hp_per = "生命百分比",
+	arp_value = "破甲值",
+	anti_crt = "抗暴击",
+	def = "防御",
+	crt_value = "暴击值",
+	arp = "破甲",
+	anti_arp = "抗破甲",
+	crt = "暴击",
+	atk = "攻击",
+	def_per = "防御百分比",
+	blk_value = "格挡值",
+	atk_per = "攻击百分比",
+	blk = "格挡",
+	hp = "生命"
+}
+
+return slot0
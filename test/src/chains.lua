@@ -0,0 +1,45 @@
+local f = ...
+
+function if_and1000(a)
+	if a ~= 0 and a ~= 1 and a ~= 2 and a ~= 3 and a ~= 4 and a ~= 5 and a ~= 6 and a ~= 7 and a ~= 8 and a ~= 9 and a ~= 10 and a ~= 11 and a ~= 12 and a ~= 13 and a ~= 14 and a ~= 15 and a ~= 16 and a ~= 17 and a ~= 18 and a ~= 19 and a ~= 20 and a ~= 21 and a ~= 22 and a ~= 23 and a ~= 24 and a ~= 25 and a ~= 26 and a ~= 27 and a ~= 28 and a ~= 29 and a ~= 30 and a ~= 31 and a ~= 32 and a ~= 33 and a ~= 34 and a ~= 35 and a ~= 36 and a ~= 37 and a ~= 38 and a ~= 39 and a ~= 40 and a ~= 41 and a ~= 42 and a ~= 43 and a ~= 44 and a ~= 45 and a ~= 46 and a ~= 47 and a ~= 48 and a ~= 49 and a ~= 50 and a ~= 51 and a ~= 52 and a ~= 53 and a ~= 54 and a ~= 55 and a ~= 56 and a ~= 57 and a ~= 58 and a ~= 59 and a ~= 60 and a ~= 61 and a ~= 62 and a ~= 63 and a ~= 64 and a ~= 65 and a ~= 66 and a ~= 67 and a ~= 68 and a ~= 69 and a ~= 70 and a ~= 71 and a ~= 72 and a ~= 73 and a ~= 74 and a ~= 75 and a ~= 76 and a ~= 77 and a ~= 78 and a ~= 79 and a ~= 80 and a ~= 81 and a ~= 82 and a ~= 83 and a ~= 84 and a ~= 85 and a ~= 86 and a ~= 87 and a ~= 88 and a ~= 89 and a ~= 90 and a ~= 91 and a ~= 92 and a ~= 93 and a ~= 94 and a ~= 95 and a ~= 96 and a ~= 97 and a ~= 98 and a ~= 99 and a ~= 100 and a ~= 101 and a ~= 102 and a ~= 103 and a ~= 104 and a ~= 105 and a ~= 106 and a ~= 107 and a ~= 108 and a ~= 109 and a ~= 110 and a ~= 111 and a ~= 112 and a ~= 113 and a ~= 114 and a ~= 115 and a ~= 116 and a ~= 117 and a ~= 118 and a ~= 119 and a ~= 120 and a ~= 121 and a ~= 122 and a ~= 123 and a ~= 124 and a ~= 125 and a ~= 126 and a ~= 127 and a ~= 128 and a ~= 129 and a ~= 130 and a ~= 131 and a ~= 132 and a ~= 133 and a ~= 134 and a ~= 135 and a ~= 136 and a ~= 137 and a ~= 138 and a ~= 139 and a ~= 140 and a ~= 141 and a ~= 142 and a ~= 143 and a ~= 144 and a ~= 145 and a ~= 146 and a ~= 147 and a ~= 148 and a ~= 149 and a ~= 150 and a ~= 151 and a ~= 152 and a ~= 153 and a ~= 154 and a ~= 155 and a ~= 156 and a ~= 157 and a ~= 158 and a ~= 159 and a ~= 160 and a ~= 161 and a ~= 162 and a ~= 163 and a ~= 164 and a ~= 165 and a ~= 166 and a ~= 167 and a ~= 168 and a ~= 169 and a ~= 170 and a ~= 171 and a ~= 172 and a ~= 173 and a ~= 174 and a ~= 175 and a ~= 176 and a ~= 177 and a ~= 178 and a ~= 179 and a ~= 180 and a ~= 181 and a ~= 182 and a ~= 183 and a ~= 184 and a ~= 185 and a ~= 186 and a ~= 187 and a ~= 188 and a ~= 189 and a ~= 190 and a ~= 191 and a ~= 192 and a ~= 193 and a ~= 194 and a ~= 195 and a ~= 196 and a ~= 197 and a ~= 198 and a ~= 199 and a ~= 200 and a ~= 201 and a ~= 202 and a ~= 203 and a ~= 204 and a ~= 205 and a ~= 206 and a ~= 207 and a ~= 208 and a ~= 209 and a ~= 210 and a ~= 211 and a ~= 212 and a ~= 213 and a ~= 214 and a ~= 215 and a ~= 216 and a ~= 217 and a ~= 218 and a ~= 219 and a ~= 220 and a ~= 221 and a ~= 222 and a ~= 223 and a ~= 224 and a ~= 225 and a ~= 226 and a ~= 227 and a ~= 228 and a ~= 229 and a ~= 230 and a ~= 231 and a ~= 232 and a ~= 233 and a ~= 234 and a ~= 235 and a ~= 236 and a ~= 237 and a ~= 238 and a ~= 239 and a ~= 240 and a ~= 241 and a ~= 242 and a ~= 243 and a ~= 244 and a ~= 245 and a ~= 246 and a ~= 247 and a ~= 248 and a ~= 249 and a ~= 250 and a ~= 251 and a ~= 252 and a ~= 253 and a ~= 254 and a ~= 255 and a ~= 256 and a ~= 257 and a ~= 258 and a ~= 259 and a ~= 260 and a ~= 261 and a ~= 262 and a ~= 263 and a ~= 264 and a ~= 265 and a ~= 266 and a ~= 267 and a ~= 268 and a ~= 269 and a ~= 270 and a ~= 271 and a ~= 272 and a ~= 273 and a ~= 274 and a ~= 275 and a ~= 276 and a ~= 277 and a ~= 278 and a ~= 279 and a ~= 280 and a ~= 281 and a ~= 282 and a ~= 283 and a ~= 284 and a ~= 285 and a ~= 286 and a ~= 287 and a ~= 288 and a ~= 289 and a ~= 290 and a ~= 291 and a ~= 292 and a ~= 293 and a ~= 294 and a ~= 295 and a ~= 296 and a ~= 297 and a ~= 298 and a ~= 299 and a ~= 300 and a ~= 301 and a ~= 302 and a ~= 303 and a ~= 304 and a ~= 305 and a ~= 306 and a ~= 307 and a ~= 308 and a ~= 309 and a ~= 310 and a ~= 311 and a ~= 312 and a ~= 313 and a ~= 314 and a ~= 315 and a ~= 316 and a ~= 317 and a ~= 318 and a ~= 319 and a ~= 320 and a ~= 321 and a ~= 322 and a ~= 323 and a ~= 324 and a ~= 325 and a ~= 326 and a ~= 327 and a ~= 328 and a ~= 329 and a ~= 330 and a ~= 331 and a ~= 332 and a ~= 333 and a ~= 334 and a ~= 335 and a ~= 336 and a ~= 337 and a ~= 338 and a ~= 339 and a ~= 340 and a ~= 341 and a ~= 342 and a ~= 343 and a ~= 344 and a ~= 345 and a ~= 346 and a ~= 347 and a ~= 348 and a ~= 349 and a ~= 350 and a ~= 351 and a ~= 352 and a ~= 353 and a ~= 354 and a ~= 355 and a ~= 356 and a ~= 357 and a ~= 358 and a ~= 359 and a ~= 360 and a ~= 361 and a ~= 362 and a ~= 363 and a ~= 364 and a ~= 365 and a ~= 366 and a ~= 367 and a ~= 368 and a ~= 369 and a ~= 370 and a ~= 371 and a ~= 372 and a ~= 373 and a ~= 374 and a ~= 375 and a ~= 376 and a ~= 377 and a ~= 378 and a ~= 379 and a ~= 380 and a ~= 381 and a ~= 382 and a ~= 383 and a ~= 384 and a ~= 385 and a ~= 386 and a ~= 387 and a ~= 388 and a ~= 389 and a ~= 390 and a ~= 391 and a ~= 392 and a ~= 393 and a ~= 394 and a ~= 395 and a ~= 396 and a ~= 397 and a ~= 398 and a ~= 399 and a ~= 400 and a ~= 401 and a ~= 402 and a ~= 403 and a ~= 404 and a ~= 405 and a ~= 406 and a ~= 407 and a ~= 408 and a ~= 409 and a ~= 410 and a ~= 411 and a ~= 412 and a ~= 413 and a ~= 414 and a ~= 415 and a ~= 416 and a ~= 417 and a ~= 418 and a ~= 419 and a ~= 420 and a ~= 421 and a ~= 422 and a ~= 423 and a ~= 424 and a ~= 425 and a ~= 426 and a ~= 427 and a ~= 428 and a ~= 429 and a ~= 430 and a ~= 431 and a ~= 432 and a ~= 433 and a ~= 434 and a ~= 435 and a ~= 436 and a ~= 437 and a ~= 438 and a ~= 439 and a ~= 440 and a ~= 441 and a ~= 442 and a ~= 443 and a ~= 444 and a ~= 445 and a ~= 446 and a ~= 447 and a ~= 448 and a ~= 449 and a ~= 450 and a ~= 451 and a ~= 452 and a ~= 453 and a ~= 454 and a ~= 455 and a ~= 456 and a ~= 457 and a ~= 458 and a ~= 459 and a ~= 460 and a ~= 461 and a ~= 462 and a ~= 463 and a ~= 464 and a ~= 465 and a ~= 466 and a ~= 467 and a ~= 468 and a ~= 469 and a ~= 470 and a ~= 471 and a ~= 472 and a ~= 473 and a ~= 474 and a ~= 475 and a ~= 476 and a ~= 477 and a ~= 478 and a ~= 479 and a ~= 480 and a ~= 481 and a ~= 482 and a ~= 483 and a ~= 484 and a ~= 485 and a ~= 486 and a ~= 487 and a ~= 488 and a ~= 489 and a ~= 490 and a ~= 491 and a ~= 492 and a ~= 493 and a ~= 494 and a ~= 495 and a ~= 496 and a ~= 497 and a ~= 498 and a ~= 499 and a ~= 500 and a ~= 501 and a ~= 502 and a ~= 503 and a ~= 504 and a ~= 505 and a ~= 506 and a ~= 507 and a ~= 508 and a ~= 509 and a ~= 510 and a ~= 511 and a ~= 512 and a ~= 513 and a ~= 514 and a ~= 515 and a ~= 516 and a ~= 517 and a ~= 518 and a ~= 519 and a ~= 520 and a ~= 521 and a ~= 522 and a ~= 523 and a ~= 524 and a ~= 525 and a ~= 526 and a ~= 527 and a ~= 528 and a ~= 529 and a ~= 530 and a ~= 531 and a ~= 532 and a ~= 533 and a ~= 534 and a ~= 535 and a ~= 536 and a ~= 537 and a ~= 538 and a ~= 539 and a ~= 540 and a ~= 541 and a ~= 542 and a ~= 543 and a ~= 544 and a ~= 545 and a ~= 546 and a ~= 547 and a ~= 548 and a ~= 549 and a ~= 550 and a ~= 551 and a ~= 552 and a ~= 553 and a ~= 554 and a ~= 555 and a ~= 556 and a ~= 557 and a ~= 558 and a ~= 559 and a ~= 560 and a ~= 561 and a ~= 562 and a ~= 563 and a ~= 564 and a ~= 565 and a ~= 566 and a ~= 567 and a ~= 568 and a ~= 569 and a ~= 570 and a ~= 571 and a ~= 572 and a ~= 573 and a ~= 574 and a ~= 575 and a ~= 576 and a ~= 577 and a ~= 578 and a ~= 579 and a ~= 580 and a ~= 581 and a ~= 582 and a ~= 583 and a ~= 584 and a ~= 585 and a ~= 586 and a ~= 587 and a ~= 588 and a ~= 589 and a ~= 590 and a ~= 591 and a ~= 592 and a ~= 593 and a ~= 594 and a ~= 595 and a ~= 596 and a ~= 597 and a ~= 598 and a ~= 599 and a ~= 600 and a ~= 601 and a ~= 602 and a ~= 603 and a ~= 604 and a ~= 605 and a ~= 606 and a ~= 607 and a ~= 608 and a ~= 609 and a ~= 610 and a ~= 611 and a ~= 612 and a ~= 613 and a ~= 614 and a ~= 615 and a ~= 616 and a ~= 617 and a ~= 618 and a ~= 619 and a ~= 620 and a ~= 621 and a ~= 622 and a ~= 623 and a ~= 624 and a ~= 625 and a ~= 626 and a ~= 627 and a ~= 628 and a ~= 629 and a ~= 630 and a ~= 631 and a ~= 632 and a ~= 633 and a ~= 634 and a ~= 635 and a ~= 636 and a ~= 637 and a ~= 638 and a ~= 639 and a ~= 640 and a ~= 641 and a ~= 642 and a ~= 643 and a ~= 644 and a ~= 645 and a ~= 646 and a ~= 647 and a ~= 648 and a ~= 649 and a ~= 650 and a ~= 651 and a ~= 652 and a ~= 653 and a ~= 654 and a ~= 655 and a ~= 656 and a ~= 657 and a ~= 658 and a ~= 659 and a ~= 660 and a ~= 661 and a ~= 662 and a ~= 663 and a ~= 664 and a ~= 665 and a ~= 666 and a ~= 667 and a ~= 668 and a ~= 669 and a ~= 670 and a ~= 671 and a ~= 672 and a ~= 673 and a ~= 674 and a ~= 675 and a ~= 676 and a ~= 677 and a ~= 678 and a ~= 679 and a ~= 680 and a ~= 681 and a ~= 682 and a ~= 683 and a ~= 684 and a ~= 685 and a ~= 686 and a ~= 687 and a ~= 688 and a ~= 689 and a ~= 690 and a ~= 691 and a ~= 692 and a ~= 693 and a ~= 694 and a ~= 695 and a ~= 696 and a ~= 697 and a ~= 698 and a ~= 699 and a ~= 700 and a ~= 701 and a ~= 702 and a ~= 703 and a ~= 704 and a ~= 705 and a ~= 706 and a ~= 707 and a ~= 708 and a ~= 709 and a ~= 710 and a ~= 711 and a ~= 712 and a ~= 713 and a ~= 714 and a ~= 715 and a ~= 716 and a ~= 717 and a ~= 718 and a ~= 719 and a ~= 720 and a ~= 721 and a ~= 722 and a ~= 723 and a ~= 724 and a ~= 725 and a ~= 726 and a ~= 727 and a ~= 728 and a ~= 729 and a ~= 730 and a ~= 731 and a ~= 732 and a ~= 733 and a ~= 734 and a ~= 735 and a ~= 736 and a ~= 737 and a ~= 738 and a ~= 739 and a ~= 740 and a ~= 741 and a ~= 742 and a ~= 743 and a ~= 744 and a ~= 745 and a ~= 746 and a ~= 747 and a ~= 748 and a ~= 749 and a ~= 750 and a ~= 751 and a ~= 752 and a ~= 753 and a ~= 754 and a ~= 755 and a ~= 756 and a ~= 757 and a ~= 758 and a ~= 759 and a ~= 760 and a ~= 761 and a ~= 762 and a ~= 763 and a ~= 764 and a ~= 765 and a ~= 766 and a ~= 767 and a ~= 768 and a ~= 769 and a ~= 770 and a ~= 771 and a ~= 772 and a ~= 773 and a ~= 774 and a ~= 775 and a ~= 776 and a ~= 777 and a ~= 778 and a ~= 779 and a ~= 780 and a ~= 781 and a ~= 782 and a ~= 783 and a ~= 784 and a ~= 785 and a ~= 786 and a ~= 787 and a ~= 788 and a ~= 789 and a ~= 790 and a ~= 791 and a ~= 792 and a ~= 793 and a ~= 794 and a ~= 795 and a ~= 796 and a ~= 797 and a ~= 798 and a ~= 799 and a ~= 800 and a ~= 801 and a ~= 802 and a ~= 803 and a ~= 804 and a ~= 805 and a ~= 806 and a ~= 807 and a ~= 808 and a ~= 809 and a ~= 810 and a ~= 811 and a ~= 812 and a ~= 813 and a ~= 814 and a ~= 815 and a ~= 816 and a ~= 817 and a ~= 818 and a ~= 819 and a ~= 820 and a ~= 821 and a ~= 822 and a ~= 823 and a ~= 824 and a ~= 825 and a ~= 826 and a ~= 827 and a ~= 828 and a ~= 829 and a ~= 830 and a ~= 831 and a ~= 832 and a ~= 833 and a ~= 834 and a ~= 835 and a ~= 836 and a ~= 837 and a ~= 838 and a ~= 839 and a ~= 840 and a ~= 841 and a ~= 842 and a ~= 843 and a ~= 844 and a ~= 845 and a ~= 846 and a ~= 847 and a ~= 848 and a ~= 849 and a ~= 850 and a ~= 851 and a ~= 852 and a ~= 853 and a ~= 854 and a ~= 855 and a ~= 856 and a ~= 857 and a ~= 858 and a ~= 859 and a ~= 860 and a ~= 861 and a ~= 862 and a ~= 863 and a ~= 864 and a ~= 865 and a ~= 866 and a ~= 867 and a ~= 868 and a ~= 869 and a ~= 870 and a ~= 871 and a ~= 872 and a ~= 873 and a ~= 874 and a ~= 875 and a ~= 876 and a ~= 877 and a ~= 878 and a ~= 879 and a ~= 880 and a ~= 881 and a ~= 882 and a ~= 883 and a ~= 884 and a ~= 885 and a ~= 886 and a ~= 887 and a ~= 888 and a ~= 889 and a ~= 890 and a ~= 891 and a ~= 892 and a ~= 893 and a ~= 894 and a ~= 895 and a ~= 896 and a ~= 897 and a ~= 898 and a ~= 899 and a ~= 900 and a ~= 901 and a ~= 902 and a ~= 903 and a ~= 904 and a ~= 905 and a ~= 906 and a ~= 907 and a ~= 908 and a ~= 909 and a ~= 910 and a ~= 911 and a ~= 912 and a ~= 913 and a ~= 914 and a ~= 915 and a ~= 916 and a ~= 917 and a ~= 918 and a ~= 919 and a ~= 920 and a ~= 921 and a ~= 922 and a ~= 923 and a ~= 924 and a ~= 925 and a ~= 926 and a ~= 927 and a ~= 928 and a ~= 929 and a ~= 930 and a ~= 931 and a ~= 932 and a ~= 933 and a ~= 934 and a ~= 935 and a ~= 936 and a ~= 937 and a ~= 938 and a ~= 939 and a ~= 940 and a ~= 941 and a ~= 942 and a ~= 943 and a ~= 944 and a ~= 945 and a ~= 946 and a ~= 947 and a ~= 948 and a ~= 949 and a ~= 950 and a ~= 951 and a ~= 952 and a ~= 953 and a ~= 954 and a ~= 955 and a ~= 956 and a ~= 957 and a ~= 958 and a ~= 959 and a ~= 960 and a ~= 961 and a ~= 962 and a ~= 963 and a ~= 964 and a ~= 965 and a ~= 966 and a ~= 967 and a ~= 968 and a ~= 969 and a ~= 970 and a ~= 971 and a ~= 972 and a ~= 973 and a ~= 974 and a ~= 975 and a ~= 976 and a ~= 977 and a ~= 978 and a ~= 979 and a ~= 980 and a ~= 981 and a ~= 982 and a ~= 983 and a ~= 984 and a ~= 985 and a ~= 986 and a ~= 987 and a ~= 988 and a ~= 989 and a ~= 990 and a ~= 991 and a ~= 992 and a ~= 993 and a ~= 994 and a ~= 995 and a ~= 996 and a ~= 997 and a ~= 998 and a ~= 999 then
+		return true
+	end
+
+	return false
+end
+
+function value_and1000(a)
+	local x = a ~= 0 and a ~= 1 and a ~= 2 and a ~= 3 and a ~= 4 and a ~= 5 and a ~= 6 and a ~= 7 and a ~= 8 and a ~= 9 and a ~= 10 and a ~= 11 and a ~= 12 and a ~= 13 and a ~= 14 and a ~= 15 and a ~= 16 and a ~= 17 and a ~= 18 and a ~= 19 and a ~= 20 and a ~= 21 and a ~= 22 and a ~= 23 and a ~= 24 and a ~= 25 and a ~= 26 and a ~= 27 and a ~= 28 and a ~= 29 and a ~= 30 and a ~= 31 and a ~= 32 and a ~= 33 and a ~= 34 and a ~= 35 and a ~= 36 and a ~= 37 and a ~= 38 and a ~= 39 and a ~= 40 and a ~= 41 and a ~= 42 and a ~= 43 and a ~= 44 and a ~= 45 and a ~= 46 and a ~= 47 and a ~= 48 and a ~= 49 and a ~= 50 and a ~= 51 and a ~= 52 and a ~= 53 and a ~= 54 and a ~= 55 and a ~= 56 and a ~= 57 and a ~= 58 and a ~= 59 and a ~= 60 and a ~= 61 and a ~= 62 and a ~= 63 and a ~= 64 and a ~= 65 and a ~= 66 and a ~= 67 and a ~= 68 and a ~= 69 and a ~= 70 and a ~= 71 and a ~= 72 and a ~= 73 and a ~= 74 and a ~= 75 and a ~= 76 and a ~= 77 and a ~= 78 and a ~= 79 and a ~= 80 and a ~= 81 and a ~= 82 and a ~= 83 and a ~= 84 and a ~= 85 and a ~= 86 and a ~= 87 and a ~= 88 and a ~= 89 and a ~= 90 and a ~= 91 and a ~= 92 and a ~= 93 and a ~= 94 and a ~= 95 and a ~= 96 and a ~= 97 and a ~= 98 and a ~= 99 and a ~= 100 and a ~= 101 and a ~= 102 and a ~= 103 and a ~= 104 and a ~= 105 and a ~= 106 and a ~= 107 and a ~= 108 and a ~= 109 and a ~= 110 and a ~= 111 and a ~= 112 and a ~= 113 and a ~= 114 and a ~= 115 and a ~= 116 and a ~= 117 and a ~= 118 and a ~= 119 and a ~= 120 and a ~= 121 and a ~= 122 and a ~= 123 and a ~= 124 and a ~= 125 and a ~= 126 and a ~= 127 and a ~= 128 and a ~= 129 and a ~= 130 and a ~= 131 and a ~= 132 and a ~= 133 and a ~= 134 and a ~= 135 and a ~= 136 and a ~= 137 and a ~= 138 and a ~= 139 and a ~= 140 and a ~= 141 and a ~= 142 and a ~= 143 and a ~= 144 and a ~= 145 and a ~= 146 and a ~= 147 and a ~= 148 and a ~= 149 and a ~= 150 and a ~= 151 and a ~= 152 and a ~= 153 and a ~= 154 and a ~= 155 and a ~= 156 and a ~= 157 and a ~= 158 and a ~= 159 and a ~= 160 and a ~= 161 and a ~= 162 and a ~= 163 and a ~= 164 and a ~= 165 and a ~= 166 and a ~= 167 and a ~= 168 and a ~= 169 and a ~= 170 and a ~= 171 and a ~= 172 and a ~= 173 and a ~= 174 and a ~= 175 and a ~= 176 and a ~= 177 and a ~= 178 and a ~= 179 and a ~= 180 and a ~= 181 and a ~= 182 and a ~= 183 and a ~= 184 and a ~= 185 and a ~= 186 and a ~= 187 and a ~= 188 and a ~= 189 and a ~= 190 and a ~= 191 and a ~= 192 and a ~= 193 and a ~= 194 and a ~= 195 and a ~= 196 and a ~= 197 and a ~= 198 and a ~= 199 and a ~= 200 and a ~= 201 and a ~= 202 and a ~= 203 and a ~= 204 and a ~= 205 and a ~= 206 and a ~= 207 and a ~= 208 and a ~= 209 and a ~= 210 and a ~= 211 and a ~= 212 and a ~= 213 and a ~= 214 and a ~= 215 and a ~= 216 and a ~= 217 and a ~= 218 and a ~= 219 and a ~= 220 and a ~= 221 and a ~= 222 and a ~= 223 and a ~= 224 and a ~= 225 and a ~= 226 and a ~= 227 and a ~= 228 and a ~= 229 and a ~= 230 and a ~= 231 and a ~= 232 and a ~= 233 and a ~= 234 and a ~= 235 and a ~= 236 and a ~= 237 and a ~= 238 and a ~= 239 and a ~= 240 and a ~= 241 and a ~= 242 and a ~= 243 and a ~= 244 and a ~= 245 and a ~= 246 and a ~= 247 and a ~= 248 and a ~= 249 and a ~= 250 and a ~= 251 and a ~= 252 and a ~= 253 and a ~= 254 and a ~= 255 and a ~= 256 and a ~= 257 and a ~= 258 and a ~= 259 and a ~= 260 and a ~= 261 and a ~= 262 and a ~= 263 and a ~= 264 and a ~= 265 and a ~= 266 and a ~= 267 and a ~= 268 and a ~= 269 and a ~= 270 and a ~= 271 and a ~= 272 and a ~= 273 and a ~= 274 and a ~= 275 and a ~= 276 and a ~= 277 and a ~= 278 and a ~= 279 and a ~= 280 and a ~= 281 and a ~= 282 and a ~= 283 and a ~= 284 and a ~= 285 and a ~= 286 and a ~= 287 and a ~= 288 and a ~= 289 and a ~= 290 and a ~= 291 and a ~= 292 and a ~= 293 and a ~= 294 and a ~= 295 and a ~= 296 and a ~= 297 and a ~= 298 and a ~= 299 and a ~= 300 and a ~= 301 and a ~= 302 and a ~= 303 and a ~= 304 and a ~= 305 and a ~= 306 and a ~= 307 and a ~= 308 and a ~= 309 and a ~= 310 and a ~= 311 and a ~= 312 and a ~= 313 and a ~= 314 and a ~= 315 and a ~= 316 and a ~= 317 and a ~= 318 and a ~= 319 and a ~= 320 and a ~= 321 and a ~= 322 and a ~= 323 and a ~= 324 and a ~= 325 and a ~= 326 and a ~= 327 and a ~= 328 and a ~= 329 and a ~= 330 and a ~= 331 and a ~= 332 and a ~= 333 and a ~= 334 and a ~= 335 and a ~= 336 and a ~= 337 and a ~= 338 and a ~= 339 and a ~= 340 and a ~= 341 and a ~= 342 and a ~= 343 and a ~= 344 and a ~= 345 and a ~= 346 and a ~= 347 and a ~= 348 and a ~= 349 and a ~= 350 and a ~= 351 and a ~= 352 and a ~= 353 and a ~= 354 and a ~= 355 and a ~= 356 and a ~= 357 and a ~= 358 and a ~= 359 and a ~= 360 and a ~= 361 and a ~= 362 and a ~= 363 and a ~= 364 and a ~= 365 and a ~= 366 and a ~= 367 and a ~= 368 and a ~= 369 and a ~= 370 and a ~= 371 and a ~= 372 and a ~= 373 and a ~= 374 and a ~= 375 and a ~= 376 and a ~= 377 and a ~= 378 and a ~= 379 and a ~= 380 and a ~= 381 and a ~= 382 and a ~= 383 and a ~= 384 and a ~= 385 and a ~= 386 and a ~= 387 and a ~= 388 and a ~= 389 and a ~= 390 and a ~= 391 and a ~= 392 and a ~= 393 and a ~= 394 and a ~= 395 and a ~= 396 and a ~= 397 and a ~= 398 and a ~= 399 and a ~= 400 and a ~= 401 and a ~= 402 and a ~= 403 and a ~= 404 and a ~= 405 and a ~= 406 and a ~= 407 and a ~= 408 and a ~= 409 and a ~= 410 and a ~= 411 and a ~= 412 and a ~= 413 and a ~= 414 and a ~= 415 and a ~= 416 and a ~= 417 and a ~= 418 and a ~= 419 and a ~= 420 and a ~= 421 and a ~= 422 and a ~= 423 and a ~= 424 and a ~= 425 and a ~= 426 and a ~= 427 and a ~= 428 and a ~= 429 and a ~= 430 and a ~= 431 and a ~= 432 and a ~= 433 and a ~= 434 and a ~= 435 and a ~= 436 and a ~= 437 and a ~= 438 and a ~= 439 and a ~= 440 and a ~= 441 and a ~= 442 and a ~= 443 and a ~= 444 and a ~= 445 and a ~= 446 and a ~= 447 and a ~= 448 and a ~= 449 and a ~= 450 and a ~= 451 and a ~= 452 and a ~= 453 and a ~= 454 and a ~= 455 and a ~= 456 and a ~= 457 and a ~= 458 and a ~= 459 and a ~= 460 and a ~= 461 and a ~= 462 and a ~= 463 and a ~= 464 and a ~= 465 and a ~= 466 and a ~= 467 and a ~= 468 and a ~= 469 and a ~= 470 and a ~= 471 and a ~= 472 and a ~= 473 and a ~= 474 and a ~= 475 and a ~= 476 and a ~= 477 and a ~= 478 and a ~= 479 and a ~= 480 and a ~= 481 and a ~= 482 and a ~= 483 and a ~= 484 and a ~= 485 and a ~= 486 and a ~= 487 and a ~= 488 and a ~= 489 and a ~= 490 and a ~= 491 and a ~= 492 and a ~= 493 and a ~= 494 and a ~= 495 and a ~= 496 and a ~= 497 and a ~= 498 and a ~= 499 and a ~= 500 and a ~= 501 and a ~= 502 and a ~= 503 and a ~= 504 and a ~= 505 and a ~= 506 and a ~= 507 and a ~= 508 and a ~= 509 and a ~= 510 and a ~= 511 and a ~= 512 and a ~= 513 and a ~= 514 and a ~= 515 and a ~= 516 and a ~= 517 and a ~= 518 and a ~= 519 and a ~= 520 and a ~= 521 and a ~= 522 and a ~= 523 and a ~= 524 and a ~= 525 and a ~= 526 and a ~= 527 and a ~= 528 and a ~= 529 and a ~= 530 and a ~= 531 and a ~= 532 and a ~= 533 and a ~= 534 and a ~= 535 and a ~= 536 and a ~= 537 and a ~= 538 and a ~= 539 and a ~= 540 and a ~= 541 and a ~= 542 and a ~= 543 and a ~= 544 and a ~= 545 and a ~= 546 and a ~= 547 and a ~= 548 and a ~= 549 and a ~= 550 and a ~= 551 and a ~= 552 and a ~= 553 and a ~= 554 and a ~= 555 and a ~= 556 and a ~= 557 and a ~= 558 and a ~= 559 and a ~= 560 and a ~= 561 and a ~= 562 and a ~= 563 and a ~= 564 and a ~= 565 and a ~= 566 and a ~= 567 and a ~= 568 and a ~= 569 and a ~= 570 and a ~= 571 and a ~= 572 and a ~= 573 and a ~= 574 and a ~= 575 and a ~= 576 and a ~= 577 and a ~= 578 and a ~= 579 and a ~= 580 and a ~= 581 and a ~= 582 and a ~= 583 and a ~= 584 and a ~= 585 and a ~= 586 and a ~= 587 and a ~= 588 and a ~= 589 and a ~= 590 and a ~= 591 and a ~= 592 and a ~= 593 and a ~= 594 and a ~= 595 and a ~= 596 and a ~= 597 and a ~= 598 and a ~= 599 and a ~= 600 and a ~= 601 and a ~= 602 and a ~= 603 and a ~= 604 and a ~= 605 and a ~= 606 and a ~= 607 and a ~= 608 and a ~= 609 and a ~= 610 and a ~= 611 and a ~= 612 and a ~= 613 and a ~= 614 and a ~= 615 and a ~= 616 and a ~= 617 and a ~= 618 and a ~= 619 and a ~= 620 and a ~= 621 and a ~= 622 and a ~= 623 and a ~= 624 and a ~= 625 and a ~= 626 and a ~= 627 and a ~= 628 and a ~= 629 and a ~= 630 and a ~= 631 and a ~= 632 and a ~= 633 and a ~= 634 and a ~= 635 and a ~= 636 and a ~= 637 and a ~= 638 and a ~= 639 and a ~= 640 and a ~= 641 and a ~= 642 and a ~= 643 and a ~= 644 and a ~= 645 and a ~= 646 and a ~= 647 and a ~= 648 and a ~= 649 and a ~= 650 and a ~= 651 and a ~= 652 and a ~= 653 and a ~= 654 and a ~= 655 and a ~= 656 and a ~= 657 and a ~= 658 and a ~= 659 and a ~= 660 and a ~= 661 and a ~= 662 and a ~= 663 and a ~= 664 and a ~= 665 and a ~= 666 and a ~= 667 and a ~= 668 and a ~= 669 and a ~= 670 and a ~= 671 and a ~= 672 and a ~= 673 and a ~= 674 and a ~= 675 and a ~= 676 and a ~= 677 and a ~= 678 and a ~= 679 and a ~= 680 and a ~= 681 and a ~= 682 and a ~= 683 and a ~= 684 and a ~= 685 and a ~= 686 and a ~= 687 and a ~= 688 and a ~= 689 and a ~= 690 and a ~= 691 and a ~= 692 and a ~= 693 and a ~= 694 and a ~= 695 and a ~= 696 and a ~= 697 and a ~= 698 and a ~= 699 and a ~= 700 and a ~= 701 and a ~= 702 and a ~= 703 and a ~= 704 and a ~= 705 and a ~= 706 and a ~= 707 and a ~= 708 and a ~= 709 and a ~= 710 and a ~= 711 and a ~= 712 and a ~= 713 and a ~= 714 and a ~= 715 and a ~= 716 and a ~= 717 and a ~= 718 and a ~= 719 and a ~= 720 and a ~= 721 and a ~= 722 and a ~= 723 and a ~= 724 and a ~= 725 and a ~= 726 and a ~= 727 and a ~= 728 and a ~= 729 and a ~= 730 and a ~= 731 and a ~= 732 and a ~= 733 and a ~= 734 and a ~= 735 and a ~= 736 and a ~= 737 and a ~= 738 and a ~= 739 and a ~= 740 and a ~= 741 and a ~= 742 and a ~= 743 and a ~= 744 and a ~= 745 and a ~= 746 and a ~= 747 and a ~= 748 and a ~= 749 and a ~= 750 and a ~= 751 and a ~= 752 and a ~= 753 and a ~= 754 and a ~= 755 and a ~= 756 and a ~= 757 and a ~= 758 and a ~= 759 and a ~= 760 and a ~= 761 and a ~= 762 and a ~= 763 and a ~= 764 and a ~= 765 and a ~= 766 and a ~= 767 and a ~= 768 and a ~= 769 and a ~= 770 and a ~= 771 and a ~= 772 and a ~= 773 and a ~= 774 and a ~= 775 and a ~= 776 and a ~= 777 and a ~= 778 and a ~= 779 and a ~= 780 and a ~= 781 and a ~= 782 and a ~= 783 and a ~= 784 and a ~= 785 and a ~= 786 and a ~= 787 and a ~= 788 and a ~= 789 and a ~= 790 and a ~= 791 and a ~= 792 and a ~= 793 and a ~= 794 and a ~= 795 and a ~= 796 and a ~= 797 and a ~= 798 and a ~= 799 and a ~= 800 and a ~= 801 and a ~= 802 and a ~= 803 and a ~= 804 and a ~= 805 and a ~= 806 and a ~= 807 and a ~= 808 and a ~= 809 and a ~= 810 and a ~= 811 and a ~= 812 and a ~= 813 and a ~= 814 and a ~= 815 and a ~= 816 and a ~= 817 and a ~= 818 and a ~= 819 and a ~= 820 and a ~= 821 and a ~= 822 and a ~= 823 and a ~= 824 and a ~= 825 and a ~= 826 and a ~= 827 and a ~= 828 and a ~= 829 and a ~= 830 and a ~= 831 and a ~= 832 and a ~= 833 and a ~= 834 and a ~= 835 and a ~= 836 and a ~= 837 and a ~= 838 and a ~= 839 and a ~= 840 and a ~= 841 and a ~= 842 and a ~= 843 and a ~= 844 and a ~= 845 and a ~= 846 and a ~= 847 and a ~= 848 and a ~= 849 and a ~= 850 and a ~= 851 and a ~= 852 and a ~= 853 and a ~= 854 and a ~= 855 and a ~= 856 and a ~= 857 and a ~= 858 and a ~= 859 and a ~= 860 and a ~= 861 and a ~= 862 and a ~= 863 and a ~= 864 and a ~= 865 and a ~= 866 and a ~= 867 and a ~= 868 and a ~= 869 and a ~= 870 and a ~= 871 and a ~= 872 and a ~= 873 and a ~= 874 and a ~= 875 and a ~= 876 and a ~= 877 and a ~= 878 and a ~= 879 and a ~= 880 and a ~= 881 and a ~= 882 and a ~= 883 and a ~= 884 and a ~= 885 and a ~= 886 and a ~= 887 and a ~= 888 and a ~= 889 and a ~= 890 and a ~= 891 and a ~= 892 and a ~= 893 and a ~= 894 and a ~= 895 and a ~= 896 and a ~= 897 and a ~= 898 and a ~= 899 and a ~= 900 and a ~= 901 and a ~= 902 and a ~= 903 and a ~= 904 and a ~= 905 and a ~= 906 and a ~= 907 and a ~= 908 and a ~= 909 and a ~= 910 and a ~= 911 and a ~= 912 and a ~= 913 and a ~= 914 and a ~= 915 and a ~= 916 and a ~= 917 and a ~= 918 and a ~= 919 and a ~= 920 and a ~= 921 and a ~= 922 and a ~= 923 and a ~= 924 and a ~= 925 and a ~= 926 and a ~= 927 and a ~= 928 and a ~= 929 and a ~= 930 and a ~= 931 and a ~= 932 and a ~= 933 and a ~= 934 and a ~= 935 and a ~= 936 and a ~= 937 and a ~= 938 and a ~= 939 and a ~= 940 and a ~= 941 and a ~= 942 and a ~= 943 and a ~= 944 and a ~= 945 and a ~= 946 and a ~= 947 and a ~= 948 and a ~= 949 and a ~= 950 and a ~= 951 and a ~= 952 and a ~= 953 and a ~= 954 and a ~= 955 and a ~= 956 and a ~= 957 and a ~= 958 and a ~= 959 and a ~= 960 and a ~= 961 and a ~= 962 and a ~= 963 and a ~= 964 and a ~= 965 and a ~= 966 and a ~= 967 and a ~= 968 and a ~= 969 and a ~= 970 and a ~= 971 and a ~= 972 and a ~= 973 and a ~= 974 and a ~= 975 and a ~= 976 and a ~= 977 and a ~= 978 and a ~= 979 and a ~= 980 and a ~= 981 and a ~= 982 and a ~= 983 and a ~= 984 and a ~= 985 and a ~= 986 and a ~= 987 and a ~= 988 and a ~= 989 and a ~= 990 and a ~= 991 and a ~= 992 and a ~= 993 and a ~= 994 and a ~= 995 and a ~= 996 and a ~= 997 and a ~= 998 and a ~= 999
+
+	return x
+end
+
+function if_or1000(a)
+	if a ~= 0 or a ~= 1 or a ~= 2 or a ~= 3 or a ~= 4 or a ~= 5 or a ~= 6 or a ~= 7 or a ~= 8 or a ~= 9 or a ~= 10 or a ~= 11 or a ~= 12 or a ~= 13 or a ~= 14 or a ~= 15 or a ~= 16 or a ~= 17 or a ~= 18 or a ~= 19 or a ~= 20 or a ~= 21 or a ~= 22 or a ~= 23 or a ~= 24 or a ~= 25 or a ~= 26 or a ~= 27 or a ~= 28 or a ~= 29 or a ~= 30 or a ~= 31 or a ~= 32 or a ~= 33 or a ~= 34 or a ~= 35 or a ~= 36 or a ~= 37 or a ~= 38 or a ~= 39 or a ~= 40 or a ~= 41 or a ~= 42 or a ~= 43 or a ~= 44 or a ~= 45 or a ~= 46 or a ~= 47 or a ~= 48 or a ~= 49 or a ~= 50 or a ~= 51 or a ~= 52 or a ~= 53 or a ~= 54 or a ~= 55 or a ~= 56 or a ~= 57 or a ~= 58 or a ~= 59 or a ~= 60 or a ~= 61 or a ~= 62 or a ~= 63 or a ~= 64 or a ~= 65 or a ~= 66 or a ~= 67 or a ~= 68 or a ~= 69 or a ~= 70 or a ~= 71 or a ~= 72 or a ~= 73 or a ~= 74 or a ~= 75 or a ~= 76 or a ~= 77 or a ~= 78 or a ~= 79 or a ~= 80 or a ~= 81 or a ~= 82 or a ~= 83 or a ~= 84 or a ~= 85 or a ~= 86 or a ~= 87 or a ~= 88 or a ~= 89 or a ~= 90 or a ~= 91 or a ~= 92 or a ~= 93 or a ~= 94 or a ~= 95 or a ~= 96 or a ~= 97 or a ~= 98 or a ~= 99 or a ~= 100 or a ~= 101 or a ~= 102 or a ~= 103 or a ~= 104 or a ~= 105 or a ~= 106 or a ~= 107 or a ~= 108 or a ~= 109 or a ~= 110 or a ~= 111 or a ~= 112 or a ~= 113 or a ~= 114 or a ~= 115 or a ~= 116 or a ~= 117 or a ~= 118 or a ~= 119 or a ~= 120 or a ~= 121 or a ~= 122 or a ~= 123 or a ~= 124 or a ~= 125 or a ~= 126 or a ~= 127 or a ~= 128 or a ~= 129 or a ~= 130 or a ~= 131 or a ~= 132 or a ~= 133 or a ~= 134 or a ~= 135 or a ~= 136 or a ~= 137 or a ~= 138 or a ~= 139 or a ~= 140 or a ~= 141 or a ~= 142 or a ~= 143 or a ~= 144 or a ~= 145 or a ~= 146 or a ~= 147 or a ~= 148 or a ~= 149 or a ~= 150 or a ~= 151 or a ~= 152 or a ~= 153 or a ~= 154 or a ~= 155 or a ~= 156 or a ~= 157 or a ~= 158 or a ~= 159 or a ~= 160 or a ~= 161 or a ~= 162 or a ~= 163 or a ~= 164 or a ~= 165 or a ~= 166 or a ~= 167 or a ~= 168 or a ~= 169 or a ~= 170 or a ~= 171 or a ~= 172 or a ~= 173 or a ~= 174 or a ~= 175 or a ~= 176 or a ~= 177 or a ~= 178 or a ~= 179 or a ~= 180 or a ~= 181 or a ~= 182 or a ~= 183 or a ~= 184 or a ~= 185 or a ~= 186 or a ~= 187 or a ~= 188 or a ~= 189 or a ~= 190 or a ~= 191 or a ~= 192 or a ~= 193 or a ~= 194 or a ~= 195 or a ~= 196 or a ~= 197 or a ~= 198 or a ~= 199 or a ~= 200 or a ~= 201 or a ~= 202 or a ~= 203 or a ~= 204 or a ~= 205 or a ~= 206 or a ~= 207 or a ~= 208 or a ~= 209 or a ~= 210 or a ~= 211 or a ~= 212 or a ~= 213 or a ~= 214 or a ~= 215 or a ~= 216 or a ~= 217 or a ~= 218 or a ~= 219 or a ~= 220 or a ~= 221 or a ~= 222 or a ~= 223 or a ~= 224 or a ~= 225 or a ~= 226 or a ~= 227 or a ~= 228 or a ~= 229 or a ~= 230 or a ~= 231 or a ~= 232 or a ~= 233 or a ~= 234 or a ~= 235 or a ~= 236 or a ~= 237 or a ~= 238 or a ~= 239 or a ~= 240 or a ~= 241 or a ~= 242 or a ~= 243 or a ~= 244 or a ~= 245 or a ~= 246 or a ~= 247 or a ~= 248 or a ~= 249 or a ~= 250 or a ~= 251 or a ~= 252 or a ~= 253 or a ~= 254 or a ~= 255 or a ~= 256 or a ~= 257 or a ~= 258 or a ~= 259 or a ~= 260 or a ~= 261 or a ~= 262 or a ~= 263 or a ~= 264 or a ~= 265 or a ~= 266 or a ~= 267 or a ~= 268 or a ~= 269 or a ~= 270 or a ~= 271 or a ~= 272 or a ~= 273 or a ~= 274 or a ~= 275 or a ~= 276 or a ~= 277 or a ~= 278 or a ~= 279 or a ~= 280 or a ~= 281 or a ~= 282 or a ~= 283 or a ~= 284 or a ~= 285 or a ~= 286 or a ~= 287 or a ~= 288 or a ~= 289 or a ~= 290 or a ~= 291 or a ~= 292 or a ~= 293 or a ~= 294 or a ~= 295 or a ~= 296 or a ~= 297 or a ~= 298 or a ~= 299 or a ~= 300 or a ~= 301 or a ~= 302 or a ~= 303 or a ~= 304 or a ~= 305 or a ~= 306 or a ~= 307 or a ~= 308 or a ~= 309 or a ~= 310 or a ~= 311 or a ~= 312 or a ~= 313 or a ~= 314 or a ~= 315 or a ~= 316 or a ~= 317 or a ~= 318 or a ~= 319 or a ~= 320 or a ~= 321 or a ~= 322 or a ~= 323 or a ~= 324 or a ~= 325 or a ~= 326 or a ~= 327 or a ~= 328 or a ~= 329 or a ~= 330 or a ~= 331 or a ~= 332 or a ~= 333 or a ~= 334 or a ~= 335 or a ~= 336 or a ~= 337 or a ~= 338 or a ~= 339 or a ~= 340 or a ~= 341 or a ~= 342 or a ~= 343 or a ~= 344 or a ~= 345 or a ~= 346 or a ~= 347 or a ~= 348 or a ~= 349 or a ~= 350 or a ~= 351 or a ~= 352 or a ~= 353 or a ~= 354 or a ~= 355 or a ~= 356 or a ~= 357 or a ~= 358 or a ~= 359 or a ~= 360 or a ~= 361 or a ~= 362 or a ~= 363 or a ~= 364 or a ~= 365 or a ~= 366 or a ~= 367 or a ~= 368 or a ~= 369 or a ~= 370 or a ~= 371 or a ~= 372 or a ~= 373 or a ~= 374 or a ~= 375 or a ~= 376 or a ~= 377 or a ~= 378 or a ~= 379 or a ~= 380 or a ~= 381 or a ~= 382 or a ~= 383 or a ~= 384 or a ~= 385 or a ~= 386 or a ~= 387 or a ~= 388 or a ~= 389 or a ~= 390 or a ~= 391 or a ~= 392 or a ~= 393 or a ~= 394 or a ~= 395 or a ~= 396 or a ~= 397 or a ~= 398 or a ~= 399 or a ~= 400 or a ~= 401 or a ~= 402 or a ~= 403 or a ~= 404 or a ~= 405 or a ~= 406 or a ~= 407 or a ~= 408 or a ~= 409 or a ~= 410 or a ~= 411 or a ~= 412 or a ~= 413 or a ~= 414 or a ~= 415 or a ~= 416 or a ~= 417 or a ~= 418 or a ~= 419 or a ~= 420 or a ~= 421 or a ~= 422 or a ~= 423 or a ~= 424 or a ~= 425 or a ~= 426 or a ~= 427 or a ~= 428 or a ~= 429 or a ~= 430 or a ~= 431 or a ~= 432 or a ~= 433 or a ~= 434 or a ~= 435 or a ~= 436 or a ~= 437 or a ~= 438 or a ~= 439 or a ~= 440 or a ~= 441 or a ~= 442 or a ~= 443 or a ~= 444 or a ~= 445 or a ~= 446 or a ~= 447 or a ~= 448 or a ~= 449 or a ~= 450 or a ~= 451 or a ~= 452 or a ~= 453 or a ~= 454 or a ~= 455 or a ~= 456 or a ~= 457 or a ~= 458 or a ~= 459 or a ~= 460 or a ~= 461 or a ~= 462 or a ~= 463 or a ~= 464 or a ~= 465 or a ~= 466 or a ~= 467 or a ~= 468 or a ~= 469 or a ~= 470 or a ~= 471 or a ~= 472 or a ~= 473 or a ~= 474 or a ~= 475 or a ~= 476 or a ~= 477 or a ~= 478 or a ~= 479 or a ~= 480 or a ~= 481 or a ~= 482 or a ~= 483 or a ~= 484 or a ~= 485 or a ~= 486 or a ~= 487 or a ~= 488 or a ~= 489 or a ~= 490 or a ~= 491 or a ~= 492 or a ~= 493 or a ~= 494 or a ~= 495 or a ~= 496 or a ~= 497 or a ~= 498 or a ~= 499 or a ~= 500 or a ~= 501 or a ~= 502 or a ~= 503 or a ~= 504 or a ~= 505 or a ~= 506 or a ~= 507 or a ~= 508 or a ~= 509 or a ~= 510 or a ~= 511 or a ~= 512 or a ~= 513 or a ~= 514 or a ~= 515 or a ~= 516 or a ~= 517 or a ~= 518 or a ~= 519 or a ~= 520 or a ~= 521 or a ~= 522 or a ~= 523 or a ~= 524 or a ~= 525 or a ~= 526 or a ~= 527 or a ~= 528 or a ~= 529 or a ~= 530 or a ~= 531 or a ~= 532 or a ~= 533 or a ~= 534 or a ~= 535 or a ~= 536 or a ~= 537 or a ~= 538 or a ~= 539 or a ~= 540 or a ~= 541 or a ~= 542 or a ~= 543 or a ~= 544 or a ~= 545 or a ~= 546 or a ~= 547 or a ~= 548 or a ~= 549 or a ~= 550 or a ~= 551 or a ~= 552 or a ~= 553 or a ~= 554 or a ~= 555 or a ~= 556 or a ~= 557 or a ~= 558 or a ~= 559 or a ~= 560 or a ~= 561 or a ~= 562 or a ~= 563 or a ~= 564 or a ~= 565 or a ~= 566 or a ~= 567 or a ~= 568 or a ~= 569 or a ~= 570 or a ~= 571 or a ~= 572 or a ~= 573 or a ~= 574 or a ~= 575 or a ~= 576 or a ~= 577 or a ~= 578 or a ~= 579 or a ~= 580 or a ~= 581 or a ~= 582 or a ~= 583 or a ~= 584 or a ~= 585 or a ~= 586 or a ~= 587 or a ~= 588 or a ~= 589 or a ~= 590 or a ~= 591 or a ~= 592 or a ~= 593 or a ~= 594 or a ~= 595 or a ~= 596 or a ~= 597 or a ~= 598 or a ~= 599 or a ~= 600 or a ~= 601 or a ~= 602 or a ~= 603 or a ~= 604 or a ~= 605 or a ~= 606 or a ~= 607 or a ~= 608 or a ~= 609 or a ~= 610 or a ~= 611 or a ~= 612 or a ~= 613 or a ~= 614 or a ~= 615 or a ~= 616 or a ~= 617 or a ~= 618 or a ~= 619 or a ~= 620 or a ~= 621 or a ~= 622 or a ~= 623 or a ~= 624 or a ~= 625 or a ~= 626 or a ~= 627 or a ~= 628 or a ~= 629 or a ~= 630 or a ~= 631 or a ~= 632 or a ~= 633 or a ~= 634 or a ~= 635 or a ~= 636 or a ~= 637 or a ~= 638 or a ~= 639 or a ~= 640 or a ~= 641 or a ~= 642 or a ~= 643 or a ~= 644 or a ~= 645 or a ~= 646 or a ~= 647 or a ~= 648 or a ~= 649 or a ~= 650 or a ~= 651 or a ~= 652 or a ~= 653 or a ~= 654 or a ~= 655 or a ~= 656 or a ~= 657 or a ~= 658 or a ~= 659 or a ~= 660 or a ~= 661 or a ~= 662 or a ~= 663 or a ~= 664 or a ~= 665 or a ~= 666 or a ~= 667 or a ~= 668 or a ~= 669 or a ~= 670 or a ~= 671 or a ~= 672 or a ~= 673 or a ~= 674 or a ~= 675 or a ~= 676 or a ~= 677 or a ~= 678 or a ~= 679 or a ~= 680 or a ~= 681 or a ~= 682 or a ~= 683 or a ~= 684 or a ~= 685 or a ~= 686 or a ~= 687 or a ~= 688 or a ~= 689 or a ~= 690 or a ~= 691 or a ~= 692 or a ~= 693 or a ~= 694 or a ~= 695 or a ~= 696 or a ~= 697 or a ~= 698 or a ~= 699 or a ~= 700 or a ~= 701 or a ~= 702 or a ~= 703 or a ~= 704 or a ~= 705 or a ~= 706 or a ~= 707 or a ~= 708 or a ~= 709 or a ~= 710 or a ~= 711 or a ~= 712 or a ~= 713 or a ~= 714 or a ~= 715 or a ~= 716 or a ~= 717 or a ~= 718 or a ~= 719 or a ~= 720 or a ~= 721 or a ~= 722 or a ~= 723 or a ~= 724 or a ~= 725 or a ~= 726 or a ~= 727 or a ~= 728 or a ~= 729 or a ~= 730 or a ~= 731 or a ~= 732 or a ~= 733 or a ~= 734 or a ~= 735 or a ~= 736 or a ~= 737 or a ~= 738 or a ~= 739 or a ~= 740 or a ~= 741 or a ~= 742 or a ~= 743 or a ~= 744 or a ~= 745 or a ~= 746 or a ~= 747 or a ~= 748 or a ~= 749 or a ~= 750 or a ~= 751 or a ~= 752 or a ~= 753 or a ~= 754 or a ~= 755 or a ~= 756 or a ~= 757 or a ~= 758 or a ~= 759 or a ~= 760 or a ~= 761 or a ~= 762 or a ~= 763 or a ~= 764 or a ~= 765 or a ~= 766 or a ~= 767 or a ~= 768 or a ~= 769 or a ~= 770 or a ~= 771 or a ~= 772 or a ~= 773 or a ~= 774 or a ~= 775 or a ~= 776 or a ~= 777 or a ~= 778 or a ~= 779 or a ~= 780 or a ~= 781 or a ~= 782 or a ~= 783 or a ~= 784 or a ~= 785 or a ~= 786 or a ~= 787 or a ~= 788 or a ~= 789 or a ~= 790 or a ~= 791 or a ~= 792 or a ~= 793 or a ~= 794 or a ~= 795 or a ~= 796 or a ~= 797 or a ~= 798 or a ~= 799 or a ~= 800 or a ~= 801 or a ~= 802 or a ~= 803 or a ~= 804 or a ~= 805 or a ~= 806 or a ~= 807 or a ~= 808 or a ~= 809 or a ~= 810 or a ~= 811 or a ~= 812 or a ~= 813 or a ~= 814 or a ~= 815 or a ~= 816 or a ~= 817 or a ~= 818 or a ~= 819 or a ~= 820 or a ~= 821 or a ~= 822 or a ~= 823 or a ~= 824 or a ~= 825 or a ~= 826 or a ~= 827 or a ~= 828 or a ~= 829 or a ~= 830 or a ~= 831 or a ~= 832 or a ~= 833 or a ~= 834 or a ~= 835 or a ~= 836 or a ~= 837 or a ~= 838 or a ~= 839 or a ~= 840 or a ~= 841 or a ~= 842 or a ~= 843 or a ~= 844 or a ~= 845 or a ~= 846 or a ~= 847 or a ~= 848 or a ~= 849 or a ~= 850 or a ~= 851 or a ~= 852 or a ~= 853 or a ~= 854 or a ~= 855 or a ~= 856 or a ~= 857 or a ~= 858 or a ~= 859 or a ~= 860 or a ~= 861 or a ~= 862 or a ~= 863 or a ~= 864 or a ~= 865 or a ~= 866 or a ~= 867 or a ~= 868 or a ~= 869 or a ~= 870 or a ~= 871 or a ~= 872 or a ~= 873 or a ~= 874 or a ~= 875 or a ~= 876 or a ~= 877 or a ~= 878 or a ~= 879 or a ~= 880 or a ~= 881 or a ~= 882 or a ~= 883 or a ~= 884 or a ~= 885 or a ~= 886 or a ~= 887 or a ~= 888 or a ~= 889 or a ~= 890 or a ~= 891 or a ~= 892 or a ~= 893 or a ~= 894 or a ~= 895 or a ~= 896 or a ~= 897 or a ~= 898 or a ~= 899 or a ~= 900 or a ~= 901 or a ~= 902 or a ~= 903 or a ~= 904 or a ~= 905 or a ~= 906 or a ~= 907 or a ~= 908 or a ~= 909 or a ~= 910 or a ~= 911 or a ~= 912 or a ~= 913 or a ~= 914 or a ~= 915 or a ~= 916 or a ~= 917 or a ~= 918 or a ~= 919 or a ~= 920 or a ~= 921 or a ~= 922 or a ~= 923 or a ~= 924 or a ~= 925 or a ~= 926 or a ~= 927 or a ~= 928 or a ~= 929 or a ~= 930 or a ~= 931 or a ~= 932 or a ~= 933 or a ~= 934 or a ~= 935 or a ~= 936 or a ~= 937 or a ~= 938 or a ~= 939 or a ~= 940 or a ~= 941 or a ~= 942 or a ~= 943 or a ~= 944 or a ~= 945 or a ~= 946 or a ~= 947 or a ~= 948 or a ~= 949 or a ~= 950 or a ~= 951 or a ~= 952 or a ~= 953 or a ~= 954 or a ~= 955 or a ~= 956 or a ~= 957 or a ~= 958 or a ~= 959 or a ~= 960 or a ~= 961 or a ~= 962 or a ~= 963 or a ~= 964 or a ~= 965 or a ~= 966 or a ~= 967 or a ~= 968 or a ~= 969 or a ~= 970 or a ~= 971 or a ~= 972 or a ~= 973 or a ~= 974 or a ~= 975 or a ~= 976 or a ~= 977 or a ~= 978 or a ~= 979 or a ~= 980 or a ~= 981 or a ~= 982 or a ~= 983 or a ~= 984 or a ~= 985 or a ~= 986 or a ~= 987 or a ~= 988 or a ~= 989 or a ~= 990 or a ~= 991 or a ~= 992 or a ~= 993 or a ~= 994 or a ~= 995 or a ~= 996 or a ~= 997 or a ~= 998 or a ~= 999 then
+		return true
+	end
+
+	return false
+end
+
+function value_or1000(a)
+	local x = a ~= 0 or a ~= 1 or a ~= 2 or a ~= 3 or a ~= 4 or a ~= 5 or a ~= 6 or a ~= 7 or a ~= 8 or a ~= 9 or a ~= 10 or a ~= 11 or a ~= 12 or a ~= 13 or a ~= 14 or a ~= 15 or a ~= 16 or a ~= 17 or a ~= 18 or a ~= 19 or a ~= 20 or a ~= 21 or a ~= 22 or a ~= 23 or a ~= 24 or a ~= 25 or a ~= 26 or a ~= 27 or a ~= 28 or a ~= 29 or a ~= 30 or a ~= 31 or a ~= 32 or a ~= 33 or a ~= 34 or a ~= 35 or a ~= 36 or a ~= 37 or a ~= 38 or a ~= 39 or a ~= 40 or a ~= 41 or a ~= 42 or a ~= 43 or a ~= 44 or a ~= 45 or a ~= 46 or a ~= 47 or a ~= 48 or a ~= 49 or a ~= 50 or a ~= 51 or a ~= 52 or a ~= 53 or a ~= 54 or a ~= 55 or a ~= 56 or a ~= 57 or a ~= 58 or a ~= 59 or a ~= 60 or a ~= 61 or a ~= 62 or a ~= 63 or a ~= 64 or a ~= 65 or a ~= 66 or a ~= 67 or a ~= 68 or a ~= 69 or a ~= 70 or a ~= 71 or a ~= 72 or a ~= 73 or a ~= 74 or a ~= 75 or a ~= 76 or a ~= 77 or a ~= 78 or a ~= 79 or a ~= 80 or a ~= 81 or a ~= 82 or a ~= 83 or a ~= 84 or a ~= 85 or a ~= 86 or a ~= 87 or a ~= 88 or a ~= 89 or a ~= 90 or a ~= 91 or a ~= 92 or a ~= 93 or a ~= 94 or a ~= 95 or a ~= 96 or a ~= 97 or a ~= 98 or a ~= 99 or a ~= 100 or a ~= 101 or a ~= 102 or a ~= 103 or a ~= 104 or a ~= 105 or a ~= 106 or a ~= 107 or a ~= 108 or a ~= 109 or a ~= 110 or a ~= 111 or a ~= 112 or a ~= 113 or a ~= 114 or a ~= 115 or a ~= 116 or a ~= 117 or a ~= 118 or a ~= 119 or a ~= 120 or a ~= 121 or a ~= 122 or a ~= 123 or a ~= 124 or a ~= 125 or a ~= 126 or a ~= 127 or a ~= 128 or a ~= 129 or a ~= 130 or a ~= 131 or a ~= 132 or a ~= 133 or a ~= 134 or a ~= 135 or a ~= 136 or a ~= 137 or a ~= 138 or a ~= 139 or a ~= 140 or a ~= 141 or a ~= 142 or a ~= 143 or a ~= 144 or a ~= 145 or a ~= 146 or a ~= 147 or a ~= 148 or a ~= 149 or a ~= 150 or a ~= 151 or a ~= 152 or a ~= 153 or a ~= 154 or a ~= 155 or a ~= 156 or a ~= 157 or a ~= 158 or a ~= 159 or a ~= 160 or a ~= 161 or a ~= 162 or a ~= 163 or a ~= 164 or a ~= 165 or a ~= 166 or a ~= 167 or a ~= 168 or a ~= 169 or a ~= 170 or a ~= 171 or a ~= 172 or a ~= 173 or a ~= 174 or a ~= 175 or a ~= 176 or a ~= 177 or a ~= 178 or a ~= 179 or a ~= 180 or a ~= 181 or a ~= 182 or a ~= 183 or a ~= 184 or a ~= 185 or a ~= 186 or a ~= 187 or a ~= 188 or a ~= 189 or a ~= 190 or a ~= 191 or a ~= 192 or a ~= 193 or a ~= 194 or a ~= 195 or a ~= 196 or a ~= 197 or a ~= 198 or a ~= 199 or a ~= 200 or a ~= 201 or a ~= 202 or a ~= 203 or a ~= 204 or a ~= 205 or a ~= 206 or a ~= 207 or a ~= 208 or a ~= 209 or a ~= 210 or a ~= 211 or a ~= 212 or a ~= 213 or a ~= 214 or a ~= 215 or a ~= 216 or a ~= 217 or a ~= 218 or a ~= 219 or a ~= 220 or a ~= 221 or a ~= 222 or a ~= 223 or a ~= 224 or a ~= 225 or a ~= 226 or a ~= 227 or a ~= 228 or a ~= 229 or a ~= 230 or a ~= 231 or a ~= 232 or a ~= 233 or a ~= 234 or a ~= 235 or a ~= 236 or a ~= 237 or a ~= 238 or a ~= 239 or a ~= 240 or a ~= 241 or a ~= 242 or a ~= 243 or a ~= 244 or a ~= 245 or a ~= 246 or a ~= 247 or a ~= 248 or a ~= 249 or a ~= 250 or a ~= 251 or a ~= 252 or a ~= 253 or a ~= 254 or a ~= 255 or a ~= 256 or a ~= 257 or a ~= 258 or a ~= 259 or a ~= 260 or a ~= 261 or a ~= 262 or a ~= 263 or a ~= 264 or a ~= 265 or a ~= 266 or a ~= 267 or a ~= 268 or a ~= 269 or a ~= 270 or a ~= 271 or a ~= 272 or a ~= 273 or a ~= 274 or a ~= 275 or a ~= 276 or a ~= 277 or a ~= 278 or a ~= 279 or a ~= 280 or a ~= 281 or a ~= 282 or a ~= 283 or a ~= 284 or a ~= 285 or a ~= 286 or a ~= 287 or a ~= 288 or a ~= 289 or a ~= 290 or a ~= 291 or a ~= 292 or a ~= 293 or a ~= 294 or a ~= 295 or a ~= 296 or a ~= 297 or a ~= 298 or a ~= 299 or a ~= 300 or a ~= 301 or a ~= 302 or a ~= 303 or a ~= 304 or a ~= 305 or a ~= 306 or a ~= 307 or a ~= 308 or a ~= 309 or a ~= 310 or a ~= 311 or a ~= 312 or a ~= 313 or a ~= 314 or a ~= 315 or a ~= 316 or a ~= 317 or a ~= 318 or a ~= 319 or a ~= 320 or a ~= 321 or a ~= 322 or a ~= 323 or a ~= 324 or a ~= 325 or a ~= 326 or a ~= 327 or a ~= 328 or a ~= 329 or a ~= 330 or a ~= 331 or a ~= 332 or a ~= 333 or a ~= 334 or a ~= 335 or a ~= 336 or a ~= 337 or a ~= 338 or a ~= 339 or a ~= 340 or a ~= 341 or a ~= 342 or a ~= 343 or a ~= 344 or a ~= 345 or a ~= 346 or a ~= 347 or a ~= 348 or a ~= 349 or a ~= 350 or a ~= 351 or a ~= 352 or a ~= 353 or a ~= 354 or a ~= 355 or a ~= 356 or a ~= 357 or a ~= 358 or a ~= 359 or a ~= 360 or a ~= 361 or a ~= 362 or a ~= 363 or a ~= 364 or a ~= 365 or a ~= 366 or a ~= 367 or a ~= 368 or a ~= 369 or a ~= 370 or a ~= 371 or a ~= 372 or a ~= 373 or a ~= 374 or a ~= 375 or a ~= 376 or a ~= 377 or a ~= 378 or a ~= 379 or a ~= 380 or a ~= 381 or a ~= 382 or a ~= 383 or a ~= 384 or a ~= 385 or a ~= 386 or a ~= 387 or a ~= 388 or a ~= 389 or a ~= 390 or a ~= 391 or a ~= 392 or a ~= 393 or a ~= 394 or a ~= 395 or a ~= 396 or a ~= 397 or a ~= 398 or a ~= 399 or a ~= 400 or a ~= 401 or a ~= 402 or a ~= 403 or a ~= 404 or a ~= 405 or a ~= 406 or a ~= 407 or a ~= 408 or a ~= 409 or a ~= 410 or a ~= 411 or a ~= 412 or a ~= 413 or a ~= 414 or a ~= 415 or a ~= 416 or a ~= 417 or a ~= 418 or a ~= 419 or a ~= 420 or a ~= 421 or a ~= 422 or a ~= 423 or a ~= 424 or a ~= 425 or a ~= 426 or a ~= 427 or a ~= 428 or a ~= 429 or a ~= 430 or a ~= 431 or a ~= 432 or a ~= 433 or a ~= 434 or a ~= 435 or a ~= 436 or a ~= 437 or a ~= 438 or a ~= 439 or a ~= 440 or a ~= 441 or a ~= 442 or a ~= 443 or a ~= 444 or a ~= 445 or a ~= 446 or a ~= 447 or a ~= 448 or a ~= 449 or a ~= 450 or a ~= 451 or a ~= 452 or a ~= 453 or a ~= 454 or a ~= 455 or a ~= 456 or a ~= 457 or a ~= 458 or a ~= 459 or a ~= 460 or a ~= 461 or a ~= 462 or a ~= 463 or a ~= 464 or a ~= 465 or a ~= 466 or a ~= 467 or a ~= 468 or a ~= 469 or a ~= 470 or a ~= 471 or a ~= 472 or a ~= 473 or a ~= 474 or a ~= 475 or a ~= 476 or a ~= 477 or a ~= 478 or a ~= 479 or a ~= 480 or a ~= 481 or a ~= 482 or a ~= 483 or a ~= 484 or a ~= 485 or a ~= 486 or a ~= 487 or a ~= 488 or a ~= 489 or a ~= 490 or a ~= 491 or a ~= 492 or a ~= 493 or a ~= 494 or a ~= 495 or a ~= 496 or a ~= 497 or a ~= 498 or a ~= 499 or a ~= 500 or a ~= 501 or a ~= 502 or a ~= 503 or a ~= 504 or a ~= 505 or a ~= 506 or a ~= 507 or a ~= 508 or a ~= 509 or a ~= 510 or a ~= 511 or a ~= 512 or a ~= 513 or a ~= 514 or a ~= 515 or a ~= 516 or a ~= 517 or a ~= 518 or a ~= 519 or a ~= 520 or a ~= 521 or a ~= 522 or a ~= 523 or a ~= 524 or a ~= 525 or a ~= 526 or a ~= 527 or a ~= 528 or a ~= 529 or a ~= 530 or a ~= 531 or a ~= 532 or a ~= 533 or a ~= 534 or a ~= 535 or a ~= 536 or a ~= 537 or a ~= 538 or a ~= 539 or a ~= 540 or a ~= 541 or a ~= 542 or a ~= 543 or a ~= 544 or a ~= 545 or a ~= 546 or a ~= 547 or a ~= 548 or a ~= 549 or a ~= 550 or a ~= 551 or a ~= 552 or a ~= 553 or a ~= 554 or a ~= 555 or a ~= 556 or a ~= 557 or a ~= 558 or a ~= 559 or a ~= 560 or a ~= 561 or a ~= 562 or a ~= 563 or a ~= 564 or a ~= 565 or a ~= 566 or a ~= 567 or a ~= 568 or a ~= 569 or a ~= 570 or a ~= 571 or a ~= 572 or a ~= 573 or a ~= 574 or a ~= 575 or a ~= 576 or a ~= 577 or a ~= 578 or a ~= 579 or a ~= 580 or a ~= 581 or a ~= 582 or a ~= 583 or a ~= 584 or a ~= 585 or a ~= 586 or a ~= 587 or a ~= 588 or a ~= 589 or a ~= 590 or a ~= 591 or a ~= 592 or a ~= 593 or a ~= 594 or a ~= 595 or a ~= 596 or a ~= 597 or a ~= 598 or a ~= 599 or a ~= 600 or a ~= 601 or a ~= 602 or a ~= 603 or a ~= 604 or a ~= 605 or a ~= 606 or a ~= 607 or a ~= 608 or a ~= 609 or a ~= 610 or a ~= 611 or a ~= 612 or a ~= 613 or a ~= 614 or a ~= 615 or a ~= 616 or a ~= 617 or a ~= 618 or a ~= 619 or a ~= 620 or a ~= 621 or a ~= 622 or a ~= 623 or a ~= 624 or a ~= 625 or a ~= 626 or a ~= 627 or a ~= 628 or a ~= 629 or a ~= 630 or a ~= 631 or a ~= 632 or a ~= 633 or a ~= 634 or a ~= 635 or a ~= 636 or a ~= 637 or a ~= 638 or a ~= 639 or a ~= 640 or a ~= 641 or a ~= 642 or a ~= 643 or a ~= 644 or a ~= 645 or a ~= 646 or a ~= 647 or a ~= 648 or a ~= 649 or a ~= 650 or a ~= 651 or a ~= 652 or a ~= 653 or a ~= 654 or a ~= 655 or a ~= 656 or a ~= 657 or a ~= 658 or a ~= 659 or a ~= 660 or a ~= 661 or a ~= 662 or a ~= 663 or a ~= 664 or a ~= 665 or a ~= 666 or a ~= 667 or a ~= 668 or a ~= 669 or a ~= 670 or a ~= 671 or a ~= 672 or a ~= 673 or a ~= 674 or a ~= 675 or a ~= 676 or a ~= 677 or a ~= 678 or a ~= 679 or a ~= 680 or a ~= 681 or a ~= 682 or a ~= 683 or a ~= 684 or a ~= 685 or a ~= 686 or a ~= 687 or a ~= 688 or a ~= 689 or a ~= 690 or a ~= 691 or a ~= 692 or a ~= 693 or a ~= 694 or a ~= 695 or a ~= 696 or a ~= 697 or a ~= 698 or a ~= 699 or a ~= 700 or a ~= 701 or a ~= 702 or a ~= 703 or a ~= 704 or a ~= 705 or a ~= 706 or a ~= 707 or a ~= 708 or a ~= 709 or a ~= 710 or a ~= 711 or a ~= 712 or a ~= 713 or a ~= 714 or a ~= 715 or a ~= 716 or a ~= 717 or a ~= 718 or a ~= 719 or a ~= 720 or a ~= 721 or a ~= 722 or a ~= 723 or a ~= 724 or a ~= 725 or a ~= 726 or a ~= 727 or a ~= 728 or a ~= 729 or a ~= 730 or a ~= 731 or a ~= 732 or a ~= 733 or a ~= 734 or a ~= 735 or a ~= 736 or a ~= 737 or a ~= 738 or a ~= 739 or a ~= 740 or a ~= 741 or a ~= 742 or a ~= 743 or a ~= 744 or a ~= 745 or a ~= 746 or a ~= 747 or a ~= 748 or a ~= 749 or a ~= 750 or a ~= 751 or a ~= 752 or a ~= 753 or a ~= 754 or a ~= 755 or a ~= 756 or a ~= 757 or a ~= 758 or a ~= 759 or a ~= 760 or a ~= 761 or a ~= 762 or a ~= 763 or a ~= 764 or a ~= 765 or a ~= 766 or a ~= 767 or a ~= 768 or a ~= 769 or a ~= 770 or a ~= 771 or a ~= 772 or a ~= 773 or a ~= 774 or a ~= 775 or a ~= 776 or a ~= 777 or a ~= 778 or a ~= 779 or a ~= 780 or a ~= 781 or a ~= 782 or a ~= 783 or a ~= 784 or a ~= 785 or a ~= 786 or a ~= 787 or a ~= 788 or a ~= 789 or a ~= 790 or a ~= 791 or a ~= 792 or a ~= 793 or a ~= 794 or a ~= 795 or a ~= 796 or a ~= 797 or a ~= 798 or a ~= 799 or a ~= 800 or a ~= 801 or a ~= 802 or a ~= 803 or a ~= 804 or a ~= 805 or a ~= 806 or a ~= 807 or a ~= 808 or a ~= 809 or a ~= 810 or a ~= 811 or a ~= 812 or a ~= 813 or a ~= 814 or a ~= 815 or a ~= 816 or a ~= 817 or a ~= 818 or a ~= 819 or a ~= 820 or a ~= 821 or a ~= 822 or a ~= 823 or a ~= 824 or a ~= 825 or a ~= 826 or a ~= 827 or a ~= 828 or a ~= 829 or a ~= 830 or a ~= 831 or a ~= 832 or a ~= 833 or a ~= 834 or a ~= 835 or a ~= 836 or a ~= 837 or a ~= 838 or a ~= 839 or a ~= 840 or a ~= 841 or a ~= 842 or a ~= 843 or a ~= 844 or a ~= 845 or a ~= 846 or a ~= 847 or a ~= 848 or a ~= 849 or a ~= 850 or a ~= 851 or a ~= 852 or a ~= 853 or a ~= 854 or a ~= 855 or a ~= 856 or a ~= 857 or a ~= 858 or a ~= 859 or a ~= 860 or a ~= 861 or a ~= 862 or a ~= 863 or a ~= 864 or a ~= 865 or a ~= 866 or a ~= 867 or a ~= 868 or a ~= 869 or a ~= 870 or a ~= 871 or a ~= 872 or a ~= 873 or a ~= 874 or a ~= 875 or a ~= 876 or a ~= 877 or a ~= 878 or a ~= 879 or a ~= 880 or a ~= 881 or a ~= 882 or a ~= 883 or a ~= 884 or a ~= 885 or a ~= 886 or a ~= 887 or a ~= 888 or a ~= 889 or a ~= 890 or a ~= 891 or a ~= 892 or a ~= 893 or a ~= 894 or a ~= 895 or a ~= 896 or a ~= 897 or a ~= 898 or a ~= 899 or a ~= 900 or a ~= 901 or a ~= 902 or a ~= 903 or a ~= 904 or a ~= 905 or a ~= 906 or a ~= 907 or a ~= 908 or a ~= 909 or a ~= 910 or a ~= 911 or a ~= 912 or a ~= 913 or a ~= 914 or a ~= 915 or a ~= 916 or a ~= 917 or a ~= 918 or a ~= 919 or a ~= 920 or a ~= 921 or a ~= 922 or a ~= 923 or a ~= 924 or a ~= 925 or a ~= 926 or a ~= 927 or a ~= 928 or a ~= 929 or a ~= 930 or a ~= 931 or a ~= 932 or a ~= 933 or a ~= 934 or a ~= 935 or a ~= 936 or a ~= 937 or a ~= 938 or a ~= 939 or a ~= 940 or a ~= 941 or a ~= 942 or a ~= 943 or a ~= 944 or a ~= 945 or a ~= 946 or a ~= 947 or a ~= 948 or a ~= 949 or a ~= 950 or a ~= 951 or a ~= 952 or a ~= 953 or a ~= 954 or a ~= 955 or a ~= 956 or a ~= 957 or a ~= 958 or a ~= 959 or a ~= 960 or a ~= 961 or a ~= 962 or a ~= 963 or a ~= 964 or a ~= 965 or a ~= 966 or a ~= 967 or a ~= 968 or a ~= 969 or a ~= 970 or a ~= 971 or a ~= 972 or a ~= 973 or a ~= 974 or a ~= 975 or a ~= 976 or a ~= 977 or a ~= 978 or a ~= 979 or a ~= 980 or a ~= 981 or a ~= 982 or a ~= 983 or a ~= 984 or a ~= 985 or a ~= 986 or a ~= 987 or a ~= 988 or a ~= 989 or a ~= 990 or a ~= 991 or a ~= 992 or a ~= 993 or a ~= 994 or a ~= 995 or a ~= 996 or a ~= 997 or a ~= 998 or a ~= 999
+
+	return x
+end
+
+function if_mixed1000(a, b, c)
+	if b and b or a < 2 or not b or not b and f(c) == 5 and c ~= 6 or not b or not b or not b and f(c) == 10 or not b or f(c) == 12 or f(c) == 13 and a < 14 or f(c) == 15 and not (a <= 16) and f(c) == 17 and c ~= 18 and c ~= 19 and a < 20 or a < 21 or c ~= 22 and not b or b or f(c) == 25 and not b or not (a <= 27) or a < 28 or b or c ~= 30 or not (a <= 31) or b or a < 33 and not b or f(c) == 35 and not b or a < 37 or not b and not b or c ~= 40 or c ~= 41 or f(c) == 42 and b and not b and c ~= 45 or b or a < 47 and a < 48 or b or b or not (a <= 51) and c ~= 52 and a < 53 and not b and c ~= 55 and not b and a < 57 and not (a <= 58) or not b or a < 60 and f(c) == 61 and not b and f(c) == 63 or not (a <= 64) and a < 65 or c ~= 66 and not b or not (a <= 68) and not (a <= 69) and not b and not (a <= 71) or not b or not b or not (a <= 74) or f(c) == 75 and f(c) == 76 and b and f(c) == 78 or a < 79 or c ~= 80 and a < 81 or a < 82 or not b or not b or not b and not b and a < 87 or b and f(c) == 89 and f(c) == 90 or b and not (a <= 92) and c ~= 93 and c ~= 94 or b or b or not (a <= 97) and not b and c ~= 99 or c ~= 100 and c ~= 101 and b or not b or not b or c ~= 105 and c ~= 106 and not b and f(c) == 108 or b and f(c) == 110 and not b or b and c ~= 113 and a < 114 or f(c) == 115 and b or b or b and f(c) == 119 or c ~= 120 or c ~= 121 and not b and f(c) == 123 and a < 124 or not b and a < 126 and b and b or f(c) == 129 or not b and f(c) == 131 or f(c) == 132 or f(c) == 133 or not b and f(c) == 135 and not b and b or b and c ~= 139 or not b and c ~= 141 and not (a <= 142) and b and b and c ~= 145 and b or not b and f(c) == 148 or a < 149 and b or b and c ~= 152 or a < 153 and f(c) == 154 or b and not b and a < 157 or c ~= 158 and not (a <= 159) or c ~= 160 and a < 161 or not (a <= 162) or b or not (a <= 164) and b and a < 166 and c ~= 167 and a < 168 or b or not b and f(c) == 171 or not b or not (a <= 173) and c ~= 174 and not b and c ~= 176 and c ~= 177 and b and not (a <= 179) and not (a <= 180) or c ~= 181 or not (a <= 182) and not (a <= 183) or a < 184 or f(c) == 185 or not b or c ~= 187 and not (a <= 188) or not (a <= 189) and not (a <= 190) or b or f(c) == 192 and not (a <= 193) and f(c) == 194 or not b or not b or not b or not (a <= 198) or not b or not (a <= 200) and not (a <= 201) and c ~= 202 and a < 203 or a < 204 and not b and f(c) == 206 or not (a <= 207) or a < 208 and b or not (a <= 210) and not b and a < 212 or not b and b and b and b or b and c ~= 218 or a < 219 and b and b or b or b and b and f(c) == 225 and a < 226 and not (a <= 227) and f(c) == 228 and f(c) == 229 or not b and f(c) == 231 or b and f(c) == 233 or f(c) == 234 or c ~= 235 and not b and f(c) == 237 and not b and b or f(c) == 240 or not b and not (a <= 242) or f(c) == 243 and f(c) == 244 or a < 245 or f(c) == 246 or b and f(c) == 248 or b or a < 250 or a < 251 and a < 252 and not (a <= 253) and a < 254 and c ~= 255 or not b and b and a < 258 or f(c) == 259 and not b or b or not (a <= 262) and a < 263 or a < 264 or f(c) == 265 or b or a < 267 or not (a <= 268) or f(c) == 269 and b and c ~= 271 or not b or not b and not b and b or c ~= 276 and a < 277 or a < 278 or not (a <= 279) or a < 280 and b or f(c) == 282 or c ~= 283 or not b or a < 285 and not b and f(c) == 287 or not (a <= 288) or b and a < 290 and c ~= 291 and not b and not (a <= 293) or not b and a < 295 and not (a <= 296) or a < 297 or b and c ~= 299 or a < 300 or c ~= 301 and f(c) == 302 and c ~= 303 and not b and c ~= 305 or c ~= 306 or not (a <= 307) or not (a <= 308) or a < 309 and f(c) == 310 or not (a <= 311) or c ~= 312 or c ~= 313 and f(c) == 314 or b or a < 316 or b or a < 318 or c ~= 319 and not b and c ~= 321 and f(c) == 322 and f(c) == 323 or c ~= 324 and c ~= 325 or c ~= 326 and not b and not b or not b or not b and b or b or not (a <= 333) or a < 334 or not (a <= 335) or c ~= 336 or c ~= 337 or not b or not (a <= 339) and f(c) == 340 or c ~= 341 or a < 342 or b and c ~= 344 or b and f(c) == 346 and not b or a < 348 and f(c) == 349 and b or f(c) == 351 or b or f(c) == 353 and not (a <= 354) and f(c) == 355 and not b and not (a <= 357) and a < 358 or b or b and c ~= 361 or not b and not b or a < 364 or c ~= 365 and f(c) == 366 and b and not (a <= 368) and f(c) == 369 or a < 370 and not (a <= 371) and f(c) == 372 or a < 373 or not (a <= 374) or not b and not (a <= 376) and not (a <= 377) and not b or c ~= 379 or c ~= 380 and c ~= 381 or b and not (a <= 383) or not b and not b and a < 386 and c ~= 387 or a < 388 or not (a <= 389) and b and c ~= 391 and c ~= 392 or not b or a < 394 and not (a <= 395) or b and not (a <= 397) or c ~= 398 and not b or f(c) == 400 and not (a <= 401) or not b and c ~= 403 or f(c) == 404 and f(c) == 405 and a < 406 and not (a <= 407) or b and c ~= 409 and f(c) == 410 or b or a < 412 and b and not b and not (a <= 415) and a < 416 or a < 417 or a < 418 or f(c) == 419 or a < 420 and f(c) == 421 or f(c) == 422 and not (a <= 423) or c ~= 424 or not b and c ~= 426 or not (a <= 427) and f(c) == 428 or c ~= 429 and c ~= 430 and a < 431 and c ~= 432 and f(c) == 433 and c ~= 434 and f(c) == 435 or not (a <= 436) or a < 437 or f(c) == 438 or b and c ~= 440 or f(c) == 441 and f(c) == 442 or c ~= 443 or b or c ~= 445 and not (a <= 446) and f(c) == 447 and b or b and b and f(c) == 451 or b or not (a <= 453) or c ~= 454 and f(c) == 455 and not b or not b or a < 458 and not b and a < 460 or not b and not b or c ~= 463 or a < 464 and f(c) == 465 or not (a <= 466) and c ~= 467 or c ~= 468 or not (a <= 469) or f(c) == 470 or b or f(c) == 472 and a < 473 and f(c) == 474 or a < 475 or f(c) == 476 or c ~= 477 or f(c) == 478 or not (a <= 479) and a < 480 or b and not b or a < 483 and not b or b and b and not (a <= 487) and c ~= 488 and b or a < 490 and f(c) == 491 or not b and f(c) == 493 and not b and b and c ~= 496 and f(c) == 497 and not b or c ~= 499 and a < 500 or b or f(c) == 502 and f(c) == 503 or not b and not (a <= 505) and c ~= 506 and not (a <= 507) or a < 508 and f(c) == 509 and c ~= 510 or c ~= 511 or not b or not (a <= 513) and f(c) == 514 and b and c ~= 516 and f(c) == 517 or not (a <= 518) or c ~= 519 or not (a <= 520) and not (a <= 521) and not b or f(c) == 523 and b or b or not b or b or b and not (a <= 529) or not b and b and b or f(c) == 533 or f(c) == 534 or not (a <= 535) or b or b and c ~= 538 or a < 539 or a < 540 or not b and a < 542 or f(c) == 543 or not (a <= 544) and c ~= 545 and a < 546 and f(c) == 547 or not b or a < 549 or not (a <= 550) or b and a < 552 or a < 553 and not (a <= 554) or b and a < 556 or c ~= 557 or c ~= 558 and not (a <= 559) or f(c) == 560 and b or c ~= 562 and c ~= 563 and a < 564 or not (a <= 565) and not (a <= 566) and not b and not (a <= 568) and f(c) == 569 or f(c) == 570 or not b and a < 572 and not b and a < 574 and not b or c ~= 576 or f(c) == 577 and b or not (a <= 579) and not b or c ~= 581 or b and b or not (a <= 584) and a < 585 or f(c) == 586 or not (a <= 587) or f(c) == 588 or b or f(c) == 590 or not b and f(c) == 592 and b and c ~= 594 or c ~= 595 and not (a <= 596) or b and f(c) == 598 and not (a <= 599) or not b and b or not b and not b and c ~= 604 and b and f(c) == 606 and b or not (a <= 608) or not (a <= 609) and b or b and a < 612 or not (a <= 613) and not (a <= 614) and not (a <= 615) and c ~= 616 or not b or f(c) == 618 and a < 619 or c ~= 620 and not b and not (a <= 622) or c ~= 623 and not b or a < 625 or a < 626 or not (a <= 627) and not b and a < 629 or not (a <= 630) and c ~= 631 and a < 632 and f(c) == 633 or not (a <= 634) and f(c) == 635 or c ~= 636 and a < 637 or c ~= 638 and a < 639 or a < 640 and f(c) == 641 or f(c) == 642 and not b or c ~= 644 or c ~= 645 or a < 646 and b or not b and not b or b and not (a <= 651) or not b or a < 653 and c ~= 654 and a < 655 and b and not (a <= 657) or b and not (a <= 659) or a < 660 or b or a < 662 or not (a <= 663) or b and b and c ~= 666 or a < 667 and c ~= 668 or not (a <= 669) or not b or not b and b and a < 673 and b or not b or not (a <= 676) and a < 677 or f(c) == 678 and a < 679 or not b and f(c) == 681 or not b or a < 683 or a < 684 and f(c) == 685 or not (a <= 686) or f(c) == 687 and not b or a < 689 and c ~= 690 or f(c) == 691 and c ~= 692 or c ~= 693 and not b and b or not (a <= 696) or not b or not b or not b and not b or c ~= 701 or b and not (a <= 703) or f(c) == 704 and f(c) == 705 or a < 706 or a < 707 or not (a <= 708) and f(c) == 709 and a < 710 or c ~= 711 and b or a < 713 or a < 714 and f(c) == 715 and b or not b or b and not b and not (a <= 720) and not b or not b or b or not (a <= 724) and b or b or f(c) == 727 and not b and not (a <= 729) and not (a <= 730) and a < 731 and b and b or c ~= 734 and a < 735 and c ~= 736 or not b and not b or a < 739 or b or c ~= 741 and f(c) == 742 and b or not (a <= 744) or f(c) == 745 and f(c) == 746 and f(c) == 747 or not (a <= 748) and c ~= 749 or c ~= 750 and f(c) == 751 or a < 752 or a < 753 or not b and not (a <= 755) and c ~= 756 or b and not b or a < 759 and c ~= 760 and b and a < 762 or c ~= 763 and a < 764 and c ~= 765 or c ~= 766 or not b and not b and c ~= 769 or not (a <= 770) or b and not b and b and b and f(c) == 775 or f(c) == 776 and a < 777 or not (a <= 778) and not b and not b and not (a <= 781) or b and not (a <= 783) and b and c ~= 785 or not b or a < 787 or not (a <= 788) or a < 789 or not b or not (a <= 791) and a < 792 and a < 793 and c ~= 794 and b and not (a <= 796) or b and f(c) == 798 and not b or not b or a < 801 and not b and c ~= 803 or c ~= 804 and not (a <= 805) and f(c) == 806 and b or b or f(c) == 809 or not (a <= 810) and not b and a < 812 or a < 813 or not b and c ~= 815 and c ~= 816 and b and b or not (a <= 819) or c ~= 820 or f(c) == 821 and f(c) == 822 and not (a <= 823) or c ~= 824 or f(c) == 825 and a < 826 and c ~= 827 or not b and not b or not (a <= 830) or not b or c ~= 832 and f(c) == 833 or a < 834 or not (a <= 835) and f(c) == 836 or not (a <= 837) and not b and not b or not (a <= 840) and not (a <= 841) and not (a <= 842) and f(c) == 843 or not (a <= 844) or not b and c ~= 846 and f(c) == 847 or not (a <= 848) and f(c) == 849 or not b and a < 851 or b and b and a < 854 or b or a < 856 or f(c) == 857 and b and a < 859 and a < 860 or not (a <= 861) and c ~= 862 or c ~= 863 or a < 864 and b or b and a < 867 or b or not (a <= 869) or f(c) == 870 or not b or not b or not (a <= 873) or f(c) == 874 and not (a <= 875) or f(c) == 876 and c ~= 877 and a < 878 and not b and b and not (a <= 881) and f(c) == 882 and not b and b and not b and f(c) == 886 or f(c) == 887 and c ~= 888 or f(c) == 889 and not (a <= 890) and a < 891 or f(c) == 892 and f(c) == 893 or b and a < 895 or b or a < 897 or b and not (a <= 899) and not (a <= 900) or not b and b and not (a <= 903) or b or not b or not (a <= 906) or not b and c ~= 908 or a < 909 and b or a < 911 and a < 912 and f(c) == 913 and b and b and not b and not (a <= 917) and f(c) == 918 or b or c ~= 920 and not (a <= 921) and not (a <= 922) or b or not (a <= 924) or f(c) == 925 and a < 926 or b or b or c ~= 929 and b or b and not b and c ~= 933 and a < 934 and not b or b and a < 937 and b or not (a <= 939) or not b or f(c) == 941 or not b and not b and not b or not b and not b or c ~= 947 and f(c) == 948 and c ~= 949 and f(c) == 950 and not b and c ~= 952 or b and not b or c ~= 955 and a < 956 and f(c) == 957 and not b or f(c) == 959 and b and not b or b and f(c) == 963 or b or not (a <= 965) or not b and f(c) == 967 or c ~= 968 or b and f(c) == 970 and not b and a < 972 and f(c) == 973 or b and b or not b and f(c) == 977 or not (a <= 978) and b and b and c ~= 981 or c ~= 982 or not b and b and a < 985 and c ~= 986 or not (a <= 987) and a < 988 and f(c) == 989 and not (a <= 990) and c ~= 991 or b and f(c) == 993 and f(c) == 994 or b and a < 996 or a < 997 and a < 998 and b then
+		return true
+	end
+
+	return false
+end
+
+function value_mixed1000(a, b, c)
+	local x = c ~= 0 and not b or b and not (a <= 3) and c ~= 4 or not b and c ~= 6 and b or c ~= 8 or not (a <= 9) or f(c) == 10 and not b or a < 12 and c ~= 13 or f(c) == 14 or not b and b and not b and b or not (a <= 19) or a < 20 and a < 21 or a < 22 or not (a <= 23) or f(c) == 24 and a < 25 or b or not b and b and b or c ~= 30 and b or c ~= 32 and not (a <= 33) or not b or not (a <= 35) and not b and not (a <= 37) and b or a < 39 or b or f(c) == 41 or c ~= 42 and f(c) == 43 and f(c) == 44 or a < 45 or a < 46 and not b or f(c) == 48 or b and c ~= 50 and not b and not (a <= 52) or not b and b and b or b and not b and c ~= 58 and f(c) == 59 or b and not (a <= 61) or not (a <= 62) and a < 63 and c ~= 64 and a < 65 or b or not b and b and f(c) == 69 or c ~= 70 and f(c) == 71 or b and c ~= 73 or c ~= 74 and c ~= 75 and c ~= 76 and a < 77 and a < 78 or c ~= 79 and not b or a < 81 or not (a <= 82) or not b or b or b and a < 86 and a < 87 or c ~= 88 or c ~= 89 and c ~= 90 and f(c) == 91 and c ~= 92 or a < 93 and f(c) == 94 or c ~= 95 or a < 96 or c ~= 97 or not b or not (a <= 99) or a < 100 and not (a <= 101) and b and not b and f(c) == 104 and a < 105 or f(c) == 106 and not b and c ~= 108 and f(c) == 109 and a < 110 or not b or not b or c ~= 113 and a < 114 or not b and f(c) == 116 or not (a <= 117) and not b and not b and a < 120 and c ~= 121 or not b or f(c) == 123 or a < 124 and a < 125 and c ~= 126 or f(c) == 127 or not (a <= 128) and f(c) == 129 or f(c) == 130 or b and not (a <= 132) and b and not b or not b and b or c ~= 137 or a < 138 and f(c) == 139 and a < 140 and b and c ~= 142 or c ~= 143 or not b and b or f(c) == 146 and not (a <= 147) and not b or c ~= 149 and b and c ~= 151 or not (a <= 152) or a < 153 or a < 154 and f(c) == 155 or b or not b or c ~= 158 and b and a < 160 and c ~= 161 or b and b and f(c) == 164 or b and not b and f(c) == 167 or b and not b and c ~= 170 and f(c) == 171 or not (a <= 172) and b or not b and f(c) == 175 and not b or not (a <= 177) and c ~= 178 and c ~= 179 and not b and not (a <= 181) and not b or not b or f(c) == 184 and c ~= 185 and f(c) == 186 or b and b or not b or a < 190 or not b or a < 192 or not b or f(c) == 194 and b and b or not b and f(c) == 198 and b or c ~= 200 or not b and not b or a < 203 or f(c) == 204 and not (a <= 205) and a < 206 or c ~= 207 and not b or not (a <= 209) and not (a <= 210) and f(c) == 211 and not (a <= 212) and c ~= 213 and not (a <= 214) or f(c) == 215 or not (a <= 216) and b and not (a <= 218) or not b and b or not b or a < 222 and b or f(c) == 224 or f(c) == 225 and b and not b or a < 228 or not (a <= 229) and c ~= 230 or not b or c ~= 232 or a < 233 and b or f(c) == 235 or not (a <= 236) or a < 237 or not b or b and a < 240 and c ~= 241 or f(c) == 242 and f(c) == 243 or not b and c ~= 245 and b or a < 247 and f(c) == 248 and b and a < 250 and not (a <= 251) and b and b or f(c) == 254 or f(c) == 255 or not (a <= 256) and not b or not (a <= 258) and a < 259 and not (a <= 260) and f(c) == 261 or c ~= 262 or c ~= 263 or a < 264 and f(c) == 265 and a < 266 or b or b and f(c) == 269 or b and not b and not b or not b or f(c) == 274 or b and a < 276 or b or c ~= 278 or c ~= 279 or c ~= 280 and not b or b or not b and not (a <= 284) and not (a <= 285) and b and a < 287 or not (a <= 288) or not (a <= 289) or b or c ~= 291 or c ~= 292 or f(c) == 293 or not b or c ~= 295 and c ~= 296 or not (a <= 297) or not b and not b and c ~= 300 or f(c) == 301 and b and c ~= 303 or c ~= 304 and a < 305 or not (a <= 306) and not (a <= 307) and not (a <= 308) and c ~= 309 and b or b or a < 312 or not (a <= 313) and not (a <= 314) and f(c) == 315 and not (a <= 316) or not b and a < 318 or a < 319 and not (a <= 320) or not b or a < 322 and b or not b or not (a <= 325) or b and a < 327 and c ~= 328 and b and f(c) == 330 or a < 331 or b and c ~= 333 or f(c) == 334 and c ~= 335 or c ~= 336 or f(c) == 337 and f(c) == 338 and a < 339 or not b and a < 341 and not b and c ~= 343 and not b or f(c) == 345 and f(c) == 346 and f(c) == 347 and f(c) == 348 or not (a <= 349) or f(c) == 350 or c ~= 351 or a < 352 or c ~= 353 and f(c) == 354 or b and b or f(c) == 357 and not b or a < 359 and not (a <= 360) or not b or not (a <= 362) and b or not (a <= 364) or b or c ~= 366 or a < 367 or not b and not b and c ~= 370 and a < 371 or not (a <= 372) or not b and not b and c ~= 375 or not b or b or f(c) == 378 or f(c) == 379 or a < 380 and c ~= 381 and not (a <= 382) and not (a <= 383) and f(c) == 384 and c ~= 385 and not (a <= 386) and c ~= 387 or c ~= 388 or f(c) == 389 and a < 390 and c ~= 391 or c ~= 392 and not b and f(c) == 394 or b or not b and c ~= 397 or c ~= 398 or not (a <= 399) or b or not (a <= 401) or b or a < 403 and not (a <= 404) or a < 405 and not b or not (a <= 407) and not b and f(c) == 409 or a < 410 and b and c ~= 412 or c ~= 413 and not b or not b and b or b and b or b and a < 420 or b and not b and b and a < 424 or not b and not b and b or b and b or f(c) == 430 or not b and c ~= 432 and f(c) == 433 or c ~= 434 and a < 435 or b and not (a <= 437) and not (a <= 438) and f(c) == 439 and c ~= 440 or not (a <= 441) and f(c) == 442 or b or a < 444 and not (a <= 445) or b or f(c) == 447 or a < 448 or a < 449 or a < 450 or not b or not (a <= 452) or c ~= 453 and b or c ~= 455 and f(c) == 456 or b or not b and not (a <= 459) and a < 460 or b or not b and not (a <= 463) or f(c) == 464 or not b or b or b and f(c) == 468 or not b and f(c) == 470 and not (a <= 471) and c ~= 472 and c ~= 473 or a < 474 and not (a <= 475) or not (a <= 476) or c ~= 477 or a < 478 or a < 479 and a < 480 and c ~= 481 and c ~= 482 and a < 483 or a < 484 and not (a <= 485) and c ~= 486 or not (a <= 487) or a < 488 and not b and f(c) == 490 or not b or b and not (a <= 493) or c ~= 494 or a < 495 or not (a <= 496) or c ~= 497 and b and a < 499 or f(c) == 500 or not b or a < 502 and a < 503 and not (a <= 504) and f(c) == 505 and not b and not b or f(c) == 508 or a < 509 or a < 510 or b or c ~= 512 or f(c) == 513 and not b or a < 515 or c ~= 516 and not b or b or f(c) == 519 or c ~= 520 or f(c) == 521 and c ~= 522 and b and c ~= 524 and b and f(c) == 526 and not b and not b or c ~= 529 or b or c ~= 531 or not (a <= 532) or f(c) == 533 or b and b or b and c ~= 537 or b and c ~= 539 or not b or f(c) == 541 or b and not (a <= 543) and not (a <= 544) and a < 545 or not (a <= 546) and not b and f(c) == 548 and c ~= 549 or b or b or not b and f(c) == 553 and b and c ~= 555 and b and a < 557 or not (a <= 558) and b and c ~= 560 or b and a < 562 or not b and b and not (a <= 565) and not b and a < 567 or not b or b and not b and not b or not (a <= 572) and not (a <= 573) and b and c ~= 575 or a < 576 and not (a <= 577) or not (a <= 578) or f(c) == 579 or f(c) == 580 or not (a <= 581) or f(c) == 582 and f(c) == 583 or b and f(c) == 585 and c ~= 586 and not b and f(c) == 588 and c ~= 589 or b and not b and c ~= 592 and b and a < 594 or a < 595 or not (a <= 596) or a < 597 or not (a <= 598) and a < 599 or not b or c ~= 601 and not (a <= 602) or b and not (a <= 604) and not b or not (a <= 606) and not b and b or c ~= 609 or b or b and a < 612 and a < 613 and not b and a < 615 or not b or not b and a < 618 or a < 619 or f(c) == 620 and c ~= 621 or c ~= 622 and not (a <= 623) and not (a <= 624) or b or not (a <= 626) and not b or b and not b or b or f(c) == 631 and b and not (a <= 633) or not b or not (a <= 635) and not b or not b or not (a <= 638) and c ~= 639 or a < 640 and b or not b and f(c) == 643 and a < 644 and f(c) == 645 or a < 646 and f(c) == 647 and b or not b or not (a <= 650) or c ~= 651 and not b and c ~= 653 or not (a <= 654) and c ~= 655 or b or a < 657 and a < 658 and not (a <= 659) or a < 660 and b or b and not b and c ~= 664 or b and b or not b or not (a <= 668) and not (a <= 669) or c ~= 670 or not b and a < 672 and not b or b and b and c ~= 676 and f(c) == 677 or not b and b and not b or f(c) == 681 or not (a <= 682) and f(c) == 683 and not (a <= 684) and not (a <= 685) or not (a <= 686) and c ~= 687 and not (a <= 688) or b and b or not b and c ~= 692 and b and not (a <= 694) and not (a <= 695) or c ~= 696 or b and a < 698 and a < 699 and not b and not b and b and f(c) == 703 or not b and f(c) == 705 or f(c) == 706 and a < 707 or a < 708 and not b or not b and b and not b or b or b and a < 715 and f(c) == 716 and not (a <= 717) or b and not (a <= 719) or f(c) == 720 and f(c) == 721 and f(c) == 722 or not b or a < 724 and c ~= 725 and c ~= 726 and not b and f(c) == 728 or not (a <= 729) or b or not b and f(c) == 732 or b or f(c) == 734 or a < 735 and c ~= 736 or c ~= 737 and c ~= 738 and b or b and c ~= 741 and b and not (a <= 743) or b or f(c) == 745 or a < 746 and not b and b or b or not (a <= 750) or not (a <= 751) and not b and not (a <= 753) and b and f(c) == 755 or f(c) == 756 or a < 757 or not (a <= 758) and a < 759 or not (a <= 760) or a < 761 or f(c) == 762 and not b or not (a <= 764) or not (a <= 765) or c ~= 766 or b and c ~= 768 and not b and not (a <= 770) and a < 771 and not b or a < 773 or b or f(c) == 775 or f(c) == 776 and not (a <= 777) and not (a <= 778) or f(c) == 779 and c ~= 780 or f(c) == 781 or not (a <= 782) or c ~= 783 and a < 784 and a < 785 and c ~= 786 or b and f(c) == 788 and b and not b and b or f(c) == 792 and not (a <= 793) or f(c) == 794 and f(c) == 795 or b or a < 797 or not (a <= 798) and f(c) == 799 or c ~= 800 or b and a < 802 and not (a <= 803) and not b and a < 805 and a < 806 or f(c) == 807 and not (a <= 808) and not b or not b or a < 811 or f(c) == 812 or not (a <= 813) or b or a < 815 or not (a <= 816) or c ~= 817 or a < 818 and f(c) == 819 or f(c) == 820 or not b or not b or not b and not b or c ~= 825 and a < 826 or a < 827 or not (a <= 828) and a < 829 or b or b or f(c) == 832 and c ~= 833 or c ~= 834 and f(c) == 835 or not (a <= 836) and b and c ~= 838 and f(c) == 839 and c ~= 840 and not b and b or not b or not b or a < 845 and b and not b or not b and c ~= 849 and not (a <= 850) or f(c) == 851 or c ~= 852 and not b or f(c) == 854 and not b or f(c) == 856 or f(c) == 857 or a < 858 and b or c ~= 860 or b or not b and a < 863 and not (a <= 864) and a < 865 and f(c) == 866 and c ~= 867 and f(c) == 868 and not (a <= 869) and not (a <= 870) or a < 871 or c ~= 872 and not (a <= 873) or a < 874 and f(c) == 875 or not (a <= 876) and f(c) == 877 and c ~= 878 and not b and a < 880 or f(c) == 881 and not b and b or not (a <= 884) and not (a <= 885) and not (a <= 886) or b or a < 888 and c ~= 889 and f(c) == 890 or a < 891 or c ~= 892 and f(c) == 893 and not (a <= 894) and not (a <= 895) or c ~= 896 or f(c) == 897 and c ~= 898 and c ~= 899 or not (a <= 900) or b and not b or not (a <= 903) and f(c) == 904 or c ~= 905 or f(c) == 906 and a < 907 or c ~= 908 and not b or a < 910 or not (a <= 911) or not b or c ~= 913 and not (a <= 914) or b and c ~= 916 and f(c) == 917 or b and not (a <= 919) or a < 920 and b or c ~= 922 and a < 923 or not b or f(c) == 925 or a < 926 or b or not b and not (a <= 929) and a < 930 or not b and not b or not (a <= 933) or a < 934 or f(c) == 935 or not b and b and f(c) == 938 and not b and a < 940 and c ~= 941 or f(c) == 942 or not (a <= 943) or a < 944 or a < 945 or a < 946 or c ~= 947 and b or not (a <= 949) and f(c) == 950 and c ~= 951 and not (a <= 952) or not (a <= 953) or b and c ~= 955 or f(c) == 956 or not (a <= 957) and not (a <= 958) and a < 959 or not b or f(c) == 961 and not b or f(c) == 963 or not (a <= 964) or not b and c ~= 966 or c ~= 967 or c ~= 968 and a < 969 and not (a <= 970) or not (a <= 971) and a < 972 or b and not b and not b or b and a < 977 or b and c ~= 979 and not (a <= 980) and f(c) == 981 and not (a <= 982) and a < 983 or b or c ~= 985 or not b or a < 987 or not b and b and a < 990 or a < 991 or f(c) == 992 and a < 993 or not (a <= 994) or b or a < 996 and f(c) == 997 and a < 998 and a < 999
+
+	return x
+end
+
+return if_and1000, value_and1000, if_or1000, value_or1000, if_mixed1000, value_mixed1000
@@ -0,0 +1,62 @@
+local t, f, g = ...
+
+function inverted(a, b)
+	local r = 0
+
+	if not (a < b) then
+		r = r + 1
+	end
+
+	if not (f(a) <= t.b) then
+		r = r + 2
+	end
+
+	while not (t.i >= g(a, b)) do
+		t.i = t.i + 1
+	end
+
+	repeat
+		a = a + 1
+	until not (a ~= f(b))
+
+	local x = a < b or t.c
+	local y = not (f(a) == b) and g(a, b)
+
+	return r, x, y
+end
+
+function shared(a)
+	local n = f(a)
+
+	if not (n < a) and not (n > t.limit) then
+		n = n + a
+	end
+
+	local m = n
+
+	if not (m >= n) or not (f(m) < n) then
+		return m
+	end
+
+	return function ()
+		return not (m < a)
+	end
+end
+
+function chain50()
+	if t.d0 ~= g(t.e0, 0) and not t.c1 or t.d2 ~= g(t.e2, 2) and f(t.x3) == 3 and f(t.x4) == 4 or t.a5 < t.b5 and not (t.y6 <= f(6)) and not (t.y7 <= f(7)) or not t.c8 or not (t.y9 <= f(9)) or not (t.y10 <= f(10)) and t.a11 < t.b11 or t.d12 ~= g(t.e12, 12) or not t.c13 and not (t.y14 <= f(14)) or t.a15 < t.b15 and t.d16 ~= g(t.e16, 16) and not (t.y17 <= f(17)) and t.a18 < t.b18 and t.a19 < t.b19 and t.d20 ~= g(t.e20, 20) or t.d21 ~= g(t.e21, 21) or not (t.y22 <= f(22)) or t.d23 ~= g(t.e23, 23) and t.d24 ~= g(t.e24, 24) or not t.c25 and t.d26 ~= g(t.e26, 26) or t.d27 ~= g(t.e27, 27) and t.d28 ~= g(t.e28, 28) and t.d29 ~= g(t.e29, 29) or t.a30 < t.b30 and t.a31 < t.b31 and not t.c32 and not t.c33 and not t.c34 or not t.c35 and not (t.y36 <= f(36)) or f(t.x37) == 37 or f(t.x38) == 38 or t.d39 ~= g(t.e39, 39) or t.d40 ~= g(t.e40, 40) or t.d41 ~= g(t.e41, 41) or f(t.x42) == 42 and f(t.x43) == 43 or f(t.x44) == 44 and not (t.y45 <= f(45)) and not (t.y46 <= f(46)) and not t.c47 or not (t.y48 <= f(48)) and f(t.x49) == 49 then
+		return true
+	end
+
+	return false
+end
+
+function chain100()
+	if not (t.y0 <= f(0)) and t.a1 < t.b1 and t.a2 < t.b2 or not t.c3 or t.a4 < t.b4 and t.d5 ~= g(t.e5, 5) and not (t.y6 <= f(6)) or not t.c7 or t.a8 < t.b8 and not (t.y9 <= f(9)) and not (t.y10 <= f(10)) and t.a11 < t.b11 and not (t.y12 <= f(12)) and f(t.x13) == 13 and not (t.y14 <= f(14)) and f(t.x15) == 15 and t.a16 < t.b16 and f(t.x17) == 17 and t.d18 ~= g(t.e18, 18) or f(t.x19) == 19 or f(t.x20) == 20 or t.a21 < t.b21 and f(t.x22) == 22 or t.a23 < t.b23 or t.a24 < t.b24 or t.a25 < t.b25 and f(t.x26) == 26 or t.a27 < t.b27 and t.d28 ~= g(t.e28, 28) or f(t.x29) == 29 and f(t.x30) == 30 or f(t.x31) == 31 or not t.c32 or t.d33 ~= g(t.e33, 33) and not t.c34 and t.a35 < t.b35 and not (t.y36 <= f(36)) or not (t.y37 <= f(37)) and not t.c38 and t.a39 < t.b39 or f(t.x40) == 40 and t.a41 < t.b41 or t.a42 < t.b42 and not (t.y43 <= f(43)) and t.a44 < t.b44 or t.a45 < t.b45 and t.a46 < t.b46 and t.a47 < t.b47 or not t.c48 or not (t.y49 <= f(49)) or not t.c50 or f(t.x51) == 51 and t.a52 < t.b52 and f(t.x53) == 53 and not t.c54 and not (t.y55 <= f(55)) or t.a56 < t.b56 or t.a57 < t.b57 and t.d58 ~= g(t.e58, 58) and not t.c59 and f(t.x60) == 60 or t.d61 ~= g(t.e61, 61) and t.a62 < t.b62 or t.d63 ~= g(t.e63, 63) and f(t.x64) == 64 and f(t.x65) == 65 and not t.c66 or t.a67 < t.b67 or t.d68 ~= g(t.e68, 68) and not t.c69 or f(t.x70) == 70 or not (t.y71 <= f(71)) or f(t.x72) == 72 and not t.c73 or t.d74 ~= g(t.e74, 74) and not (t.y75 <= f(75)) and t.a76 < t.b76 and not (t.y77 <= f(77)) or f(t.x78) == 78 and t.a79 < t.b79 or t.d80 ~= g(t.e80, 80) or f(t.x81) == 81 or t.a82 < t.b82 and t.d83 ~= g(t.e83, 83) or t.d84 ~= g(t.e84, 84) and t.a85 < t.b85 or t.d86 ~= g(t.e86, 86) and t.d87 ~= g(t.e87, 87) and t.a88 < t.b88 or not t.c89 and t.a90 < t.b90 and t.a91 < t.b91 and t.d92 ~= g(t.e92, 92) and not (t.y93 <= f(93)) and t.a94 < t.b94 or t.a95 < t.b95 or t.d96 ~= g(t.e96, 96) or not (t.y97 <= f(97)) and not (t.y98 <= f(98)) and not (t.y99 <= f(99)) then
+		return true
+	end
+
+	return false
+end
+
+return inverted, shared, chain50, chain100
@@ -0,0 +1,212 @@
+local f = ...
+
+function compare(a, b)
+	if a < b then
+		f("lt")
+	end
+
+	if a >= b then
+		f("ge")
+	end
+
+	if a <= b then
+		f("le")
+	end
+
+	if a > b then
+		f("gt")
+	end
+
+	if a == b then
+		f("eqv")
+	end
+
+	if a ~= b then
+		f("nev")
+	end
+
+	if a == "s" then
+		f("eqs")
+	end
+
+	if a ~= "s" then
+		f("nes")
+	end
+
+	if a == 1 then
+		f("eqn")
+	end
+
+	if a ~= 1 then
+		f("nen")
+	end
+
+	if a == nil then
+		f("eqp")
+	end
+
+	if a ~= true then
+		f("nep")
+	end
+
+	if a then
+		f("ist")
+	end
+
+	if not b then
+		f("isf")
+	end
+
+	if not (a < b) then
+		f("nlt")
+	end
+
+	if not (a <= b) then
+		f("nle")
+	end
+
+	local c = a or b
+	local d = a and b
+
+	return c, d, not a
+end
+
+function arithmetic(a, b)
+	local x = a + 1
+	local y = a - 2
+	local z = a * 3
+	local w = a / 4
+	local v = a % 5
+
+	x = 1 + x
+	y = 2 - y
+	z = 3 * z
+	w = 4 / w
+	v = 5 % v
+
+	x = x + b
+	y = y - b
+	z = z * b
+	w = w / b
+	v = v % b
+
+	return x, y, z, w, v, a ^ b, -a, #b, a .. b .. "c"
+end
+
+function constants()
+	local a = nil
+	local b = false
+	local c = true
+	local d = 7
+	local e = 123456789
+	local g = 1.5
+	local h = "string"
+	local i, j, k = nil
+
+	return a, b, c, d, e, g, h, i, j, k
+end
+
+function nothing(a)
+	f(a)
+end
+
+function upvalues(a)
+	local count = 0
+	local name = "name"
+
+	local function inc(b)
+		count = count + b
+		name = "other"
+		count = 1
+		name = nil
+
+		return count
+	end
+
+	for i = 1, a do
+		local captured = i
+
+		f(function ()
+			return captured
+		end)
+	end
+
+	return inc, name
+end
+
+function tables(a, b, ...)
+	local t = {}
+	local u = {
+		1,
+		2,
+		x = "y"
+	}
+
+	t[a] = b
+	t.name = a
+	t[1] = b
+	u.x = t[a]
+	u.y = t.name
+	u.z = t[2]
+	global_value = t
+	u.w = global_value
+
+	local v = {
+		a,
+		...
+	}
+
+	return t, u, v
+end
+
+function calls(a, ...)
+	f(a)
+	f(f(a))
+	f(...)
+
+	local x, y = f(a)
+
+	return f(x, y, ...)
+end
+
+function tail(a)
+	return f(a)
+end
+
+function varargs(a, ...)
+	return a, ...
+end
+
+function loops(a, t)
+	for i = 1, a do
+		f(i)
+	end
+
+	for i = a, 1, -1 do
+		f(i)
+	end
+
+	for k, v in pairs(t) do
+		f(k, v)
+	end
+
+	for k, v in next, t do
+		f(k, v)
+	end
+
+	for x in f(t) do
+		f(x)
+	end
+
+	while a > 0 do
+		a = a - 1
+	end
+
+	repeat
+		a = a + 1
+	until a > 10
+
+	return a
+end
+
+return compare, arithmetic, constants, nothing, upvalues, tables, calls, tail, varargs, loops
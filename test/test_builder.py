@@ -0,0 +1,259 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import copy
+import random
+
+import ljd.ast.builder as builder
+import ljd.bytecode.instructions as instructions
+from ljd.bytecode.debuginfo import DebugInformation, VariableInfo
+from ljd.bytecode.helpers import get_jump_destination, set_jump_destination
+
+
+def _make_state(rng, count):
+    state = builder._State()
+    state.debuginfo = DebugInformation()
+    code = []
+
+    for addr in range(count):
+        if addr % 7 == 3:
+            instruction = instructions.JMP()
+            instruction.CD = rng.randrange(-min(addr, 40),
+                                           min(40, count - addr - 1))
+        else:
+            instruction = instructions.MOV()
+
+        code.append(instruction)
+        state.debuginfo.addr_to_line_map.append(addr)
+
+    for addr in range(0, count, 16):
+        info = VariableInfo()
+        info.start_addr = addr
+        info.end_addr = min(count, addr + 32)
+        state.debuginfo.variable_info.append(info)
+
+    return state, code
+
+
+def _targets(code):
+    return {instruction: code[get_jump_destination(addr, instruction)]
+            for addr, instruction in enumerate(code)
+            if instruction.opcode == instructions.JMP.opcode}
+
+
+def test_removals_keep_jump_targets():
+    rng = random.Random(0)
+    state, code = _make_state(rng, 2048)
+
+    targets = _targets(code)
+    kept_targets = set(targets.values())
+
+    removals = [addr for addr in rng.sample(range(1, 2047), 300)
+                if code[addr] not in kept_targets
+                and code[addr].opcode != instructions.JMP.opcode]
+
+    removed = [code[addr] for addr in removals]
+    ranges = [(info.start_addr, info.end_addr)
+              for info in state.debuginfo.variable_info]
+    lines = [line for addr, line in enumerate(state.debuginfo.addr_to_line_map)
+             if addr not in removals]
+
+    edits = builder._InstructionEdits(code)
+
+    for addr in removals:
+        edits.remove(addr)
+
+    edits.apply(state)
+
+    assert len(code) == 2048 - len(removals)
+    assert not set(removed) & set(code)
+    assert _targets(code) == targets
+    assert state.debuginfo.addr_to_line_map == lines
+
+    for info, (start, end) in zip(state.debuginfo.variable_info, ranges):
+        assert info.start_addr == start - sum(1 for addr in removals
+                                              if addr < start)
+        assert info.end_addr == end - sum(1 for addr in removals
+                                          if addr < end)
+
+
+def test_forward_jump_to_removed_instruction():
+    state, code = _make_state(random.Random(0), 8)
+
+    jump = instructions.JMP()
+    jump.CD = 2
+    code[0] = jump
+
+    landing = code[4]
+
+    edits = builder._InstructionEdits(code)
+    edits.remove(3)
+    edits.apply(state)
+
+    assert code[get_jump_destination(0, jump)] is landing
+
+
+def _index(code, instruction):
+    return next(addr for addr, other in enumerate(code) if other is instruction)
+
+
+# The relocation of the pre-passes before _InstructionEdits: one list edit,
+# then one pass over the jumps and the variable ranges
+def _shift_one(state, code, shift, index):
+    for addr, instruction in enumerate(code):
+        if instruction.opcode not in builder._WARP_INSTRUCTIONS:
+            continue
+
+        if addr < index and instruction.CD >= 0:
+            destination = get_jump_destination(addr, instruction)
+
+            if destination > index or (destination == index and shift > 0):
+                instruction.CD += shift
+
+        elif addr >= index and instruction.CD < 0:
+            destination = addr + instruction.CD - shift + 1
+
+            if destination < index or (destination == index and shift > 0):
+                instruction.CD -= shift
+
+    for info in state.debuginfo.variable_info:
+        if info.end_addr > index or (shift > 0 and info.end_addr == index):
+            info.end_addr += shift
+
+        if info.start_addr > index or (shift > 0 and info.start_addr == index):
+            info.start_addr += shift
+
+
+def _insert_one(state, code, index, instruction):
+    line_map = state.debuginfo.addr_to_line_map
+
+    code.insert(index, instruction)
+    line_map.insert(index, line_map[index - 1])
+
+    _shift_one(state, code, 1, index)
+
+
+def _remove_one(state, code, index):
+    code.pop(index)
+    state.debuginfo.addr_to_line_map.pop(index)
+
+    _shift_one(state, code, -1, index)
+
+
+# The edits one at a time, by ascending address: the inserts before an
+# address, then its removal. Retargeted jumps are set once all are done.
+def _apply_one_by_one(state, code, inserts, removals, targets):
+    originals = list(code)
+
+    for addr, original in enumerate(originals):
+        index = _index(code, original)
+        inserted = inserts.get(addr, ())
+
+        for offset, instruction in enumerate(inserted):
+            _insert_one(state, code, index + offset, instruction)
+
+        if addr in removals:
+            _remove_one(state, code, index + len(inserted))
+
+    for jump, target in targets.items():
+        set_jump_destination(_index(code, jump), jump, _index(code, target))
+
+
+# A batch of inserts, removals and retargets in the addresses from before
+# any of them. Jumps land on removed instructions and on the ones inserts go
+# before, and retargeted jumps cross the edited addresses.
+def _make_batch(rng, code):
+    count = len(code)
+    jumps = [addr for addr, instruction in enumerate(code)
+             if instruction.opcode == instructions.JMP.opcode]
+    landings = sorted({get_jump_destination(addr, code[addr])
+                       for addr in jumps} - {0, count - 1})
+
+    # The last instruction stays, the targets after removed ones move there
+    edited = rng.sample(landings, len(landings) // 2)
+    edited += rng.sample(range(1, count - 1), count // 8)
+
+    inserts = {}
+    removals = set()
+    targets = {}
+
+    for addr in sorted(set(edited)):
+        kind = rng.randrange(3)
+
+        if kind != 1 and code[addr].opcode != instructions.JMP.opcode:
+            removals.add(addr)
+
+        if kind != 0:
+            new = [instructions.MOV() for _ in range(rng.randrange(1, 4))]
+
+            if rng.randrange(2):
+                jump = instructions.JMP()
+                new.insert(rng.randrange(len(new) + 1), jump)
+                targets[jump] = rng.randrange(1, count)
+
+            inserts[addr] = new
+
+    for addr in rng.sample(jumps, len(jumps) // 4):
+        targets[code[addr]] = rng.randrange(1, count)
+
+    # Target addresses become original instructions that stay, or
+    # inserted ones
+    inserted = [instruction for new in inserts.values() for instruction in new]
+
+    for jump, target in list(targets.items()):
+        if rng.randrange(4) == 0:
+            targets[jump] = rng.choice(inserted)
+            continue
+
+        while target in removals:
+            target += 1
+
+        targets[jump] = code[target]
+
+    return inserts, removals, targets
+
+
+def test_batch_matches_edits_one_by_one():
+    checked = 0
+
+    for seed in range(20):
+        rng = random.Random(seed)
+        state, code = _make_state(rng, 400)
+        inserts, removals, targets = _make_batch(rng, code)
+
+        copies = {}
+        reference = copy.deepcopy((state, code, inserts, targets), copies)
+
+        _apply_one_by_one(reference[0], reference[1], reference[2], removals,
+                          reference[3])
+
+        edits = builder._InstructionEdits(code)
+
+        for addr, new in inserts.items():
+            edits.insert(addr, new)
+
+        for addr in removals:
+            edits.remove(addr)
+
+        for jump, target in targets.items():
+            edits.retarget(jump, target)
+
+        edits.apply(state)
+
+        reference_state, reference_code = reference[:2]
+
+        assert [copies[id(instruction)] for instruction in code] \
+            == reference_code
+        assert [instruction.CD for instruction in code] \
+            == [instruction.CD for instruction in reference_code]
+        assert state.debuginfo.addr_to_line_map \
+            == reference_state.debuginfo.addr_to_line_map
+        assert [(info.start_addr, info.end_addr)
+                for info in state.debuginfo.variable_info] \
+            == [(info.start_addr, info.end_addr)
+                for info in reference_state.debuginfo.variable_info]
+
+        checked += len(inserts) + len(removals) + len(targets)
+
+    assert checked > 0
@@ -0,0 +1,280 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import glob
+import os
+
+import ljd.ast.builder
+import ljd.ast.nodes as nodes
+import ljd.ast.pipeline as pipeline
+import ljd.ast.traverse as traverse
+import ljd.bytecode.dataflow as dataflow
+import ljd.bytecode.instructions as ins
+import ljd.rawdump.parser
+from ljd.bytecode.helpers import get_jump_destination
+
+_ENC = os.path.join(os.path.dirname(__file__), "enc")
+
+
+# (prototype, dataflow) of every prototype in test/enc, as the builder
+# leaves them
+def _flows():
+    for filename in sorted(glob.glob(os.path.join(_ENC, "*.luac"))):
+        _, prototype = ljd.rawdump.parser.parse(filename)
+
+        if not prototype:
+            continue
+
+        times = []
+        ljd.ast.builder.build(prototype, times)
+
+        for built, node, _ in times:
+            yield built, node._dataflow
+
+
+# The slots live at the exit of every block of flow
+def _live_out(flow):
+    if flow.live_out is None:
+        flow._solve()
+
+    return flow.live_out
+
+
+# The addresses every instruction may go on to, without any blocks
+def _successors(instructions):
+    count = len(instructions)
+    successors = []
+
+    for addr, instruction in enumerate(instructions):
+        opcode = instruction.opcode
+        addresses = []
+
+        if addr == 0:
+            addresses.append(1)
+        elif opcode in dataflow._JUMPS:
+            addresses.append(get_jump_destination(addr, instruction))
+
+            previous = instructions[addr - 1].opcode
+
+            if opcode in dataflow._LOOPS or (
+                    opcode == ins.JMP.opcode
+                    and previous in dataflow._CONDITIONS):
+                addresses.append(addr + 1)
+        elif opcode not in dataflow._RETURNS:
+            addresses.append(addr + 1)
+
+        successors.append([a for a in addresses if 0 < a < count])
+
+    return successors
+
+
+def _live_after(instructions, effects):
+    successors = _successors(instructions)
+    live_in = [0] * len(instructions)
+
+    changed = True
+    while changed:
+        changed = False
+
+        for addr in range(len(instructions) - 1, 0, -1):
+            uses, defs, kills = effects[addr]
+            live = 0
+
+            for successor in successors[addr]:
+                live |= live_in[successor]
+
+            live = (live & ~kills) | uses
+
+            if live != live_in[addr]:
+                live_in[addr] = live
+                changed = True
+
+    def live_after(addr):
+        live = 0
+
+        for successor in successors[addr]:
+            live |= live_in[successor]
+
+        return live
+
+    return live_after
+
+
+# The definitions a read of slot at addr sees, by a search backwards
+def _definitions(predecessors, effects, arguments_count, addr, slot):
+    found = set()
+    pending = list(predecessors[addr])
+    visited = set()
+
+    while pending:
+        current = pending.pop()
+
+        if current in visited:
+            continue
+
+        visited.add(current)
+
+        if current == 0:
+            if slot < arguments_count:
+                found.add(0)
+
+            continue
+
+        uses, defs, kills = effects[current]
+
+        if defs >> slot & 1:
+            found.add(current)
+
+        if not kills >> slot & 1:
+            pending += predecessors[current]
+
+    return found
+
+
+def test_matches_instruction_level_search():
+    checked = 0
+
+    for prototype, flow in _flows():
+        instructions = flow.instructions
+
+        if len(instructions) > 600:
+            continue
+
+        effects = [dataflow._get_effects(instruction)
+                   for instruction in instructions]
+
+        predecessors = [[] for _ in instructions]
+        for addr, successors in enumerate(_successors(instructions)):
+            for successor in successors:
+                predecessors[successor].append(addr)
+
+        live_after = _live_after(instructions, effects)
+
+        for index, live in enumerate(_live_out(flow)):
+            assert live == live_after(flow._last_address(index))
+
+        for addr in range(1, len(instructions)):
+            for slot in dataflow._iterate_bits(effects[addr][0]):
+                expected = _definitions(predecessors, effects,
+                                        prototype.arguments_count,
+                                        addr, slot)
+
+                assert set(flow.definitions(addr, slot)) == expected
+                checked += 1
+
+    assert checked > 1000
+
+
+def test_jiterl_is_a_loop():
+    checked = 0
+
+    for prototype, flow in _flows():
+        if not any(instruction.opcode == ins.ITERL.opcode
+                   for instruction in flow.instructions):
+            continue
+
+        patched = list(flow.instructions)
+
+        for addr, instruction in enumerate(patched):
+            if instruction.opcode == ins.ITERL.opcode:
+                patched[addr] = ins.JITERL()
+                patched[addr].A = instruction.A
+                patched[addr].CD = instruction.CD
+
+        jitted = dataflow.Dataflow(patched, flow.block_starts,
+                                   prototype.arguments_count)
+
+        assert jitted.block_starts == flow.block_starts
+
+        assert _live_out(jitted) == _live_out(flow)
+        assert jitted.successors == flow.successors
+
+        checked += 1
+
+    assert checked > 0
+
+
+# FORL reads again the controls FORI read, the tree reads them once
+def test_loop_controls_are_read_once():
+    checked = 0
+
+    for _, flow in _flows():
+        for addr, instruction in enumerate(flow.instructions):
+            if instruction.opcode != ins.FORI.opcode:
+                continue
+
+            for slot in range(instruction.A + 1, instruction.A + 3):
+                for definition in flow.definitions(addr, slot):
+                    assert flow.reads(definition, slot) == 1
+
+                    # A loop that only ends in a break has no FORL
+                    if len(flow.uses(definition, slot)) == 2:
+                        checked += 1
+
+    assert checked > 0
+
+
+# The assignments of functions to slots, with the dataflow of the
+# function they are in
+class _FunctionAssignments(traverse.Visitor):
+    def __init__(self):
+        super().__init__()
+        self._functions = []
+        self.found = []
+
+    def visit_function_definition(self, node):
+        self._functions.append(node)
+
+    def leave_function_definition(self, node):
+        self._functions.pop()
+
+    def visit_assignment(self, node):
+        destination = node.destinations.contents[0]
+        expression = node.expressions.contents[0]
+
+        if isinstance(expression, nodes.FunctionDefinition) \
+                and isinstance(destination, nodes.Identifier) \
+                and hasattr(node, "_addr"):
+            self.found.append((node, self._functions[-1]._dataflow,
+                               destination.slot))
+
+
+def _function_assignments(ast):
+    visitor = _FunctionAssignments()
+    traverse.traverse(visitor, ast)
+
+    return visitor.found
+
+
+# A function read in two blocks is read once in the block of its
+# assignment only, the dataflow keeps slotworks from inlining it there
+def test_functions_read_twice_are_kept():
+    names = [step.name for step in pipeline.PASSES]
+    passes = pipeline.PASSES[:names.index("eliminate_temporary") + 1]
+
+    kept = 0
+
+    for filename in sorted(glob.glob(os.path.join(_ENC, "*.luac"))):
+        _, prototype = ljd.rawdump.parser.parse(filename)
+
+        if not prototype:
+            continue
+
+        ast = ljd.ast.builder.build(prototype)
+
+        before = [node for node, flow, slot in _function_assignments(ast)
+                  if len(flow.uses(node._addr, slot)) > 1]
+
+        try:
+            pipeline.PassManager(passes).run(ast)
+        except Exception:
+            continue
+
+        after = [node for node, _, _ in _function_assignments(ast)]
+
+        for node in before:
+            assert node in after
+            kept += 1
+
+    assert kept > 0
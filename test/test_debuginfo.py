@@ -0,0 +1,50 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import random
+
+from ljd.bytecode.debuginfo import DebugInformation, VariableInfo
+
+
+def _make_debuginfo(rng, addr_count):
+    debuginfo = DebugInformation()
+
+    for start in sorted(rng.randrange(addr_count)
+                        for _ in range(addr_count // 8)):
+        info = VariableInfo()
+        info.start_addr = start
+        info.end_addr = min(addr_count, start + rng.randrange(1, 64))
+        info.name = "var" + str(start)
+        debuginfo.variable_info.append(info)
+
+    return debuginfo
+
+
+def test_lookup_matches_scan():
+    rng = random.Random(0)
+    debuginfo = _make_debuginfo(rng, 1024)
+
+    for _ in range(4000):
+        addr = rng.randrange(-1, 1100)
+        slot = rng.randrange(8)
+
+        assert debuginfo.lookup_local_name(addr, slot) \
+            is debuginfo._scan_local_name(addr, slot)
+
+
+def test_lookup_after_reset():
+    rng = random.Random(1)
+    debuginfo = _make_debuginfo(rng, 256)
+
+    debuginfo.lookup_local_name(0, 0)
+
+    for info in debuginfo.variable_info:
+        info.end_addr += 16
+
+    debuginfo.reset_local_names()
+
+    for addr in range(300):
+        for slot in range(4):
+            assert debuginfo.lookup_local_name(addr, slot) \
+                is debuginfo._scan_local_name(addr, slot)
@@ -0,0 +1,79 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import os
+
+import pytest
+
+import ljd
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# test/enc has the dumps, test/expected what -c made of them
+_DUMPS = os.path.join(_ROOT, "enc")
+_EXPECTED = os.path.join(_ROOT, "expected")
+
+_NAMES = sorted(os.path.splitext(name)[0] for name in os.listdir(_EXPECTED))
+
+# Dumps that don't decompile even with -c
+_FAILING = ["ifs", "primitive"]
+
+
+def _expected(name):
+    with open(os.path.join(_EXPECTED, name + ".lua"), encoding="utf-8") as f:
+        return f.read()
+
+
+def _decompile(name, **options):
+    return ljd.decompile(os.path.join(_DUMPS, name + ".luac"),
+                         catch_asserts=True, **options)
+
+
+@pytest.mark.parametrize("name", _NAMES)
+def test_output(name):
+    assert _decompile(name).lua == _expected(name)
+
+
+@pytest.mark.parametrize("name", _NAMES)
+def test_output_without_checks(name):
+    assert _decompile(name, checks=False).lua == _expected(name)
+
+
+@pytest.mark.parametrize("name", _NAMES)
+def test_output_from_memory(name):
+    with open(os.path.join(_DUMPS, name + ".luac"), "rb") as f:
+        data = f.read()
+
+    result = ljd.decompile(data, name, catch_asserts=True)
+
+    assert result.lua == _expected(name)
+
+
+@pytest.mark.parametrize("name", _FAILING)
+def test_failure_is_reported(name):
+    result = _decompile(name)
+
+    assert result.lua is None
+    assert result.errors
+
+
+# deep.luac nests ifs, loops, calls and tables 150 deep, closures as deep
+# as LuaJIT allows, and adds up 1000 terms
+def test_deep_nesting():
+    result = _decompile("deep")
+
+    assert not result.errors
+    assert result.lua.count("while a > ") == 150
+    assert "return a0 + a94" in result.lua
+
+
+# opcodes.luac is a LuaJIT 2.1 dump of test/src/opcodes.lua, opcodes_20.luac
+# one of LuaJIT 2.0, which numbers the opcodes from ISTYPE on apart. Neither
+# may leave its numbering to the next dump.
+def test_versions_back_to_back():
+    for name in ("opcodes_20", "opcodes", "opcodes_20"):
+        result = _decompile(name)
+
+        assert not result.errors
+        assert result.lua == _expected("opcodes")
@@ -0,0 +1,97 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import os
+
+import pytest
+
+import ljd.ast.builder
+import ljd.ast.nodes as nodes
+import ljd.ast.pipeline as pipeline
+import ljd.ast.slotworks as slotworks
+import ljd.ast.traverse as traverse
+import ljd.context
+import ljd.rawdump.parser
+
+_DUMP = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                     "enc", "login.luac")
+
+
+class _Upvalues(traverse.Visitor):
+    def __init__(self):
+        super().__init__()
+        self.found = []
+
+    def visit_identifier(self, node):
+        if node.type == nodes.Identifier.T_UPVALUE:
+            self.found.append((node.slot, node.slot_index))
+
+
+# The tree of the dump after the passes up to through
+def _build(ctx=None, through="eliminate_temporary"):
+    names = [step.name for step in pipeline.PASSES]
+    passes = pipeline.PASSES[:names.index(through) + 1]
+
+    _, prototype = ljd.rawdump.parser.parse(_DUMP)
+    ast = ljd.ast.builder.build(prototype)
+
+    pipeline.PassManager(passes).run(ast, ctx)
+
+    return ast
+
+
+def _upvalues(ast):
+    visitor = _Upvalues()
+    traverse.traverse(visitor, ast)
+
+    return visitor.found
+
+
+# The upvalues as bound by a walk of their own
+def _bound_upvalues():
+    ast = _build(through="mark_locals")
+    slotworks.bind_upvalues(ast)
+
+    return _upvalues(ast)
+
+
+def _fail(*args):
+    raise AssertionError("slot walk")
+
+
+def test_bind_upvalues_matches_slot_walk():
+    ast = _build(through="mark_locals")
+    traverse.traverse(slotworks._SlotsCollector(upvalues=True), ast)
+
+    expected = _upvalues(ast)
+
+    assert _bound_upvalues() == expected
+    assert any(slot_index != 0 for _, slot_index in expected)
+
+
+# The slot walk fails at the first assignment, before it changed the tree
+def test_caught_failure_binds_upvalues(monkeypatch):
+    monkeypatch.setattr(slotworks._SlotsCollector, "_eliminate_multres",
+                        _fail)
+
+    ctx = ljd.context.DecompileContext(catch_asserts=True)
+    ast = _build(ctx)
+
+    assert [error.stage for error in ctx.errors] == ["eliminate_temporary"]
+    assert _upvalues(ast) == _bound_upvalues()
+
+
+def test_failure_without_catch_asserts(monkeypatch):
+    monkeypatch.setattr(slotworks._SlotsCollector, "_eliminate_multres",
+                        _fail)
+
+    with pytest.raises(AssertionError):
+        _build(ljd.context.DecompileContext())
+
+
+def test_upvalue_failure_is_not_caught(monkeypatch):
+    monkeypatch.setattr(slotworks._SlotsVisitor, "_bind_upvalue", _fail)
+
+    with pytest.raises(AssertionError):
+        _build(ljd.context.DecompileContext(catch_asserts=True))
@@ -0,0 +1,113 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import io
+
+import pytest
+
+import ljd.ast.nodes as nodes
+import ljd.ast.traverse as traverse
+import ljd.ast.validator as validator
+import ljd.bytecode.constants
+import ljd.lua.writer
+from ljd.ast.helpers import insert_table_record
+
+
+def _make_table():
+    template = ljd.bytecode.constants.Table()
+    template.array = [None, 1, "two", 3.5]
+    template.dictionary = [("name", "value"), (10, True), ("not a name", False)]
+
+    return nodes.ConstantTable(template)
+
+
+def _constant(value, value_type):
+    node = nodes.Constant()
+    node.type = value_type
+    node.value = value
+
+    return node
+
+
+# local t = <table>
+def _write(table):
+    identifier = nodes.Identifier()
+    identifier.type = nodes.Identifier.T_LOCAL
+    identifier.name = "t"
+
+    assignment = nodes.Assignment()
+    assignment.type = nodes.Assignment.T_LOCAL_DEFINITION
+    assignment.destinations.contents.append(identifier)
+    assignment.expressions.contents.append(table)
+
+    ast = nodes.FunctionDefinition()
+    ast.statements.contents.append(assignment)
+
+    out = io.StringIO()
+    ljd.lua.writer.write(out, ast)
+
+    return out.getvalue()
+
+
+def test_probes_do_not_expand():
+    table = _make_table()
+
+    assert not hasattr(table, "missing")
+    assert len(table.array.contents) == 0
+    assert table.template is not None
+
+    traverse.traverse(validator.Visitor(warped=False), table)
+
+    assert type(table) is nodes.ConstantTable
+    assert table.template is not None
+
+
+def test_expand_writes_the_same():
+    expected = _write(_make_table())
+
+    table = _make_table()
+    table.expand()
+
+    assert type(table) is nodes.ConstantTable
+    assert table.template is None
+    assert len(table.array.contents) == 4
+    assert len(table.records.contents) == 3
+    assert _write(table) == expected
+
+
+def test_string_key_keeps_template():
+    table = _make_table()
+
+    insert_table_record(table, _constant("added", nodes.Constant.T_STRING),
+                        _constant(1, nodes.Constant.T_INTEGER))
+
+    assert table.template is not None
+    assert len(table.records.contents) == 1
+    assert _write(table).endswith('["not a name"] = false,\n\tadded = 1\n}\n')
+
+
+def test_integer_key_expands():
+    table = _make_table()
+
+    insert_table_record(table, _constant("added", nodes.Constant.T_STRING),
+                        _constant(1, nodes.Constant.T_INTEGER))
+    insert_table_record(table, _constant(4, nodes.Constant.T_INTEGER),
+                        _constant("four", nodes.Constant.T_STRING))
+
+    assert table.template is None
+    assert len(table.array.contents) == 5
+    assert table.array.contents[4].value.value == "four"
+
+    # Records added before the expansion stay behind the template ones
+    keys = [record.key.value for record in table.records.contents]
+
+    assert keys == ["name", 10, "not a name", "added"]
+
+
+def test_bad_template_item():
+    table = _make_table()
+    table.template.dictionary.append(("key", object()))
+
+    with pytest.raises(AssertionError):
+        traverse.traverse(validator.Visitor(warped=False), table)
@@ -0,0 +1,146 @@
+#
+# Copyright (C) 2013 Andrian Nord. See Copyright Notice in main.py
+#
+
+import copy
+import os
+import sys
+
+import pytest
+
+import ljd
+import ljd.ast.builder
+import ljd.ast.nodes as nodes
+import ljd.ast.pipeline as pipeline
+import ljd.ast.unwarper as unwarper
+import ljd.context
+import ljd.rawdump.parser
+
+_DUMPS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "enc")
+
+# A function of 2000 ifs in a row
+_LARGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "large",
+                      "ifs.luac")
+
+_NAMES = sorted(os.path.splitext(name)[0] for name in os.listdir(_DUMPS))
+
+_NODES = tuple(value for value in vars(nodes).values()
+               if isinstance(value, type)
+               and value.__module__ == nodes.__name__)
+
+
+def _path(name):
+    return os.path.join(_DUMPS, name + ".luac")
+
+
+# How often every node is reached in the tree, by id
+def _count_nodes(node, counts):
+    if isinstance(node, list):
+        for item in node:
+            _count_nodes(item, counts)
+
+        return
+
+    if not isinstance(node, _NODES):
+        return
+
+    counts[id(node)] = counts.get(id(node), 0) + 1
+
+    if counts[id(node)] > 1:
+        return
+
+    for name, value in vars(node).items():
+        if not name.startswith("_"):
+            _count_nodes(value, counts)
+
+
+def test_invert_shares_operands():
+    left = nodes.Identifier()
+    right = nodes.Identifier()
+
+    comparison = nodes.BinaryOperator()
+    comparison.type = nodes.BinaryOperator.T_LESS_THEN
+    comparison.left = left
+    comparison.right = right
+
+    inverted = unwarper._invert(comparison)
+
+    assert inverted is not comparison
+    assert inverted.type == nodes.BinaryOperator.T_GREATER_OR_EQUAL
+    assert comparison.type == nodes.BinaryOperator.T_LESS_THEN
+
+    assert inverted.left is left
+    assert inverted.right is right
+
+
+@pytest.mark.parametrize("name", _NAMES)
+def test_output_matches_deep_copies(name, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(unwarper, "_clone", copy.deepcopy)
+        expected = ljd.decompile(_path(name), catch_asserts=True).lua
+
+    assert ljd.decompile(_path(name), catch_asserts=True).lua == expected
+
+
+# Lists of blocks find their blocks by position or by a scan, with the
+# same result
+@pytest.mark.parametrize("path", [_path("MyApp"), _path("chains"), _LARGE])
+def test_indexed_blocks_match_scans(path, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(unwarper, "_INDEXED_BLOCKS", sys.maxsize)
+        expected = ljd.decompile(path, catch_asserts=True).lua
+
+    monkeypatch.setattr(unwarper, "_INDEXED_BLOCKS", 0)
+
+    assert ljd.decompile(path, catch_asserts=True).lua == expected
+
+
+# An inverted comparison shares its operands with the one it came from.
+# The passes after unwarp may rewrite them, so the old one must be gone
+# from the tree by then and they must show up in one place only.
+def test_shared_operands_show_once(monkeypatch):
+    clones = []
+
+    def clone(node):
+        new = copy.copy(node)
+        clones.append((node, new))
+
+        return new
+
+    monkeypatch.setattr(unwarper, "_clone", clone)
+
+    _, prototype = ljd.rawdump.parser.parse(_path("conditions"))
+    ast = ljd.ast.builder.build(prototype)
+
+    pipeline.PassManager().run(ast, ljd.context.DecompileContext())
+
+    counts = {}
+    _count_nodes(ast, counts)
+
+    comparisons = [(node, new) for node, new in clones
+                   if isinstance(node, nodes.BinaryOperator)]
+
+    assert len(comparisons) > 50
+
+    for node, new in comparisons:
+        assert id(node) not in counts
+        assert counts.get(id(new), 0) <= 1
+
+        if id(new) in counts:
+            assert counts[id(new.left)] == 1
+            assert counts[id(new.right)] == 1
+
+
+# The 1000-term and/or chains of chains.luac nest their subexpressions
+# 1000 deep, unwarp must not need a stack frame for each
+def test_long_chains_need_no_deep_stack():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(300)
+
+    try:
+        result = ljd.decompile(_path("chains"))
+    finally:
+        sys.setrecursionlimit(limit)
+
+    assert not result.errors
+    assert result.lua.count(" and ") + result.lua.count(" or ") > 5000
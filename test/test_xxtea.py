@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+import random
+
+import pytest
+
+# The key module is site specific, see xxteafile/key.py.sample
+pytest.importorskip("xxteafile.key")
+
+from xxteafile.xxteafile import xxteaFile
+
+_KEY = "ljd-test"
+
+# Some source encrypted with _KEY
+_KNOWN = bytes.fromhex(
+    "df9e885a8db73d9f32e11fb6a6b8ad600297bab8072247404fc0c961")
+
+
+@pytest.mark.parametrize("size",
+                         [1, 2, 3, 4, 5, 7, 8, 9, 15, 16, 17, 100, 1000, 4099])
+def test_round_trip(size):
+    engine = xxteaFile()
+    rng = random.Random(size)
+    data = bytes(rng.getrandbits(8) for _ in range(size))
+
+    encrypted = engine.encrypt(data, _KEY)
+
+    assert engine.decrypt(encrypted, _KEY) == data
+
+
+def test_known_answer():
+    assert xxteaFile().decrypt(_KNOWN, _KEY) == b"local a = 1\nreturn a\n"
+
+
+def test_bad_length():
+    engine = xxteaFile()
+    encrypted = bytearray(engine.encrypt(b"local a = 1\n", _KEY))
+    encrypted[-1] ^= 0xff
+
+    with pytest.raises(ValueError):
+        engine.decrypt(bytes(encrypted), _KEY)
+
+
+def test_empty():
+    assert xxteaFile().decrypt(b"", _KEY) == b""
+
+
+def test_read_file(tmp_path):
+    from xxteafile.key import KEY, SIGN
+
+    engine = xxteaFile()
+    data = b"\x1bLJ\x02local bytecode"
+
+    encrypted = tmp_path / "encrypted.lua"
+    encrypted.write_bytes(bytes(SIGN, encoding="ascii")
+                          + engine.encrypt(data, KEY))
+
+    plain = tmp_path / "plain.lua"
+    plain.write_bytes(data)
+
+    short = tmp_path / "short.lua"
+    short.write_bytes(b"\x1b")
+
+    assert xxteaFile(str(encrypted)).data == data
+    assert xxteaFile(str(plain)).data == data
+    assert xxteaFile(str(short)).data == b"\x1b"
+
+
+# Sizes in bytes on both sides of the 52 word (208 byte) round count step
+_MANY_SIZES = [1, 4, 7, 8, 9, 100, 200, 207, 208, 209, 1000, 4099, 20000]
+
+
+def _encrypted_many(engine):
+    rng = random.Random(0)
+    datas = [rng.randbytes(rng.choice(_MANY_SIZES)) for _ in range(400)]
+    datas.append(b"")
+
+    return datas, [engine.encrypt(data, _KEY) if data else b""
+                   for data in datas]
+
+
+@pytest.mark.parametrize("min_rows", [1, 16])
+def test_decrypt_many(monkeypatch, min_rows):
+    import xxteafile.xxteafile
+
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(xxteafile.xxteafile, "_MIN_ROWS", min_rows)
+
+    engine = xxteaFile()
+    datas, encrypted = _encrypted_many(engine)
+
+    assert engine.decrypt_many(encrypted, _KEY) == datas
+
+
+def test_decrypt_many_without_numpy(monkeypatch):
+    import xxteafile.xxteafile
+
+    monkeypatch.setattr(xxteafile.xxteafile, "numpy", None)
+
+    engine = xxteaFile()
+    datas, encrypted = _encrypted_many(engine)
+
+    assert engine.decrypt_many(encrypted, _KEY) == datas
+
+
+def test_decrypt_many_bad_length():
+    engine = xxteaFile()
+    encrypted = [engine.encrypt(b"local a = %d\n" % i, _KEY)
+                 for i in range(20)]
+    encrypted[7] = encrypted[7][:-1] + bytes([encrypted[7][-1] ^ 0xff])
+
+    with pytest.raises(ValueError):
+        engine.decrypt_many(encrypted, _KEY)
+
+
+def test_read_files(tmp_path):
+    from xxteafile.key import KEY, SIGN
+
+    engine = xxteaFile()
+    paths = []
+    datas = []
+
+    for i in range(40):
+        data = b"\x1bLJ\x02bytecode %d" % i * (i + 1)
+        path = tmp_path / "{0}.lua".format(i)
+
+        if i % 3:
+            path.write_bytes(bytes(SIGN, encoding="ascii")
+                             + engine.encrypt(data, KEY))
+        else:
+            path.write_bytes(data)
+
+        paths.append(str(path))
+        datas.append(data)
+
+    assert engine.read_files(paths) == datas
@@ -6,29 +6,41 @@ import sys
 import os
 import shutil
 import binascii
-from shutil import copyfile
 from xxteafile.key import *
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# decrypt_many() leaves batches of fewer items than this to decrypt(),
+# and batches no more than _BATCH_WORDS words in all
+_MIN_ROWS = 16
+_BATCH_WORDS = 1 << 22
+
 
 class xxteaFile():
     DELTA = 0x9E3779B9
 
-    def __init__(self, file_path, out_file_path):
+    def __init__(self, file_path=None, out_file_path=None):
+        # Without a path this is just the cipher engine
+        if file_path is None:
+            return
+
         file_path = file_path.strip()  # remove the space
-        if self.isEncrypt(file_path):
-            self.decrypt_file(file_path, out_file_path)
-        else:
-            parent_path = os.path.dirname(out_file_path)
-            if not os.path.exists(parent_path):
-                os.makedirs(parent_path)
-            copyfile(file_path, out_file_path)
+
+        # Decrypted (or plain) file contents, written out only on request
+        self.data = self.read_file(file_path)
+
+        if out_file_path is not None:
+            self.write_file(out_file_path, self.data)
 
     def _long2str(self, v, w):
         n = (len(v) - 1) << 2
         if w:
             m = v[-1]
             if (m < n - 3) or (m > n):
-                return ''
+                raise ValueError("xxtea: bad data length {0}".format(m))
             n = m
         s = struct.pack('<%iL' % len(v), *v)
         return s[0:n] if w else s
@@ -68,13 +80,43 @@ class xxteaFile():
             q -= 1
         return self._long2str(v, False)
 
+    # Raises ValueError if str isn't something encrypt() made with key
     def decrypt(self, str, key):
-        if str == '':
-            return str
+        if not str:
+            return b''
         v = self._str2long(str, False)
-        k = self._str2long(
+        return self._long2str(self._decrypt_longs(v, self._key(key)), True)
+
+    # decrypt() of every item of strs, in order. With NumPy the items
+    # that run the same number of rounds are decrypted side by side, one
+    # vector operation per word position instead of one Python step per
+    # word; without it this is just a loop over decrypt()
+    def decrypt_many(self, strs, key):
+        k = self._key(key)
+        results = [b''] * len(strs)
+        groups = {}
+        for index, str in enumerate(strs):
+            if str:
+                v = self._str2long(str, False)
+                groups.setdefault(52 // len(v), []).append((index, v))
+
+        for items in groups.values():
+            items.sort(key=lambda item: len(item[1]), reverse=True)
+            for batch in _batches(items):
+                if numpy is None or len(batch) < _MIN_ROWS:
+                    decrypted = [self._decrypt_longs(v, k) for _, v in batch]
+                else:
+                    decrypted = self._decrypt_rows([v for _, v in batch], k)
+                for (index, _), v in zip(batch, decrypted):
+                    results[index] = self._long2str(v, True)
+
+        return results
+
+    def _key(self, key):
+        return self._str2long(
             bytes(key, encoding='ascii').ljust(16, b'\0'), False)
-        # k = [1970563447, 1467512927, 19781, 0]
+
+    def _decrypt_longs(self, v, k):
         n = len(v) - 1
         z = v[n]
         y = v[0]
@@ -92,7 +134,51 @@ class xxteaFile():
                     ^ (sum ^ y) + (k[0 & 3 ^ e] ^ z))) & 0xffffffff
             y = v[0]
             sum = (sum - self.DELTA) & 0xffffffff
-        return self._long2str(v, True)
+        return v
+
+    # The XXTEA rounds of vs, longest first and all with the same number
+    # of rounds, as one uint32 array. Row j holds word n - j of every
+    # item, so a round walks the rows from the top and the items shorter
+    # than the current row have dropped off the right hand end
+    def _decrypt_rows(self, vs, k):
+        count = len(vs)
+        sizes = numpy.array([len(v) for v in vs])
+        width = len(vs[0])
+        last = sizes - 1
+        columns = numpy.arange(count)
+
+        w = numpy.zeros((width, count), dtype=numpy.uint32)
+        for column, v in enumerate(vs):
+            w[:len(v), column] = v[::-1]
+
+        # Items still running at row j, i.e. with a word at row j + 1
+        active = numpy.searchsorted(
+            -sizes, -numpy.arange(2, width + 1), side='right').tolist()
+        # keys[e][j & 3] is k[p & 3 ^ e] of every item at row j
+        k = numpy.array(k, dtype=numpy.uint32)
+        keys = [[k[(last - r) & 3 ^ e] for r in range(4)] for e in range(4)]
+
+        sum = ((6 + 52 // width) * self.DELTA) & 0xffffffff
+        y = w[last, columns]
+        while (sum != 0):
+            e = sum >> 2 & 3
+            s = numpy.uint32(sum)
+            for j in range(width - 1):
+                m = active[j]
+                z = w[j + 1, :m]
+                y = y[:m]
+                y = w[j, :m] - ((z >> 5 ^ y << 2) + (y >> 3 ^ z << 4)
+                                ^ (s ^ y) + (keys[e][j & 3][:m] ^ z))
+                w[j, :m] = y
+            z = w[0]
+            y = w[last - 1, columns]
+            y = w[last, columns] - ((z >> 5 ^ y << 2) + (y >> 3 ^ z << 4)
+                                    ^ (s ^ y) + (k[e] ^ z))
+            w[last, columns] = y
+            sum = (sum - self.DELTA) & 0xffffffff
+
+        return [w[:len(v), column][::-1].tolist()
+                for column, v in enumerate(vs)]
 
     def encrypt_file(self, path):
         # open file
@@ -111,18 +197,46 @@ class xxteaFile():
 
     def decrypt_file(self, path, out_file_path):
         # open file
-        src_file = open(path, 'rb')
-        img_data = src_file.read()
+        with open(path, 'rb') as src_file:
+            img_data = src_file.read()
         # do decrypt
         img_data = self.decrypt(img_data[SIGN_LEN:], KEY)
         # rewite
+        self.write_file(out_file_path, img_data)
+        # print (path + " decrypt success")
+
+    def read_file(self, path):
+        with open(path, 'rb') as src_file:
+            img_data = src_file.read()
+
+        if img_data[:SIGN_LEN] == bytes(SIGN, encoding='ascii'):
+            img_data = self.decrypt(img_data[SIGN_LEN:], KEY)
+
+        return img_data
+
+    # read_file() of every path, with the encrypted ones decrypted together
+    def read_files(self, paths):
+        datas = []
+        for path in paths:
+            with open(path, 'rb') as src_file:
+                datas.append(src_file.read())
+
+        sign = bytes(SIGN, encoding='ascii')
+        encrypted = [index for index, img_data in enumerate(datas)
+                     if img_data[:SIGN_LEN] == sign]
+        decrypted = self.decrypt_many(
+            [datas[index][SIGN_LEN:] for index in encrypted], KEY)
+        for index, img_data in zip(encrypted, decrypted):
+            datas[index] = img_data
+
+        return datas
+
+    def write_file(self, out_file_path, img_data):
         out_path = os.path.dirname(out_file_path)
         if not os.path.exists(out_path):
             os.makedirs(out_path)
-        des_file = open(out_file_path, 'wb')
-        des_file.write(img_data)
-        des_file.close()
-        # print (path + " decrypt success")
+        with open(out_file_path, 'wb') as des_file:
+            des_file.write(img_data)
 
     def isEncrypt(self, path):
         size = os.path.getsize(path)
@@ -136,6 +250,25 @@ class xxteaFile():
         return flag
 
 
+# Runs of items, longest first, short enough to share one array without
+# much of it being padding
+def _batches(items):
+    start = 0
+    while start < len(items):
+        width = len(items[start][1])
+        end = start + 1
+        while (end < len(items) and len(items[end][1]) * 4 >= width
+               and (end + 1 - start) * width <= _BATCH_WORDS):
+            end += 1
+        # An item much longer than the others would run most of its rows
+        # alone, it is decrypted by itself
+        if (end - start >= _MIN_ROWS
+                and len(items[start + _MIN_ROWS - 1][1]) * 4 < width * 3):
+            end = start + 1
+        yield items[start:end]
+        start = end
+
+
 def main():
     file_path = 'F:/lua/files/2020-08-29/src/app/Helper.lua'
     xx = xxteaFile(file_path, 'tttt.lua')